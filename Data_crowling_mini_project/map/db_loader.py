@@ -3,10 +3,15 @@
 news.db에서 뉴스 데이터를 가져옵니다
 """
 
-import sqlite3
 import os
+import sys
 from typing import List, Dict, Optional
 
+# 크롤러와 같은 DB 접근 계층 사용 (src/crawlers/sqlite_store.py)
+_project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(_project_root, 'src', 'crawlers'))
+from sqlite_store import get_store
+
 
 class NewsDBLoader:
     """뉴스 데이터베이스 로더 (news.db & news_scraped.db 통합)"""
@@ -31,12 +36,7 @@ class NewsDBLoader:
         all_data = []
         for path in self.db_paths:
             try:
-                conn = sqlite3.connect(path)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                all_data.extend([dict(row) for row in cursor.fetchall()])
-                conn.close()
+                all_data.extend(get_store(path).query_dicts(query, params))
             except Exception:
                 continue
         
@@ -116,8 +116,6 @@ class NewsDBLoader:
         keywords = []
         for db_path in self.db_paths:
             try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
                 placeholders = ",".join(["?"] * len(regions))
                 query = f"""
                     SELECT keyword
@@ -126,9 +124,7 @@ class NewsDBLoader:
                       AND keyword IS NOT NULL
                       AND TRIM(keyword) != ''
                 """
-                cursor.execute(query, regions)
-                keywords.extend([row[0] for row in cursor.fetchall()])
-                conn.close()
+                keywords.extend([row[0] for row in get_store(db_path).query(query, regions)])
             except Exception:
                 continue
         return keywords
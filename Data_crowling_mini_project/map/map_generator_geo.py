@@ -45,6 +45,13 @@ class NewsMapGeneratorGeo:
             cursor.execute(f"ATTACH DATABASE '{self.db_scraped}' AS scraped")
         return conn
 
+    @staticmethod
+    def _unique_filter(cursor, schema: str) -> str:
+        """유사 중복 기사 제외 조건 (canonical_id 컬럼이 없는 이전 DB는 조건 없음)"""
+        cursor.execute(f"PRAGMA {schema}.table_info(news)")
+        columns = {row[1] for row in cursor.fetchall()}
+        return " WHERE canonical_id IS NULL" if 'canonical_id' in columns else ""
+
     def get_region_statistics(self):
         """통합 DB에서 지역별 통계 추출"""
         conn = self._get_integrated_conn()
@@ -52,9 +59,11 @@ class NewsMapGeneratorGeo:
         cursor.execute("PRAGMA database_list")
         databases = [row[1] for row in cursor.fetchall()]
         
-        subquery = "SELECT region, sentiment_score FROM main.news"
+        # 원본에 연결된 유사 중복 기사(재게재된 통신사 기사)는 지역별 건수에서 제외
+        subquery = f"SELECT region, sentiment_score FROM main.news{self._unique_filter(cursor, 'main')}"
         if 'scraped' in databases:
-            subquery += " UNION ALL SELECT region, sentiment_score FROM scraped.news"
+            subquery += (" UNION ALL SELECT region, sentiment_score FROM scraped.news"
+                         f"{self._unique_filter(cursor, 'scraped')}")
             
         query = f"""
         SELECT region, COUNT(*) as count,
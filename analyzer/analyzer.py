@@ -1,9 +1,8 @@
 import os
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
-import sqlite3
+import sys
 import logging
 import time
-import os
 from analyzer import log_config
 from analyzer.sentiment import NewsSentimentAnalyzer
 
@@ -12,40 +11,67 @@ logger = logging.getLogger(__name__)
 # 프로젝트 루트 기준으로 경로 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(BASE_DIR, "data", "news.db")
+
+# 크롤러와 같은 DB 접근 계층 사용 (src/crawlers/sqlite_store.py)
+sys.path.append(os.path.join(BASE_DIR, "src", "crawlers"))
+from near_duplicate import NearDuplicateDetector
+from sqlite_store import get_store
+
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
+def propagate_to_duplicates(cursor):
+    """원본이 이미 분석된 유사 중복 기사에 원본 점수 복사"""
+    cursor.execute("""
+        UPDATE news
+        SET sentiment_score = (SELECT c.sentiment_score FROM news c WHERE c.id = news.canonical_id),
+            is_processed = 1
+        WHERE is_processed = 0
+          AND canonical_id IN (SELECT id FROM news WHERE is_processed = 1)
+    """)
+    if cursor.rowcount > 0:
+        logger.info(f"유사 중복 기사 {cursor.rowcount}건에 원본 점수 반영")
+
+
+def save_scores(store, scores):
+    """분석 점수 저장 ([(점수, id, id)], 원본에 연결된 유사 중복 기사에도 같은 점수)"""
+    store.executemany("""
+        UPDATE news
+        SET sentiment_score = ?,
+            is_processed = 1
+        WHERE id = ? OR canonical_id = ?
+    """, scores)
+
+
 def run_analysis():
     start_time = time.time()
     logger.info("감성 배치 시작")
 
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        #processed가 0인거 실행하기
-        cursor.execute("""
+        store = get_store(DB_PATH)
+        # 크롤러가 아직 열지 않은 DB에도 canonical_id 컬럼이 있도록 (없으면 아래 조회가 실패)
+        with store.transaction() as cursor:
+            NearDuplicateDetector().ensure_schema(cursor)
+        #processed가 0인거 실행하기 (유사 중복 기사는 원본 결과를 복사하므로 제외)
+        rows = store.query("""
             SELECT id, content
             FROM news
-            WHERE is_processed = 0
+            WHERE is_processed = 0 AND canonical_id IS NULL
         """)
 
-        rows = cursor.fetchall()
-
         if not rows:
+            with store.transaction() as cursor:
+                propagate_to_duplicates(cursor)
             logger.info("처리할 뉴스 없음")
             return
 
         analyzer = NewsSentimentAnalyzer()
 
+        # 점수는 모아서 chunk_size건마다 한 트랜잭션으로 저장 (중간에 멈춰도 앞선 결과는 남음)
+        scores = []
         for news_id, content in rows:
             try:
                 label, score = analyzer.predict(content)
-
-                cursor.execute("""
-                    UPDATE news
-                    SET sentiment_score = ?,
-                        is_processed = 1
-                    WHERE id = ?
-                """, (score, news_id))
+                scores.append((score, news_id, news_id))
 
                 logger.info(
                     f"ID {news_id} 처리 완료 | 결과: {label} | 점수: {score:.4f}"
@@ -54,13 +80,18 @@ def run_analysis():
             except Exception:
                 logger.exception(f"ID {news_id} 처리 중 오류 발생")
 
-        conn.commit()
+            if len(scores) >= store.chunk_size:
+                save_scores(store, scores)
+                scores = []
+
+        save_scores(store, scores)
+        with store.transaction() as cursor:
+            propagate_to_duplicates(cursor)
 
     except Exception:
         logger.exception("배치 실행 중 치명적 오류 발생")
 
     finally:
-        conn.close()
         elapsed = time.time() - start_time
         logger.info(f"감성 배치 종료 | 총 소요 시간: {elapsed:.2f}초")
 
@@ -2,7 +2,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import sqlite3
 import plotly.graph_objects as go
 import plotly.express as px
 import html
@@ -15,6 +14,12 @@ map_module_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'Data_
 if map_module_path not in sys.path:
     sys.path.append(map_module_path)
 
+# 크롤러와 같은 DB 접근 계층 사용 (src/crawlers/sqlite_store.py)
+crawlers_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'src', 'crawlers'))
+if crawlers_path not in sys.path:
+    sys.path.append(crawlers_path)
+from sqlite_store import get_store
+
 # 2. 지도 모듈 임포트
 try:
     from map_generator_geo import NewsMapGeneratorGeo
@@ -44,15 +49,13 @@ except ImportError:
     fdr = None
 
 def get_combined_df(query, params=None):
-    """news.db와 news_scraped.db 통합 로드"""
+    """news.db와 news_scraped.db 통합 로드 (DB별 연결 풀을 재실행 간에도 재사용)"""
     df_list = []
     for db_file in ['news.db', 'news_scraped.db']:
         try:
             full_path = os.path.join('data', db_file)
             if os.path.exists(full_path):
-                conn = sqlite3.connect(full_path)
-                df = pd.read_sql(query, conn, params=params)
-                conn.close()
+                df = get_store(os.path.abspath(full_path)).read_frame(query, params=params)
                 if not df.empty: df_list.append(df)
         except: continue
     if not df_list: return pd.DataFrame()
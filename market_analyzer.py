@@ -1,11 +1,15 @@
 import pandas as pd
 import numpy as np
 import FinanceDataReader as fdr
-import sqlite3
 import os
+import sys
 from datetime import datetime, timedelta
 import scipy.stats as stats
 
+# 크롤러와 같은 DB 접근 계층 사용 (src/crawlers/sqlite_store.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'crawlers'))
+from sqlite_store import get_store
+
 
 
 
@@ -21,11 +25,9 @@ def get_data_from_db(db_path):
             print(f"⚠️ 파일 없음: {db_path}")
             return pd.DataFrame()
        
-        conn = sqlite3.connect(db_path)
         # [주석] 데이터가 왜 적은지 확인하기 위해 'is_processed' 조건을 제거하고 전체를 봅니다.
         query = "SELECT published_time, sentiment_score, is_processed FROM news"
-        df = pd.read_sql(query, conn)
-        conn.close()
+        df = get_store(os.path.abspath(db_path)).read_frame(query)
        
         if not df.empty:
             processed_count = df[df['is_processed'] == 1].shape[0]
@@ -5,18 +5,25 @@ Base Crawler 클래스
 
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from datetime import datetime
 import logging
 from abc import ABC, abstractmethod
+import asyncio
+import threading
 import time
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 import pandas as pd
 
+from http_cache import get_response_cache
+from rate_limiter import get_rate_limiter
+from browser_pool import get_browser_pool
+from html_parser import make_soup
+from charset_resolver import get_charset_resolver
+from transport import create_session
+from crawl_metrics import get_crawl_metrics
+from raw_archive import get_raw_archive, raw_archive_enabled
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +31,42 @@ logging.basicConfig(
 )
 
 
+class HostGate:
+    """
+    호스트별 요청 제어 (동시 요청 수 제한 + 도메인 속도 제한)
+    스레드/비동기 모드 모두에서 fetch_page가 이 게이트를 통과
+    요청 간격은 프로세스 공용 속도 제한기가 응답 상태에 따라 조절
+    """
+
+    def __init__(self, host: str, max_concurrency: int, min_interval: float):
+        self.host = host
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._limiter = get_rate_limiter()
+
+        # min_interval을 이 호스트의 최고 속도로 사용
+        if min_interval > 0:
+            self._limiter.configure(host, max_rate=1.0 / min_interval)
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        try:
+            self._limiter.acquire(self.host)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+    def report(self, status_code: int, retry_after: Optional[str] = None):
+        """응답 상태를 속도 제한기에 전달 (429/403/503이면 감속)"""
+        self._limiter.on_response(self.host, status_code, retry_after)
+
+
 class BaseCrawler(ABC):
     """
     모든 지역 신문 크롤러의 부모 클래스
@@ -34,8 +77,17 @@ class BaseCrawler(ABC):
         2. region: 지역명
         3. base_url: 메인 URL
         4. config: CSS 선택자 등 설정
+           - max_concurrency: 비동기 모드에서 호스트당 동시 요청 수 (기본값: 4)
+           - min_request_interval: 같은 호스트로의 최소 요청 간격(초), 속도 제한기의 최고 속도로 사용 (기본값: 0.5)
+           - use_cache: HTTP 응답 캐시(조건부 GET) 사용 여부 (기본값: False)
+           - browser_pool_size: Selenium 사용 시 공용 브라우저 풀 크기 (기본값: 2)
+           - transport: HTTP 전송 백엔드 'requests' 또는 'httpx' (기본값: 환경 변수 CRAWLER_TRANSPORT 또는 requests)
     """
 
+    # 호스트별 게이트 (같은 호스트를 쓰는 크롤러끼리 공유)
+    _host_gates: Dict[str, HostGate] = {}
+    _host_gates_lock = threading.Lock()
+
     def __init__(self,
                  newspaper_name: str,
                  region: str,
@@ -59,9 +111,21 @@ class BaseCrawler(ABC):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
+        # 비동기 모드 설정
+        self.max_concurrency = config.get('max_concurrency', 4)
+        self.min_request_interval = config.get('min_request_interval', 0.5)
+
+        # HTTP 응답 캐시 (enable_cache()로도 켤 수 있음)
+        self.cache = get_response_cache() if config.get('use_cache') else None
+
+        # 기사 원본 보관 (CRAWLER_RAW_ARCHIVE=1 또는 config 'raw_archive'), 재추출 시 이 이름으로 크롤러를 다시 생성
+        self.raw_archive = get_raw_archive() if config.get('raw_archive', raw_archive_enabled()) else None
+        self.archive_source = f"crawler:{type(self).__module__}.{type(self).__name__}"
+
         self.articles = []
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # 동시 요청 수만큼 커넥션 풀 확보 (transport가 'httpx'면 HTTP/2로 연결 하나에 다중화)
+        self.session = create_session(pool_size=max(10, self.max_concurrency), headers=self.headers,
+                                      backend=config.get('transport'))
 
     @abstractmethod
     def get_article_urls(self) -> List[str]:
@@ -79,7 +143,30 @@ class BaseCrawler(ABC):
         """
         pass
 
-    def fetch_page(self, url: str, use_selenium: bool = False, retries: int = 3) -> Optional[BeautifulSoup]:
+    async def get_article_urls_async(self) -> List[str]:
+        """get_article_urls의 코루틴 버전 (파싱 로직은 동기 메서드 재사용)"""
+        return await asyncio.to_thread(self.get_article_urls)
+
+    async def parse_article_async(self, url: str) -> Optional[Dict]:
+        """parse_article의 코루틴 버전 (파싱 로직은 동기 메서드 재사용)"""
+        return await asyncio.to_thread(self.parse_article, url)
+
+    def _get_host_gate(self, url: str) -> HostGate:
+        """URL의 호스트에 해당하는 게이트 반환 (없으면 생성)"""
+        host = urlparse(url).netloc or urlparse(self.base_url).netloc
+        with BaseCrawler._host_gates_lock:
+            gate = BaseCrawler._host_gates.get(host)
+            if gate is None:
+                gate = HostGate(host, self.max_concurrency, self.min_request_interval)
+                BaseCrawler._host_gates[host] = gate
+            return gate
+
+    def enable_cache(self, cache=None):
+        """HTTP 응답 캐시 사용 (cache를 주지 않으면 프로세스 공용 캐시 사용)"""
+        self.cache = cache or get_response_cache()
+
+    def fetch_page(self, url: str, use_selenium: bool = False, retries: int = 3,
+                   page_class: str = 'article', targets=None) -> Optional[BeautifulSoup]:
         """
         HTML 페이지 요청 및 파싱 (재시도 로직 포함)
 
@@ -87,30 +174,65 @@ class BaseCrawler(ABC):
             url: 요청 URL
             use_selenium: JavaScript 렌더링 필요 여부
             retries: 재시도 횟수
+            page_class: 캐시 유효 시간 구분 ('list': 목록 페이지, 'article': 기사 상세)
+            targets: 부분 파싱 필터 (html_parser.target_filter, 주면 대상 하위 트리만 파싱)
 
         Returns:
             BeautifulSoup 객체 또는 None
         """
+        metrics = get_crawl_metrics()
+
+        # 캐시 확인 (유효하면 요청 없이 반환, 만료되었으면 조건부 GET)
+        cached = None
+        request_headers = None
+        if self.cache and not use_selenium:
+            cached = self.cache.get(url)
+            if cached and self.cache.is_fresh(cached, page_class):
+                self.logger.debug(f"✓ 캐시 사용: {url[:60]}...")
+                metrics.observe_fetch(url, 0.0, 'cache', stage=page_class)
+                return self._to_soup(self.cache.to_response(cached), page_class, targets)
+            if cached:
+                request_headers = self.cache.conditional_headers(cached)
+
         for attempt in range(retries):
+            if attempt > 0:
+                metrics.record_retry(url, page_class)
+            started = None
             try:
-                if use_selenium:
-                    return self._fetch_with_selenium(url)
-                response = self.session.get(url, timeout=15)
-
-                # 인코딩 자동 감지 및 설정
-                if response.encoding and response.encoding.lower() in ['iso-8859-1', 'windows-1252']:
-                    response.encoding = 'utf-8'
-                elif not response.encoding:
-                    response.encoding = response.apparent_encoding or 'utf-8'
+                gate = self._get_host_gate(url)
+                with gate:
+                    if use_selenium:
+                        return self._fetch_with_selenium(url)
+                    started = time.perf_counter()
+                    response = self.session.get(url, headers=request_headers, timeout=15)
+                    metrics.observe_fetch(url, time.perf_counter() - started, response.status_code,
+                                          len(response.content or b''), page_class)
+                gate.report(response.status_code, response.headers.get('Retry-After'))
+
+                if response.status_code == 304 and cached:
+                    self.cache.touch(url)
+                    self.logger.debug(f"✓ 변경 없음(304), 캐시 사용: {url[:60]}...")
+                    return self._to_soup(self.cache.to_response(cached), page_class, targets)
 
                 if response.status_code == 200:
+                    if self.cache:
+                        self.cache.store(url, response)
+                    if self.raw_archive and page_class == 'article':
+                        self.raw_archive.store(url, response, self.archive_source)
                     self.logger.debug(f"✓ 페이지 로드: {url[:60]}...")
-                    return BeautifulSoup(response.text, 'html.parser', from_encoding='utf-8')
+                    return self._to_soup(response, page_class, targets)
+
+                if response.status_code in (429, 503) and attempt < retries - 1:
+                    # 속도 제한기가 감속·대기를 처리하므로 바로 재시도
+                    self.logger.warning(f"⏳ 상태 코드 {response.status_code} (재시도 {attempt + 1}/{retries}): {url[:60]}...")
+                    continue
 
                 self.logger.warning(f"✗ 상태 코드 {response.status_code}: {url}")
                 return None
 
             except requests.Timeout:
+                if started is not None:
+                    metrics.observe_fetch(url, time.perf_counter() - started, 'error', stage=page_class)
                 if attempt < retries - 1:
                     self.logger.warning(f"⏱ 타임아웃 (재시도 {attempt + 1}/{retries}): {url[:60]}...")
                     time.sleep(1)
@@ -119,6 +241,8 @@ class BaseCrawler(ABC):
                     return None
 
             except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                if started is not None:
+                    metrics.observe_fetch(url, time.perf_counter() - started, 'error', stage=page_class)
                 if attempt < retries - 1:
                     self.logger.warning(f"🔄 연결 오류 (재시도 {attempt + 1}/{retries}): {url[:60]}...")
                     time.sleep(2)
@@ -136,26 +260,19 @@ class BaseCrawler(ABC):
 
         return None
 
+    def _to_soup(self, response, page_class: str = 'article', targets=None) -> BeautifulSoup:
+        """응답을 도메인 인코딩으로 디코딩 후 BeautifulSoup 객체로 변환 (도메인당 한 번만 감지)"""
+        started = time.perf_counter()
+        soup = make_soup(get_charset_resolver().decode(response), targets=targets)
+        get_crawl_metrics().observe_parse(response.url, time.perf_counter() - started, page_class)
+        return soup
+
     def _fetch_with_selenium(self, url: str) -> Optional[BeautifulSoup]:
-        """Selenium을 사용한 JavaScript 렌더링 페이지 로드"""
+        """Selenium을 사용한 JavaScript 렌더링 페이지 로드 (공용 브라우저 풀의 드라이버 재사용)"""
         try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-
-            driver = webdriver.Chrome(options=options)
-            driver.get(url)
-
-            # 컨텐츠 로딩 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'body'))
-            )
-
-            html = driver.page_source
-            driver.quit()
-
-            return BeautifulSoup(html, 'html.parser')
+            pool = get_browser_pool(size=self.config.get('browser_pool_size', 2))
+            html = pool.fetch_html(url)
+            return make_soup(html)
         except Exception as e:
             self.logger.error(f"✗ Selenium 로드 실패: {e}")
             return None
@@ -183,16 +300,20 @@ class BaseCrawler(ABC):
         except Exception:
             return default
 
-    def crawl(self, max_articles: int = 50) -> List[Dict]:
+    def crawl(self, max_articles: int = 50, use_async: bool = False) -> List[Dict]:
         """
         전체 크롤링 프로세스
 
         Args:
             max_articles: 최대 수집할 기사 수
+            use_async: 비동기 모드 사용 여부 (호스트당 동시 요청 수/요청 간격은 config로 조절)
 
         Returns:
             기사 딕셔너리 리스트
         """
+        if use_async:
+            return asyncio.run(self.crawl_async(max_articles=max_articles))
+
         self.logger.info(f"\n{'=' * 60}")
         self.logger.info(f"[{self.newspaper_name}({self.region})] 크롤링 시작")
         self.logger.info(f"{'=' * 60}")
@@ -220,6 +341,7 @@ class BaseCrawler(ABC):
                     article['newspaper'] = self.newspaper_name
                     article['region'] = self.region
                     self.articles.append(article)
+                    get_crawl_metrics().record_articles(url)
 
                 # 서버 부하 방지 (요청 간 1초 대기)
                 time.sleep(1)
@@ -233,6 +355,83 @@ class BaseCrawler(ABC):
             self.logger.error(f"✗ 크롤링 중 오류: {e}")
             return self.articles
 
+    def enqueue_article_urls(self, queue, max_articles: int = 50) -> int:
+        """
+        기사 URL만 수집해 크롤 작업 큐(crawl_queue.CrawlQueue)에 등록
+        파싱은 큐 작업자가 이 크롤러 클래스의 parse_article로 처리 (인자 없는 생성자 필요)
+
+        Returns:
+            새로 등록된 작업 수
+        """
+        article_urls = self.get_article_urls()[:max_articles]
+        crawler_path = f"{type(self).__module__}.{type(self).__name__}"
+        added = queue.enqueue_many(article_urls, kind='crawler', payload={'crawler': crawler_path})
+        self.logger.info(f"✓ [{self.newspaper_name}] 작업 {added}개 등록 (URL {len(article_urls)}개)")
+        return added
+
+    async def crawl_async(self, max_articles: int = 50) -> List[Dict]:
+        """
+        비동기 크롤링 프로세스
+        기사 파싱을 max_concurrency개까지 동시에 진행하고,
+        요청 간격은 호스트 게이트(도메인 속도 제한기)가 응답 상태에 맞춰 조절
+
+        Args:
+            max_articles: 최대 수집할 기사 수
+
+        Returns:
+            기사 딕셔너리 리스트
+        """
+        self.logger.info(f"\n{'=' * 60}")
+        self.logger.info(f"[{self.newspaper_name}({self.region})] 비동기 크롤링 시작 "
+                         f"(동시 {self.max_concurrency}개, 간격 {self.min_request_interval}초)")
+        self.logger.info(f"{'=' * 60}")
+
+        try:
+            # 1단계: 기사 URL 수집
+            self.logger.info("1단계: 기사 URL 수집 중...")
+            article_urls = await self.get_article_urls_async()
+
+            if not article_urls:
+                self.logger.warning("수집된 URL이 없습니다.")
+                return self.articles
+
+            article_urls = article_urls[:max_articles]
+            self.logger.info(f"✓ {len(article_urls)}개 URL 수집 완료")
+
+            # 2단계: 기사 동시 파싱
+            self.logger.info(f"2단계: {len(article_urls)}개 기사 파싱 중...")
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def parse_one(idx: int, url: str) -> Optional[Dict]:
+                async with semaphore:
+                    self.logger.info(f"  [{idx}/{len(article_urls)}] 파싱...")
+                    return await self.parse_article_async(url)
+
+            results = await asyncio.gather(
+                *(parse_one(idx, url) for idx, url in enumerate(article_urls, 1)),
+                return_exceptions=True
+            )
+
+            # URL 순서 유지하며 결과 병합
+            for url, article in zip(article_urls, results):
+                if isinstance(article, Exception):
+                    self.logger.error(f"✗ 파싱 중 오류 ({url}): {article}")
+                    continue
+                if article:
+                    article['newspaper'] = self.newspaper_name
+                    article['region'] = self.region
+                    self.articles.append(article)
+                    get_crawl_metrics().record_articles(url)
+
+            self.logger.info(f"✓ 크롤링 완료: {len(self.articles)}개 기사 수집")
+            self.logger.info(f"{'=' * 60}\n")
+
+            return self.articles
+
+        except Exception as e:
+            self.logger.error(f"✗ 크롤링 중 오류: {e}")
+            return self.articles
+
     def to_dataframe(self) -> pd.DataFrame:
         """수집한 기사를 DataFrame으로 반환"""
         if not self.articles:
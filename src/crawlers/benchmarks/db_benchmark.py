@@ -0,0 +1,166 @@
+"""
+뉴스 DB 접근 벤치마크
+호출마다 sqlite3.connect → 행마다 execute → commit → close 하던 기존 방식과
+sqlite_store(연결 풀, WAL, PRAGMA, 묶음 executemany)를 같은 DB 사본에서 비교
+
+- 삽입: 수집 기사(data/scraped/*.csv)를 --batch개씩 나눠 저장 (상시 수집기처럼 작은 묶음을 자주 저장하는 경우)
+- 조회: 대시보드(app.py)와 DatabaseManager의 조회 쿼리를 --reads번 반복
+- 키워드 추출과 유사 중복 지문 계산은 두 방식에 똑같이 드는 비용이라 제외하고 DB 계층만 측정
+
+원본 DB는 건드리지 않고 임시 디렉터리에 사본을 두 개 만들어 측정
+(기존 방식 사본은 기존 저널 모드 그대로, sqlite_store 사본은 WAL + 조회 인덱스)
+
+사용 예시:
+  python benchmarks/db_benchmark.py
+  python benchmarks/db_benchmark.py --batch 500 --copies 10
+  python benchmarks/db_benchmark.py --db data/news_scraped.db
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+CRAWLERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.abspath(os.path.join(CRAWLERS_DIR, '..', '..'))
+sys.path.append(CRAWLERS_DIR)
+
+from database_manager import INSERT_NEWS_SQL, ensure_news_indexes, scraped_row_to_article  # noqa: E402
+from near_duplicate import NearDuplicateDetector  # noqa: E402
+from sqlite_store import SQLiteStore, chunked, resolve_db_path  # noqa: E402
+
+DEFAULT_CSV_GLOB = os.path.join(PROJECT_ROOT, 'data', 'scraped', '*.csv')
+
+# (이름, 쿼리, 파라미터) — canonical_id 컬럼은 prepare_copy가 사본에 추가
+READ_QUERIES = [
+    ('대시보드 기간 조회',
+     "SELECT sentiment_score, url, region FROM news WHERE date(published_time) BETWEEN ? AND ?",
+     ('2026-02-20', '2026-02-23')),
+    ('대시보드 키워드 조회',
+     "SELECT keyword, sentiment_score, region, url FROM news WHERE keyword IS NOT NULL AND keyword != ''",
+     None),
+    ('지역별 기사 조회',
+     "SELECT * FROM news WHERE region = ? ORDER BY published_time DESC",
+     ('서울',)),
+    ('미분석 기사 조회',
+     "SELECT id, content FROM news WHERE is_processed = 0 AND canonical_id IS NULL",
+     None),
+]
+
+
+def load_rows(paths: List[str], copies: int) -> List[tuple]:
+    """INSERT_NEWS_SQL 행 (copies배로 늘릴 때는 URL에 번호를 붙여 모두 새 기사로)"""
+    articles = []
+    for path in paths:
+        frame = pd.read_csv(path).fillna('')
+        articles.extend(scraped_row_to_article(row) for row in frame.to_dict('records'))
+    rows = []
+    for copy in range(copies):
+        for article in articles:
+            url = article['url'] if copy == 0 else f"{article['url']}#{copy}"
+            rows.append((article['title'], article['content'], article['region'], None, 0,
+                         article['published_time'], '', article['collected_at'], url, None))
+    return rows
+
+
+def prepare_copy(source: str, target: str) -> None:
+    """원본 DB 사본 (news 테이블이 없으면 DatabaseManager와 같은 스키마로 생성)"""
+    shutil.copy(source, target)
+    conn = sqlite3.connect(target)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS news (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, content TEXT, region TEXT,
+            sentiment_score REAL, is_processed INTEGER DEFAULT 0, published_time TEXT, url TEXT UNIQUE,
+            keyword TEXT, collected_at TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    # 크롤러를 돌리기 전 DB에는 canonical_id 컬럼이 없으므로 두 사본 모두 같은 스키마로 맞춤 (미분석 기사 조회용)
+    NearDuplicateDetector().ensure_schema(conn.cursor())
+    conn.commit()
+    conn.close()
+
+
+def legacy_insert(db_path: str, rows: List[tuple], batch: int) -> None:
+    for chunk in chunked(rows, batch):
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        for row in chunk:
+            cursor.execute(INSERT_NEWS_SQL, row)
+        conn.commit()
+        conn.close()
+
+
+def store_insert(store: SQLiteStore, rows: List[tuple], batch: int) -> None:
+    for chunk in chunked(rows, batch):
+        store.executemany(INSERT_NEWS_SQL, chunk)
+
+
+def legacy_read(db_path: str, sql: str, params) -> pd.DataFrame:
+    conn = sqlite3.connect(db_path)
+    frame = pd.read_sql(sql, conn, params=params)
+    conn.close()
+    return frame
+
+
+def timed(function: Callable, repeat: int = 1) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 DB 접근 벤치마크')
+    parser.add_argument('--db', default='data/news.db', help='사본을 만들 원본 DB (기본값: data/news.db)')
+    parser.add_argument('--csv', nargs='+', help='삽입할 기사 CSV 경로 (기본값: data/scraped/*.csv)')
+    parser.add_argument('--copies', type=int, default=1, help='기사를 몇 배로 늘려 삽입할지')
+    parser.add_argument('--batch', type=int, default=10, help='한 번에 저장하는 기사 수')
+    parser.add_argument('--reads', type=int, default=20, help='조회 쿼리 반복 횟수')
+    args = parser.parse_args()
+
+    source = resolve_db_path(args.db)
+    paths = args.csv or sorted(glob.glob(DEFAULT_CSV_GLOB))
+    if not os.path.exists(source) or not paths:
+        print("원본 DB 또는 기사 CSV가 없습니다.")
+        return
+    rows = load_rows(paths, args.copies)
+
+    with tempfile.TemporaryDirectory(prefix='db_benchmark_') as workdir:
+        legacy_path = os.path.join(workdir, 'legacy.db')
+        store_path = os.path.join(workdir, 'store.db')
+        prepare_copy(source, legacy_path)
+        prepare_copy(source, store_path)
+        store = SQLiteStore(store_path)
+        with store.transaction() as cursor:
+            ensure_news_indexes(cursor)
+
+        results: Dict[str, tuple] = {}
+        results[f'삽입 {len(rows)}개 ({args.batch}개씩)'] = (
+            timed(lambda: legacy_insert(legacy_path, rows, args.batch)),
+            timed(lambda: store_insert(store, rows, args.batch)),
+        )
+        for name, sql, params in READ_QUERIES:
+            store.read_frame(sql, params)  # 연결/페이지 캐시 준비
+            results[f'{name} x{args.reads}'] = (
+                timed(lambda: legacy_read(legacy_path, sql, params), args.reads),
+                timed(lambda: store.read_frame(sql, params), args.reads),
+            )
+        store.close()
+
+    print("\n" + "=" * 74)
+    print(f"{'항목':<32}{'기존(ms)':>12}{'sqlite_store(ms)':>18}{'배율':>8}")
+    print("=" * 74)
+    for name, (legacy_time, store_time) in results.items():
+        print(f"{name:<32}{legacy_time * 1000:>12.1f}{store_time * 1000:>18.1f}"
+              f"{legacy_time / max(store_time, 1e-9):>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
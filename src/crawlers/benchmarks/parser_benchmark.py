@@ -0,0 +1,237 @@
+"""
+HTML 파서 백엔드 벤치마크
+저장된 신문사 페이지를 백엔드별(selectolax, lxml, html.parser)로 파싱하여
+신문사별 파싱 시간과 백엔드별 메모리 사용량을 비교
+
+페이지 소스:
+  - HTTP 응답 캐시(data/http_cache.db): 스크래퍼를 SCRAPER_HTTP_CACHE=1 로 실행하면 쌓임
+  - 저장된 HTML 폴더(data/benchmark_pages/*.html)
+  - --fetch 옵션: 지원 신문사 목록 페이지를 받아 위 폴더에 저장
+
+사용 예시:
+  python benchmarks/parser_benchmark.py --fetch
+  python benchmarks/parser_benchmark.py --repeat 5 --json logs/parser_benchmark.json
+  python benchmarks/parser_benchmark.py --backends lxml --targets 'div#article-view-content-div' 'h4.subheading'
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import zlib
+import sqlite3
+import argparse
+import resource
+import tracemalloc
+import multiprocessing
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+CRAWLERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.abspath(os.path.join(CRAWLERS_DIR, '..', '..'))
+sys.path.append(CRAWLERS_DIR)
+
+from html_parser import available_backends, parse_html, target_filter  # noqa: E402
+
+DEFAULT_CACHE_DB = os.path.join(PROJECT_ROOT, 'data', 'http_cache.db')
+DEFAULT_PAGES_DIR = os.path.join(PROJECT_ROOT, 'data', 'benchmark_pages')
+
+# 지원 신문사 목록 페이지 (--fetch 용)
+SAMPLE_LIST_URLS = {
+    'seoul': 'https://www.seoul.co.kr/newsList/economy?page=1',
+    'cctoday': 'https://www.cctoday.co.kr/news/articleList.html?sc_section_code=S1N4&view_type=sm&page=1',
+    'incheonilbo': 'https://www.incheonilbo.com/news/articleList.html?sc_section_code=S1N4&view_type=sm&page=1',
+    'imaeil': 'https://www.imaeil.com/economy?page=1',
+    'jejunews': 'http://www.jejunews.com/news/articleList.html?sc_section_code=S1N5&view_type=sm&page=1',
+    'kwnews': 'https://www.kwnews.co.kr/economy/all?page=1',
+    'gnen': 'https://www.gnen.net/news/articleList.html?page=1&sc_section_code=S1N2&view_type=sm',
+    'busan': 'https://www.busan.com/economy',
+    'kyeongin': 'https://www.kyeongin.com/money',
+    'hankyung': 'https://www.hankyung.com/economy/macro?page=1',
+    'kwangju': 'http://www.kwangju.co.kr/section.php?sid=5&page=1',
+    'ccnnews': 'http://www.ccnnews.co.kr/news/articleList.html?sc_section_code=S1N3&view_type=sm&page=1',
+    'kado': 'https://www.kado.net/news/articleList.html?sc_section_code=S1N2&page=1',
+    'kyeonggi': 'https://www.kyeonggi.com',
+    'jldnews': 'https://www.jldnews.co.kr/news/articleList.html?sc_sub_section_code=S2N24&view_type=sm&page=1',
+}
+
+
+def fetch_samples(pages_dir: str) -> None:
+    """지원 신문사 목록 페이지를 받아 저장"""
+    os.makedirs(pages_dir, exist_ok=True)
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    for name, url in SAMPLE_LIST_URLS.items():
+        try:
+            response = requests.get(url, headers=headers, timeout=20, verify=False)
+            if response.status_code != 200:
+                print(f"  ✗ {name}: HTTP {response.status_code}")
+                continue
+            with open(os.path.join(pages_dir, f"{name}.html"), 'wb') as f:
+                f.write(response.content)
+            print(f"  ✓ {name}: {len(response.content) // 1024}KB")
+        except requests.RequestException as e:
+            print(f"  ✗ {name}: {e}")
+
+
+def load_pages(cache_db: str, pages_dir: str, limit_per_site: int) -> List[Tuple[str, bytes]]:
+    """(신문사, HTML 바이트) 목록 로드"""
+    pages = defaultdict(list)
+
+    if os.path.exists(cache_db):
+        conn = sqlite3.connect(cache_db)
+        for url, body in conn.execute('SELECT url, body FROM responses'):
+            site = urlparse(url).netloc.replace('www.', '')
+            if body and len(pages[site]) < limit_per_site:
+                pages[site].append(zlib.decompress(body))
+        conn.close()
+
+    for path in sorted(glob.glob(os.path.join(pages_dir, '*.html'))):
+        site = os.path.splitext(os.path.basename(path))[0].split('_')[0]
+        if len(pages[site]) < limit_per_site:
+            with open(path, 'rb') as f:
+                pages[site].append(f.read())
+
+    return [(site, body) for site, bodies in sorted(pages.items()) for body in bodies]
+
+
+def _extract(doc) -> int:
+    """스크래퍼와 비슷한 작업량: 제목, 링크, 본문 텍스트 추출"""
+    title = doc.select_one('title')
+    links = doc.select('a')
+    body = doc.select_one('body')
+    text = body.get_text(' ', strip=True) if body else ''
+    return len(links) + len(text) + (1 if title else 0)
+
+
+def _run_backend(backend: str, pages: List[Tuple[str, bytes]], repeat: int, queue,
+                 target_selectors: Optional[List[str]] = None) -> None:
+    """
+    백엔드 하나를 별도 프로세스에서 측정 (메모리 측정이 서로 섞이지 않도록)
+    target_selectors를 주면 그 선택자의 하위 트리만 부분 파싱 (첫 선택자가 필수, BeautifulSoup 백엔드)
+    """
+    targets = target_filter(target_selectors, required=target_selectors[:1]) if target_selectors else None
+    parse_times = defaultdict(float)
+    extract_times = defaultdict(float)
+    counts = defaultdict(int)
+
+    for _ in range(repeat):
+        for site, body in pages:
+            start = time.perf_counter()
+            doc = parse_html(body, backend=backend, encoding='utf-8', targets=targets)
+            parsed = time.perf_counter()
+            _extract(doc)
+            parse_times[site] += parsed - start
+            extract_times[site] += time.perf_counter() - parsed
+            counts[site] += 1
+
+    # 메모리: 모든 페이지의 트리를 동시에 유지할 때 사용량
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    docs = [parse_html(body, backend=backend, encoding='utf-8', targets=targets) for _, body in pages]
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del docs
+
+    queue.put({
+        'backend': backend,
+        'sites': {
+            site: {
+                'pages': counts[site] // repeat,
+                'parse_ms': parse_times[site] / counts[site] * 1000,
+                'extract_ms': extract_times[site] / counts[site] * 1000,
+            }
+            for site in counts
+        },
+        'total_s': sum(parse_times.values()) + sum(extract_times.values()),
+        'python_peak_mb': py_peak / 1024 / 1024,
+        # ru_maxrss는 Linux에서 KB 단위 (C 라이브러리 할당 포함)
+        'rss_growth_mb': (rss_after - rss_before) / 1024,
+        # 부분 파싱에서 필수 선택자를 찾지 못해 전체 파싱한 비율
+        'full_parse_ratio': targets.misses / max(targets.hits + targets.misses, 1) if targets else None,
+    })
+
+
+def run_benchmark(pages: List[Tuple[str, bytes]], backends: List[str], repeat: int,
+                  target_selectors: Optional[List[str]] = None) -> List[Dict]:
+    """백엔드별 측정 결과 목록"""
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    for backend in backends:
+        queue = ctx.Queue()
+        process = ctx.Process(target=_run_backend, args=(backend, pages, repeat, queue, target_selectors))
+        process.start()
+        results.append(queue.get())
+        process.join()
+    return results
+
+
+def print_report(results: List[Dict]) -> None:
+    """신문사별 / 백엔드별 결과 출력"""
+    backends = [r['backend'] for r in results]
+    sites = sorted({site for r in results for site in r['sites']})
+
+    print("\n" + "=" * 70)
+    print("신문사별 페이지당 파싱 시간 (ms, 괄호: 파싱+추출)")
+    print("=" * 70)
+    print(f"{'신문사':<20}" + "".join(f"{b:>16}" for b in backends))
+    for site in sites:
+        row = f"{site:<20}"
+        for r in results:
+            s = r['sites'].get(site)
+            row += f"{s['parse_ms']:>8.1f}({s['parse_ms'] + s['extract_ms']:>5.1f})" if s else f"{'-':>16}"
+        print(row)
+
+    print("\n" + "=" * 70)
+    print("백엔드별 합계")
+    print("=" * 70)
+    print(f"{'백엔드':<14}{'총 시간(s)':>12}{'Python 최대(MB)':>18}{'RSS 증가(MB)':>16}")
+    for r in results:
+        print(f"{r['backend']:<14}{r['total_s']:>12.2f}{r['python_peak_mb']:>18.1f}{r['rss_growth_mb']:>16.1f}")
+    for r in results:
+        if r.get('full_parse_ratio') is not None:
+            print(f"  {r['backend']}: 부분 파싱 후 전체 파싱 비율 {r['full_parse_ratio']:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--cache-db', default=DEFAULT_CACHE_DB, help='HTTP 응답 캐시 DB 경로')
+    parser.add_argument('--pages-dir', default=DEFAULT_PAGES_DIR, help='저장된 HTML 폴더')
+    parser.add_argument('--fetch', action='store_true', help='지원 신문사 목록 페이지를 받아 저장')
+    parser.add_argument('--limit', type=int, default=50, help='신문사당 최대 페이지 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--backends', nargs='+', choices=['selectolax', 'lxml', 'html.parser'],
+                        help='측정할 백엔드 (기본값: 설치된 전체)')
+    parser.add_argument('--targets', nargs='+',
+                        help='부분 파싱할 선택자 (첫 선택자가 필수, 없으면 전체 파싱으로 다시 시도)')
+    parser.add_argument('--json', help='결과를 JSON으로 저장할 경로')
+    args = parser.parse_args()
+
+    if args.fetch:
+        print("📥 샘플 페이지 다운로드")
+        fetch_samples(args.pages_dir)
+
+    pages = load_pages(args.cache_db, args.pages_dir, args.limit)
+    if not pages:
+        print("벤치마크할 페이지가 없습니다. --fetch 옵션을 사용하거나 SCRAPER_HTTP_CACHE=1 로 스크래퍼를 실행하세요.")
+        return
+
+    backends = [b for b in (args.backends or available_backends()) if b in available_backends()]
+    total_kb = sum(len(body) for _, body in pages) // 1024
+    print(f"\n페이지 {len(pages)}개 ({total_kb}KB), 백엔드: {', '.join(backends)}, 반복 {args.repeat}회")
+
+    results = run_benchmark(pages, backends, args.repeat, args.targets)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 결과 저장: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""
+스크래퍼 처리량 벤치마크 (녹화/재생)
+실제 신문사 사이트 대신 녹화해 둔 응답을 로컬 재생 서버로 돌려주고
+스크래퍼별 초당 기사 수, CPU 시간, 최대 메모리를 측정 (파서/동시성/전송 계층 변경 비교용)
+
+대상:
+  - scraper/*.py 스크래퍼 (site_specs 기반 스크래퍼와 광주일보 스크립트)
+  - regional/* 크롤러 (BaseCrawler 기반)
+
+측정은 대상마다 별도 프로세스에서 수행 (CPU 시간과 최대 RSS가 서로 섞이지 않도록)
+
+사용 예시:
+  # 1) 실제 사이트에서 한 번 녹화 (data/replay_archive.db)
+  python benchmarks/scraper_benchmark.py --record --days 3 --articles 20
+
+  # 2) 재생 서버로 측정 (응답 지연 150ms ± 50ms, 오류 2%)
+  python benchmarks/scraper_benchmark.py --latency 0.15 --jitter 0.05 --error-rate 0.02 --repeat 3
+
+  # 속도 제한 없이 (파서/동시성만 비교)
+  python benchmarks/scraper_benchmark.py --no-rate-limit --targets seoul_seoul regional:seoul_shinmun
+
+  # 파싱을 작업자 프로세스 4개로 (CPU 시간은 작업자 프로세스 포함)
+  python benchmarks/scraper_benchmark.py --no-rate-limit --parse-workers 4
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import socket
+import argparse
+import resource
+import importlib
+import subprocess
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+
+CRAWLERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.abspath(os.path.join(CRAWLERS_DIR, '..', '..'))
+sys.path.insert(0, CRAWLERS_DIR)
+
+from replay_archive import ReplayArchive, DEFAULT_ARCHIVE_PATH  # noqa: E402
+
+# regional/* 크롤러 (이름: 모듈 경로, 클래스명)
+REGIONAL_CRAWLERS = {
+    'seoul_shinmun': ('regional.seoul.seoul_shinmun', 'SeoulShinmunCrawler'),
+    'gyeonggi_ilbo': ('regional.gyeonggi.gyeonggi_ilbo', 'GyeonggiIlboCrawler'),
+    'gangwon_domin_ilbo': ('regional.gangwon.gangwon_domin_ilbo', 'GangwonDominIlboCrawler'),
+    'daejon_ilbo': ('regional.chungcheong.daejon_ilbo', 'ChungcheongCrawler'),
+    'busan_ilbo': ('regional.gyeongsang.busan_ilbo', 'GyeongsangCrawler'),
+    'jeonnam_ilbo': ('regional.jeolla.jeonnam_ilbo', 'JeollaCrawler'),
+}
+
+RESULT_PREFIX = 'BENCH_RESULT '
+
+_SITE_RE = re.compile(r'^SITE\s*=\s*["\'](\w+)["\']', re.M)
+
+
+def discover_targets() -> List[str]:
+    """
+    측정 대상 목록
+    - 'seoul_seoul' 처럼 site_specs 키 (SITE = ... 를 선언한 scraper/*.py)
+    - 'regional:seoul_shinmun' 처럼 regional 크롤러
+    """
+    targets = []
+    for path in sorted(glob.glob(os.path.join(CRAWLERS_DIR, 'scraper', '*_scraper.py'))):
+        with open(path, encoding='utf-8') as f:
+            match = _SITE_RE.search(f.read())
+        if match:
+            targets.append(match.group(1))
+    targets.extend(f"regional:{name}" for name in REGIONAL_CRAWLERS)
+    return targets
+
+
+def run_target(target: str, days: int, articles: int) -> int:
+    """대상 하나를 실행하여 수집한 기사 수 반환 (자식 프로세스에서 호출)"""
+    if target.startswith('regional:'):
+        module_name, class_name = REGIONAL_CRAWLERS[target.split(':', 1)[1]]
+        crawler = getattr(importlib.import_module(module_name), class_name)()
+        return len(crawler.crawl(max_articles=articles))
+
+    from scraping_engine import run_site
+    return len(run_site(target, days=days, use_cache=False, skip_known=False))
+
+
+def child_main(target: str, days: int, articles: int):
+    """자식 프로세스: 대상 실행 후 측정값을 한 줄 JSON으로 출력"""
+    start = time.perf_counter()
+    error = None
+    try:
+        count = run_target(target, days, articles)
+    except Exception as e:  # 측정은 계속 진행
+        count = 0
+        error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - start
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # 종료된 파싱 작업자 프로세스(parse_pool)의 CPU 시간
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    print(RESULT_PREFIX + json.dumps({
+        'target': target,
+        'articles': count,
+        'wall_s': wall,
+        'cpu_s': usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime,
+        # ru_maxrss는 Linux에서 KB 단위
+        'peak_rss_mb': usage.ru_maxrss / 1024,
+        'error': error,
+    }, ensure_ascii=False), flush=True)
+
+
+def run_child(target: str, days: int, articles: int, env: Dict[str, str], verbose: bool) -> Dict:
+    """대상 하나를 별도 프로세스로 실행하고 측정값 반환"""
+    command = [sys.executable, os.path.abspath(__file__), '--child', target,
+               '--days', str(days), '--articles', str(articles)]
+    proc = subprocess.run(command, env=env, cwd=CRAWLERS_DIR, stdout=subprocess.PIPE,
+                          stderr=None if verbose else subprocess.DEVNULL, text=True)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    return {'target': target, 'articles': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'peak_rss_mb': 0.0,
+            'error': f"종료 코드 {proc.returncode}"}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_replay_server(archive_path: str, args) -> Tuple[subprocess.Popen, str]:
+    """재생 서버를 별도 프로세스로 시작 (스크래퍼와 CPU 측정이 섞이지 않도록)"""
+    port = args.port or _free_port()
+    command = [sys.executable, os.path.join(CRAWLERS_DIR, 'replay_archive.py'), '--archive', archive_path,
+               'serve', '--port', str(port), '--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--error-rate', str(args.error_rate), '--error-status', str(args.error_status),
+               '--reset-rate', str(args.reset_rate), '--seed', str(args.seed)]
+    proc = subprocess.Popen(command, stdout=subprocess.DEVNULL,
+                            stderr=None if args.verbose else subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("재생 서버가 시작되지 않았습니다.")
+
+
+def replay_days(archive: ReplayArchive, days: int) -> int:
+    """녹화 날짜 기준 수집 기간이 같도록 오늘 기준 기간으로 환산"""
+    recorded = archive.get_meta('recorded_date')
+    if not recorded:
+        return days
+    elapsed = (date.today() - datetime.strptime(recorded, '%Y-%m-%d').date()).days
+    return archive.get_meta('days', days) + max(elapsed, 0)
+
+
+def print_report(results: List[Dict]) -> None:
+    """대상별 결과 출력"""
+    print("\n" + "=" * 92)
+    print(f"{'대상':<36}{'기사':>6}{'시간(s)':>10}{'기사/초':>10}{'CPU(s)':>10}{'CPU/기사(ms)':>14}{'최대 RSS(MB)':>14}")
+    print("=" * 92)
+    for r in results:
+        rate = r['articles'] / r['wall_s'] if r['wall_s'] else 0.0
+        cpu_per = r['cpu_s'] / r['articles'] * 1000 if r['articles'] else 0.0
+        print(f"{r['target']:<36}{r['articles']:>6}{r['wall_s']:>10.2f}{rate:>10.2f}{r['cpu_s']:>10.2f}"
+              f"{cpu_per:>14.1f}{r['peak_rss_mb']:>14.1f}")
+        if r.get('error'):
+            print(f"    ✗ {r['error']}")
+
+
+def _median_result(runs: List[Dict]) -> Dict:
+    """반복 측정 중 소요 시간 중앙값 실행을 대표값으로 사용"""
+    runs = sorted(runs, key=lambda r: r['wall_s'])
+    result = dict(runs[len(runs) // 2])
+    result['runs'] = runs
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스크래퍼 처리량 벤치마크 (녹화/재생)')
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE_PATH, help='녹화 저장소 경로')
+    parser.add_argument('--targets', nargs='+', help='측정 대상 (기본값: 전체, --list로 확인)')
+    parser.add_argument('--list', action='store_true', help='측정 대상 목록 출력')
+    parser.add_argument('--record', action='store_true', help='실제 사이트에서 응답 녹화')
+    parser.add_argument('--days', type=int, default=3, help='스크래퍼 수집 기간 (일)')
+    parser.add_argument('--articles', type=int, default=20, help='regional 크롤러 최대 기사 수')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 횟수 (중앙값 사용)')
+    parser.add_argument('--port', type=int, help='재생 서버 포트 (기본값: 빈 포트)')
+    parser.add_argument('--latency', type=float, default=0.0, help='재생 응답 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 범위(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 코드')
+    parser.add_argument('--reset-rate', type=float, default=0.0, help='연결 끊김 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=42, help='지연/오류 난수 시드')
+    parser.add_argument('--no-rate-limit', action='store_true', help='도메인별 속도 제한 끄기')
+    parser.add_argument('--transport', choices=['requests', 'httpx'], help='전송 백엔드 (녹화/재생은 requests)')
+    parser.add_argument('--parse-workers', type=int, help='상세 페이지 파싱 작업자 프로세스 수 (스크래퍼 대상)')
+    parser.add_argument('--json', help='결과를 JSON으로 저장할 경로')
+    parser.add_argument('--verbose', action='store_true', help='스크래퍼 로그 출력')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child_main(args.child, args.days, args.articles)
+        return
+
+    all_targets = discover_targets()
+    if args.list:
+        print("\n".join(all_targets))
+        return
+    targets = args.targets or all_targets
+    unknown = [t for t in targets if t not in all_targets]
+    if unknown:
+        parser.error(f"알 수 없는 대상: {', '.join(unknown)}")
+
+    archive_path = args.archive
+    if not os.path.isabs(archive_path):
+        archive_path = os.path.join(PROJECT_ROOT, archive_path)
+    archive = ReplayArchive(archive_path)
+
+    env = dict(os.environ)
+    env.pop('CRAWLER_RECORD', None)
+    env.pop('CRAWLER_REPLAY', None)
+    # 캐시/건너뛰기 없이 매번 같은 요청을 보내도록
+    env['SCRAPER_HTTP_CACHE'] = '0'
+    env['SCRAPER_SKIP_KNOWN'] = '0'
+    if args.no_rate_limit:
+        env['CRAWLER_RATE_LIMIT'] = 'off'
+    if args.transport:
+        env['CRAWLER_TRANSPORT'] = args.transport
+    if args.parse_workers is not None:
+        env['CRAWLER_PARSE_WORKERS'] = str(args.parse_workers)
+
+    if args.record:
+        env['CRAWLER_RECORD'] = '1'
+        env['CRAWLER_RECORD_PATH'] = archive_path
+        print(f"📼 녹화: {len(targets)}개 대상, 기간 {args.days}일 → {archive_path}")
+        results = [run_child(target, args.days, args.articles, env, args.verbose) for target in targets]
+        archive.set_meta('recorded_date', date.today().strftime('%Y-%m-%d'))
+        archive.set_meta('days', args.days)
+        print_report(results)
+        total = sum(info['responses'] for info in archive.stats().values())
+        print(f"\n✓ 녹화 응답 {total}개")
+        return
+
+    if not archive.stats():
+        print("녹화된 응답이 없습니다. 먼저 --record 로 녹화하세요.")
+        return
+
+    days = replay_days(archive, args.days)
+    server, server_url = start_replay_server(archive_path, args)
+    env['CRAWLER_REPLAY'] = server_url
+    print(f"▶ 재생: {server_url} (지연 {args.latency}s ± {args.jitter}s, 오류 {args.error_rate:.0%}, "
+          f"연결 끊김 {args.reset_rate:.0%}), 반복 {args.repeat}회")
+
+    results = []
+    try:
+        for target in targets:
+            runs = [run_child(target, days, args.articles, env, args.verbose) for _ in range(args.repeat)]
+            results.append(_median_result(runs))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'settings': {k: v for k, v in vars(args).items() if k != 'child'},
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 결과 저장: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
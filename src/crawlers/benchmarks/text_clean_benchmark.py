@@ -0,0 +1,176 @@
+"""
+본문 정제 / 메타데이터 추출 벤치마크
+수집된 CSV(data/scraped/*.csv)의 기사로 기존 구현(키워드별 split, 매번 re.sub/re.search)과
+text_engine(미리 컴파일한 교대 정규식, 필요한 글자가 없으면 정규식 생략)을 비교
+
+- 함수별 총 시간과 속도 비율
+- 결과가 기존 구현과 다른 건수 (0이어야 함)
+- pyahocorasick이 설치되어 있으면 노이즈 키워드 판별을 Aho-Corasick으로도 측정 (비교용)
+
+CSV 본문은 이미 정제된 결과이므로 --footer를 주면 기자 이메일, 저작권 문구, 해시태그 등
+정제 전 본문 끝에 붙는 문구를 섞어 정제 전 입력을 흉내 냄
+
+사용 예시:
+  python benchmarks/text_clean_benchmark.py
+  python benchmarks/text_clean_benchmark.py --footer --repeat 5
+  python benchmarks/text_clean_benchmark.py --csv data/scraped/raw_seoul_seoul.csv
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import random
+import argparse
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+CRAWLERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.abspath(os.path.join(CRAWLERS_DIR, '..', '..'))
+sys.path.append(CRAWLERS_DIR)
+
+import text_engine  # noqa: E402
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+DEFAULT_CSV_GLOB = os.path.join(PROJECT_ROOT, 'data', 'scraped', '*.csv')
+
+# 정제 전 본문 끝에 흔히 붙는 문구 (--footer)
+FOOTERS = [
+    ' 홍길동 기자 hong@example.co.kr',
+    ' 저작권자 © 지역신문 무단 전재 및 재배포 금지',
+    ' 관련기사 다른기사 보기 좋아요 0 훈훈해요 0 슬퍼요 0 화나요 0',
+    ' #경제 #지역',
+    ' /김철수 기자\n',
+    ' 승인 2026-02-23 15:39 입력 2026.02.23',
+    ' 사진=https://www.example.co.kr/photo/1.jpg',
+    ' 이영희 특파원',
+]
+
+
+# ---- 기존 구현 (비교 기준) ----
+
+def legacy_clean_text(text):
+    if not text: return ""
+    text = re.split(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)[0]
+    for kw in text_engine.CUT_MARKERS:
+        if kw in text: text = text.split(kw)[0]
+    text = re.sub(r'#\S+', '', text)
+    text = re.sub(r'/[가-힣]{2,4}\s*기자.*$', '', text, flags=re.MULTILINE)
+    return text.strip()
+
+
+def legacy_clean_article_text(text):
+    text = re.sub(r'https?://[^\s]+', '', text)
+    text = re.sub(r'www\.[^\s]+', '', text)
+    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_is_noise(text):
+    return any(keyword in text for keyword in text_engine.NOISE_KEYWORDS)
+
+
+def legacy_extract_date(text):
+    for pattern in text_engine.DATE_PATTERNS:
+        match = re.search(pattern, text)
+        if match:
+            groups = match.groups()
+            if len(groups) >= 3:
+                return f"{groups[0]}-{groups[1]}-{groups[2]}"
+            return match.group(1)
+    return ''
+
+
+def legacy_extract_writer(text):
+    for pattern, _ in text_engine.WRITER_PATTERNS:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1)
+    return ''
+
+
+def _ahocorasick_is_noise() -> Callable[[str], bool]:
+    automaton = ahocorasick.Automaton()
+    for keyword in text_engine.NOISE_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+# ---- 측정 ----
+
+def load_corpus(paths: List[str], footer: bool, seed: int) -> Dict[str, List[str]]:
+    """{'body': 본문 목록, 'lines': 문장 단위 목록, 'page': 제목+부제+본문(+날짜) 목록}"""
+    rng = random.Random(seed)
+    bodies, pages = [], []
+    for path in paths:
+        frame = pd.read_csv(path).fillna('')
+        for row in frame.itertuples():
+            body = str(getattr(row, 'content', ''))
+            if footer:
+                body += ''.join(rng.sample(FOOTERS, 3))
+            bodies.append(body)
+            pages.append(f"{getattr(row, 'title', '')} {getattr(row, 'sub_title', '')} {body}")
+    lines = [line for body in bodies for line in re.split(r'(?<=[.!?])\s+|\n', body) if line]
+    return {'body': bodies, 'lines': lines, 'page': pages}
+
+
+def measure(function: Callable, inputs: List[str], repeat: int):
+    """(최소 시간, 결과 목록)"""
+    best, results = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [function(text) for text in inputs]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='본문 정제 / 메타데이터 추출 벤치마크')
+    parser.add_argument('--csv', nargs='+', help='기사 CSV 경로 (기본값: data/scraped/*.csv)')
+    parser.add_argument('--footer', action='store_true', help='정제 전 본문 끝 문구를 섞어서 측정')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--seed', type=int, default=42, help='--footer 난수 시드')
+    args = parser.parse_args()
+
+    paths = args.csv or sorted(glob.glob(DEFAULT_CSV_GLOB))
+    if not paths:
+        print("기사 CSV가 없습니다. 스크래퍼를 먼저 실행하거나 --csv로 지정하세요.")
+        return
+    corpus = load_corpus(paths, args.footer, args.seed)
+    total_kb = sum(len(text) for text in corpus['page']) // 1024
+    print(f"\n기사 {len(corpus['body'])}개, 문장 {len(corpus['lines'])}개 ({total_kb}K자), 반복 {args.repeat}회"
+          f"{', 본문 끝 문구 포함' if args.footer else ''}")
+
+    cases = [
+        ('clean_text', 'body', legacy_clean_text, text_engine.clean_body),
+        ('clean_article_text', 'body', legacy_clean_article_text, text_engine.clean_article),
+        ('_is_noise', 'lines', legacy_is_noise, text_engine.is_noise),
+        ('extract_date', 'page', legacy_extract_date, text_engine.extract_date),
+        ('extract_writer', 'page', legacy_extract_writer, text_engine.extract_writer),
+    ]
+    if ahocorasick is not None:
+        cases.append(('_is_noise (Aho-Corasick)', 'lines', legacy_is_noise, _ahocorasick_is_noise()))
+
+    print("\n" + "=" * 78)
+    print(f"{'함수':<28}{'기존(ms)':>12}{'개선(ms)':>18}{'배율':>8}{'결과 차이':>12}")
+    print("=" * 78)
+    for name, field, legacy, engine in cases:
+        inputs = corpus[field]
+        legacy_time, expected = measure(legacy, inputs, args.repeat)
+        engine_time, actual = measure(engine, inputs, args.repeat)
+        mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+        print(f"{name:<28}{legacy_time * 1000:>12.1f}{engine_time * 1000:>18.1f}"
+              f"{legacy_time / max(engine_time, 1e-9):>7.1f}x{mismatches:>12}")
+
+
+if __name__ == '__main__':
+    main()
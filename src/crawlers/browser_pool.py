@@ -0,0 +1,193 @@
+"""
+헤드리스 브라우저 풀
+JavaScript 렌더링이 필요한 페이지를 위해 Chrome 드라이버를 미리 띄워 두고 재사용
+(URL마다 브라우저를 새로 띄우는 비용 제거)
+"""
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger('BrowserPool')
+
+# 렌더링에 필요 없는 리소스 (이미지, 폰트)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+]
+
+
+class _PooledDriver:
+    """풀에서 관리하는 드라이버와 사용 횟수"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class BrowserPool:
+    """
+    Chrome 드라이버 풀
+
+    - 최대 size개의 드라이버를 필요할 때 생성하여 작업 스레드에 빌려줌
+    - 드라이버당 max_pages 페이지를 처리하면 재시작 (메모리 누수 방지)
+    - 오류가 난 드라이버는 버리고 다음 요청 때 새로 생성
+    """
+
+    def __init__(self, size: int = 2, max_pages: int = 50, page_load_timeout: int = 20):
+        """
+        Args:
+            size: 최대 드라이버 수
+            max_pages: 드라이버 재시작 전 최대 처리 페이지 수
+            page_load_timeout: 페이지 로드 제한 시간(초)
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.page_load_timeout = page_load_timeout
+
+        self._idle: List[_PooledDriver] = []
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _create_driver(self):
+        """eager 로딩 + 이미지/폰트 차단 설정으로 드라이버 생성"""
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
+        # DOMContentLoaded까지만 대기 (이미지·광고 로딩 완료를 기다리지 않음)
+        options.page_load_strategy = 'eager'
+
+        driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.debug(f"리소스 차단 설정 실패 (무시): {e}")
+
+        logger.info("✓ 브라우저 드라이버 생성")
+        return driver
+
+    def _acquire(self) -> _PooledDriver:
+        """유휴 드라이버를 꺼내거나, 여유가 있으면 새로 생성 (없으면 대기)"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("브라우저 풀이 종료되었습니다.")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._cond.wait()
+
+        # 드라이버 생성은 잠금 밖에서 (수 초 걸림)
+        try:
+            return _PooledDriver(self._create_driver())
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _discard(self, pooled: _PooledDriver):
+        """드라이버 종료 후 풀에서 제거"""
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    def _release(self, pooled: _PooledDriver, broken: bool):
+        """사용한 드라이버 반납 (오류 또는 사용 한도 초과 시 재시작)"""
+        pooled.pages += 1
+        if broken or pooled.pages >= self.max_pages or self._closed:
+            if not broken and pooled.pages >= self.max_pages:
+                logger.debug(f"드라이버 재시작 ({pooled.pages}페이지 처리)")
+            self._discard(pooled)
+            return
+
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self):
+        """드라이버 대여 (with 블록이 끝나면 자동 반납)"""
+        pooled = self._acquire()
+        broken = False
+        try:
+            yield pooled.driver
+        except TimeoutException:
+            # 느린 페이지일 뿐 드라이버는 정상 (TimeoutException도 WebDriverException이므로 먼저 처리)
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self._release(pooled, broken)
+
+    def fetch_html(self, url: str, wait_selector: str = 'body', wait_timeout: int = 10) -> str:
+        """페이지를 렌더링하여 HTML 반환"""
+        with self.lease() as driver:
+            driver.get(url)
+            WebDriverWait(driver, wait_timeout).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, wait_selector))
+            )
+            return driver.page_source
+
+    def shutdown(self):
+        """모든 드라이버 종료"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+
+        for pooled in idle:
+            self._discard(pooled)
+        if idle:
+            logger.info(f"✓ 브라우저 풀 종료 ({len(idle)}개 드라이버)")
+
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_browser_pool(size: int = 2, max_pages: int = 50) -> BrowserPool:
+    """프로세스 전체에서 공유하는 브라우저 풀 반환 (종료된 경우 새로 생성)"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool._closed:
+            _shared_pool = BrowserPool(size=size, max_pages=max_pages)
+        return _shared_pool
+
+
+def shutdown_browser_pool():
+    """공용 브라우저 풀 종료 (생성된 적이 없으면 아무 것도 하지 않음)"""
+    global _shared_pool
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+# 비정상 종료 시에도 Chrome 프로세스가 남지 않도록
+atexit.register(shutdown_browser_pool)
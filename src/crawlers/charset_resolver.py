@@ -0,0 +1,222 @@
+"""
+도메인별 문자 인코딩 캐시 모듈
+응답마다 apparent_encoding(본문 전체 chardet 감지)을 돌리는 대신,
+도메인의 인코딩을 한 번만 알아내 디스크(SQLite)에 저장하고 이후 페이지는 바이트에서 바로 디코딩
+
+인코딩 결정 순서:
+  1. Content-Type 헤더의 charset (명시된 경우만)
+  2. 도메인 캐시
+  3. 본문 앞부분의 <meta charset> / <meta http-equiv="Content-Type">
+  4. UTF-8 엄격 디코딩 성공 여부 → 실패하면 본문 앞부분으로 chardet 감지
+캐시된 인코딩으로 디코딩이 실패하면(사이트 인코딩 변경) 캐시를 지우고 다시 판단
+"""
+
+import os
+import re
+import time
+import codecs
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from requests.compat import chardet
+
+logger = logging.getLogger('CharsetResolver')
+
+# meta 태그는 문서 앞부분에 있으므로 이 범위만 검사
+SNIFF_BYTES = 4096
+# chardet 감지에 사용할 최대 바이트 (전체 본문 감지는 큰 페이지에서 느림)
+DETECT_BYTES = 64 * 1024
+
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+# 한국어 사이트의 euc-kr 표기는 실제로 cp949(확장 완성형) 문자를 포함하는 경우가 많음
+_ALIASES = {
+    'euc_kr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'ksc5601': 'cp949',
+    'iso-8859-1': None,   # requests 기본값/잘못된 선언이 대부분이라 신뢰하지 않음
+    'latin_1': None,
+    'ascii': 'utf-8',
+}
+
+
+def normalize_charset(name: Optional[str]) -> Optional[str]:
+    """인코딩 이름 정규화 (알 수 없거나 신뢰할 수 없는 이름이면 None)"""
+    if not name:
+        return None
+    name = name.strip().lower()
+    if name in _ALIASES:
+        return _ALIASES[name]
+    try:
+        canonical = codecs.lookup(name).name
+    except LookupError:
+        return None
+    if canonical in _ALIASES:
+        return _ALIASES[canonical]
+    return 'utf-8' if canonical == 'utf-8' else canonical
+
+
+def header_charset(headers) -> Optional[str]:
+    """Content-Type 헤더에 명시된 charset"""
+    match = _HEADER_CHARSET_RE.search(headers.get('Content-Type', '') or '')
+    return normalize_charset(match.group(1)) if match else None
+
+
+def meta_charset(body: bytes) -> Optional[str]:
+    """문서 앞부분 meta 태그에 선언된 charset"""
+    match = _META_CHARSET_RE.search(body[:SNIFF_BYTES])
+    return normalize_charset(match.group(1).decode('ascii', 'ignore')) if match else None
+
+
+def detect_charset(body: bytes) -> str:
+    """본문으로 인코딩 감지 (UTF-8 엄격 디코딩을 먼저 시도, 실패 시 앞부분만 chardet)"""
+    sample = body[:DETECT_BYTES]
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # 잘라낸 경계에서 멀티바이트 문자가 끊긴 경우는 UTF-8로 봄
+        if e.start >= len(sample) - 3 and len(body) > len(sample):
+            return 'utf-8'
+    detected = chardet.detect(sample) if chardet else {}
+    return normalize_charset(detected.get('encoding')) or 'utf-8'
+
+
+class CharsetResolver:
+    """
+    도메인별 인코딩 캐시
+    여러 스레드가 하나의 인스턴스를 공유할 수 있도록 내부 잠금 사용
+    """
+
+    def __init__(self, db_path: str = 'data/charset_cache.db'):
+        """
+        Args:
+            db_path: 캐시 DB 파일 경로 (상대 경로면 프로젝트 루트 기준)
+        """
+        if os.path.isabs(db_path):
+            self.db_path = db_path
+        else:
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            self.db_path = os.path.join(project_root, db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+        # 조회는 메모리에서만 (도메인 수가 적어 전체를 올려 둠)
+        self._charsets: Dict[str, str] = dict(
+            self._conn.execute('SELECT domain, charset FROM charsets').fetchall()
+        )
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS charsets (
+                    domain TEXT PRIMARY KEY,
+                    charset TEXT NOT NULL,
+                    source TEXT,
+                    updated_at REAL
+                )
+            ''')
+            self._conn.commit()
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url or '').netloc.lower()
+
+    def get(self, url: str) -> Optional[str]:
+        """도메인에 저장된 인코딩 (없으면 None)"""
+        with self._lock:
+            return self._charsets.get(self._domain(url))
+
+    def learn(self, url: str, charset: str, source: str):
+        """도메인 인코딩 저장 (같은 값이면 기록하지 않음)"""
+        domain = self._domain(url)
+        if not domain:
+            return
+        with self._lock:
+            if self._charsets.get(domain) == charset:
+                return
+            self._charsets[domain] = charset
+            self._conn.execute('''
+                INSERT OR REPLACE INTO charsets (domain, charset, source, updated_at) VALUES (?, ?, ?, ?)
+            ''', (domain, charset, source, time.time()))
+            self._conn.commit()
+        logger.info(f"✓ 인코딩 저장: {domain} → {charset} ({source})")
+
+    def forget(self, url: str):
+        """도메인 인코딩 삭제 (다음 응답에서 다시 판단)"""
+        domain = self._domain(url)
+        with self._lock:
+            if self._charsets.pop(domain, None) is not None:
+                self._conn.execute('DELETE FROM charsets WHERE domain = ?', (domain,))
+                self._conn.commit()
+
+    def resolve(self, response) -> str:
+        """응답의 인코딩 결정 (헤더 → 도메인 캐시 → meta 태그 → 감지 순)"""
+        url = response.url
+        charset = header_charset(response.headers)
+        if charset:
+            self.learn(url, charset, 'header')
+            return charset
+
+        charset = self.get(url)
+        if charset:
+            return charset
+
+        body = response.content or b''
+        charset = meta_charset(body)
+        source = 'meta'
+        if not charset:
+            charset = detect_charset(body)
+            source = 'detect'
+        self.learn(url, charset, source)
+        return charset
+
+    def apply(self, response):
+        """response.encoding 설정 (이후 response.text가 chardet 감지 없이 디코딩)"""
+        response.encoding = self.resolve(response)
+        return response
+
+    def decode(self, response) -> str:
+        """
+        응답 본문 디코딩
+        캐시된 인코딩으로 디코딩이 안 되면 도메인 캐시를 지우고 다시 판단
+        """
+        body = response.content or b''
+        charset = self.resolve(response)
+        try:
+            text = body.decode(charset)
+        except (UnicodeDecodeError, LookupError):
+            if header_charset(response.headers):
+                # 헤더 선언이 틀린 경우는 본문으로만 판단
+                charset = meta_charset(body) or detect_charset(body)
+            else:
+                self.forget(response.url)
+                charset = self.resolve(response)
+            text = body.decode(charset, errors='replace')
+        response.encoding = charset
+        return text
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+_shared_resolver: Optional[CharsetResolver] = None
+_shared_resolver_lock = threading.Lock()
+
+
+def get_charset_resolver() -> CharsetResolver:
+    """프로세스 전체에서 공유하는 인코딩 캐시 인스턴스 반환"""
+    global _shared_resolver
+    with _shared_resolver_lock:
+        if _shared_resolver is None:
+            _shared_resolver = CharsetResolver()
+        return _shared_resolver
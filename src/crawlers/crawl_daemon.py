@@ -0,0 +1,419 @@
+"""
+상시 수집 데몬
+사이트마다 피드 또는 첫 목록 페이지를 주기적으로 확인하여, 이미 아는 URL이 나오면 멈추고
+새 기사만 상세 수집해 바로 news_scraped.db에 저장 (30일 치를 매번 다시 수집하지 않음)
+
+- 사이트별 확인 주기: 관측한 게재 속도(분당 새 기사 수)의 지수 가중 이동 평균(EWMA)으로 조절
+  새 기사가 target_new개쯤 쌓였을 때 확인하도록 min_interval ~ max_interval 사이에서 정함
+- 요청이 실패하면 주기를 두 배로 늘려 물러남
+- 사이트별 게재 속도/주기는 data/crawl_daemon.db에 저장하여 재시작해도 이어서 사용
+- 저장한 기사는 is_processed=0이므로 감성 분석 배치(analyzer)가 그대로 이어서 처리
+
+사용 예시:
+  python crawl_daemon.py
+  python crawl_daemon.py --sites chungcheong_cctoday jeju_jeju --min-interval 120
+  python crawl_daemon.py --once
+  python crawl_daemon.py --status
+"""
+
+import os
+import time
+import signal
+import sqlite3
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from scraping_engine import SiteSpec, SpecCrawler, SITE_SPECS, OLDER, get_site_logger
+from database_manager import DatabaseManager, scraped_row_to_article
+from url_index import KnownUrlIndex
+from transport import create_session
+from crawl_metrics import get_crawl_metrics
+from scraper.utils import get_common_headers
+
+logger = logging.getLogger('CrawlDaemon')
+
+SCRAPED_DB = 'data/news_scraped.db'
+
+
+class SiteSchedule:
+    """사이트 하나의 확인 주기 (게재 속도 EWMA 기반)"""
+
+    def __init__(self, key: str, min_interval: float, max_interval: float, target_new: float = 2.0,
+                 alpha: float = 0.3, rate: Optional[float] = None, interval: Optional[float] = None,
+                 last_poll: Optional[float] = None):
+        """
+        Args:
+            key: 사이트 키
+            min_interval / max_interval: 확인 주기 범위(초)
+            target_new: 한 번 확인할 때 기대하는 새 기사 수
+            alpha: EWMA 가중치 (클수록 최근 관측을 빠르게 반영)
+            rate / interval / last_poll: 저장된 상태 (없으면 첫 확인부터 관측)
+        """
+        self.key = key
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.alpha = alpha
+        self.rate = rate
+        self.interval = interval or min_interval
+        self.last_poll = last_poll
+        self.failures = 0
+
+    @property
+    def next_poll(self) -> float:
+        return (self.last_poll or 0) + self.interval
+
+    def _clamp(self, seconds: float) -> float:
+        return max(self.min_interval, min(self.max_interval, seconds))
+
+    def observe(self, new_count: int, now: Optional[float] = None) -> float:
+        """확인 결과 반영 → 다음 확인까지 대기 시간(초)"""
+        now = time.time() if now is None else now
+        # 첫 확인은 밀린 기사까지 한꺼번에 찾으므로 게재 속도 관측에서 제외
+        if self.last_poll is not None and now > self.last_poll:
+            observed = new_count / ((now - self.last_poll) / 60)
+            self.rate = observed if self.rate is None else self.alpha * observed + (1 - self.alpha) * self.rate
+        self.last_poll = now
+        self.failures = 0
+        if self.rate:
+            self.interval = self._clamp(self.target_new / self.rate * 60)
+        elif self.rate is not None:
+            self.interval = self.max_interval
+        return self.interval
+
+    def backoff(self, now: Optional[float] = None) -> float:
+        """확인 실패 → 주기를 두 배로 (최대 max_interval)"""
+        self.last_poll = time.time() if now is None else now
+        self.failures += 1
+        self.interval = self._clamp(self.interval * 2)
+        return self.interval
+
+
+class PollState:
+    """
+    사이트별 확인 주기 저장소 (SQLite)
+    여러 사이트 스레드가 하나의 인스턴스를 공유할 수 있도록 내부 잠금 사용
+    """
+
+    def __init__(self, db_path: str = 'data/crawl_daemon.db'):
+        """
+        Args:
+            db_path: 상태 DB 파일 경로 (상대 경로면 프로젝트 루트 기준)
+        """
+        if os.path.isabs(db_path):
+            self.db_path = db_path
+        else:
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            self.db_path = os.path.join(project_root, db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS sites (
+                    key TEXT PRIMARY KEY,
+                    rate REAL,
+                    interval REAL,
+                    last_poll REAL,
+                    polls INTEGER DEFAULT 0,
+                    articles INTEGER DEFAULT 0,
+                    last_article_at REAL
+                )
+            ''')
+            self._conn.commit()
+
+    def load(self, key: str) -> Dict:
+        """저장된 상태 (없으면 빈 딕셔너리)"""
+        with self._lock:
+            row = self._conn.execute('SELECT rate, interval, last_poll FROM sites WHERE key = ?', (key,)).fetchone()
+        if not row:
+            return {}
+        return {'rate': row[0], 'interval': row[1], 'last_poll': row[2]}
+
+    def save(self, schedule: SiteSchedule, new_count: int = 0) -> None:
+        """확인 결과 저장 (확인 횟수/누적 기사 수 갱신)"""
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO sites (key, rate, interval, last_poll, polls, articles, last_article_at)
+                VALUES (?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    rate = excluded.rate, interval = excluded.interval, last_poll = excluded.last_poll,
+                    polls = polls + 1, articles = articles + excluded.articles,
+                    last_article_at = COALESCE(excluded.last_article_at, last_article_at)
+            ''', (schedule.key, schedule.rate, schedule.interval, schedule.last_poll, new_count,
+                  schedule.last_poll if new_count else None))
+            self._conn.commit()
+
+    def all(self) -> List[Dict]:
+        """전체 사이트 상태"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, rate, interval, last_poll, polls, articles, last_article_at FROM sites ORDER BY key'
+            ).fetchall()
+        columns = ('key', 'rate', 'interval', 'last_poll', 'polls', 'articles', 'last_article_at')
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+class CrawlDaemon:
+    """
+    사이트별 스레드가 각자의 주기로 새 기사를 확인하는 상시 수집기
+
+    - 피드(spec의 feeds)가 있으면 피드로, 없거나 읽을 수 없으면 목록 1페이지부터 확인
+    - 이미 아는 URL(KnownUrlIndex)이 나오면 더 이상 페이지를 넘기지 않음
+    - 상세 수집은 모든 사이트가 공유하는 executor에서 처리하고, 결과는 바로 DB에 저장
+    """
+
+    def __init__(self, site_keys: Optional[List[str]] = None, min_interval: float = 60,
+                 max_interval: float = 1800, target_new: float = 2.0, lookback_days: int = 1,
+                 max_pages: int = 5, max_workers: int = 8, db_path: str = SCRAPED_DB,
+                 state_path: str = 'data/crawl_daemon.db', transport: Optional[str] = None,
+                 maintenance_interval: float = 600):
+        """
+        Args:
+            site_keys: 확인할 사이트 키 (None이면 SITE_SPECS 전체)
+            min_interval / max_interval: 사이트별 확인 주기 범위(초)
+            target_new: 한 번 확인할 때 기대하는 새 기사 수 (게재 속도로 주기 계산)
+            lookback_days: 이보다 오래된 기사는 새 기사로 보지 않음 (처음 실행할 때 밀린 기사 범위)
+            max_pages: 한 번 확인할 때 읽을 최대 목록 페이지 수
+            max_workers: 전체 사이트가 공유하는 상세 페이지 작업자 수
+            db_path: 기사를 저장할 DB
+            state_path: 확인 주기 상태 DB
+            transport: HTTP 전송 백엔드 ('requests' 또는 'httpx', None이면 CRAWLER_TRANSPORT 환경 변수)
+            maintenance_interval: URL 인덱스 갱신/저장과 계측 결과 저장 주기(초)
+        """
+        keys = site_keys or list(SITE_SPECS.keys())
+        unknown = [key for key in keys if key not in SITE_SPECS]
+        if unknown:
+            raise ValueError(f"알 수 없는 사이트: {', '.join(unknown)}")
+
+        self.specs = [SiteSpec(key, SITE_SPECS[key]) for key in keys]
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.lookback_days = lookback_days
+        self.max_pages = max_pages
+        self.maintenance_interval = maintenance_interval
+
+        self.known_urls = KnownUrlIndex.load_or_build()
+        self.db = DatabaseManager(db_path)
+        self.state = PollState(state_path)
+        self.session = create_session(pool_size=max(10, max_workers), hosts=len(self.specs) * 2,
+                                      headers=get_common_headers(), verify=False, backend=transport)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='daemon')
+
+        self._stop = threading.Event()
+        self._db_lock = threading.Lock()
+        # 상세 수집이 계속 실패하는 URL은 몇 번 시도 후 아는 URL로 처리 (매번 다시 요청하지 않도록)
+        self._attempts: Dict[str, int] = {}
+        self._attempts_lock = threading.Lock()
+        self.max_attempts = 3
+
+    def _crawler(self, spec: SiteSpec) -> SpecCrawler:
+        # 목록은 항상 새로 받아야 하므로 HTTP 캐시를 쓰지 않음 (피드는 조건부 GET)
+        return SpecCrawler(spec, session=self.session, cache=None, known_urls=self.known_urls,
+                           logger=get_site_logger(spec.key))
+
+    def _new_entries(self, crawler: SpecCrawler, limit_date: str) -> List[Dict]:
+        """피드 또는 목록 페이지에서 아직 모르는 기사 항목"""
+        spec = crawler.spec
+        discovered = crawler.discover_items(limit_date, set())
+        if discovered is not None:
+            entries, complete = discovered
+            # 피드가 기준일까지 닿지 않았는데 모두 새 기사면 피드 밖에도 새 기사가 있을 수 있음
+            if complete or not entries:
+                return entries
+            seen = {entry['article_url'] for entry in entries}
+        else:
+            entries, seen = [], set()
+
+        for list_url in spec.list_urls:
+            for entry in crawler.poll_list_items(list_url, limit_date, self.max_pages):
+                if entry['article_url'] not in seen:
+                    seen.add(entry['article_url'])
+                    entries.append(entry)
+        return entries
+
+    def _settle(self, url: str, done: bool) -> None:
+        """처리 결과에 따라 아는 URL로 등록 (실패는 max_attempts번째에 등록)"""
+        if not done:
+            with self._attempts_lock:
+                self._attempts[url] = self._attempts.get(url, 0) + 1
+                if self._attempts[url] < self.max_attempts:
+                    return
+        with self._attempts_lock:
+            self._attempts.pop(url, None)
+        self.known_urls.add(url)
+
+    def poll_site(self, crawler: SpecCrawler) -> int:
+        """사이트 한 번 확인 → 저장한 새 기사 수"""
+        limit_date = (datetime.now() - timedelta(days=self.lookback_days)).strftime('%Y-%m-%d')
+        entries = self._new_entries(crawler, limit_date)
+        if not entries:
+            return 0
+
+        results = list(self.executor.map(lambda entry: crawler.process_item(entry, limit_date), entries))
+        articles = []
+        for entry, result in zip(entries, results):
+            if isinstance(result, dict):
+                articles.append(scraped_row_to_article(result))
+            self._settle(entry['article_url'], isinstance(result, dict) or result == OLDER)
+
+        if not articles:
+            return 0
+        with self._db_lock:
+            return self.db.insert_articles(articles)
+
+    def _site_loop(self, spec: SiteSpec) -> None:
+        """사이트 하나를 주기적으로 확인 (stop()까지)"""
+        crawler = self._crawler(spec)
+        site_logger = crawler.logger
+        schedule = SiteSchedule(spec.key, self.min_interval, self.max_interval, self.target_new,
+                                **self.state.load(spec.key))
+        # 재시작했으면 지난번에 정한 다음 확인 시각까지 대기
+        delay = max(0.0, schedule.next_poll - time.time())
+        while not self._stop.wait(delay):
+            new_count = 0
+            try:
+                new_count = self.poll_site(crawler)
+                delay = schedule.observe(new_count)
+                rate = f"분당 {schedule.rate:.2f}개" if schedule.rate is not None else "게재 속도 관측 전"
+                site_logger.info(f"새 기사 {new_count}개 저장 → {delay:.0f}초 후 다시 확인 ({rate})")
+            except Exception as e:
+                delay = schedule.backoff()
+                site_logger.error(f"확인 실패 ({schedule.failures}회 연속): {e} → {delay:.0f}초 후 다시 시도")
+            self.state.save(schedule, new_count)
+
+    def _maintain(self) -> None:
+        """다른 수집 작업이 저장한 URL 반영, 인덱스와 계측 결과 저장"""
+        try:
+            self.known_urls.refresh()
+            self.known_urls.save()
+            get_crawl_metrics().export('crawl_daemon')
+        except Exception as e:
+            logger.warning(f"주기 작업 실패: {e}")
+
+    def run(self) -> None:
+        """사이트별 확인 스레드 실행 (stop() 또는 Ctrl+C까지)"""
+        logger.info(f"✓ 상시 수집 시작: {len(self.specs)}개 사이트 "
+                    f"(확인 주기 {self.min_interval:.0f}~{self.max_interval:.0f}초)")
+        threads = [threading.Thread(target=self._site_loop, args=(spec,), name=f"daemon-{spec.key}", daemon=True)
+                   for spec in self.specs]
+        for thread in threads:
+            thread.start()
+        try:
+            while not self._stop.wait(self.maintenance_interval):
+                self._maintain()
+        except KeyboardInterrupt:
+            self.stop()
+        for thread in threads:
+            thread.join()
+        self._maintain()
+        logger.info("✓ 상시 수집 종료")
+
+    def run_once(self) -> Dict[str, int]:
+        """모든 사이트를 한 번씩 동시에 확인 (cron 등 외부 스케줄러용) → 사이트별 저장 건수"""
+        counts = {}
+
+        def poll(spec):
+            schedule = SiteSchedule(spec.key, self.min_interval, self.max_interval, self.target_new,
+                                    **self.state.load(spec.key))
+            try:
+                counts[spec.key] = self.poll_site(self._crawler(spec))
+                schedule.observe(counts[spec.key])
+            except Exception as e:
+                counts[spec.key] = 0
+                schedule.backoff()
+                logger.error(f"{spec.key} 확인 실패: {e}")
+            self.state.save(schedule, counts[spec.key])
+
+        threads = [threading.Thread(target=poll, args=(spec,), name=f"daemon-{spec.key}", daemon=True)
+                   for spec in self.specs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._maintain()
+        return counts
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+        self.state.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def print_status(state_path: str = 'data/crawl_daemon.db') -> None:
+    """사이트별 게재 속도/확인 주기 출력"""
+    state = PollState(state_path)
+    print(f"{'사이트':<24}{'분당 기사':>10}{'주기(초)':>10}{'확인':>8}{'저장':>8}  마지막 확인 / 새 기사")
+    for site in state.all():
+        last_poll = datetime.fromtimestamp(site['last_poll']).strftime('%m-%d %H:%M') if site['last_poll'] else '-'
+        last_new = (datetime.fromtimestamp(site['last_article_at']).strftime('%m-%d %H:%M')
+                    if site['last_article_at'] else '-')
+        rate = f"{site['rate']:.2f}" if site['rate'] is not None else '-'
+        print(f"{site['key']:<24}{rate:>10}{site['interval'] or 0:>10.0f}{site['polls']:>8}{site['articles']:>8}"
+              f"  {last_poll} / {last_new}")
+    state.close()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='새 기사 상시 수집 데몬')
+    parser.add_argument('--sites', nargs='+', choices=list(SITE_SPECS.keys()), help='확인할 사이트 (기본값: 전체)')
+    parser.add_argument('--min-interval', type=float, default=60, help='최소 확인 주기(초)')
+    parser.add_argument('--max-interval', type=float, default=1800, help='최대 확인 주기(초)')
+    parser.add_argument('--target-new', type=float, default=2.0, help='한 번 확인할 때 기대하는 새 기사 수')
+    parser.add_argument('--lookback-days', type=int, default=1, help='새 기사로 볼 기간 (일)')
+    parser.add_argument('--max-pages', type=int, default=5, help='한 번 확인할 때 읽을 최대 목록 페이지 수')
+    parser.add_argument('--workers', type=int, default=8, help='전체 사이트가 공유하는 작업자 수')
+    parser.add_argument('--db', default=SCRAPED_DB, help='기사를 저장할 DB')
+    parser.add_argument('--transport', choices=['requests', 'httpx'],
+                        help='HTTP 전송 백엔드 (기본값: CRAWLER_TRANSPORT 환경 변수)')
+    parser.add_argument('--once', action='store_true', help='모든 사이트를 한 번만 확인하고 종료')
+    parser.add_argument('--status', action='store_true', help='사이트별 확인 주기 상태 출력')
+    args = parser.parse_args()
+
+    if args.status:
+        print_status()
+        return
+
+    with CrawlDaemon(args.sites, min_interval=args.min_interval, max_interval=args.max_interval,
+                     target_new=args.target_new, lookback_days=args.lookback_days, max_pages=args.max_pages,
+                     max_workers=args.workers, db_path=args.db, transport=args.transport) as daemon:
+        if args.once:
+            counts = daemon.run_once()
+            for key, count in counts.items():
+                print(f"{key:<24}{count:>6}건")
+            return
+
+        # 서비스 관리자의 종료 요청(SIGTERM)도 Ctrl+C와 같이 정리 후 종료
+        signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+        daemon.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+"""
+크롤링 계측 모듈
+도메인/단계(list, article)별로 요청 지연 시간, 상태 코드, 재시도, 다운로드 바이트, 파싱 시간,
+선택자 적중/실패, 초당 기사 수를 기록하고 실행이 끝나면 파일로 내보냄
+
+- Prometheus 텍스트 형식 (node_exporter textfile collector로 수집 가능): <디렉터리>/<이름>.prom
+- JSON 요약 (도메인별 p50/p95/p99 등): <디렉터리>/<이름>_summary.json
+
+사이트별 동시 요청 수(workers)를 조정할 때 어느 사이트가 느린지, 요청과 파싱 중
+어느 쪽이 시간을 더 쓰는지 확인하는 용도
+"""
+
+import os
+import json
+import time
+import random
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger('CrawlMetrics')
+
+# Prometheus 히스토그램 구간(초)
+FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# 분위수 계산용으로 보관할 최대 표본 수 (초과하면 저수지 표집)
+MAX_SAMPLES = 10000
+
+DEFAULT_METRICS_DIR = 'data/metrics'
+
+
+def domain_of(url: str) -> str:
+    """URL의 도메인 (URL이 아니면 그대로 사용)"""
+    return urlparse(url).netloc.lower() or url if url else 'unknown'
+
+
+class _Distribution:
+    """히스토그램 구간 집계 + 분위수용 표본"""
+
+    __slots__ = ('buckets', 'counts', 'total', 'count', 'samples')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+        self.samples: List[float] = []
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = value
+
+    def quantile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def cumulative(self) -> List[int]:
+        """Prometheus 형식의 누적 구간 개수"""
+        result, running = [], 0
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+class CrawlMetrics:
+    """
+    크롤링 계측 값 저장소
+    여러 스레드가 하나의 인스턴스를 공유할 수 있도록 내부 잠금 사용
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """모든 값 초기화 (실행 시작 시각도 다시 기록)"""
+        with self._lock:
+            self.started_at = time.time()
+            self._fetch = defaultdict(lambda: _Distribution(FETCH_BUCKETS))     # (domain, stage)
+            self._parse = defaultdict(lambda: _Distribution(PARSE_BUCKETS))     # (domain, stage)
+            self._status = defaultdict(int)                                     # (domain, stage, status)
+            self._retries = defaultdict(int)                                    # (domain, stage)
+            self._bytes = defaultdict(int)                                      # (domain, stage)
+            self._selectors = defaultdict(lambda: [0, 0])                       # (domain, field, selector) → [hit, miss]
+            self._articles = defaultdict(int)                                   # domain
+            self._first_article = {}
+            self._last_article = {}
+
+    # ---- 기록 ----
+
+    def observe_fetch(self, url: str, seconds: float, status, nbytes: int = 0, stage: str = 'article'):
+        """
+        요청 한 번 기록
+
+        Args:
+            url: 요청 URL
+            seconds: 응답까지 걸린 시간
+            status: HTTP 상태 코드, 'cache'(유효한 캐시 사용) 또는 'error'(예외)
+            nbytes: 받은 본문 크기
+            stage: 'list', 'article' 또는 'feed'
+        """
+        key = (domain_of(url), stage)
+        with self._lock:
+            if status != 'cache':
+                self._fetch[key].observe(seconds)
+            self._status[key + (str(status),)] += 1
+            self._bytes[key] += nbytes
+
+    def record_retry(self, url: str, stage: str = 'article'):
+        with self._lock:
+            self._retries[(domain_of(url), stage)] += 1
+
+    def observe_parse(self, url: str, seconds: float, stage: str = 'article'):
+        with self._lock:
+            self._parse[(domain_of(url), stage)].observe(seconds)
+
+    def record_selector(self, url: str, field: str, selector: str, hit: bool):
+        with self._lock:
+            self._selectors[(domain_of(url), field, selector)][0 if hit else 1] += 1
+
+    def selector_recorder(self, url: str, field: str):
+        """SelectorPlan 등에 넘길 (selector, hit) 기록 함수 (hit: 그 선택자가 채택됨)"""
+        domain = domain_of(url)
+
+        def record(selector: str, hit: bool):
+            self.record_selector(domain, field, selector, hit)
+        return record
+
+    def record_articles(self, url: str, count: int = 1):
+        """수집 완료된 기사 수 기록 (초당 기사 수 계산용)"""
+        if count <= 0:
+            return
+        domain = domain_of(url)
+        now = time.time()
+        with self._lock:
+            self._articles[domain] += count
+            self._first_article.setdefault(domain, now)
+            self._last_article[domain] = now
+
+    # ---- 프로세스 간 전달 ----
+
+    def drain(self) -> Dict:
+        """
+        지금까지 기록한 파싱 시간, 선택자 적중, 기사 수를 꺼내고 초기화 (피클 가능한 딕셔너리)
+        파싱 작업자 프로세스(parse_pool)에서 작업마다 호출하고, 메인 프로세스에서 merge로 합침
+        """
+        with self._lock:
+            events = {
+                'parse': {key: list(dist.samples) for key, dist in self._parse.items()},
+                'selectors': {key: list(counts) for key, counts in self._selectors.items()},
+                'articles': dict(self._articles),
+            }
+        self.reset()
+        return events
+
+    def merge(self, events: Dict):
+        """drain으로 꺼낸 다른 프로세스의 기록 합치기"""
+        for (domain, stage), samples in events.get('parse', {}).items():
+            for seconds in samples:
+                self.observe_parse(domain, seconds, stage)
+        with self._lock:
+            for key, (hits, misses) in events.get('selectors', {}).items():
+                counts = self._selectors[key]
+                counts[0] += hits
+                counts[1] += misses
+        for domain, count in events.get('articles', {}).items():
+            self.record_articles(domain, count)
+
+    # ---- 요약 / 내보내기 ----
+
+    def summary(self) -> Dict:
+        """도메인별 요약 (JSON 직렬화 가능)"""
+        with self._lock:
+            elapsed = max(time.time() - self.started_at, 1e-9)
+            domains = defaultdict(lambda: {'stages': {}, 'selectors': {}, 'articles': 0, 'articles_per_second': 0.0})
+
+            stage_keys = set(self._fetch) | set(self._parse) | set(self._bytes) | set(self._retries)
+            stage_keys |= {key[:2] for key in self._status}
+            for domain, stage in sorted(stage_keys):
+                fetch = self._fetch.get((domain, stage))
+                parse = self._parse.get((domain, stage))
+                domains[domain]['stages'][stage] = {
+                    'requests': fetch.count if fetch else 0,
+                    'fetch_p50': round(fetch.quantile(0.5), 4) if fetch else 0.0,
+                    'fetch_p95': round(fetch.quantile(0.95), 4) if fetch else 0.0,
+                    'fetch_p99': round(fetch.quantile(0.99), 4) if fetch else 0.0,
+                    'fetch_seconds': round(fetch.total, 3) if fetch else 0.0,
+                    'parse_p50': round(parse.quantile(0.5), 5) if parse else 0.0,
+                    'parse_p95': round(parse.quantile(0.95), 5) if parse else 0.0,
+                    'parse_seconds': round(parse.total, 3) if parse else 0.0,
+                    'status': {status: count for (d, s, status), count in self._status.items()
+                               if d == domain and s == stage},
+                    'retries': self._retries.get((domain, stage), 0),
+                    'bytes': self._bytes.get((domain, stage), 0),
+                }
+
+            for (domain, field, selector), (hits, misses) in sorted(self._selectors.items()):
+                domains[domain]['selectors'].setdefault(field, {})[selector] = {'hit': hits, 'miss': misses}
+
+            for domain, count in self._articles.items():
+                span = self._last_article[domain] - self._first_article[domain]
+                domains[domain]['articles'] = count
+                # 첫 기사부터 마지막 기사까지의 처리 속도 (한 건이면 전체 실행 시간 기준)
+                domains[domain]['articles_per_second'] = round(count / (span if span > 0 else elapsed), 3)
+
+            return {
+                'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+                'elapsed_seconds': round(elapsed, 3),
+                'domains': dict(domains),
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines = []
+        summary = self.summary()
+
+        def histograms(name: str, help_text: str, distributions: Dict):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (domain, stage), dist in sorted(distributions.items()):
+                for bound, count in zip(dist.buckets, dist.cumulative()):
+                    lines.append(f"{name}_bucket{_labels(domain=domain, stage=stage, le=bound)} {count}")
+                lines.append(f"{name}_bucket{_labels(domain=domain, stage=stage, le='+Inf')} {dist.count}")
+                lines.append(f"{name}_sum{_labels(domain=domain, stage=stage)} {dist.total:.6f}")
+                lines.append(f"{name}_count{_labels(domain=domain, stage=stage)} {dist.count}")
+
+        def counters(name: str, help_text: str, values: Dict, label_names):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(values.items()):
+                lines.append(f"{name}{_labels(**dict(zip(label_names, key)))} {value}")
+
+        with self._lock:
+            histograms('crawler_fetch_duration_seconds', '요청 응답 시간', dict(self._fetch))
+            histograms('crawler_parse_duration_seconds', 'HTML 파싱/추출 시간', dict(self._parse))
+            counters('crawler_responses_total', '상태 코드별 응답 수', dict(self._status), ('domain', 'stage', 'status'))
+            counters('crawler_retries_total', '재시도 수', dict(self._retries), ('domain', 'stage'))
+            counters('crawler_bytes_total', '받은 본문 바이트', dict(self._bytes), ('domain', 'stage'))
+            lines.append("# HELP crawler_selector_total 선택자 적중/실패 수")
+            lines.append("# TYPE crawler_selector_total counter")
+            for (domain, field, selector), (hits, misses) in sorted(self._selectors.items()):
+                lines.append(f"crawler_selector_total{_labels(domain=domain, field=field, selector=selector, result='hit')} {hits}")
+                lines.append(f"crawler_selector_total{_labels(domain=domain, field=field, selector=selector, result='miss')} {misses}")
+            counters('crawler_articles_total', '수집된 기사 수', {(d,): c for d, c in self._articles.items()}, ('domain',))
+
+        lines.append("# HELP crawler_articles_per_second 도메인별 초당 기사 수")
+        lines.append("# TYPE crawler_articles_per_second gauge")
+        for domain, info in sorted(summary['domains'].items()):
+            if info['articles']:
+                lines.append(f"crawler_articles_per_second{_labels(domain=domain)} {info['articles_per_second']}")
+        lines.append("# HELP crawler_run_duration_seconds 실행 시간")
+        lines.append("# TYPE crawler_run_duration_seconds gauge")
+        lines.append(f"crawler_run_duration_seconds {summary['elapsed_seconds']}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, name: str = 'crawl', directory: str = DEFAULT_METRICS_DIR) -> Dict[str, str]:
+        """
+        Prometheus 텍스트 파일과 JSON 요약 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            name: 파일 이름 (<name>.prom, <name>_summary.json)
+            directory: 저장 디렉터리 (상대 경로면 프로젝트 루트 기준)
+
+        Returns:
+            {'prometheus': 경로, 'json': 경로}
+        """
+        if not os.path.isabs(directory):
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            directory = os.path.join(project_root, directory)
+        os.makedirs(directory, exist_ok=True)
+
+        paths = {
+            'prometheus': os.path.join(directory, f"{name}.prom"),
+            'json': os.path.join(directory, f"{name}_summary.json"),
+        }
+        contents = {
+            'prometheus': self.to_prometheus(),
+            'json': json.dumps(self.summary(), ensure_ascii=False, indent=2),
+        }
+        for kind, path in paths.items():
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(contents[kind])
+            os.replace(tmp_path, path)
+        logger.info(f"✓ 계측 결과 저장: {paths['prometheus']}, {paths['json']}")
+        return paths
+
+    def log_summary(self, log=None):
+        """도메인별 요약 표 로그 출력"""
+        log = log or logger
+        summary = self.summary()
+        log.info(f"{'도메인':<28}{'단계':<9}{'요청':>6}{'p50':>8}{'p95':>8}{'p99':>8}{'파싱p50':>9}{'재시도':>6}{'MB':>8}")
+        for domain, info in sorted(summary['domains'].items()):
+            for stage, s in sorted(info['stages'].items()):
+                log.info(f"{domain:<28}{stage:<9}{s['requests']:>6}{s['fetch_p50']:>8.2f}{s['fetch_p95']:>8.2f}"
+                         f"{s['fetch_p99']:>8.2f}{s['parse_p50']:>9.3f}{s['retries']:>6}{s['bytes'] / 1e6:>8.2f}")
+            if info['articles']:
+                log.info(f"{domain:<28}기사 {info['articles']}건, {info['articles_per_second']:.2f}건/초")
+
+
+_shared_metrics: Optional[CrawlMetrics] = None
+_shared_metrics_lock = threading.Lock()
+
+
+def get_crawl_metrics() -> CrawlMetrics:
+    """프로세스 전체에서 공유하는 계측 인스턴스 반환"""
+    global _shared_metrics
+    with _shared_metrics_lock:
+        if _shared_metrics is None:
+            _shared_metrics = CrawlMetrics()
+        return _shared_metrics
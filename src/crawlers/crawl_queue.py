@@ -0,0 +1,594 @@
+"""
+SQLite 기반 크롤 작업 큐
+기사 URL을 작업으로 등록해 두고, 여러 작업자 프로세스(같은 서버 또는 볼륨을 공유하는 여러 서버)가
+임대(lease) 방식으로 가져가 처리
+
+- 임대 시간(visibility timeout) 안에 완료하지 못한 작업은 다른 작업자가 다시 가져감
+- 실패한 작업은 지수 백오프로 재시도, max_attempts를 넘으면 failed
+- 도메인별 공정성: 가장 오래 전에 임대된 도메인의 작업부터, 도메인당 동시 임대 수 제한
+- 여러 서버에서 공유할 때는 파일 잠금이 동작하는 볼륨이어야 함 (SQLite 제약)
+
+작업 종류 (kind):
+  crawler  BaseCrawler.parse_article(url)        payload: {"crawler": "모듈.클래스"}
+  article  scraping_engine 사이트 설정으로 수집     payload: {"site": 키, "entry": 목록 항목, "limit_date", "end_date"}
+  details  scraper/utils.fetch_article_details    payload: {"selectors": {...}}
+
+사용 예시:
+  python crawl_queue.py enqueue-sites --sites seoul_seoul jeju_jeju --days 7
+  python crawl_queue.py enqueue-crawlers --max-articles 50
+  python crawl_queue.py worker --threads 8          (여러 프로세스/서버에서 동시에 실행 가능)
+  python crawl_queue.py stats
+  python crawl_queue.py export
+"""
+
+import os
+import json
+import time
+import socket
+import logging
+import argparse
+import importlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+import sqlite3
+
+from crawl_metrics import get_crawl_metrics
+
+logger = logging.getLogger('CrawlQueue')
+
+DEFAULT_DB_PATH = 'data/crawl_queue.db'
+
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class CrawlQueue:
+    """
+    SQLite 크롤 작업 큐 (프로세스 간 공유 가능)
+    같은 프로세스의 스레드는 하나의 연결을 잠금으로 공유하고,
+    프로세스 간에는 SQLite 파일 잠금(BEGIN IMMEDIATE)으로 임대를 직렬화
+    """
+
+    def __init__(self,
+                 db_path: str = DEFAULT_DB_PATH,
+                 visibility_timeout: float = 300.0,
+                 max_attempts: int = 3,
+                 retry_backoff: float = 30.0,
+                 per_domain_limit: int = 4):
+        """
+        Args:
+            db_path: 큐 DB 파일 경로 (상대 경로면 프로젝트 루트 기준)
+            visibility_timeout: 임대 유지 시간(초), 지나면 다른 작업자가 다시 가져감
+            max_attempts: 작업당 최대 시도 횟수
+            retry_backoff: 첫 재시도 대기 시간(초), 시도마다 두 배
+            per_domain_limit: 도메인당 동시에 임대할 수 있는 최대 작업 수
+        """
+        if os.path.isabs(db_path):
+            self.db_path = db_path
+        else:
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            self.db_path = os.path.join(project_root, db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.per_domain_limit = per_domain_limit
+
+        self._lock = threading.Lock()
+        # 트랜잭션은 직접 관리 (isolation_level=None), 다른 프로세스가 쓰는 중이면 최대 30초 대기
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL UNIQUE,
+                    domain TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    payload TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, domain, available_at)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs (status, lease_expires)')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS domains (
+                    domain TEXT PRIMARY KEY,
+                    last_leased REAL NOT NULL DEFAULT 0
+                )
+            ''')
+
+    def _transaction(self):
+        """쓰기 잠금을 바로 잡는 트랜잭션 시작 (다른 프로세스와 임대가 겹치지 않도록)"""
+        self._conn.execute('BEGIN IMMEDIATE')
+
+    # ---- 등록 ----
+
+    def enqueue(self, url: str, kind: str, payload: Optional[Dict] = None) -> bool:
+        """작업 등록 (이미 있는 URL이면 무시하고 False)"""
+        return self.enqueue_many([url], kind, payload) == 1
+
+    def enqueue_many(self, urls: Iterable[str], kind: str, payload: Optional[Dict] = None,
+                     payloads: Optional[List[Dict]] = None) -> int:
+        """
+        작업 여러 개 등록
+
+        Args:
+            urls: URL 목록
+            kind: 작업 종류 ('crawler', 'article', 'details')
+            payload: 모든 작업에 공통인 부가 정보
+            payloads: URL별 부가 정보 (urls와 같은 순서)
+
+        Returns:
+            새로 등록된 작업 수
+        """
+        now = time.time()
+        rows = []
+        for idx, url in enumerate(urls):
+            data = payloads[idx] if payloads else payload
+            rows.append((url, urlparse(url).netloc.lower(), kind, json.dumps(data or {}, ensure_ascii=False),
+                         self.max_attempts, now, now, now))
+
+        with self._lock:
+            self._transaction()
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany('''
+                    INSERT OR IGNORE INTO jobs (url, domain, kind, payload, max_attempts, available_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                added = self._conn.total_changes - before
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return added
+
+    # ---- 임대 / 완료 ----
+
+    def lease(self, owner: str, visibility_timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        처리할 작업 하나 임대 (없으면 None)
+        가장 오래 전에 임대된 도메인부터 돌아가며 가져가고, 동시 임대 수가 찬 도메인은 건너뜀
+        """
+        timeout = visibility_timeout or self.visibility_timeout
+        now = time.time()
+
+        with self._lock:
+            self._transaction()
+            try:
+                self._expire_leases(now)
+                row = self._conn.execute('''
+                    SELECT j.domain
+                    FROM jobs j LEFT JOIN domains d ON d.domain = j.domain
+                    WHERE j.status = 'pending' AND j.available_at <= ?
+                      AND (SELECT COUNT(*) FROM jobs l WHERE l.domain = j.domain AND l.status = 'leased') < ?
+                    GROUP BY j.domain
+                    ORDER BY COALESCE(MAX(d.last_leased), 0) ASC
+                    LIMIT 1
+                ''', (now, self.per_domain_limit)).fetchone()
+                if row is None:
+                    self._conn.execute('COMMIT')
+                    return None
+
+                domain = row[0]
+                job = self._conn.execute('''
+                    SELECT id, url, domain, kind, payload, attempts, max_attempts
+                    FROM jobs WHERE status = 'pending' AND domain = ? AND available_at <= ?
+                    ORDER BY id LIMIT 1
+                ''', (domain, now)).fetchone()
+
+                self._conn.execute('''
+                    UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?,
+                                    attempts = attempts + 1, updated_at = ?
+                    WHERE id = ?
+                ''', (owner, now + timeout, now, job[0]))
+                self._conn.execute('''
+                    INSERT INTO domains (domain, last_leased) VALUES (?, ?)
+                    ON CONFLICT(domain) DO UPDATE SET last_leased = excluded.last_leased
+                ''', (domain, now))
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        return {
+            'id': job[0],
+            'url': job[1],
+            'domain': job[2],
+            'kind': job[3],
+            'payload': json.loads(job[4]) if job[4] else {},
+            'attempts': job[5] + 1,
+            'max_attempts': job[6],
+        }
+
+    def _expire_leases(self, now: float):
+        """임대 시간이 지난 작업을 대기 상태로 되돌림 (시도 횟수 초과면 failed, 트랜잭션 안에서 호출)"""
+        self._conn.execute('''
+            UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+                            error = COALESCE(error, '임대 시간 초과'), lease_owner = NULL, lease_expires = NULL,
+                            updated_at = ?
+            WHERE status = 'leased' AND lease_expires < ?
+        ''', (now, now))
+
+    def _finish(self, job_id: int, owner: str, sql: str, params: tuple) -> bool:
+        """임대한 작업자만 상태를 바꿀 수 있음 (임대가 만료되어 다른 작업자가 가져갔으면 False)"""
+        with self._lock:
+            cursor = self._conn.execute(sql + " WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                                        params + (job_id, owner))
+        if cursor.rowcount == 0:
+            logger.warning(f"작업 {job_id}: 임대가 만료되어 결과를 기록하지 않았습니다.")
+            return False
+        return True
+
+    def complete(self, job_id: int, owner: str, result=None) -> bool:
+        """작업 완료 (결과는 JSON으로 저장)"""
+        return self._finish(job_id, owner, '''
+            UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_owner = NULL,
+                            lease_expires = NULL, updated_at = ?
+        ''', (json.dumps(result, ensure_ascii=False) if result is not None else None, time.time()))
+
+    def fail(self, job_id: int, owner: str, error: str, attempts: int, max_attempts: int) -> bool:
+        """작업 실패 (남은 시도가 있으면 백오프 후 재시도)"""
+        now = time.time()
+        if attempts >= max_attempts:
+            return self._finish(job_id, owner, '''
+                UPDATE jobs SET status = 'failed', error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ?
+            ''', (error, now))
+
+        delay = self.retry_backoff * (2 ** (attempts - 1))
+        return self._finish(job_id, owner, '''
+            UPDATE jobs SET status = 'pending', error = ?, available_at = ?, lease_owner = NULL,
+                            lease_expires = NULL, updated_at = ?
+        ''', (error, now + delay, now))
+
+    # ---- 조회 / 관리 ----
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        counts = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def domain_stats(self) -> List[tuple]:
+        """도메인별 (도메인, 대기, 임대, 완료, 실패) 작업 수"""
+        with self._lock:
+            return self._conn.execute('''
+                SELECT domain,
+                       SUM(status = 'pending'), SUM(status = 'leased'), SUM(status = 'done'), SUM(status = 'failed')
+                FROM jobs GROUP BY domain ORDER BY domain
+            ''').fetchall()
+
+    def results(self, kind: Optional[str] = None) -> Iterable[Dict]:
+        """완료된 작업 결과 (None 결과 제외)"""
+        sql = "SELECT kind, payload, result FROM jobs WHERE status = 'done' AND result IS NOT NULL"
+        params = ()
+        if kind:
+            sql += ' AND kind = ?'
+            params = (kind,)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        for job_kind, payload, result in rows:
+            yield {'kind': job_kind, 'payload': json.loads(payload) if payload else {}, 'result': json.loads(result)}
+
+    def requeue_failed(self) -> int:
+        """실패한 작업을 다시 대기 상태로 (시도 횟수 초기화)"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute('''
+                UPDATE jobs SET status = 'pending', attempts = 0, available_at = ?, updated_at = ?
+                WHERE status = 'failed'
+            ''', (now, now))
+        return cursor.rowcount
+
+    def has_pending(self) -> bool:
+        """대기 또는 임대 중인 작업이 남아 있는지"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE status IN ('pending', 'leased') LIMIT 1"
+            ).fetchone()
+        return row is not None
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+class QueueWorker:
+    """
+    큐에서 작업을 임대해 처리하는 작업자
+    한 프로세스에서 threads개 스레드로 동작하며, 여러 프로세스/서버에서 동시에 실행 가능
+    """
+
+    def __init__(self, queue: CrawlQueue, threads: int = 4, owner: Optional[str] = None,
+                 idle_sleep: float = 2.0, exit_when_empty: bool = True):
+        """
+        Args:
+            queue: 작업 큐
+            threads: 작업 스레드 수
+            owner: 작업자 식별자 (기본값: 호스트명-PID)
+            idle_sleep: 처리할 작업이 없을 때 대기 시간(초)
+            exit_when_empty: 대기/임대 중인 작업이 모두 없어지면 종료
+        """
+        self.queue = queue
+        self.threads = threads
+        self.owner = owner or f"{socket.gethostname()}-{os.getpid()}"
+        self.idle_sleep = idle_sleep
+        self.exit_when_empty = exit_when_empty
+
+        self._stop = threading.Event()
+        self._crawlers = {}
+        self._crawlers_lock = threading.Lock()
+        self.processed = 0
+        self.failed = 0
+        self._count_lock = threading.Lock()
+
+    # ---- 작업 종류별 처리 ----
+
+    def _get_crawler(self, key: str, factory):
+        """작업 종류별 크롤러를 프로세스당 하나만 생성 (세션/커넥션 재사용)"""
+        with self._crawlers_lock:
+            if key not in self._crawlers:
+                self._crawlers[key] = factory()
+            return self._crawlers[key]
+
+    def _run_crawler_job(self, job: Dict):
+        """BaseCrawler.parse_article 경로"""
+        path = job['payload']['crawler']
+
+        def factory():
+            module_name, class_name = path.rsplit('.', 1)
+            return getattr(importlib.import_module(module_name), class_name)()
+
+        crawler = self._get_crawler(f"crawler:{path}", factory)
+        article = crawler.parse_article(job['url'])
+        if article:
+            article['newspaper'] = crawler.newspaper_name
+            article['region'] = crawler.region
+        return article
+
+    def _run_article_job(self, job: Dict):
+        """scraping_engine 사이트 설정 경로 (목록 단계에서 등록된 항목의 상세 수집)"""
+        from scraping_engine import SiteSpec, SpecCrawler, SITE_SPECS, get_site_logger
+        from scraper.utils import get_scraper_cache
+
+        payload = job['payload']
+        key = payload['site']
+
+        def factory():
+            return SpecCrawler(SiteSpec(key, SITE_SPECS[key]), cache=get_scraper_cache(),
+                               logger=get_site_logger(key))
+
+        crawler = self._get_crawler(f"site:{key}", factory)
+        result = crawler.process_item(payload['entry'], payload['limit_date'], payload.get('end_date'))
+        return result if isinstance(result, dict) else None
+
+    def _run_details_job(self, job: Dict):
+        """scraper/utils.fetch_article_details 경로"""
+        from transport import create_session
+        from scraper.utils import fetch_article_details, get_common_headers, get_scraper_cache
+
+        session = self._get_crawler('details:session',
+                                    lambda: create_session(pool_size=self.threads, hosts=self.threads, verify=False))
+        details = fetch_article_details(job['url'], job['payload'].get('selectors', {}), get_common_headers(),
+                                        logger, session=session, cache=get_scraper_cache())
+        details['article_url'] = job['url']
+        return details
+
+    def handle(self, job: Dict):
+        """작업 하나 처리 (결과 반환, 실패 시 예외)"""
+        handlers = {
+            'crawler': self._run_crawler_job,
+            'article': self._run_article_job,
+            'details': self._run_details_job,
+        }
+        handler = handlers.get(job['kind'])
+        if handler is None:
+            raise ValueError(f"알 수 없는 작업 종류: {job['kind']}")
+        return handler(job)
+
+    # ---- 실행 ----
+
+    def _loop(self):
+        while not self._stop.is_set():
+            job = self.queue.lease(self.owner)
+            if job is None:
+                if self.exit_when_empty and not self.queue.has_pending():
+                    return
+                self._stop.wait(self.idle_sleep)
+                continue
+
+            try:
+                result = self.handle(job)
+                self.queue.complete(job['id'], self.owner, result)
+                with self._count_lock:
+                    self.processed += 1
+            except Exception as e:
+                logger.warning(f"작업 실패 ({job['url']}, {job['attempts']}/{job['max_attempts']}회): {e}")
+                self.queue.fail(job['id'], self.owner, f"{type(e).__name__}: {e}",
+                                job['attempts'], job['max_attempts'])
+                with self._count_lock:
+                    self.failed += 1
+
+    def run(self):
+        """작업 스레드 실행 (exit_when_empty면 큐가 빌 때까지, 아니면 stop()까지)"""
+        logger.info(f"✓ 작업자 시작: {self.owner} (스레드 {self.threads}개)")
+        threads = [threading.Thread(target=self._loop, name=f"queue-worker-{i}", daemon=True)
+                   for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1.0)
+        except KeyboardInterrupt:
+            # 진행 중인 작업은 임대 시간이 지나면 다른 작업자가 다시 가져감
+            self.stop()
+        logger.info(f"✓ 작업자 종료: 완료 {self.processed}개, 실패 {self.failed}개")
+
+        # 작업자 프로세스별 통계 파일 (여러 작업자가 같은 디렉터리에 써도 겹치지 않음)
+        metrics = get_crawl_metrics()
+        metrics.log_summary(logger)
+        try:
+            metrics.export(f"queue_worker_{os.getpid()}")
+        except OSError as e:
+            logger.warning(f"수집 통계 저장 실패: {e}")
+
+    def stop(self):
+        self._stop.set()
+
+
+def enqueue_site(queue: CrawlQueue, key: str, days: int = 30, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None) -> int:
+    """
+    사이트 목록 페이지만 읽어 상세 수집 작업을 큐에 등록
+    (페이지가 끝나거나 사이트의 종료 규칙에 걸리면 중단 — first_older: 기준일 이전 기사가 하나라도 나옴,
+     older_ratio: 목록 아이템 중 기준일 이전 기사 비율이 older_ratio 이상)
+    """
+    from scraping_engine import SiteSpec, SpecCrawler, SITE_SPECS, OLDER, FetchError, get_site_logger
+
+    spec = SiteSpec(key, SITE_SPECS[key])
+    crawler = SpecCrawler(spec, logger=get_site_logger(key))
+    limit_date = start_date or (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    end_date = (end_date or datetime.now().strftime('%Y-%m-%d')) if start_date else None
+
+    total = 0
+    for list_url in spec.list_urls:
+        seen_urls = set()
+        for page in range(1, spec.max_pages + 1):
+            try:
+                entries = crawler.fetch_list_items(list_url, page, limit_date, seen_urls, end_date, keep_older=True)
+            except FetchError as e:
+                # 이미 등록한 작업은 그대로 두고 다음 목록으로 (다시 실행하면 같은 URL은 중복 등록되지 않음)
+                crawler.logger.error(f"{page}페이지를 읽지 못해 목록 등록을 멈춥니다 ({list_url}): {e}")
+                break
+            if entries is None:
+                break
+            articles = [entry for entry in entries if entry != OLDER]
+            total += queue.enqueue_many(
+                [entry['article_url'] for entry in articles], kind='article',
+                payloads=[{'site': key, 'entry': entry, 'limit_date': limit_date, 'end_date': end_date}
+                          for entry in articles]
+            )
+            older_count = len(entries) - len(articles)
+            if spec.stop_rule == 'older_ratio':
+                if entries and older_count >= len(entries) * spec.older_ratio:
+                    break
+            elif older_count:
+                break
+    crawler.logger.info(f"✓ 작업 {total}개 등록 ({key})")
+    return total
+
+
+def enqueue_details(queue: CrawlQueue, urls: Iterable[str], selectors: Dict) -> int:
+    """fetch_article_details로 처리할 상세 페이지 작업 등록 (selectors는 fetch_article_details와 동일)"""
+    return queue.enqueue_many(urls, kind='details', payload={'selectors': selectors})
+
+
+def export_results(queue: CrawlQueue, crawler_output: str = 'data/queue_crawler_results.csv') -> Dict[str, int]:
+    """완료된 작업 결과 저장 (사이트 작업은 사이트별 output, 크롤러 작업은 crawler_output)"""
+    import pandas as pd
+    from collections import defaultdict
+    from scraping_engine import save_site_results
+
+    by_site = defaultdict(list)
+    crawler_rows = []
+    for item in queue.results():
+        if item['kind'] == 'article':
+            by_site[item['payload']['site']].append(item['result'])
+        elif item['kind'] == 'crawler':
+            crawler_rows.append(item['result'])
+
+    counts = {}
+    for key, rows in by_site.items():
+        save_site_results(key, rows)
+        counts[key] = len(rows)
+    if crawler_rows:
+        os.makedirs(os.path.dirname(crawler_output) or '.', exist_ok=True)
+        pd.DataFrame(crawler_rows).to_csv(crawler_output, index=False, encoding='utf-8-sig')
+        counts['crawler'] = len(crawler_rows)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 크롤 작업 큐')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='큐 DB 경로')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('enqueue-sites', help='scraping_engine 사이트의 기사 작업 등록')
+    p.add_argument('--sites', nargs='+', help='사이트 키 (기본값: 전체)')
+    p.add_argument('--days', type=int, default=30)
+    p.add_argument('--start-date')
+    p.add_argument('--end-date')
+
+    p = sub.add_parser('enqueue-crawlers', help='CrawlerManager 지역 크롤러의 기사 작업 등록')
+    p.add_argument('--max-articles', type=int, default=50)
+
+    p = sub.add_parser('worker', help='작업 처리')
+    p.add_argument('--threads', type=int, default=4)
+    p.add_argument('--forever', action='store_true', help='큐가 비어도 종료하지 않고 대기')
+    p.add_argument('--per-domain', type=int, default=4, help='도메인당 동시 작업 수')
+    p.add_argument('--visibility-timeout', type=float, default=300.0)
+
+    sub.add_parser('stats', help='작업 현황')
+    sub.add_parser('requeue-failed', help='실패한 작업 재등록')
+    sub.add_parser('export', help='완료된 결과를 CSV로 저장')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s')
+
+    if args.command == 'worker':
+        queue = CrawlQueue(args.db, visibility_timeout=args.visibility_timeout, per_domain_limit=args.per_domain)
+        QueueWorker(queue, threads=args.threads, exit_when_empty=not args.forever).run()
+    else:
+        queue = CrawlQueue(args.db)
+
+    if args.command == 'enqueue-sites':
+        from site_specs import SITE_SPECS
+        for key in args.sites or list(SITE_SPECS.keys()):
+            enqueue_site(queue, key, args.days, args.start_date, args.end_date)
+    elif args.command == 'enqueue-crawlers':
+        from crawler_manager import CrawlerManager
+        manager = CrawlerManager(use_database=False, save_text_files=False)
+        manager.register_all_crawlers()
+        manager.enqueue_crawlers(queue, max_articles=args.max_articles)
+    elif args.command == 'requeue-failed':
+        print(f"재등록: {queue.requeue_failed()}개")
+    elif args.command == 'export':
+        for key, count in export_results(queue).items():
+            print(f"{key:<24}{count:>6}건")
+
+    if args.command in ('stats', 'enqueue-sites', 'enqueue-crawlers', 'worker'):
+        print("\n" + "=" * 60)
+        print(f"{'도메인':<32}{'대기':>6}{'임대':>6}{'완료':>6}{'실패':>6}")
+        for domain, pending, leased, done, failed in queue.domain_stats():
+            print(f"{domain:<32}{pending:>6}{leased:>6}{done:>6}{failed:>6}")
+        print(f"전체: {queue.stats()}")
+
+    queue.close()
+
+
+if __name__ == '__main__':
+    main()
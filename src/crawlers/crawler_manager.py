@@ -5,6 +5,9 @@
 
 import pandas as pd
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import Counter
 import logging
 
 # 지역별 크롤러 임포트
@@ -18,6 +21,8 @@ from regional.jeolla.jeonnam_ilbo import JeollaCrawler
 # 데이터베이스 및 텍스트 파일 저장
 from database_manager import DatabaseManager
 from text_file_saver import TextFileSaver
+from browser_pool import shutdown_browser_pool
+from crawl_metrics import get_crawl_metrics
 
 logger = logging.getLogger('CrawlerManager')
 
@@ -34,6 +39,7 @@ class CrawlerManager:
         self.crawlers = []
         self.all_articles = []
         self.region_stats = {}
+        self._results_lock = threading.Lock()
 
         # 데이터베이스 매니저
         self.use_database = use_database
@@ -50,6 +56,12 @@ class CrawlerManager:
         self.crawlers.append(crawler)
         logger.info(f"✓ {crawler.newspaper_name} 크롤러 등록")
 
+    def enable_response_cache(self):
+        """등록된 모든 크롤러에서 HTTP 응답 캐시(조건부 GET) 사용"""
+        for crawler in self.crawlers:
+            crawler.enable_cache()
+        logger.info("✓ HTTP 응답 캐시 사용")
+
     def register_all_crawlers(self):
         """모든 지역 크롤러 기본 등록"""
         crawlers_list = [
@@ -64,13 +76,16 @@ class CrawlerManager:
         for crawler in crawlers_list:
             self.register_crawler(crawler)
 
-    def run_by_region(self, region: str, max_articles: int = 50) -> List[Dict]:
+    def run_by_region(self, region: str, max_articles: int = 50, use_async: bool = False,
+                      workers: int = 1) -> List[Dict]:
         """
         특정 지역의 크롤러만 실행
 
         Args:
             region: 지역명 (예: '서울', '경기도', '강원도')
             max_articles: 신문사당 최대 기사 수
+            use_async: 크롤러별 비동기 모드 사용 여부
+            workers: 동시에 실행할 크롤러 수 (1이면 순차 실행)
         """
         target_crawlers = [c for c in self.crawlers if c.region == region]
 
@@ -78,32 +93,38 @@ class CrawlerManager:
         logger.info(f"🕷️  [{region}] 크롤링 시작 ({len(target_crawlers)}개 신문)")
         logger.info(f"{'=' * 60}\n")
 
-        for crawler in target_crawlers:
-            articles = crawler.crawl(max_articles=max_articles)
-            self.all_articles.extend(articles)
+        get_crawl_metrics().reset()
+        try:
+            self._run_crawlers(target_crawlers, max_articles, use_async, workers)
+        finally:
+            self.close()
+            self._export_metrics(f'region_{region}')
 
         return self.all_articles
 
-    def run_all_crawlers(self, max_articles: int = 50) -> List[Dict]:
+    def run_all_crawlers(self, max_articles: int = 50, use_async: bool = False,
+                         workers: int = 1) -> List[Dict]:
         """
         모든 지역의 모든 크롤러 실행
 
         Args:
             max_articles: 신문사당 최대 기사 수
+            use_async: 크롤러별 비동기 모드 사용 여부
+            workers: 동시에 실행할 크롤러 수 (1이면 순차 실행)
         """
         logger.info(f"\n\n{'=' * 70}")
         logger.info("🕷️  [전체] 지역별 뉴스 크롤링 시작")
         logger.info(f"    - 크롤러 수: {len(self.crawlers)}개")
         logger.info(f"    - 신문사당 기사 수: {max_articles}개")
+        logger.info(f"    - 동시 실행 크롤러 수: {workers}개")
         logger.info(f"{'=' * 70}\n")
 
-        for idx, crawler in enumerate(self.crawlers, 1):
-            logger.info(f"[{idx}/{len(self.crawlers)}] {crawler.newspaper_name}({crawler.region})")
-            articles = crawler.crawl(max_articles=max_articles)
-            self.all_articles.extend(articles)
-
-            # 지역별 통계
-            self.region_stats[crawler.region] = self.region_stats.get(crawler.region, 0) + len(articles)
+        get_crawl_metrics().reset()
+        try:
+            self._run_crawlers(self.crawlers, max_articles, use_async, workers)
+        finally:
+            self.close()
+            self._export_metrics('all_crawlers')
 
         logger.info(f"\n{'=' * 70}")
         logger.info(f"✓ 전체 크롤링 완료: {len(self.all_articles)}개 기사 수집")
@@ -111,6 +132,84 @@ class CrawlerManager:
 
         return self.all_articles
 
+    def _run_crawlers(self, crawlers: List, max_articles: int, use_async: bool, workers: int):
+        """
+        크롤러 목록 실행 (순차 또는 병렬)
+        병렬 모드에서는 신문사마다 별도 스레드에서 실행되며,
+        요청 간격은 각 크롤러의 세션/호스트 게이트가 따로 관리
+        """
+        if workers <= 1 or len(crawlers) <= 1:
+            for idx, crawler in enumerate(crawlers, 1):
+                logger.info(f"[{idx}/{len(crawlers)}] {crawler.newspaper_name}({crawler.region})")
+                articles = crawler.crawl(max_articles=max_articles, use_async=use_async)
+                self._merge_results(crawler, articles)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crawler') as executor:
+            futures = {
+                executor.submit(crawler.crawl, max_articles=max_articles, use_async=use_async): crawler
+                for crawler in crawlers
+            }
+
+            # 먼저 끝난 신문사부터 결과 병합 (느린 사이트가 다른 사이트를 막지 않음)
+            for done_count, future in enumerate(as_completed(futures), 1):
+                crawler = futures[future]
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    logger.error(f"✗ {crawler.newspaper_name} 크롤링 실패: {e}")
+                    continue
+
+                self._merge_results(crawler, articles)
+                logger.info(f"[{done_count}/{len(crawlers)}] {crawler.newspaper_name}({crawler.region}) "
+                            f"완료: {len(articles)}개")
+
+    def enqueue_crawlers(self, queue, max_articles: int = 50) -> int:
+        """
+        등록된 크롤러의 기사 URL을 크롤 작업 큐에 등록 (파싱은 crawl_queue 작업자가 처리)
+
+        Returns:
+            새로 등록된 작업 수
+        """
+        total = 0
+        for crawler in self.crawlers:
+            try:
+                total += crawler.enqueue_article_urls(queue, max_articles=max_articles)
+            except Exception as e:
+                logger.error(f"✗ {crawler.newspaper_name} 작업 등록 실패: {e}")
+        logger.info(f"✓ 작업 {total}개 등록")
+        return total
+
+    def load_queue_results(self, queue) -> int:
+        """크롤 작업 큐에서 완료된 기사를 가져와 결과에 병합 (이후 save_all로 저장)"""
+        articles = [item['result'] for item in queue.results(kind='crawler')]
+        with self._results_lock:
+            self.all_articles.extend(articles)
+            for article in articles:
+                region = article.get('region', '')
+                self.region_stats[region] = self.region_stats.get(region, 0) + 1
+        logger.info(f"✓ 큐에서 {len(articles)}개 기사 로드")
+        return len(articles)
+
+    def close(self):
+        """크롤링 종료 후 공용 자원 정리 (Selenium 브라우저 풀 종료)"""
+        shutdown_browser_pool()
+
+    def _export_metrics(self, name: str):
+        """수집 통계 로그 출력 및 파일 저장 (data/metrics)"""
+        metrics = get_crawl_metrics()
+        metrics.log_summary(logger)
+        try:
+            metrics.export(name)
+        except OSError as e:
+            logger.warning(f"수집 통계 저장 실패: {e}")
+
+    def _merge_results(self, crawler, articles: List[Dict]):
+        """크롤러 결과를 전체 결과와 지역별 통계에 병합"""
+        with self._results_lock:
+            self.all_articles.extend(articles)
+            self.region_stats[crawler.region] = self.region_stats.get(crawler.region, 0) + len(articles)
+
     def to_dataframe(self) -> pd.DataFrame:
         """모든 기사를 DataFrame으로 반환"""
         if not self.all_articles:
@@ -240,12 +339,11 @@ class CrawlerManager:
         # 기사 저장
         inserted = self.db_manager.insert_articles(self.all_articles)
 
-        # 지역별 통계 업데이트
-        for region, count in self.region_stats.items():
-            newspapers = [a['newspaper'] for a in self.all_articles if a['region'] == region]
-            for newspaper in set(newspapers):
-                news_count = sum(1 for a in self.all_articles if a['region'] == region and a['newspaper'] == newspaper)
-                self.db_manager.update_region_stats(region, newspaper, news_count)
+        # 지역별 통계 업데이트 (지역/신문사별 기사 수를 한 번에 세어 한 트랜잭션으로 저장)
+        counts = Counter((a['region'], a['newspaper']) for a in self.all_articles if a['region'] in self.region_stats)
+        self.db_manager.update_region_stats_many(
+            [(region, newspaper, news_count) for (region, newspaper), news_count in counts.items()]
+        )
 
         logger.info(f"✓ {inserted}개 기사 데이터베이스 저장 완료")
         
@@ -1,5 +1,4 @@
 import os
-import sqlite3
 import pandas as pd
 import glob
 import logging
@@ -9,11 +8,15 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 같은 위치의 database_manager에서 함수 가져오기
 try:
-    from database_manager import extract_keyword
+    from database_manager import extract_keyword, REGION_MAP, ensure_news_indexes, fetch_url_ids
+    from near_duplicate import NearDuplicateDetector, SimHashIndex
+    from sqlite_store import get_store
 except ImportError:
     import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from database_manager import extract_keyword
+    from database_manager import extract_keyword, REGION_MAP, ensure_news_indexes, fetch_url_ids
+    from near_duplicate import NearDuplicateDetector, SimHashIndex
+    from sqlite_store import get_store
 
 # 로그 설정
 os.makedirs("logs", exist_ok=True)
@@ -29,42 +32,40 @@ logger = logging.getLogger("CsvDataToDB")
 
 class DataToDBProcessor:
     def __init__(self, db_path="data/news_scraped.db", max_workers=4):
-        self.db_path = db_path
+        self.store = get_store(db_path)
+        self.db_path = self.store.db_path
         self.max_workers = max_workers
-        self.region_map = {
-            'gangwon': '강원도', 'gyeonggi': '경기도', 'gyeongsang': '경상도',
-            'gyeongnam': '경남', 'gyeongbuk': '경북', 'jeolla': '전라도', 'jeonnam': '전남',
-            'chungcheong': '충청도', 'seoul': '서울', 'incheon': '인천',
-            'daegu': '대구', 'busan': '부산', 'ulsan': '울산',
-            'gwangju': '광주', 'daejeon': '대전', 'sejong': '세종',
-            'jeju': '제주', 'national': '전국'
-        }
+        self.region_map = dict(REGION_MAP)
+        self.dedup = NearDuplicateDetector()
         self._init_db()
 
     def _init_db(self):
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS news (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                region TEXT,
-                sentiment_score REAL,
-                is_processed INTEGER DEFAULT 0,
-                published_time TEXT,
-                url TEXT UNIQUE,
-                keyword TEXT,
-                collected_at TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-        conn.close()
-
-    def process_row(self, row):
-        """행 데이터 처리 및 튜플 반환 (날짜 형식 수정)"""
+        with self.store.transaction() as cursor:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS news (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    content TEXT,
+                    region TEXT,
+                    sentiment_score REAL,
+                    is_processed INTEGER DEFAULT 0,
+                    published_time TEXT,
+                    url TEXT UNIQUE,
+                    keyword TEXT,
+                    collected_at TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            # 유사 중복 기사 지문 인덱스, 기존 기사 검사
+            self.dedup.ensure_schema(cursor)
+            self.dedup.index_existing(cursor)
+            ensure_news_indexes(cursor)
+
+    def process_row(self, row, canonical=None):
+        """
+        행 데이터 처리 및 튜플 반환 (날짜 형식 수정)
+        canonical이 주어지면(유사 중복 기사) 키워드 추출 없이 원본의 키워드/감성 결과 사용
+        """
         url = row.get('article_url', row.get('url', ''))
         if not url or pd.isna(url): return None
         
@@ -86,16 +87,55 @@ class DataToDBProcessor:
         raw_region = row.get('region', 'unknown')
         region = self.region_map.get(str(raw_region).lower(), str(raw_region))
         
-        keywords = extract_keyword(title, content)
         # 수집 시간은 구분을 위해 시간까지 포함 유지
         collected_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        return (title, content, region, None, 0, pub_time, url, keywords, collected_at)
 
-    def get_existing_urls(self, conn):
-        cursor = conn.cursor()
-        cursor.execute("SELECT url FROM news")
-        return {row[0] for row in cursor.fetchall()}
+        if canonical:
+            return (title, content, region, canonical['sentiment_score'], canonical['is_processed'],
+                    pub_time, url, canonical['keyword'], collected_at, canonical['id'])
+
+        keywords = extract_keyword(title, content)
+        return (title, content, region, None, 0, pub_time, url, keywords, collected_at, None)
+
+    def split_duplicates(self, cursor, df, url_col):
+        """
+        유사 중복 기사 분리 (DB의 원본 또는 같은 파일의 앞선 기사와 비교)
+
+        Returns:
+            (원본 [(row, 지문)], 중복 [(row, 원본 id 또는 같은 파일 원본 URL)])
+        """
+        originals, duplicates = [], []
+        batch = SimHashIndex(self.dedup.max_distance)
+        for _, row in df.iterrows():
+            content = row.get('content')
+            fingerprint = self.dedup.fingerprint(str(content) if pd.notna(content) else '')
+            canonical = self.dedup.find_canonical(cursor, fingerprint)
+            if canonical is None and fingerprint is not None:
+                canonical = batch.find(fingerprint)
+            if canonical is not None:
+                duplicates.append((row, canonical))
+                continue
+            if fingerprint is not None:
+                batch.add(row[url_col], fingerprint)
+            originals.append((row, fingerprint))
+        return originals, duplicates
+
+    def _insert_rows(self, cursor, rows):
+        if rows:
+            cursor.executemany('''
+                INSERT OR IGNORE INTO news (title, content, region, sentiment_score, is_processed, published_time, url, keyword, collected_at, canonical_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+    def _insert_originals(self, cursor, rows, fingerprints):
+        """원본 기사 저장 및 지문 등록 (URL → id 반환)"""
+        self._insert_rows(cursor, rows)
+        url_ids = fetch_url_ids(cursor, [res[6] for res in rows])
+        self.dedup.add_many(cursor, [(news_id, fingerprints.get(url)) for url, news_id in url_ids.items()])
+        return url_ids
+
+    def get_existing_urls(self):
+        return {row[0] for row in self.store.query("SELECT url FROM news")}
 
     def process_csv_files(self, start_date=None):
         if start_date is None:
@@ -106,8 +146,7 @@ class DataToDBProcessor:
             logger.warning("처리할 raw_*.csv 파일이 없습니다.")
             return
 
-        conn = sqlite3.connect(self.db_path)
-        existing_urls = self.get_existing_urls(conn)
+        existing_urls = self.get_existing_urls()
         
         for file_path in csv_files:
             logger.info(f"파일 처리 시작: {file_path}")
@@ -130,31 +169,52 @@ class DataToDBProcessor:
                     logger.info(f"신규 데이터 없음: {file_path}")
                     continue
 
+                # 유사 중복 기사는 키워드 추출 없이 원본에 연결
+                with self.store.connection() as conn:
+                    originals, duplicates = self.split_duplicates(conn, df_to_process, url_col)
+                fingerprints = {row[url_col]: fingerprint for row, fingerprint in originals}
+
+                # 키워드 추출은 쓰기 잠금을 잡기 전에 처리
                 results = []
                 with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    futures = [executor.submit(self.process_row, row) for _, row in df_to_process.iterrows()]
+                    futures = [executor.submit(self.process_row, row) for row, _ in originals]
                     for future in tqdm(as_completed(futures), total=len(futures), desc=f"{os.path.basename(file_path)} 분석"):
                         try:
                             res = future.result()
                             if res: results.append(res)
                         except Exception as e:
                             logger.error(f"행 처리 중 에러: {e}")
-                
+
+                # 파일 하나를 한 트랜잭션으로 저장 (실패하면 그 파일은 전부 롤백)
+                with self.store.transaction() as cursor:
+                    # 원본 저장 후 지문 등록 (같은 파일의 중복이 원본 id를 참조할 수 있도록)
+                    url_ids = self._insert_originals(cursor, results, fingerprints)
+
+                    duplicate_results = []
+                    for row, canonical in duplicates:
+                        canonical_id = canonical if isinstance(canonical, int) else url_ids.get(canonical)
+                        fields = self.dedup.canonical_fields(cursor, canonical_id) if canonical_id else {}
+                        if not fields:
+                            # 원본 행이 저장되지 않은 경우(제목 없음 등) 원본으로 처리
+                            res = self.process_row(row)
+                            if res:
+                                content = row.get('content')
+                                fingerprint = self.dedup.fingerprint(str(content) if pd.notna(content) else '')
+                                url_ids.update(self._insert_originals(cursor, [res], {res[6]: fingerprint}))
+                                results.append(res)
+                            continue
+                        res = self.process_row(row, canonical={**fields, 'id': canonical_id})
+                        if res: duplicate_results.append(res)
+                    self._insert_rows(cursor, duplicate_results)
+                results.extend(duplicate_results)
+
                 if results:
-                    cursor = conn.cursor()
-                    cursor.executemany('''
-                        INSERT OR IGNORE INTO news (title, content, region, sentiment_score, is_processed, published_time, url, keyword, collected_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', results)
-                    conn.commit()
                     existing_urls.update([r[6] for r in results])
-                    logger.info(f"저장 완료: {file_path} ({len(results)}건)")
+                    logger.info(f"저장 완료: {file_path} ({len(results)}건, 유사 중복 {len(duplicate_results)}건)")
                 
             except Exception as e:
                 logger.error(f"파일 에러 ({file_path}): {e}")
 
-        conn.close()
-
 if __name__ == "__main__":
     processor = DataToDBProcessor(max_workers=8)
     processor.process_csv_files()
\ No newline at end of file
@@ -6,10 +6,12 @@
 import sqlite3
 import logging
 from datetime import datetime
-from typing import List, Dict
-import os
+from typing import List, Dict, Tuple
 import re
 
+from near_duplicate import NearDuplicateDetector, SimHashIndex
+from sqlite_store import chunked, get_store
+
 logger = logging.getLogger('DatabaseManager')
 
 # 불용어 리스트 (키워드 추출 시 제외할 단어)
@@ -22,6 +24,29 @@ STOPWORDS = {
     '-', '·', '…', '"', '"', ''', ''', '(', ')', '[', ']', '<', '>', '/', '\\', '|'
 }
 
+# 스크래퍼 CSV의 영문 지역 코드 → DB 지역명 (csv_data_to_db, reextract에서 공용)
+REGION_MAP = {
+    'gangwon': '강원도', 'gyeonggi': '경기도', 'gyeongsang': '경상도',
+    'gyeongnam': '경남', 'gyeongbuk': '경북', 'jeolla': '전라도', 'jeonnam': '전남',
+    'chungcheong': '충청도', 'seoul': '서울', 'incheon': '인천',
+    'daegu': '대구', 'busan': '부산', 'ulsan': '울산',
+    'gwangju': '광주', 'daejeon': '대전', 'sejong': '세종',
+    'jeju': '제주', 'national': '전국'
+}
+
+
+def scraped_row_to_article(row: Dict) -> Dict:
+    """스크래퍼 결과 행(scraping_engine) → DB 기사 딕셔너리 (reextract, crawl_daemon에서 공용)"""
+    region = str(row['region'])
+    return {
+        'title': row['title'],
+        'content': row['content'],
+        'region': REGION_MAP.get(region.lower(), region),
+        'published_time': str(row['date'])[:10],
+        'url': row['article_url'],
+        'collected_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
 # Kiwi 인스턴스 전역 초기화 (메모리 효율성 및 속도 향상)
 _kiwi = None
 try:
@@ -73,78 +98,108 @@ def extract_keyword(title: str, content: str = '') -> str:
         logger.error(f"키워드 추출 중 오류 발생: {e}")
         return '키워드 추출 실패'
 
+# 기사 저장 SQL (연결마다 한 번 컴파일되어 재사용)
+INSERT_NEWS_SQL = '''
+    INSERT OR IGNORE INTO news
+    (title, content, region, sentiment_score, is_processed, published_time, keyword, collected_at, url, canonical_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# 대시보드/분석기 조회용 인덱스 (지역별 최신순, 발행일 범위, 미처리 기사)
+NEWS_INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_news_region_published ON news (region, published_time)',
+    'CREATE INDEX IF NOT EXISTS idx_news_published_date ON news (date(published_time))',
+    'CREATE INDEX IF NOT EXISTS idx_news_unprocessed ON news (is_processed, canonical_id)',
+]
+
+
+def ensure_news_indexes(cursor):
+    """news 테이블 조회용 인덱스 생성 (canonical_id 컬럼이 있어야 함)"""
+    for statement in NEWS_INDEXES:
+        cursor.execute(statement)
+
+
+def fetch_url_ids(cursor, urls) -> Dict[str, int]:
+    """DB에 이미 있는 URL → 기사 id"""
+    ids = {}
+    for chunk in chunked([url for url in dict.fromkeys(urls) if url], 500):
+        placeholders = ','.join('?' * len(chunk))
+        ids.update(cursor.execute(f'SELECT url, id FROM news WHERE url IN ({placeholders})', chunk).fetchall())
+    return ids
+
+
 class DatabaseManager:
-    """SQLite 데이터베이스 관리"""
+    """SQLite 데이터베이스 관리 (같은 DB 파일의 인스턴스끼리 연결 풀 공유)"""
     
     def __init__(self, db_path: str = 'data/news.db'):
         """
         Args:
             db_path: 데이터베이스 파일 경로
         """
-        if os.path.isabs(db_path):
-            self.db_path = db_path
-        else:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-            self.db_path = os.path.join(project_root, db_path)
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.store = get_store(db_path)
+        self.db_path = self.store.db_path
         logger.info(f"✓ 데이터베이스 경로: {self.db_path}")
+        self.dedup = NearDuplicateDetector()
         self._create_tables()
     
     def _create_tables(self):
         """테이블 생성"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # 뉴스 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS news (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                region TEXT,
-                sentiment_score REAL,
-                is_processed INTEGER DEFAULT 0,
-                published_time TEXT,
-                url TEXT UNIQUE,
-                keyword TEXT,
-                collected_at TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # keyword 컬럼이 없는 기존 테이블에 추가
-        try:
-            cursor.execute("ALTER TABLE news ADD COLUMN keyword TEXT")
-            logger.info("✓ keyword 컬럼 추가 완료")
-        except sqlite3.OperationalError:
-            pass  # 이미 존재하는 경우
-        
-        # collected_at 컬럼이 없는 기존 테이블에 추가
-        try:
-            cursor.execute("ALTER TABLE news ADD COLUMN collected_at TEXT")
-            logger.info("✓ collected_at 컬럼 추가 완료")
-        except sqlite3.OperationalError:
-            pass  # 이미 존재하는 경우
-        
-        # 지역 통계 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS region_stats (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                region TEXT,
-                newspaper TEXT,
-                article_count INTEGER,
-                last_crawled TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        with self.store.transaction() as cursor:
+            # 뉴스 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS news (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    content TEXT,
+                    region TEXT,
+                    sentiment_score REAL,
+                    is_processed INTEGER DEFAULT 0,
+                    published_time TEXT,
+                    url TEXT UNIQUE,
+                    keyword TEXT,
+                    collected_at TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # keyword 컬럼이 없는 기존 테이블에 추가
+            try:
+                cursor.execute("ALTER TABLE news ADD COLUMN keyword TEXT")
+                logger.info("✓ keyword 컬럼 추가 완료")
+            except sqlite3.OperationalError:
+                pass  # 이미 존재하는 경우
+            
+            # collected_at 컬럼이 없는 기존 테이블에 추가
+            try:
+                cursor.execute("ALTER TABLE news ADD COLUMN collected_at TEXT")
+                logger.info("✓ collected_at 컬럼 추가 완료")
+            except sqlite3.OperationalError:
+                pass  # 이미 존재하는 경우
+            
+            # 지역 통계 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS region_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    region TEXT,
+                    newspaper TEXT,
+                    article_count INTEGER,
+                    last_crawled TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # 유사 중복 기사 지문 인덱스 (canonical_id 컬럼 + fingerprints 테이블), 기존 기사 검사
+            self.dedup.ensure_schema(cursor)
+            self.dedup.index_existing(cursor)
+            ensure_news_indexes(cursor)
         
-        conn.commit()
-        conn.close()
         logger.info(f"✓ 데이터베이스 초기화: {self.db_path}")
     
     def insert_articles(self, articles: List[Dict]) -> int:
         """
         뉴스 기사 삽입
+        chunk_size개씩 나눠 키워드 추출/유사 중복 확인은 트랜잭션 밖에서 하고,
+        저장은 묶음마다 한 트랜잭션에서 executemany로 처리
         
         Args:
             articles: 기사 딕셔너리 리스트
@@ -156,88 +211,235 @@ class DatabaseManager:
             logger.warning("삽입할 기사가 없습니다.")
             return 0
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         inserted_count = 0
-        for article in articles:
+        duplicate_count = 0
+        for chunk in chunked(articles, self.store.chunk_size):
             try:
-                # 키워드 자동 추출
-                keyword = extract_keyword(
-                    article.get('title', ''),
-                    article.get('content', '')
-                )
-                
-                cursor.execute('''
-                    INSERT OR IGNORE INTO news 
-                    (title, content, region, sentiment_score, is_processed, published_time, keyword, collected_at, url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article.get('title'),
-                    article.get('content'),
-                    article.get('region'),
-                    article.get('sentiment_score', 0.0),
-                    article.get('is_processed', 0),
-                    article.get('published_time'),
-                    keyword,
-                    article.get('collected_at'),
-                    article.get('url')
-                ))
-                
-                if cursor.rowcount > 0:
-                    inserted_count += 1
-            
-            except sqlite3.IntegrityError:
-                logger.debug(f"중복 URL 건너뛰기: {article.get('url')}")
+                with self.store.connection() as conn:
+                    rows, pending, singles = self._prepare_rows(conn, chunk)
+                with self.store.transaction() as cursor:
+                    inserted, duplicates = self._write_rows(cursor, rows, pending)
+                    # URL이 없는 기사는 id를 URL로 찾을 수 없으므로 하나씩 삽입
+                    for article in singles:
+                        single_inserted, canonical_id = self._insert_article(cursor, article)
+                        inserted += single_inserted
+                        duplicates += bool(single_inserted and canonical_id)
+                inserted_count += inserted
+                duplicate_count += duplicates
             except Exception as e:
-                logger.error(f"삽입 실패: {e}")
-        
-        conn.commit()
-        conn.close()
+                logger.error(f"삽입 실패 ({len(chunk)}개 묶음): {e}")
         
-        logger.info(f"✓ 데이터베이스에 {inserted_count}개 기사 저장")
+        logger.info(f"✓ 데이터베이스에 {inserted_count}개 기사 저장 (유사 중복 {duplicate_count}개는 원본에 연결)")
         return inserted_count
     
-    def update_region_stats(self, region: str, newspaper: str, count: int):
-        """지역별 통계 업데이트"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _prepare_rows(self, conn, articles: List[Dict]):
+        """
+        저장할 행 준비 (이미 있는 URL, 같은 묶음에서 앞서 나온 URL, 제목 없는 기사는 제외)
+        
+        Returns:
+            (행과 원본이면 지문 [(행, 지문)],
+             같은 묶음의 원본에 연결할 중복 [(기사, 원본 URL, 지문)],
+             URL이 없는 기사)
+        """
+        seen = set(fetch_url_ids(conn, [article.get('url') for article in articles]))
+        batch = SimHashIndex(self.dedup.max_distance)
+        rows, pending, singles = [], [], []
+        for article in articles:
+            url = article.get('url')
+            if article.get('title') is None:
+                logger.debug(f"제목 없는 기사 건너뛰기: {url}")
+                continue
+            if not url:
+                singles.append(article)
+                continue
+            if url in seen:
+                logger.debug(f"중복 URL 건너뛰기: {url}")
+                continue
+            seen.add(url)
+            
+            fingerprint = self.dedup.fingerprint(article.get('content', ''))
+            canonical_id = self.dedup.find_canonical(conn, fingerprint)
+            canonical = self.dedup.canonical_fields(conn, canonical_id) if canonical_id else {}
+            if canonical:
+                rows.append((self._article_row(article, canonical, canonical_id), None))
+                continue
+            source_url = batch.find(fingerprint) if fingerprint is not None else None
+            if source_url is not None:
+                pending.append((article, source_url, fingerprint))
+                continue
+            rows.append((self._article_row(article), fingerprint))
+            if fingerprint is not None:
+                batch.add(url, fingerprint)
+        return rows, pending, singles
+    
+    def _write_rows(self, cursor, rows, pending):
+        """
+        준비한 행 저장: 원본과 DB 원본에 연결된 중복 → 원본 지문 등록 → 같은 묶음의 원본에 연결된 중복
+        
+        Returns:
+            (삽입된 기사 수, 원본에 연결된 기사 수)
+        """
+        inserted = duplicates = 0
+        if rows:
+            cursor.executemany(INSERT_NEWS_SQL, [row for row, _ in rows])
+            inserted += cursor.rowcount
+            duplicates += sum(1 for row, _ in rows if row[-1])
+        
+        originals = {row[8]: (row, fingerprint) for row, fingerprint in rows if not row[-1]}
+        url_ids = fetch_url_ids(cursor, list(originals))
+        self.dedup.add_many(cursor, [(url_ids[url], fingerprint)
+                                     for url, (_, fingerprint) in originals.items() if url in url_ids])
+        
+        linked, unlinked = [], []
+        for article, source_url, fingerprint in pending:
+            canonical_id = url_ids.get(source_url)
+            if canonical_id is None:
+                unlinked.append((article, fingerprint))
+                continue
+            source = originals[source_url][0]
+            canonical = {'keyword': source[6], 'sentiment_score': source[3], 'is_processed': source[4]}
+            linked.append(self._article_row(article, canonical, canonical_id))
+        if linked:
+            cursor.executemany(INSERT_NEWS_SQL, linked)
+            inserted += cursor.rowcount
+            duplicates += len(linked)
+        # 원본 행이 저장되지 않은 경우 원본으로 처리
+        for article, fingerprint in unlinked:
+            cursor.execute(INSERT_NEWS_SQL, self._article_row(article))
+            if cursor.rowcount:
+                inserted += 1
+                self.dedup.add(cursor, cursor.lastrowid, fingerprint)
+        return inserted, duplicates
+    
+    @staticmethod
+    def _article_row(article: Dict, canonical: Dict = None, canonical_id: int = None) -> tuple:
+        """
+        INSERT_NEWS_SQL 행
+        유사 중복이면 원본의 키워드/감성 결과를 그대로 사용 (키워드 추출/분석 생략)
+        """
+        if canonical:
+            keyword = canonical['keyword']
+            sentiment_score = canonical['sentiment_score']
+            is_processed = canonical['is_processed']
+        else:
+            canonical_id = None
+            # 키워드 자동 추출
+            keyword = extract_keyword(
+                article.get('title', ''),
+                article.get('content', '')
+            )
+            sentiment_score = article.get('sentiment_score', 0.0)
+            is_processed = article.get('is_processed', 0)
+        
+        return (
+            article.get('title'),
+            article.get('content'),
+            article.get('region'),
+            sentiment_score,
+            is_processed,
+            article.get('published_time'),
+            keyword,
+            article.get('collected_at'),
+            article.get('url'),
+            canonical_id
+        )
+    
+    def _insert_article(self, cursor, article: Dict):
+        """
+        기사 하나 삽입 (이미 있는 URL이면 무시)
+        
+        Returns:
+            (삽입 여부, 연결된 원본 기사 id 또는 None)
+        """
+        fingerprint = self.dedup.fingerprint(article.get('content', ''))
+        canonical_id = self.dedup.find_canonical(cursor, fingerprint)
+        canonical = self.dedup.canonical_fields(cursor, canonical_id) if canonical_id else {}
+        row = self._article_row(article, canonical, canonical_id)
+        
+        cursor.execute(INSERT_NEWS_SQL, row)
+        
+        if cursor.rowcount == 0:
+            return False, None
+        if not row[-1]:
+            self.dedup.add(cursor, cursor.lastrowid, fingerprint)
+        return True, row[-1]
+    
+    def upsert_articles(self, articles: List[Dict]) -> Dict[str, int]:
+        """
+        재추출한 기사 반영 (URL 기준, chunk_size개씩 한 트랜잭션)
+        - 없는 URL: insert_articles와 같이 삽입
+        - 제목/본문이 바뀐 URL: 내용과 키워드를 갱신하고 감성 분석 대상으로 되돌림 (is_processed=0)
+        - 바뀌지 않은 URL: 그대로 둠
+        
+        Returns:
+            {'inserted': 삽입 수, 'updated': 갱신 수, 'unchanged': 변경 없음 수}
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not articles:
+            return counts
+        
+        for chunk in chunked(articles, self.store.chunk_size):
+            with self.store.transaction() as cursor:
+                for article in chunk:
+                    try:
+                        self._upsert_article(cursor, article, counts)
+                    except Exception as e:
+                        logger.error(f"재추출 반영 실패 ({article.get('url')}): {e}")
+        
+        logger.info(f"✓ 재추출 반영: 삽입 {counts['inserted']}개, 갱신 {counts['updated']}개, "
+                    f"변경 없음 {counts['unchanged']}개")
+        return counts
+    
+    def _upsert_article(self, cursor, article: Dict, counts: Dict[str, int]):
+        row = cursor.execute(
+            'SELECT id, title, content, canonical_id FROM news WHERE url = ?', (article.get('url'),)
+        ).fetchone()
+        if row is None:
+            inserted, _ = self._insert_article(cursor, article)
+            counts['inserted' if inserted else 'unchanged'] += 1
+            return
+        
+        news_id, title, content, canonical_id = row
+        new_title = article.get('title') or title
+        new_content = article.get('content') or content
+        if (new_title, new_content) == (title, content):
+            counts['unchanged'] += 1
+            return
         
         cursor.execute('''
+            UPDATE news SET title = ?, content = ?, published_time = COALESCE(?, published_time),
+                   keyword = ?, sentiment_score = NULL, is_processed = 0
+            WHERE id = ?
+        ''', (new_title, new_content, article.get('published_time'),
+              extract_keyword(new_title, new_content), news_id))
+        # 원본 기사는 지문도 새 본문으로 갱신 (유사 중복 기사는 기존 원본 연결 유지)
+        if not canonical_id:
+            self.dedup.add(cursor, news_id, self.dedup.fingerprint(new_content))
+        counts['updated'] += 1
+    
+    def update_region_stats(self, region: str, newspaper: str, count: int):
+        """지역별 통계 업데이트"""
+        self.update_region_stats_many([(region, newspaper, count)])
+    
+    def update_region_stats_many(self, stats: List[Tuple[str, str, int]]):
+        """지역별 통계 여러 건 업데이트 ([(지역, 신문사, 기사 수)], 한 트랜잭션)"""
+        crawled_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.store.executemany('''
             INSERT INTO region_stats (region, newspaper, article_count, last_crawled)
             VALUES (?, ?, ?, ?)
-        ''', (region, newspaper, count, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
-        
-        conn.commit()
-        conn.close()
+        ''', [(region, newspaper, count, crawled_at) for region, newspaper, count in stats])
     
     def get_total_count(self) -> int:
         """전체 기사 수 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM news')
-        count = cursor.fetchone()[0]
-        
-        conn.close()
-        return count
+        return self.store.query_one('SELECT COUNT(*) FROM news')[0]
     
     def get_articles_by_region(self, region: str) -> List[Dict]:
         """지역별 기사 조회"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        return self.store.query_dicts('''
             SELECT * FROM news 
             WHERE region = ? 
             ORDER BY published_time DESC
         ''', (region,))
-        
-        articles = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return articles
     
     def delete_old_articles(self, days: int = 30) -> int:
         """
@@ -251,46 +453,35 @@ class DatabaseManager:
         """
         from datetime import timedelta
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # 기준일 계산
         cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        # 삭제 전 개수 확인
-        cursor.execute('SELECT COUNT(*) FROM news WHERE published_time < ?', (cutoff_date,))
-        old_count = cursor.fetchone()[0]
-        
-        if old_count > 0:
+        with self.store.transaction() as cursor:
             # 오래된 기사 삭제
             cursor.execute('DELETE FROM news WHERE published_time < ?', (cutoff_date,))
-            conn.commit()
+            old_count = cursor.rowcount
+            if old_count > 0:
+                self.dedup.remove_orphans(cursor)
+        
+        if old_count > 0:
             logger.info(f"✓ {days}일 이전 기사 {old_count}개 삭제 (기준일: {cutoff_date})")
         else:
             logger.debug(f"삭제할 기사 없음 (기준일: {cutoff_date})")
-        
-        conn.close()
         return old_count
     
     def print_stats(self):
         """통계 출력"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # 전체 통계
-        cursor.execute('SELECT COUNT(*) FROM news')
-        total = cursor.fetchone()[0]
-        
-        # 지역별 통계
-        cursor.execute('''
-            SELECT region, COUNT(*) as count 
-            FROM news 
-            GROUP BY region 
-            ORDER BY count DESC
-        ''')
-        region_stats = cursor.fetchall()
-        
-        conn.close()
+        with self.store.connection() as conn:
+            # 전체 통계
+            total = conn.execute('SELECT COUNT(*) FROM news').fetchone()[0]
+            
+            # 지역별 통계
+            region_stats = conn.execute('''
+                SELECT region, COUNT(*) as count 
+                FROM news 
+                GROUP BY region 
+                ORDER BY count DESC
+            ''').fetchall()
         
         logger.info(f"\n{'='*70}")
         logger.info("📊 데이터베이스 통계")
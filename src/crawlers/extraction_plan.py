@@ -0,0 +1,223 @@
+"""
+사이트별 추출 계획
+필드(본문, 부제, 날짜 등)마다 후보 CSS 선택자를 처음 한 번만 컴파일해 두고,
+그 사이트에서 실제로 채택되는 선택자부터 시도하도록 순서를 스스로 조정
+
+- 선택자는 soupsieve로 미리 컴파일 (BeautifulSoup 백엔드, selectolax는 lexbor가 C에서 직접 처리)
+- 처음 warmup번과 이후 recheck_every번마다 한 번은 모든 후보를 선언 순서대로 시도하여
+  채택 기록과 "같은 페이지에서 함께 맞은 후보" 기록을 쌓음
+- 그 외에는 채택 횟수가 많은 후보부터 시도하고, 맞으면 그 후보와 함께 맞은 적이 있는 앞선 후보만 다시 확인
+  (서로 겹치지 않는 후보는 시도하지 않아 탐색 횟수가 줄고, 'title'처럼 어디서나 맞는 예비 후보가 있어도
+   선언 순서대로 처음 맞는 후보를 고르던 기존 결과와 같게 유지)
+- 본문 노이즈 제거와 텍스트 추출을 한 번의 순회로 처리 (노이즈 하위 트리는 건너뛰고 트리는 바꾸지 않음)
+- 사이트/필드별로 어떤 선택자가 채택됐는지는 plan_stats()와 계측(crawl_metrics)의 selector 항목으로 확인
+"""
+
+import threading
+from itertools import count
+from typing import Callable, Dict, Sequence, Tuple
+
+from bs4 import Tag
+
+try:
+    import soupsieve
+except ImportError:
+    soupsieve = None
+
+
+def compile_selector(selector: str):
+    """soupsieve 컴파일 (soupsieve가 없거나 지원하지 않는 문법이면 None → 문자열로 select)"""
+    if soupsieve is None or not selector:
+        return None
+    try:
+        return soupsieve.compile(selector)
+    except Exception:
+        return None
+
+
+class SelectorPlan:
+    """
+    필드 하나의 후보 선택자 목록
+    여러 스레드가 하나의 인스턴스를 공유 (순서와 함께 맞은 후보 기록은 잠금 안에서 새 값으로 교체)
+    """
+
+    def __init__(self, selectors: Sequence[str], warmup: int = 20, recheck_every: int = 200):
+        """
+        Args:
+            selectors: 우선순위 순 후보 선택자
+            warmup: 처음 이 횟수만큼은 모든 후보를 선언 순서대로 시도 (채택/함께 맞은 후보 기록 수집)
+            recheck_every: 이후 이 횟수마다 한 번은 모든 후보를 선언 순서대로 시도 (사이트 개편 대비)
+        """
+        self.selectors = list(selectors)
+        self.warmup = warmup
+        self.recheck_every = recheck_every
+        self._compiled = [compile_selector(selector) for selector in self.selectors]
+        self._wins = [0] * len(self.selectors)
+        self._order = list(range(len(self.selectors)))
+        # _overlaps[i]: 선언 순서 확인에서 i와 같은 페이지에서 함께 맞은 적이 있는 앞선 후보
+        self._overlaps = [frozenset() for _ in self.selectors]
+        self._calls = count(1)
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.selectors)
+
+    def _select(self, index: int, element):
+        pattern = self._compiled[index]
+        if pattern is not None and isinstance(element, Tag):
+            return pattern.select_one(element)
+        return element.select_one(self.selectors[index])
+
+    def first(self, element, extract: Callable = None, record=None):
+        """
+        후보 중 처음 채택된 결과
+        extract(tag)가 주어지면 그 결과가 None이 아닌 첫 후보의 결과 (없으면 찾은 요소)
+        record(selector, hit)가 주어지면 시도한 선택자별로 채택 여부 기록 (crawl_metrics.selector_recorder)
+        """
+        if not self.selectors:
+            return None
+        calls = next(self._calls)
+        declared = calls <= self.warmup or (self.recheck_every and calls % self.recheck_every == 0)
+
+        tried = []
+
+        def attempt(index):
+            tried.append(index)
+            tag = self._select(index, element)
+            if tag is None:
+                return None
+            return extract(tag) if extract else tag
+
+        if declared:
+            chosen, result = self._first_declared(attempt)
+        else:
+            chosen, result = self._first_adaptive(attempt)
+
+        if record is not None:
+            for index in tried:
+                record(self.selectors[index], index == chosen)
+        if chosen is None:
+            return None
+        self._win(chosen)
+        return result
+
+    def _first_declared(self, attempt):
+        """모든 후보를 선언 순서대로 시도하여 처음 맞는 후보 선택 (함께 맞은 후보 기록)"""
+        hits = [(index, result) for index, result in ((i, attempt(i)) for i in range(len(self.selectors)))
+                if result is not None]
+        if not hits:
+            return None, None
+        matched = [index for index, _ in hits]
+        for position, index in enumerate(matched[1:], 1):
+            earlier = frozenset(matched[:position])
+            if not earlier <= self._overlaps[index]:
+                with self._lock:
+                    self._overlaps[index] = self._overlaps[index] | earlier
+        return hits[0]
+
+    def _first_adaptive(self, attempt):
+        """채택 순으로 시도하고, 맞은 후보와 함께 맞은 적이 있는 앞선 후보만 다시 확인"""
+        order = self._order
+        for position, chosen in enumerate(order):
+            result = attempt(chosen)
+            if result is not None:
+                break
+        else:
+            return None, None
+        missed = order[:position]
+        for earlier in sorted(self._overlaps[chosen]):
+            if earlier not in missed:
+                earlier_result = attempt(earlier)
+                if earlier_result is not None:
+                    return earlier, earlier_result
+        return chosen, result
+
+    def select_one(self, element, record=None):
+        """처음 채택된 요소 (없으면 None)"""
+        return self.first(element, record=record)
+
+    def _win(self, index: int) -> None:
+        with self._lock:
+            self._wins[index] += 1
+            position = self._order.index(index)
+            if position and self._wins[self._order[position - 1]] < self._wins[index]:
+                # 채택 횟수 많은 순 (같으면 선언 순)
+                self._order = sorted(range(len(self.selectors)), key=lambda i: (-self._wins[i], i))
+
+    def stats(self) -> Dict[str, int]:
+        """현재 시도 순서대로 선택자별 채택 횟수"""
+        with self._lock:
+            return {self.selectors[i]: self._wins[i] for i in self._order}
+
+
+class NoiseFilter:
+    """본문에서 뺄 노이즈 선택자 (미리 컴파일)"""
+
+    def __init__(self, selector: str):
+        self.selector = selector or ''
+        self._pattern = compile_selector(self.selector)
+
+    def text(self, tag, separator: str = ' ') -> str:
+        """
+        노이즈 하위 트리를 뺀 텍스트 (get_text(separator, strip=True)와 같은 규칙)
+        BeautifulSoup이면 한 번의 순회로 처리, selectolax면 lexbor로 노이즈 제거 후 추출
+        """
+        if not isinstance(tag, Tag) or (self.selector and self._pattern is None):
+            if self.selector:
+                for noise in tag.select(self.selector):
+                    noise.decompose()
+            return tag.get_text(separator, strip=True)
+
+        types = tag.interesting_string_types
+        pattern = self._pattern
+        parts = []
+        stack = [iter(tag.contents)]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, Tag):
+                    if pattern is None or not pattern.match(child):
+                        stack.append(iter(child.contents))
+                        break
+                elif type(child) in types:
+                    text = child.strip()
+                    if text:
+                        parts.append(text)
+            else:
+                stack.pop()
+        return separator.join(parts)
+
+
+_plans: Dict[Tuple[str, str, Tuple[str, ...]], SelectorPlan] = {}
+_noise_filters: Dict[str, NoiseFilter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_plan(site: str, field: str, selectors) -> SelectorPlan:
+    """사이트/필드별 추출 계획 (프로세스당 한 번만 컴파일, 같은 사이트의 크롤러끼리 공유)"""
+    if isinstance(selectors, str):
+        selectors = [selectors]
+    key = (site, field, tuple(selectors or ()))
+    plan = _plans.get(key)
+    if plan is None:
+        with _registry_lock:
+            plan = _plans.setdefault(key, SelectorPlan(key[2]))
+    return plan
+
+
+def get_noise_filter(selector: str) -> NoiseFilter:
+    """노이즈 선택자별 필터 (프로세스당 한 번만 컴파일)"""
+    noise_filter = _noise_filters.get(selector)
+    if noise_filter is None:
+        with _registry_lock:
+            noise_filter = _noise_filters.setdefault(selector, NoiseFilter(selector))
+    return noise_filter
+
+
+def plan_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """사이트별 → 필드별 → 선택자별 채택 횟수 (시도 순서대로)"""
+    with _registry_lock:
+        plans = list(_plans.items())
+    stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for (site, field, _), plan in plans:
+        stats.setdefault(site, {})[field] = plan.stats()
+    return stats
@@ -0,0 +1,289 @@
+"""
+피드/사이트맵 기반 기사 탐색
+RSS 2.0 / Atom 피드와 사이트맵(뉴스 사이트맵, 사이트맵 인덱스)에서 새 기사 URL과 날짜를 읽어
+목록 페이지를 넘기지 않고 기사를 찾음
+
+- 피드는 목록 페이지보다 훨씬 작고, 조건부 GET(If-None-Match / If-Modified-Since)으로
+  바뀌지 않았으면 304만 받으므로 자주 확인해도 부담이 적음
+- 재검증 정보와 마지막 본문은 HTTP 캐시(http_cache)에 'feed' 종류로 저장 (매번 재검증)
+- 탐색 결과는 목록 아이템과 같은 형태 (date, title, description, article_url, image_url)
+  피드가 기준일까지 거슬러 올라가지 못하면 complete=False → 호출자가 목록 페이지로 보충
+
+사용 예시:
+  python feed_discovery.py https://www.cctoday.co.kr/rss/S1N4.xml --days 3
+"""
+
+import re
+import html
+import logging
+import argparse
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from http_cache import get_response_cache
+from scraper.utils import get_common_headers, common_parse_date, fetch_url
+
+logger = logging.getLogger('FeedDiscovery')
+
+# 기사 날짜는 국내 신문사 기준(KST)으로 변환
+KST = timezone(timedelta(hours=9))
+
+_XML_ENCODING = re.compile(rb'<\?xml[^>]*encoding=["\']([A-Za-z0-9_.-]+)["\']')
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+_TAGS = re.compile(r'<[^>]+>')
+
+
+def _local(tag) -> str:
+    """네임스페이스를 뗀 태그 이름 (주석 등은 빈 문자열)"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _find(element, *names):
+    """하위 요소 중 이름이 names에 있는 첫 요소 (네임스페이스 무시)"""
+    for child in element.iter():
+        if child is not element and _local(child.tag) in names:
+            return child
+    return None
+
+
+def _text(element, *names) -> str:
+    """하위 요소 텍스트 (없으면 빈 문자열)"""
+    child = _find(element, *names)
+    return (child.text or '').strip() if child is not None else ''
+
+
+def _plain(text: str) -> str:
+    """피드 요약의 HTML 태그와 엔티티 제거"""
+    return ' '.join(html.unescape(_TAGS.sub(' ', text)).split())
+
+
+def parse_feed_date(text: str) -> str:
+    """RFC 822(RSS) / ISO 8601(Atom, 사이트맵) 날짜 → KST 기준 YYYY-MM-DD (없으면 빈 문자열)"""
+    text = (text or '').strip()
+    if not text:
+        return ''
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return common_parse_date(text)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(KST)
+    return parsed.strftime('%Y-%m-%d')
+
+
+def _parse_xml(content: bytes):
+    """XML 파싱 (expat이 지원하지 않는 EUC-KR 등은 선언된 인코딩으로 직접 디코딩)"""
+    content = content.lstrip()
+    try:
+        return ET.fromstring(content)
+    except (ET.ParseError, ValueError):
+        # ValueError: multi-byte encodings are not supported
+        match = _XML_ENCODING.search(content[:200])
+        if not match:
+            raise
+        text = content.decode(match.group(1).decode('ascii'), errors='replace')
+        return ET.fromstring(_XML_DECLARATION.sub('', text, count=1))
+
+
+def _entry(base_url: str, link: str, date: str, title: str = '', description: str = '', image: str = '') -> Dict:
+    return {
+        'date': date,
+        'title': _plain(title),
+        'description': _plain(description),
+        'article_url': urljoin(base_url, link.strip()),
+        'image_url': urljoin(base_url, image.strip()) if image else '',
+    }
+
+
+def _rss_image(item) -> str:
+    """RSS 아이템 이미지 (image/* enclosure 또는 media:content / media:thumbnail)"""
+    for child in item.iter():
+        name = _local(child.tag)
+        if name == 'enclosure' and child.get('type', 'image/').startswith('image/'):
+            return child.get('url', '')
+        if name in ('content', 'thumbnail') and child.get('url'):
+            return child.get('url')
+    return ''
+
+
+def _atom_link(entry) -> str:
+    """Atom 항목의 기사 링크 (rel="alternate" 또는 rel 없는 link)"""
+    for child in entry:
+        if _local(child.tag) == 'link' and child.get('rel', 'alternate') == 'alternate':
+            return child.get('href', '')
+    return ''
+
+
+def parse_feed(content: bytes, base_url: str = '') -> Tuple[List[Dict], List[Tuple[str, str]]]:
+    """
+    피드/사이트맵 본문 파싱
+
+    Returns:
+        (기사 항목 리스트, 하위 사이트맵 [(URL, 수정일)]) - 사이트맵 인덱스가 아니면 하위 사이트맵은 빈 리스트
+
+    Raises:
+        ValueError: 피드/사이트맵이 아니거나 XML이 깨진 경우
+    """
+    try:
+        root = _parse_xml(content)
+    except (ET.ParseError, LookupError) as e:
+        raise ValueError(f"XML 파싱 실패: {e}")
+
+    kind = _local(root.tag)
+    if kind == 'sitemapindex':
+        sitemaps = [(urljoin(base_url, _text(sitemap, 'loc')), parse_feed_date(_text(sitemap, 'lastmod')))
+                    for sitemap in root if _local(sitemap.tag) == 'sitemap' and _text(sitemap, 'loc')]
+        return [], sitemaps
+
+    entries = []
+    if kind == 'urlset':
+        # 뉴스 사이트맵이면 news:publication_date / news:title, 아니면 lastmod
+        for url in root:
+            if _local(url.tag) != 'url' or not _text(url, 'loc'):
+                continue
+            date = _text(url, 'publication_date') or _text(url, 'lastmod')
+            image = _find(url, 'image')
+            entries.append(_entry(base_url, _text(url, 'loc'), parse_feed_date(date), _text(url, 'title'),
+                                  image=_text(image, 'loc') if image is not None else ''))
+    elif kind == 'feed':
+        for item in root:
+            if _local(item.tag) != 'entry' or not _atom_link(item):
+                continue
+            date = _text(item, 'published') or _text(item, 'updated')
+            entries.append(_entry(base_url, _atom_link(item), parse_feed_date(date), _text(item, 'title'),
+                                  _text(item, 'summary') or _text(item, 'content'), _rss_image(item)))
+    elif kind in ('rss', 'RDF'):
+        for item in root.iter():
+            if _local(item.tag) != 'item' or not _text(item, 'link'):
+                continue
+            date = _text(item, 'pubDate') or _text(item, 'date')
+            entries.append(_entry(base_url, _text(item, 'link'), parse_feed_date(date), _text(item, 'title'),
+                                  _text(item, 'description'), _rss_image(item)))
+    else:
+        raise ValueError(f"피드/사이트맵 형식이 아닙니다: <{kind}>")
+    return entries, []
+
+
+class FeedDiscovery:
+    """
+    피드/사이트맵 URL 목록에서 새 기사 항목 탐색
+    요청은 fetch_url을 거치므로 도메인별 속도 제한과 계측이 그대로 적용됨
+    """
+
+    def __init__(self, session=None, headers: Optional[Dict] = None, logger=None, cache=None,
+                 max_sitemaps: int = 5):
+        """
+        Args:
+            session: 요청 세션 (None이면 공용 세션)
+            headers: 요청 헤더 (None이면 공통 헤더)
+            logger: 로거 (None이면 FeedDiscovery 로거)
+            cache: 조건부 GET용 HTTP 캐시 (None이면 공용 캐시)
+            max_sitemaps: 사이트맵 인덱스에서 읽을 최대 하위 사이트맵 수 (최근 수정 순)
+        """
+        self.session = session
+        self.headers = headers or get_common_headers()
+        self.logger = logger or logging.getLogger('FeedDiscovery')
+        self.cache = cache or get_response_cache()
+        self.max_sitemaps = max_sitemaps
+
+    def fetch(self, url: str) -> Optional[Tuple[bytes, bool]]:
+        """피드 요청 → (본문, 304로 캐시 본문을 재사용했는지), 실패하면 None"""
+        response = fetch_url(url, self.headers, self.logger, session=self.session,
+                             cache=self.cache, page_class='feed')
+        if response is None:
+            return None
+        return response.content, response.headers.get('X-From-Cache') == '1'
+
+    def read(self, url: str, limit_date: str = '') -> Optional[Dict]:
+        """
+        피드/사이트맵 하나 읽기 (사이트맵 인덱스면 limit_date 이후 수정된 하위 사이트맵까지)
+
+        Returns:
+            {'entries', 'oldest', 'not_modified'} 또는 실패 시 None
+        """
+        fetched = self.fetch(url)
+        if fetched is None:
+            return None
+        content, not_modified = fetched
+        try:
+            entries, sitemaps = parse_feed(content, url)
+        except ValueError as e:
+            self.logger.warning(f"피드 해석 실패 ({url}): {e}")
+            return None
+
+        if sitemaps:
+            recent = [loc for loc, lastmod in sorted(sitemaps, key=lambda s: s[1], reverse=True)
+                      if not lastmod or lastmod >= limit_date][:self.max_sitemaps]
+            results = [result for result in (self.read(loc, limit_date) for loc in recent) if result]
+            if not results:
+                return None
+            entries = [entry for result in results for entry in result['entries']]
+            not_modified = all(result['not_modified'] for result in results)
+
+        dates = [entry['date'] for entry in entries if entry['date']]
+        return {'entries': entries, 'oldest': min(dates) if dates else '', 'not_modified': not_modified}
+
+    def discover(self, feed_urls: List[str], limit_date: str = '', end_date: Optional[str] = None) -> Optional[Dict]:
+        """
+        여러 피드에서 limit_date ~ end_date 기사 항목 탐색 (URL 기준 중복 제거, 최신순)
+
+        Returns:
+            {'entries', 'complete', 'not_modified'} 또는 모든 피드가 실패하면 None
+            complete: 읽은 피드가 모두 limit_date 이전 기사까지 포함 (목록 페이지 보충 불필요)
+            not_modified: 모든 피드가 304 (지난번 이후 새 기사 없음)
+        """
+        results = []
+        for url in feed_urls:
+            result = self.read(url, limit_date)
+            if result is None:
+                continue
+            self.logger.info(f"피드 {url}: {len(result['entries'])}개 항목"
+                             f"{' (변경 없음)' if result['not_modified'] else ''}")
+            results.append(result)
+        if not results:
+            return None
+
+        entries = {}
+        for result in results:
+            for entry in result['entries']:
+                if entry['date'] and entry['date'] < limit_date:
+                    continue
+                if end_date and entry['date'] and entry['date'] > end_date:
+                    continue
+                entries.setdefault(entry['article_url'], entry)
+
+        return {
+            'entries': sorted(entries.values(), key=lambda entry: entry['date'], reverse=True),
+            'complete': all(result['oldest'] and result['oldest'] < limit_date for result in results),
+            'not_modified': all(result['not_modified'] for result in results),
+        }
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='RSS/Atom 피드·사이트맵 기사 탐색')
+    parser.add_argument('urls', nargs='+', help='피드 또는 사이트맵 URL')
+    parser.add_argument('--days', type=int, default=1, help='탐색 기간 (일)')
+    args = parser.parse_args()
+
+    limit_date = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d')
+    result = FeedDiscovery().discover(args.urls, limit_date)
+    if result is None:
+        print("피드를 읽지 못했습니다.")
+        return
+
+    for entry in result['entries']:
+        print(f"{entry['date']}  {entry['article_url']}  {entry['title'][:40]}")
+    print(f"\n{len(result['entries'])}개 항목, 기준일({limit_date})까지 포함: {result['complete']}, "
+          f"변경 없음: {result['not_modified']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,451 @@
+"""
+HTML 파서 선택 모듈
+BeautifulSoup(html.parser) 대신 더 빠른 파서(lxml, selectolax/lexbor)를 골라 쓸 수 있게 함
+
+- parse_html(): select / select_one / get_text / get / [] / name / decompose 만 쓰는 코드용
+                (selectolax 사용 가능)
+- make_soup(): find(text=...) 등 BeautifulSoup 전체 API가 필요한 코드용
+               (항상 BeautifulSoup, 트리 빌더만 lxml로 교체)
+- target_filter(): 본문/부제/날짜 선택자가 가리키는 하위 트리만 만드는 부분 파싱용 필터
+                   (parse_html/make_soup의 targets로 전달, 기본 백엔드가 selectolax여도
+                    BeautifulSoup 트리 빌더로 파싱, 필수 선택자가 빠지면 전체 파싱으로 다시 시도)
+
+백엔드는 환경 변수 CRAWLER_HTML_PARSER ('selectolax', 'lxml', 'html.parser')로 지정,
+지정하지 않으면 설치된 것 중 selectolax → lxml → html.parser 순으로 사용
+"""
+
+import os
+import re
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+try:
+    from bs4.filter import ElementFilter
+except ImportError:  # beautifulsoup4 < 4.13
+    ElementFilter = None
+
+try:
+    import soupsieve
+except ImportError:
+    soupsieve = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger('HtmlParser')
+
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+# BeautifulSoup의 get_text()가 제외하는 태그 (스크립트/스타일 본문)
+_NON_TEXT_TAGS = {'script', 'style', 'template'}
+_TEXT_SENTINEL = '\x1f'
+
+
+def available_backends() -> List[str]:
+    """현재 환경에서 사용 가능한 백엔드 목록"""
+    backends = []
+    if LexborHTMLParser is not None:
+        backends.append('selectolax')
+    if HAS_LXML:
+        backends.append('lxml')
+    backends.append('html.parser')
+    return backends
+
+
+def default_backend() -> str:
+    """환경 변수 또는 설치 상태에 따른 기본 백엔드"""
+    backend = os.environ.get('CRAWLER_HTML_PARSER', '').strip().lower()
+    if backend:
+        if backend in available_backends():
+            return backend
+        logger.warning(f"HTML 파서 '{backend}'를 사용할 수 없습니다. 기본 파서를 사용합니다.")
+    return available_backends()[0]
+
+
+def _soup_builder() -> str:
+    """BeautifulSoup 트리 빌더 (selectolax가 기본이어도 lxml 사용)"""
+    backend = default_backend()
+    if backend == 'html.parser' or not HAS_LXML:
+        return 'html.parser'
+    return 'lxml'
+
+
+class LexborElement:
+    """
+    selectolax 노드를 BeautifulSoup 태그처럼 쓰기 위한 래퍼
+    프로젝트에서 사용하는 select / select_one / get_text / get / [] / name / decompose 지원
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def _text_root(self):
+        return self._node
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def attrs(self) -> dict:
+        attrs = {}
+        for key, value in self._node.attributes.items():
+            value = value if value is not None else ''
+            # BeautifulSoup과 동일하게 class는 리스트로 반환
+            attrs[key] = value.split() if key == 'class' else value
+        return attrs
+
+    def get(self, key: str, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key: str) -> bool:
+        return key in self._node.attributes
+
+    def __getitem__(self, key: str):
+        return self.attrs[key]
+
+    def select_one(self, selector: str) -> Optional['LexborElement']:
+        node = self._node.css_first(selector)
+        return LexborElement(node) if node is not None else None
+
+    def select(self, selector: str) -> List['LexborElement']:
+        return [LexborElement(node) for node in self._node.css(selector)]
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        """BeautifulSoup의 get_text와 같은 규칙으로 텍스트 추출 (script/style 제외)"""
+        root = self._text_root()
+        if root is None:
+            return ''
+
+        if root.css_first('script, style, template') is None:
+            # 빠른 경로: lexbor 내부 텍스트 추출 사용
+            if not strip:
+                return root.text(deep=True, separator=separator)
+            raw = root.text(deep=True, separator=_TEXT_SENTINEL, strip=True)
+            return separator.join(part for part in raw.split(_TEXT_SENTINEL) if part)
+
+        parts = []
+        for node in root.traverse(include_text=True):
+            if node.tag != '-text':
+                continue
+            parent = node.parent
+            if parent is not None and parent.tag in _NON_TEXT_TAGS:
+                continue
+            text = node.text_content or ''
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            parts.append(text)
+        return separator.join(parts)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    def decompose(self) -> None:
+        self._node.decompose()
+
+    def __str__(self) -> str:
+        return self._node.html or ''
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class LexborDocument(LexborElement):
+    """selectolax 문서 (BeautifulSoup 객체 대응)"""
+
+    __slots__ = ()
+
+    def _text_root(self):
+        return self._node.root
+
+    @property
+    def name(self) -> str:
+        return '[document]'
+
+    @property
+    def attrs(self) -> dict:
+        return {}
+
+    def has_attr(self, key: str) -> bool:
+        return False
+
+    def decompose(self) -> None:
+        pass
+
+    def __str__(self) -> str:
+        return self._node.html or ''
+
+
+# 부분 파싱 대상이 될 수 있는 선택자의 맨 앞 단위 (태그, #id, .class, [속성] 조합)
+_COMPOUND_PART = re.compile(
+    r'([a-zA-Z][\w-]*|\*)'
+    r'|#([\w-]+)'
+    r'|\.([\w-]+)'
+    r'|\[\s*([\w:-]+)\s*(?:([~|^$*]?=)\s*(?:"([^"]*)"|\'([^\']*)\'|([^\]\s]+))\s*)?\]'
+)
+# 뒤쪽 단위에 있으면 하위 트리 밖을 참조할 수 있는 의사 클래스
+_OUTER_PSEUDO = re.compile(r':(?:not|is|where|has|matches|root|scope)\b')
+
+_ATTR_TESTS = {
+    None: lambda value, expected: True,
+    '=': lambda value, expected: value == expected,
+    '~=': lambda value, expected: expected in value.split(),
+    '^=': lambda value, expected: bool(expected) and value.startswith(expected),
+    '$=': lambda value, expected: bool(expected) and value.endswith(expected),
+    '*=': lambda value, expected: bool(expected) and expected in value,
+    '|=': lambda value, expected: value == expected or value.startswith(expected + '-'),
+}
+
+
+def _split_selector_list(selector: str) -> List[str]:
+    """쉼표로 묶인 선택자 목록 분리 (괄호/대괄호 안의 쉼표는 유지)"""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(selector):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(selector[start:i])
+            start = i + 1
+    parts.append(selector[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _leading_compound(selector: str) -> Optional[Tuple]:
+    """
+    선택자의 맨 앞 단위 → (태그, id, class 목록, [(속성, 연산자, 값)])
+    맨 앞 단위와 일치하는 요소의 하위 트리에 선택 결과가 모두 들어 있는 경우만 반환
+    (형제 결합자 +/~, 맨 앞의 의사 클래스, 하위 트리 밖을 참조하는 의사 클래스가 있으면 None)
+    """
+    tag, element_id, classes, attrs = None, None, [], []
+    pos = 0
+    while pos < len(selector):
+        match = _COMPOUND_PART.match(selector, pos)
+        if not match or match.end() == pos:
+            break
+        name, id_, class_, attr, op, quoted1, quoted2, bare = match.groups()
+        if name:
+            if pos:
+                return None
+            tag = None if name == '*' else name.lower()
+        elif id_:
+            element_id = id_
+        elif class_:
+            classes.append(class_)
+        else:
+            value = next((v for v in (quoted1, quoted2, bare) if v is not None), None)
+            attrs.append((attr.lower(), op, value))
+        pos = match.end()
+
+    rest = selector[pos:]
+    if not pos or (rest and not rest[0].isspace() and rest[0] != '>'):
+        return None
+    depth = 0
+    for char in rest:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char in '+~' and depth == 0:
+            return None
+    if _OUTER_PSEUDO.search(rest):
+        return None
+    return tag, element_id, classes, attrs
+
+
+def _compound_matches(compound: Tuple, name: str, attrs: Dict) -> bool:
+    tag, element_id, classes, attr_tests = compound
+    if tag and name != tag:
+        return False
+    if element_id and attrs.get('id') != element_id:
+        return False
+    if classes:
+        present = attrs.get('class') or ''
+        present = present if isinstance(present, (list, tuple)) else present.split()
+        if not all(class_ in present for class_ in classes):
+            return False
+    for attr, op, expected in attr_tests:
+        value = attrs.get(attr)
+        if value is None:
+            return False
+        if isinstance(value, (list, tuple)):
+            value = ' '.join(value)
+        if not _ATTR_TESTS[op](value, expected):
+            return False
+    return True
+
+
+class TargetFilter:
+    """
+    부분 파싱 필터
+    선택자들의 맨 앞 단위와 일치하는 요소의 하위 트리만 BeautifulSoup 객체로 만듦
+    (내비게이션, 푸터, 광고, 스크립트 영역은 토큰만 읽고 객체를 만들지 않음)
+
+    선택자 중 하나라도 부분 파싱으로 결과를 보장할 수 없으면 비활성 (항상 전체 파싱)
+    required 선택자가 부분 트리에서 하나도 찾아지지 않으면 호출자가 전체 파싱으로 다시 시도
+    """
+
+    def __init__(self, selectors: Sequence[str], required: Sequence[str] = ()):
+        """
+        Args:
+            selectors: 추출에 쓰는 선택자 전체 (본문, 부제, 날짜 등)
+            required: 부분 트리에 반드시 있어야 하는 선택자 (보통 본문 선택자)
+        """
+        self.selectors = [selector for selector in selectors if selector]
+        self.required = [selector for selector in required if selector]
+        self.hits = 0
+        self.misses = 0
+
+        compounds = []
+        for selector in self.selectors:
+            for part in _split_selector_list(selector):
+                compound = _leading_compound(part)
+                if compound is None:
+                    compounds = None
+                    break
+                compounds.append(compound)
+            if compounds is None:
+                break
+        self._compounds = compounds or None
+
+        required_selector = ', '.join(self.required)
+        self._required = None
+        if required_selector and soupsieve is not None:
+            try:
+                self._required = soupsieve.compile(required_selector)
+            except Exception:
+                self._required = None
+        self._required_selector = required_selector
+
+    def __bool__(self) -> bool:
+        return self._compounds is not None
+
+    def _allow(self, name: str, attrs) -> bool:
+        attrs = attrs or {}
+        return any(_compound_matches(compound, name, attrs) for compound in self._compounds)
+
+    def strainer(self):
+        """BeautifulSoup parse_only 인자"""
+        if ElementFilter is not None:
+            return _TargetElementFilter(self._allow)
+        # beautifulsoup4 < 4.13: 이름 자리의 함수가 (태그 이름, 속성)으로 호출됨
+        return SoupStrainer(self._allow)
+
+    def found(self, soup) -> bool:
+        """부분 트리에 필수 선택자가 있는지 (없으면 전체 파싱 필요)"""
+        if not self._required_selector:
+            found = True
+        elif self._required is not None:
+            found = self._required.select_one(soup) is not None
+        else:
+            found = soup.select_one(self._required_selector) is not None
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+
+if ElementFilter is not None:
+    class _TargetElementFilter(ElementFilter):
+        """TargetFilter를 beautifulsoup4 4.13+ parse_only 인터페이스로 연결"""
+
+        def __init__(self, allow):
+            super().__init__()
+            self._allow = allow
+
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            return self._allow(name, attrs)
+
+        def allow_string_creation(self, string) -> bool:
+            # 대상 하위 트리 밖의 문자열 (하위 트리 안은 이 필터를 거치지 않음)
+            return False
+
+
+_target_filters: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], TargetFilter] = {}
+_target_filters_lock = threading.Lock()
+
+
+def target_filter(selectors: Sequence[str], required: Sequence[str] = ()) -> TargetFilter:
+    """선택자 조합별 부분 파싱 필터 (프로세스당 한 번만 생성, 사이트의 작업자끼리 공유)"""
+    key = (tuple(selectors), tuple(required))
+    target = _target_filters.get(key)
+    if target is None:
+        with _target_filters_lock:
+            target = _target_filters.setdefault(key, TargetFilter(*key))
+    return target
+
+
+def parse_html(markup: Union[str, bytes], backend: Optional[str] = None,
+               encoding: Optional[str] = None, targets: Optional[TargetFilter] = None):
+    """
+    HTML 파싱
+
+    Args:
+        markup: HTML 문자열 또는 바이트
+        backend: 'selectolax', 'lxml', 'html.parser' (None이면 default_backend())
+        encoding: markup이 바이트일 때 사용할 인코딩
+        targets: 부분 파싱 필터 (backend를 지정하지 않으면 기본 백엔드가 selectolax여도
+                 BeautifulSoup 트리 빌더로 부분 파싱, backend='selectolax'를 직접 주면 무시)
+
+    Returns:
+        BeautifulSoup 객체 또는 LexborDocument (select 계열 API 동일)
+    """
+    if backend is None and targets:
+        return _targeted_parse(markup, _soup_builder(), encoding, targets)
+    backend = backend or default_backend()
+
+    if backend == 'selectolax' and LexborHTMLParser is not None:
+        if isinstance(markup, bytes):
+            markup = markup.decode(encoding or 'utf-8', errors='replace')
+        return LexborDocument(LexborHTMLParser(markup))
+
+    if backend == 'selectolax':
+        backend = 'lxml' if HAS_LXML else 'html.parser'
+    return _targeted_parse(markup, backend, encoding, targets)
+
+
+def make_soup(markup: Union[str, bytes], encoding: Optional[str] = None,
+              targets: Optional[TargetFilter] = None) -> BeautifulSoup:
+    """BeautifulSoup 전체 API가 필요한 경우 (가장 빠른 트리 빌더 사용, targets를 주면 부분 파싱)"""
+    return _targeted_parse(markup, _soup_builder(), encoding, targets)
+
+
+def _targeted_parse(markup: Union[str, bytes], builder: str, encoding: Optional[str],
+                    targets: Optional[TargetFilter]) -> BeautifulSoup:
+    """부분 파싱 후 필수 선택자가 없으면 전체 파싱"""
+    if targets:
+        soup = _bs4_parse(markup, builder, encoding, targets.strainer())
+        if targets.found(soup):
+            return soup
+        logger.debug(f"부분 파싱에서 필수 선택자를 찾지 못해 전체 파싱: {targets.required}")
+    return _bs4_parse(markup, builder, encoding)
+
+
+def _bs4_parse(markup: Union[str, bytes], builder: str, encoding: Optional[str],
+               parse_only=None) -> BeautifulSoup:
+    """BeautifulSoup 생성 (바이트일 때만 from_encoding 전달)"""
+    kwargs = {'from_encoding': encoding} if isinstance(markup, bytes) and encoding else {}
+    if parse_only is not None:
+        kwargs['parse_only'] = parse_only
+    try:
+        return BeautifulSoup(markup, builder, **kwargs)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', **kwargs)
@@ -0,0 +1,201 @@
+"""
+HTTP 응답 캐시 모듈
+URL 기준으로 응답 본문을 디스크(SQLite)에 저장하고,
+만료된 항목은 조건부 GET(If-None-Match / If-Modified-Since)으로 재검증
+"""
+
+import os
+import json
+import zlib
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger('ResponseCache')
+
+# 페이지 종류별 캐시 유효 시간(초)
+DEFAULT_TTLS = {
+    'list': 10 * 60,                # 목록 페이지: 새 기사가 계속 올라오므로 짧게
+    'article': 30 * 24 * 60 * 60,   # 기사 상세: 거의 바뀌지 않음
+    'feed': 0,                      # RSS/사이트맵: 매번 조건부 GET으로 재검증 (변경 없으면 304)
+}
+
+
+class ResponseCache:
+    """
+    SQLite 기반 HTTP 응답 캐시
+    여러 스레드가 하나의 인스턴스를 공유할 수 있도록 내부 잠금 사용
+    """
+
+    def __init__(self,
+                 db_path: str = 'data/http_cache.db',
+                 max_size_mb: int = 1024,
+                 ttls: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            db_path: 캐시 DB 파일 경로 (상대 경로면 프로젝트 루트 기준)
+            max_size_mb: 캐시 최대 크기(MB), 초과 시 오래 안 쓴 항목부터 삭제
+            ttls: 페이지 종류별 유효 시간(초) (예: {'list': 600, 'article': 2592000})
+        """
+        if os.path.isabs(db_path):
+            self.db_path = db_path
+        else:
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            self.db_path = os.path.join(project_root, db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        logger.info(f"✓ HTTP 캐시 경로: {self.db_path}")
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    status INTEGER,
+                    headers TEXT,
+                    body BLOB,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL,
+                    accessed_at REAL,
+                    size INTEGER
+                )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)')
+            self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT status, headers, body, etag, last_modified, fetched_at FROM responses WHERE url = ?',
+                (url,)
+            ).fetchone()
+            if not row:
+                return None
+            self._conn.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            self._conn.commit()
+
+        status, headers, body, etag, last_modified, fetched_at = row
+        return {
+            'url': url,
+            'status': status,
+            'headers': json.loads(headers) if headers else {},
+            'body': zlib.decompress(body) if body else b'',
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+        }
+
+    def is_fresh(self, entry: Dict, page_class: str = 'article') -> bool:
+        """페이지 종류의 TTL 안에 있는지 확인"""
+        ttl = self.ttls.get(page_class, self.ttls['article'])
+        return time.time() - entry['fetched_at'] < ttl
+
+    @staticmethod
+    def conditional_headers(entry: Dict) -> Dict[str, str]:
+        """재검증용 조건부 요청 헤더"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, response) -> None:
+        """200 응답 저장"""
+        body = zlib.compress(response.content)
+        headers = {k: v for k, v in response.headers.items() if k.lower() == 'content-type'}
+        now = time.time()
+
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+            self._conn.execute('''
+                INSERT OR REPLACE INTO responses
+                (url, status, headers, body, etag, last_modified, fetched_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                url,
+                response.status_code,
+                json.dumps(headers),
+                body,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                now,
+                now,
+                len(body)
+            ))
+            self._conn.commit()
+            self._total_bytes += len(body) - (old[0] if old else 0)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def touch(self, url: str) -> None:
+        """304 응답 시 캐시 유효 시간 갱신"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """최대 크기의 90% 이하가 될 때까지 오래 안 쓴 항목부터 삭제 (잠금 보유 상태에서 호출)"""
+        target = int(self.max_bytes * 0.9)
+        cursor = self._conn.execute('SELECT url, size FROM responses ORDER BY accessed_at ASC')
+
+        victims = []
+        for url, size in cursor:
+            if self._total_bytes <= target:
+                break
+            victims.append((url,))
+            self._total_bytes -= size
+
+        self._conn.executemany('DELETE FROM responses WHERE url = ?', victims)
+        self._conn.commit()
+        logger.debug(f"캐시 정리: {len(victims)}개 항목 삭제")
+
+    @staticmethod
+    def to_response(entry: Dict) -> requests.Response:
+        """캐시 항목을 requests.Response 형태로 변환"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry['url']
+        response._content = entry['body']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.headers['X-From-Cache'] = '1'
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 전체에서 공유하는 캐시 인스턴스 반환"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
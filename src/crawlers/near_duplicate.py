@@ -0,0 +1,257 @@
+"""
+유사 중복 기사 탐지 모듈 (SimHash)
+지역 신문이 연합뉴스 등 통신사 기사를 조금씩 고쳐 재게재하는 경우를 찾아
+원본(canonical) 기사에 연결 → 키워드 추출/감성 분석을 원본 한 번만 수행
+
+- 본문을 정규화(기자명/이메일/저작권 문구/공백/특수문자 제거)한 뒤 글자 4-gram으로 64비트 SimHash 계산
+- 해밍 거리 max_distance(기본 7) 이하면 중복으로 판단
+  (news.db 기사에서 한 문장을 빼거나 바꾸거나 넣으면 평균 6비트 정도 달라짐: 7 이하가 72%, 15문장 이상 기사는 90%.
+   서로 다른 기사끼리는 같은 사건을 다시 쓴 기사 외에는 7 이내로 가까운 경우가 없었음)
+- 64비트를 16비트 4개 밴드로 나누어 저장: 거리가 7 이하인 두 값은 적어도 한 밴드가 1비트 이하로 다르므로
+  밴드마다 같은 값과 1비트씩 뒤집은 값 16개(밴드당 17개)를 인덱스에서 조회해 후보만 찾고 거리 계산
+  (8비트 밴드 8개는 조회마다 전체의 1/32 정도가 후보로 나오지만, 이 방식은 1/1000 정도)
+- 지문은 각 뉴스 DB의 fingerprints 테이블에 저장 (원본 기사만 인덱스에 등록)
+"""
+
+import re
+import sqlite3
+import logging
+from collections import Counter
+from hashlib import blake2b
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger('NearDuplicate')
+
+SHINGLE_SIZE = 4
+BAND_BITS = 16
+BANDS = 64 // BAND_BITS
+# 밴드마다 이 비트 수까지 뒤집어 조회 (찾을 수 있는 최대 거리 = (PROBE_BITS + 1) * BANDS - 1)
+PROBE_BITS = 1
+MAX_DISTANCE = (PROBE_BITS + 1) * BANDS - 1
+BAND_COLUMNS = [f'band{i}' for i in range(BANDS)]
+
+# 통신사 기사 머리/꼬리에 붙는 출처/기자/저작권 문구 (매체마다 다르게 붙어 비교에서 제외)
+_BOILERPLATE_RE = re.compile(
+    r'\([^)]{0,20}=\s*[^)]{0,20}\)'                  # (서울=연합뉴스)
+    r'|[가-힣]{2,4}\s*(?:기자|특파원)\s*=?'             # 홍길동 기자 =
+    r'|[\w.+-]+@[\w-]+(?:\.[\w-]+)+'                   # 이메일
+    r'|<?저작권자[^\n]*|무단\s*전재[^\n]*|재배포\s*금지[^\n]*|ⓒ[^\n]*|©[^\n]*'
+)
+_NON_WORD_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_content(text: str) -> str:
+    """비교용 본문 정규화 (출처/기자/저작권 문구, 공백, 특수문자 제거)"""
+    if not text:
+        return ''
+    text = _BOILERPLATE_RE.sub(' ', str(text).lower())
+    return _NON_WORD_RE.sub('', text)
+
+
+def simhash(text: str) -> Optional[int]:
+    """정규화된 본문의 64비트 SimHash (4-gram이 없을 만큼 짧으면 None)"""
+    shingles = Counter(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+    if not shingles:
+        return None
+
+    hashes = np.fromiter(
+        (int.from_bytes(blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big') for s in shingles),
+        dtype=np.uint64, count=len(shingles)
+    )
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+    # (N, 64) 비트 행렬, 비트마다 가중치 합의 부호로 지문 결정
+    bits = np.unpackbits(hashes.astype('>u8').view(np.uint8).reshape(-1, 8), axis=1)
+    score = weights @ (bits.astype(np.int64) * 2 - 1)
+    return int.from_bytes(np.packbits(score > 0).tobytes(), 'big')
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def bands(fingerprint: int) -> List[int]:
+    """16비트 밴드 4개 (상위 비트부터)"""
+    mask = (1 << BAND_BITS) - 1
+    return [(fingerprint >> (BAND_BITS * (BANDS - 1 - i))) & mask for i in range(BANDS)]
+
+
+def band_probes(band: int) -> List[int]:
+    """조회할 밴드 값 (같은 값과 1비트씩 뒤집은 값)"""
+    return [band] + [band ^ (1 << bit) for bit in range(BAND_BITS)]
+
+
+def probes(fingerprint: int) -> List[int]:
+    """_FIND_SQL 인자 (밴드 순서대로 band_probes)"""
+    return [value for band in bands(fingerprint) for value in band_probes(band)]
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장하기 위한 변환"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+_FIND_SQL = f'''
+    SELECT news_id, simhash FROM fingerprints
+    WHERE {' OR '.join(f"{column} IN ({', '.join('?' * (BAND_BITS + 1))})" for column in BAND_COLUMNS)}
+    ORDER BY news_id
+'''
+_INSERT_SQL = f'''
+    INSERT OR REPLACE INTO fingerprints (news_id, simhash, {', '.join(BAND_COLUMNS)})
+    VALUES ({', '.join('?' * (BANDS + 2))})
+'''
+
+
+class SimHashIndex:
+    """메모리 밴드 인덱스 (DB에 넣기 전 같은 배치 안의 중복 확인용)"""
+
+    def __init__(self, max_distance: int = 7):
+        self.max_distance = max_distance
+        self._bands: Dict[tuple, List[tuple]] = {}
+
+    def find(self, fingerprint: int):
+        """거리 이내의 등록된 키 (없으면 None)"""
+        for i, band in enumerate(bands(fingerprint)):
+            for probe in band_probes(band):
+                for key, other in self._bands.get((i, probe), ()):
+                    if hamming(fingerprint, other) <= self.max_distance:
+                        return key
+        return None
+
+    def add(self, key, fingerprint: int):
+        for i, band in enumerate(bands(fingerprint)):
+            self._bands.setdefault((i, band), []).append((key, fingerprint))
+
+
+class NearDuplicateDetector:
+    """
+    뉴스 DB의 지문 인덱스 (fingerprints 테이블, news.canonical_id 컬럼)
+    메서드는 호출하는 쪽의 커서를 받아 같은 트랜잭션 안에서 동작
+    """
+
+    def __init__(self, max_distance: int = 7, min_length: int = 200):
+        """
+        Args:
+            max_distance: 중복으로 볼 최대 해밍 거리 (밴드 4개, 1비트 조회 구조상 7 이하)
+            min_length: 정규화된 본문이 이보다 짧으면 비교하지 않음 (짧은 글은 오탐이 많음)
+        """
+        if max_distance > MAX_DISTANCE:
+            raise ValueError(f"max_distance는 {MAX_DISTANCE} 이하여야 합니다.")
+        self.max_distance = max_distance
+        self.min_length = min_length
+
+    def fingerprint(self, content: str) -> Optional[int]:
+        """본문 지문 (비교 대상이 아니면 None)"""
+        text = normalize_content(content)
+        if len(text) < self.min_length:
+            return None
+        return simhash(text)
+
+    def ensure_schema(self, cursor):
+        """
+        fingerprints 테이블과 news.canonical_id 컬럼 생성
+        밴드 구성이 다른 기존 fingerprints 테이블은 지우고 다시 만듦 (index_existing이 원본 기사 지문을 다시 계산)
+        """
+        try:
+            cursor.execute("ALTER TABLE news ADD COLUMN canonical_id INTEGER")
+            logger.info("✓ canonical_id 컬럼 추가 완료")
+        except sqlite3.OperationalError:
+            pass  # 이미 존재하는 경우
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_canonical ON news (canonical_id)")
+
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(fingerprints)")}
+        if columns and columns != {'news_id', 'simhash', *BAND_COLUMNS}:
+            cursor.execute("DROP TABLE fingerprints")
+            logger.info(f"✓ fingerprints 테이블을 밴드 {BANDS}개 구성으로 다시 만듭니다.")
+        # simhash가 NULL인 행은 비교 대상이 아닌 기사 (다시 검사하지 않도록 기록)
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                news_id INTEGER PRIMARY KEY,
+                simhash INTEGER,
+                {', '.join(f'{column} INTEGER' for column in BAND_COLUMNS)}
+            )
+        ''')
+        for column in BAND_COLUMNS:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_fingerprints_{column} ON fingerprints ({column})")
+
+    def find_canonical(self, cursor, fingerprint: Optional[int]) -> Optional[int]:
+        """지문이 가까운 원본 기사 id (없으면 None)"""
+        if fingerprint is None:
+            return None
+        rows = cursor.execute(_FIND_SQL, probes(fingerprint)).fetchall()
+        for news_id, other in rows:
+            if hamming(fingerprint, _to_unsigned(other)) <= self.max_distance:
+                return news_id
+        return None
+
+    def add(self, cursor, news_id: int, fingerprint: Optional[int]):
+        """원본 기사 지문 등록 (None이면 검사 완료 표시만)"""
+        if fingerprint is None:
+            cursor.execute("INSERT OR REPLACE INTO fingerprints (news_id) VALUES (?)", (news_id,))
+            return
+        cursor.execute(_INSERT_SQL, (news_id, _to_signed(fingerprint), *bands(fingerprint)))
+
+    def add_many(self, cursor, items):
+        """원본 기사 지문 여러 개 등록 ((news_id, 지문) 목록, 지문이 None이면 검사 완료 표시만)"""
+        checked, indexed = [], []
+        for news_id, fingerprint in items:
+            if fingerprint is None:
+                checked.append((news_id,))
+            else:
+                indexed.append((news_id, _to_signed(fingerprint), *bands(fingerprint)))
+        if checked:
+            cursor.executemany("INSERT OR REPLACE INTO fingerprints (news_id) VALUES (?)", checked)
+        if indexed:
+            cursor.executemany(_INSERT_SQL, indexed)
+
+    def canonical_fields(self, cursor, canonical_id: int) -> Dict:
+        """중복 기사에 복사할 원본의 키워드/감성 결과"""
+        row = cursor.execute(
+            "SELECT keyword, sentiment_score, is_processed FROM news WHERE id = ?", (canonical_id,)
+        ).fetchone()
+        if row is None:
+            return {}
+        return {'keyword': row[0], 'sentiment_score': row[1], 'is_processed': row[2] or 0}
+
+    def index_existing(self, cursor) -> int:
+        """
+        지문이 없는 기존 기사를 id 순으로 검사해 인덱스 등록 또는 원본에 연결
+        (처음 한 번은 전체를 검사, 이후에는 새로 들어온 기사만)
+
+        Returns:
+            중복으로 연결된 기사 수
+        """
+        rows = cursor.execute('''
+            SELECT id, content FROM news
+            WHERE canonical_id IS NULL AND id NOT IN (SELECT news_id FROM fingerprints)
+            ORDER BY id
+        ''').fetchall()
+
+        linked = 0
+        for news_id, content in rows:
+            fingerprint = self.fingerprint(content)
+            canonical_id = self.find_canonical(cursor, fingerprint)
+            if canonical_id is None:
+                self.add(cursor, news_id, fingerprint)
+                continue
+            cursor.execute("UPDATE news SET canonical_id = ? WHERE id = ?", (canonical_id, news_id))
+            # 지문을 다시 계산하면서 원본이 중복으로 바뀐 경우 그 기사에 연결된 중복도 새 원본으로
+            cursor.execute("UPDATE news SET canonical_id = ? WHERE canonical_id = ?", (canonical_id, news_id))
+            linked += 1
+
+        if rows:
+            logger.info(f"✓ 기존 기사 {len(rows)}개 지문 검사 (중복 {linked}개 연결)")
+        return linked
+
+    def remove_orphans(self, cursor):
+        """삭제된 기사의 지문 정리 (원본이 삭제된 중복 기사는 연결을 풀어 다음 검사에서 다시 판단)"""
+        cursor.execute("DELETE FROM fingerprints WHERE news_id NOT IN (SELECT id FROM news)")
+        cursor.execute('''
+            UPDATE news SET canonical_id = NULL
+            WHERE canonical_id IS NOT NULL AND canonical_id NOT IN (SELECT id FROM news)
+        ''')
@@ -61,7 +61,7 @@ class GenericNewspaperCrawler(BaseCrawler):
     
     def get_article_urls(self) -> List[str]:
         """기사 URL 목록 추출"""
-        soup = self.fetch_page(self.news_config.list_url)
+        soup = self.fetch_page(self.news_config.list_url, page_class='list')
         
         if not soup:
             return []
@@ -127,7 +127,8 @@ class GenericNewspaperCrawler(BaseCrawler):
         if method == 'selector':
             return ContentParser.extract_from_selector(
                 soup, 
-                self.news_config.content_selectors
+                self.news_config.content_selectors,
+                plan_key=self.news_config.base_url
             )
         elif method == 'paragraphs':
             return ContentParser.extract_from_paragraphs(
@@ -142,7 +143,8 @@ class GenericNewspaperCrawler(BaseCrawler):
         else:
             return ContentParser.extract_from_selector(
                 soup,
-                self.news_config.content_selectors
+                self.news_config.content_selectors,
+                plan_key=self.news_config.base_url
             )
     
     def _get_timestamp(self) -> str:
@@ -201,7 +203,10 @@ class NewspaperFactory:
         config = NewspaperFactory.PRESETS.get(newspaper_name)
         
         if config:
-            return GenericNewspaperCrawler(config)
+            crawler = GenericNewspaperCrawler(config)
+            # 보관본 재추출 시 같은 사전 설정으로 크롤러를 다시 생성
+            crawler.archive_source = f"factory:{newspaper_name}"
+            return crawler
         else:
             return None
     
@@ -0,0 +1,144 @@
+"""
+상세 페이지 파싱 작업자 프로세스 풀
+요청(I/O)은 수집 스레드에서, 파싱(BeautifulSoup 트리 생성, 선택자 추출, clean_text)은 작업자 프로세스에서 처리
+
+- BeautifulSoup 파싱은 순수 파이썬이라 GIL을 잡고 있어 스레드를 늘려도 한 코어 이상 쓰지 못함
+  → 응답 바이트만 작업자 프로세스로 넘겨 코어 수만큼 병렬로 파싱
+- 작업자 프로세스는 spawn으로 시작 (수집 스레드가 돌고 있는 프로세스를 fork하지 않음)
+- 작업자 프로세스마다 사이트별 SpecCrawler를 한 번만 만들어 재사용 (추출 계획도 프로세스별로 학습)
+- 수집 스레드는 작업을 넘기고 Future만 받아 바로 다음 요청으로 (결과는 iter_page_results의 소비자가 기다림)
+- 대기 중인 파싱 작업 수는 max_pending으로 제한 (넘으면 수집 스레드가 기다려 요청 속도가 파싱 속도에 맞춰짐)
+- 작업자에서 기록한 파싱 시간/선택자 적중/기사 수는 결과와 함께 돌려받아 메인 프로세스 계측에 합침
+
+환경 변수 CRAWLER_PARSE_WORKERS=<프로세스 수> 로 켜거나, ScrapingEngine(parse_workers=...) / --parse-workers로 지정
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from crawl_metrics import get_crawl_metrics
+
+logger = logging.getLogger('ParsePool')
+
+# 작업자 프로세스별 상태
+_crawlers: Dict[str, object] = {}
+
+
+def parse_workers_from_env() -> int:
+    """CRAWLER_PARSE_WORKERS 환경 변수의 작업자 수 (없거나 잘못된 값이면 0 → 스레드에서 파싱)"""
+    value = os.environ.get('CRAWLER_PARSE_WORKERS', '').strip()
+    if value.lower() == 'auto':
+        return os.cpu_count() or 1
+    try:
+        return max(0, int(value or 0))
+    except ValueError:
+        logger.warning(f"CRAWLER_PARSE_WORKERS 값이 올바르지 않습니다: {value}")
+        return 0
+
+
+def _init_worker():
+    """작업자 초기화: 요청을 하지 않으므로 보관과 로그 출력을 줄임"""
+    os.environ['CRAWLER_RAW_ARCHIVE'] = '0'
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def _crawler_for(key: str, source: Dict):
+    """사이트 크롤러 (작업자 프로세스마다 사이트당 한 번)"""
+    crawler = _crawlers.get(key)
+    if crawler is None:
+        from scraping_engine import SpecCrawler, SiteSpec
+        crawler = SpecCrawler(SiteSpec(key, source), raw_archive=False)
+        _crawlers[key] = crawler
+    return crawler
+
+
+def build_row_job(key: str, source: Dict, entry: Dict, record: Dict, limit_date: str,
+                  end_date: Optional[str]) -> Tuple[object, Dict]:
+    """
+    작업자 단위 작업: 응답 레코드로 결과 행 생성 (SpecCrawler.build_row)
+
+    Returns:
+        (dict, "OLDER" 또는 None, 이 작업에서 기록한 계측 값)
+    """
+    from raw_archive import to_response
+
+    metrics = get_crawl_metrics()
+    try:
+        row = _crawler_for(key, source).build_row(entry, to_response(record), limit_date, end_date)
+    finally:
+        events = metrics.drain()
+    return row, events
+
+
+class ParsePool:
+    """
+    파싱 작업자 프로세스 풀
+    여러 수집 스레드가 하나의 인스턴스를 공유 (submit은 대기 작업 자리가 날 때만 호출 스레드를 블록)
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        """
+        Args:
+            workers: 작업자 프로세스 수 (None이면 CPU 수)
+            max_pending: 동시에 맡길 최대 파싱 작업 수 (None이면 작업자 수의 2배)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        logger.info(f"파싱 작업자 프로세스 {self.workers}개 (최대 대기 {self.max_pending}개)")
+
+    def submit(self, spec, entry: Dict, response, limit_date: str, end_date: Optional[str] = None) -> Future:
+        """
+        상세 페이지 응답의 파싱을 작업자 프로세스에 맡기고 결과 행의 Future 반환
+        (결과는 SpecCrawler.build_row와 같음, 대기 작업이 max_pending개면 자리가 날 때까지 대기)
+
+        Args:
+            spec: SiteSpec (작업자에서 같은 설정으로 크롤러를 만들도록 원본 설정을 함께 넘김)
+            entry: 목록 항목
+            response: 상세 페이지 응답
+        """
+        record = {
+            'status': response.status_code,
+            'reason': response.reason or '',
+            'url': response.url,
+            'headers': dict(response.headers),
+            'body': response.content or b'',
+        }
+        result = Future()
+        result.set_running_or_notify_cancel()
+
+        def on_done(job):
+            self._slots.release()
+            try:
+                row, events = job.result()
+            except BaseException as e:
+                result.set_exception(e)
+                return
+            get_crawl_metrics().merge(events)
+            result.set_result(row)
+
+        self._slots.acquire()
+        try:
+            job = self._executor.submit(build_row_job, spec.key, spec.source, entry, record,
+                                        limit_date, end_date)
+        except BaseException:
+            self._slots.release()
+            raise
+        job.add_done_callback(on_done)
+        return result
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
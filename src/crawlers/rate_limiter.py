@@ -0,0 +1,209 @@
+"""
+도메인별 요청 속도 제한 모듈
+프로세스 전체에서 공유하는 토큰 버킷으로 도메인마다 초당 요청 수를 제한하고,
+429/403/503 응답에는 속도를 낮추고(Retry-After 반영) 정상 응답이 이어지면 다시 높임
+
+환경 변수 CRAWLER_RATE_LIMIT=off 이면 대기 없이 통과 (로컬 재생 서버 벤치마크용)
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger('RateLimiter')
+
+# 속도를 낮춰야 하는 응답 코드
+THROTTLE_STATUS_CODES = (403, 429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class _DomainBucket:
+    """도메인 하나의 토큰 버킷 상태"""
+
+    def __init__(self, rate: float, burst: float, max_rate: float):
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = max_rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.success_streak = 0
+
+    def refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class DomainRateLimiter:
+    """
+    도메인별 적응형 토큰 버킷
+
+    - acquire(url): 해당 도메인의 토큰이 생길 때까지 대기
+    - on_response(url, status, retry_after): 응답 결과로 속도 조절
+      * 429/403/503: 속도를 decrease_factor배로 낮추고, Retry-After 동안 도메인 전체 일시 정지
+      * 정상 응답이 increase_every번 이어지면 increase_step만큼 속도 증가 (max_rate까지)
+    """
+
+    def __init__(self,
+                 initial_rate: float = 2.0,
+                 min_rate: float = 0.1,
+                 max_rate: float = 10.0,
+                 burst: float = 5.0,
+                 increase_step: float = 0.5,
+                 increase_every: int = 20,
+                 decrease_factor: float = 0.5,
+                 default_pause: float = 5.0,
+                 enabled: bool = True):
+        """
+        Args:
+            initial_rate: 도메인별 시작 속도 (초당 요청 수)
+            min_rate: 최저 속도
+            max_rate: 최고 속도 (도메인별로 configure()에서 변경 가능)
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+            increase_step: 속도 증가 폭
+            increase_every: 속도를 올리기 위해 필요한 연속 정상 응답 수
+            decrease_factor: 차단 응답 시 속도 배율
+            default_pause: Retry-After가 없을 때 차단 응답 후 일시 정지 시간(초)
+            enabled: False면 acquire()가 대기하지 않음 (속도 기록은 유지)
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.increase_every = increase_every
+        self.decrease_factor = decrease_factor
+        self.default_pause = default_pause
+        self.enabled = enabled
+
+        self._buckets: Dict[str, _DomainBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _domain(url_or_domain: str) -> str:
+        """URL이면 호스트명만 추출"""
+        if '://' in url_or_domain:
+            return urlparse(url_or_domain).netloc.lower()
+        return url_or_domain.lower()
+
+    def _bucket(self, domain: str) -> _DomainBucket:
+        """도메인 버킷 조회 (없으면 생성, 잠금 보유 상태에서 호출)"""
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = _DomainBucket(self.initial_rate, self.burst, self.max_rate)
+            self._buckets[domain] = bucket
+        return bucket
+
+    def configure(self, url_or_domain: str, max_rate: Optional[float] = None,
+                  rate: Optional[float] = None, burst: Optional[float] = None):
+        """도메인별 속도 설정 변경"""
+        domain = self._domain(url_or_domain)
+        with self._lock:
+            bucket = self._bucket(domain)
+            if max_rate is not None:
+                bucket.max_rate = max(self.min_rate, max_rate)
+            if rate is not None:
+                bucket.rate = rate
+            if burst is not None:
+                bucket.burst = burst
+            bucket.rate = min(bucket.rate, bucket.max_rate)
+
+    def acquire(self, url: str) -> float:
+        """
+        요청 전 호출: 도메인 토큰을 하나 얻을 때까지 대기
+
+        Returns:
+            대기한 시간(초)
+        """
+        if not self.enabled:
+            return 0.0
+
+        domain = self._domain(url)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                bucket = self._bucket(domain)
+                now = time.monotonic()
+                bucket.refill(now)
+
+                if now < bucket.blocked_until:
+                    wait = bucket.blocked_until - now
+                elif bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return waited
+                else:
+                    wait = (1 - bucket.tokens) / bucket.rate
+
+            # 여러 스레드가 동시에 깨어나지 않도록 약간의 지터 추가
+            wait += random.uniform(0, min(0.2, wait * 0.1))
+            time.sleep(wait)
+            waited += wait
+
+    def on_response(self, url: str, status_code: int, retry_after: Optional[str] = None):
+        """응답 결과로 도메인 속도 조절"""
+        domain = self._domain(url)
+        with self._lock:
+            bucket = self._bucket(domain)
+
+            if status_code in THROTTLE_STATUS_CODES:
+                old_rate = bucket.rate
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+                bucket.tokens = 0
+                bucket.success_streak = 0
+
+                pause = parse_retry_after(retry_after)
+                if pause is None:
+                    pause = self.default_pause
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + pause)
+
+                logger.warning(f"[{domain}] HTTP {status_code}: 속도 {old_rate:.2f} → {bucket.rate:.2f}회/초, "
+                               f"{pause:.1f}초 대기")
+
+            elif status_code < 400:
+                bucket.success_streak += 1
+                if bucket.success_streak >= self.increase_every and bucket.rate < bucket.max_rate:
+                    bucket.rate = min(bucket.max_rate, bucket.rate + self.increase_step)
+                    bucket.success_streak = 0
+                    logger.debug(f"[{domain}] 속도 증가: {bucket.rate:.2f}회/초")
+
+    def current_rates(self) -> Dict[str, float]:
+        """도메인별 현재 속도 (초당 요청 수)"""
+        with self._lock:
+            return {domain: round(bucket.rate, 2) for domain, bucket in self._buckets.items()}
+
+
+_shared_limiter: Optional[DomainRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> DomainRateLimiter:
+    """프로세스 전체에서 공유하는 속도 제한기 반환"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            enabled = os.environ.get('CRAWLER_RATE_LIMIT', '').strip().lower() not in ('off', '0', 'false')
+            _shared_limiter = DomainRateLimiter(enabled=enabled)
+        return _shared_limiter
@@ -0,0 +1,343 @@
+"""
+원본 HTML 보관 모듈 (WARC 형식)
+기사 상세 페이지 응답을 압축된 추가 전용(append-only) 파일에 보관하고, URL별 위치(파일, 오프셋, 길이)를 인덱스에 기록
+선택자를 고친 뒤 사이트를 다시 수집하지 않고 보관본에서 바로 재추출할 수 있음 (reextract.py)
+
+- 파일: data/raw_archive/<시각>-<pid>.warc.gz (레코드마다 별도 gzip 멤버 → 오프셋으로 바로 읽기 가능,
+  표준 WARC 도구로도 읽을 수 있음), max_file_mb를 넘으면 새 파일로 교체
+- 인덱스: data/raw_archive/index.db (URL당 최신 레코드, 수집기 종류(source), 목록 페이지 정보(meta))
+  인덱스가 손상되거나 없어져도 rebuild_index()로 파일을 다시 읽어 복구
+- 본문은 전송 압축을 푼 바이트를 저장 (인코딩은 재추출 시 charset_resolver가 다시 판단)
+
+환경 변수 CRAWLER_RAW_ARCHIVE=1 로 켜거나, ScrapingEngine(raw_archive=True) / 크롤러 config의 'raw_archive'로 지정
+"""
+
+import os
+import glob
+import gzip
+import json
+import time
+import uuid
+import zlib
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger('RawArchive')
+
+DEFAULT_ARCHIVE_DIR = 'data/raw_archive'
+
+# 본문을 풀어서 저장하므로 보관하지 않는 헤더
+_SKIP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive')
+
+
+def raw_archive_enabled() -> bool:
+    """CRAWLER_RAW_ARCHIVE 환경 변수로 보관이 켜져 있는지 여부"""
+    return os.environ.get('CRAWLER_RAW_ARCHIVE', '').strip().lower() in ('1', 'true', 'on')
+
+
+def build_record(url: str, response, source: str, meta: Optional[Dict] = None) -> bytes:
+    """WARC response 레코드 바이트 (HTTP 상태줄 + 헤더 + 본문)"""
+    body = response.content or b''
+    http_lines = [f"HTTP/1.1 {response.status_code} {response.reason or ''}".rstrip()]
+    http_lines += [f"{k}: {v}" for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS]
+    http_lines.append(f"Content-Length: {len(body)}")
+    http_block = ('\r\n'.join(http_lines) + '\r\n\r\n').encode('utf-8', 'replace') + body
+
+    warc_lines = [
+        'WARC/1.0',
+        'WARC-Type: response',
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+        f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+        f"WARC-Target-URI: {url}",
+        f"WARC-Crawler-Source: {source}",
+    ]
+    if meta:
+        warc_lines.append(f"WARC-Crawler-Meta: {json.dumps(meta, ensure_ascii=True)}")
+    warc_lines += [
+        'Content-Type: application/http; msgtype=response',
+        f"Content-Length: {len(http_block)}",
+    ]
+    return ('\r\n'.join(warc_lines) + '\r\n\r\n').encode('utf-8') + http_block + b'\r\n\r\n'
+
+
+def _parse_headers(block: bytes) -> CaseInsensitiveDict:
+    headers = CaseInsensitiveDict()
+    for line in block.decode('utf-8', 'replace').split('\r\n'):
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip()] = value.strip()
+    return headers
+
+
+def parse_record(data: bytes) -> Dict:
+    """WARC 레코드 바이트를 {'url', 'source', 'meta', 'date', 'status', 'headers', 'body'}로 변환"""
+    warc_block, _, rest = data.partition(b'\r\n\r\n')
+    warc = _parse_headers(warc_block.split(b'\r\n', 1)[1] if b'\r\n' in warc_block else b'')
+    http_block = rest[:int(warc.get('Content-Length', len(rest)))]
+
+    head, _, body = http_block.partition(b'\r\n\r\n')
+    status_line, _, header_lines = head.partition(b'\r\n')
+    parts = status_line.decode('latin-1').split(' ', 2)
+    headers = _parse_headers(header_lines)
+    length = headers.get('Content-Length')
+    if length is not None:
+        body = body[:int(length)]
+
+    meta = warc.get('WARC-Crawler-Meta')
+    return {
+        'url': warc.get('WARC-Target-URI', ''),
+        'source': warc.get('WARC-Crawler-Source', ''),
+        'meta': json.loads(meta) if meta else None,
+        'date': warc.get('WARC-Date'),
+        'status': int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0,
+        'reason': parts[2] if len(parts) > 2 else '',
+        'headers': headers,
+        'body': body,
+    }
+
+
+def to_response(record: Dict) -> requests.Response:
+    """보관 레코드를 requests.Response로 변환 (크롤러 코드가 그대로 사용)"""
+    response = requests.Response()
+    response.status_code = record['status']
+    response.reason = record.get('reason', '')
+    response.url = record['url']
+    response.headers = CaseInsensitiveDict(record['headers'])
+    response._content = record['body']
+    response.encoding = None
+    return response
+
+
+def read_record(path: str, offset: int, length: int) -> Dict:
+    """파일의 오프셋 위치에서 레코드 하나 읽기 (잠금 없이 여러 프로세스에서 호출 가능)"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return parse_record(gzip.decompress(f.read(length)))
+
+
+class RawArchive:
+    """
+    WARC 보관 파일 + URL 인덱스
+    여러 스레드가 하나의 인스턴스를 공유할 수 있도록 내부 잠금 사용
+    (쓰기 파일은 프로세스마다 따로 만들어 여러 프로세스가 동시에 보관해도 섞이지 않음)
+    """
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR, max_file_mb: int = 256):
+        """
+        Args:
+            directory: 보관 디렉터리 (상대 경로면 프로젝트 루트 기준)
+            max_file_mb: 보관 파일 하나의 최대 크기(MB)
+        """
+        if os.path.isabs(directory):
+            self.directory = directory
+        else:
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            self.directory = os.path.join(project_root, directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_file_bytes = max_file_mb * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_name = None
+        self._conn = sqlite3.connect(os.path.join(self.directory, 'index.db'), timeout=30,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS records (
+                    url TEXT PRIMARY KEY,
+                    source TEXT,
+                    file TEXT,
+                    offset INTEGER,
+                    length INTEGER,
+                    status INTEGER,
+                    fetched_at REAL,
+                    meta TEXT
+                )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_records_source ON records (source)')
+            self._conn.commit()
+
+    def _writer(self):
+        """현재 쓰기 파일 (없거나 최대 크기를 넘으면 새로 생성, 잠금 보유 상태에서 호출)"""
+        if self._file is not None and self._file.tell() >= self.max_file_bytes:
+            self._file.close()
+            self._file = None
+        if self._file is None:
+            self._file_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.warc.gz"
+            self._file = open(os.path.join(self.directory, self._file_name), 'ab')
+        return self._file
+
+    def store(self, url: str, response, source: str, meta: Optional[Dict] = None) -> None:
+        """
+        응답 하나 보관 (같은 URL은 인덱스가 최신 레코드를 가리킴)
+
+        Args:
+            url: 요청 URL
+            response: requests.Response
+            source: 수집기 종류 (재추출 시 추출 로직 선택, 예: 'spec:seoul_seoul', 'crawler:모듈.클래스')
+            meta: 목록 페이지에서 얻은 정보 (제목, 날짜 등)
+        """
+        member = gzip.compress(build_record(url, response, source, meta), compresslevel=6)
+        with self._lock:
+            f = self._writer()
+            offset = f.tell()
+            f.write(member)
+            f.flush()
+            self._conn.execute('''
+                INSERT OR REPLACE INTO records (url, source, file, offset, length, status, fetched_at, meta)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (url, source, self._file_name, offset, len(member), response.status_code, time.time(),
+                  json.dumps(meta, ensure_ascii=False) if meta else None))
+            self._conn.commit()
+
+    def path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    def read(self, url: str) -> Optional[Dict]:
+        """URL의 최신 보관 레코드 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute('SELECT file, offset, length FROM records WHERE url = ?', (url,)).fetchone()
+            if row and self._file is not None:
+                self._file.flush()
+        if not row:
+            return None
+        return read_record(self.path(row[0]), row[1], row[2])
+
+    def entries(self, sources: Optional[Iterable[str]] = None, since: Optional[float] = None,
+                limit: Optional[int] = None) -> List[Dict]:
+        """인덱스 항목 목록 (파일/오프셋 순으로 정렬해 순차 읽기가 되도록)"""
+        query = 'SELECT url, source, file, offset, length, status, fetched_at, meta FROM records WHERE 1=1'
+        params = []
+        if sources:
+            sources = list(sources)
+            query += f" AND source IN ({','.join('?' * len(sources))})"
+            params += sources
+        if since:
+            query += ' AND fetched_at >= ?'
+            params.append(since)
+        query += ' ORDER BY file, offset'
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {'url': url, 'source': source, 'file': file, 'offset': offset, 'length': length,
+             'status': status, 'fetched_at': fetched_at, 'meta': json.loads(meta) if meta else None}
+            for url, source, file, offset, length, status, fetched_at, meta in rows
+        ]
+
+    def stats(self) -> Dict[str, Dict]:
+        """수집기 종류별 보관 건수와 압축 크기"""
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT source, COUNT(*), SUM(length), MAX(fetched_at) FROM records GROUP BY source ORDER BY source
+            ''').fetchall()
+        return {source: {'records': count, 'bytes': size or 0, 'last_fetched': last}
+                for source, count, size, last in rows}
+
+    def rebuild_index(self) -> int:
+        """보관 파일을 처음부터 읽어 인덱스 재작성 (파일 순서대로 읽으므로 URL당 마지막 레코드가 남음)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            self._conn.execute('DELETE FROM records')
+            count = 0
+            for path in sorted(glob.glob(os.path.join(self.directory, '*.warc.gz'))):
+                for offset, length, record in _iter_members(path):
+                    fetched_at = None
+                    if record['date']:
+                        fetched_at = datetime.strptime(record['date'], '%Y-%m-%dT%H:%M:%SZ') \
+                            .replace(tzinfo=timezone.utc).timestamp()
+                    self._conn.execute('''
+                        INSERT OR REPLACE INTO records (url, source, file, offset, length, status, fetched_at, meta)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (record['url'], record['source'], os.path.basename(path), offset, length,
+                          record['status'], fetched_at,
+                          json.dumps(record['meta'], ensure_ascii=False) if record['meta'] else None))
+                    count += 1
+            self._conn.commit()
+        logger.info(f"✓ 인덱스 재작성: 레코드 {count}개")
+        return count
+
+    def close(self):
+        """쓰기 파일과 인덱스 연결 종료"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._conn.close()
+
+
+def _iter_members(path: str):
+    """보관 파일의 gzip 멤버(레코드)를 (오프셋, 길이, 레코드) 순서로 읽기"""
+    with open(path, 'rb') as f:
+        data = memoryview(f.read())
+    offset = 0
+    while offset < len(data):
+        decompressor = zlib.decompressobj(wbits=31)
+        try:
+            raw = decompressor.decompress(data[offset:])
+        except zlib.error:
+            logger.warning(f"손상된 레코드 이후 건너뜀: {path} (오프셋 {offset})")
+            return
+        length = len(data) - offset - len(decompressor.unused_data)
+        if not decompressor.eof:
+            # 쓰는 도중 중단되어 끝이 잘린 마지막 레코드
+            logger.warning(f"잘린 레코드 건너뜀: {path} (오프셋 {offset})")
+            return
+        yield offset, length, parse_record(raw)
+        offset += length
+
+
+class ArchiveSession:
+    """
+    보관본에서 응답을 돌려주는 세션 (requests.Session의 get/post/headers/close만 제공)
+    크롤러의 session을 이것으로 바꾸면 parse_article 등 기존 추출 코드를 네트워크 없이 실행
+    보관되지 않은 URL은 404 응답
+    """
+
+    def __init__(self, archive: RawArchive):
+        self.archive = archive
+        self.headers = CaseInsensitiveDict()
+        self.misses = 0
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        record = self.archive.read(url)
+        if record is None:
+            self.misses += 1
+            return to_response({'status': 404, 'reason': 'Not Archived', 'url': url, 'headers': {}, 'body': b''})
+        return to_response(record)
+
+    def post(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.get(url)
+
+    def mount(self, prefix: str, adapter) -> None:
+        """어댑터는 사용하지 않음"""
+
+    def close(self) -> None:
+        pass
+
+
+_shared_archive: Optional[RawArchive] = None
+_shared_archive_lock = threading.Lock()
+
+
+def get_raw_archive() -> RawArchive:
+    """프로세스 전체에서 공유하는 보관소 인스턴스 반환"""
+    global _shared_archive
+    with _shared_archive_lock:
+        if _shared_archive is None:
+            _shared_archive = RawArchive()
+        return _shared_archive
@@ -0,0 +1,222 @@
+"""
+보관본 재추출
+data/raw_archive에 보관된 기사 원본에 현재 추출 로직(site_specs 선택자, 크롤러의 parse_article)을 다시 적용하여 DB에 반영
+선택자를 고친 뒤 사이트를 다시 수집하지 않고 디스크 속도로 한 달 치를 다시 추출
+
+- 스크래퍼(scraping_engine)로 보관한 기사: 목록 항목 정보 + 상세 페이지로 결과 행을 다시 만들어 news_scraped.db에 반영
+- 지역 크롤러(BaseCrawler)로 보관한 기사: 크롤러의 세션을 보관본 세션으로 바꿔 parse_article을 그대로 실행, news.db에 반영
+- 작업자 프로세스마다 보관 파일을 오프셋으로 직접 읽어 병렬로 파싱하고, DB 반영은 메인 프로세스에서 묶어서 처리
+- 제목/본문이 바뀐 기사만 갱신하고 감성 분석 대상으로 되돌림 (DatabaseManager.upsert_articles)
+
+사용 예시:
+  python reextract.py --sources spec:seoul_seoul --workers 8
+  python reextract.py --since 2026-10-01 --dry-run
+  python reextract.py --stats
+  python reextract.py --rebuild-index
+"""
+
+import os
+import time
+import logging
+import argparse
+import importlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from raw_archive import RawArchive, ArchiveSession, DEFAULT_ARCHIVE_DIR, read_record, to_response
+
+logger = logging.getLogger('ReExtract')
+
+SCRAPED_DB = 'data/news_scraped.db'
+NEWS_DB = 'data/news.db'
+
+# 작업자 프로세스별 상태
+_archive: Optional[RawArchive] = None
+_crawlers: Dict[str, object] = {}
+
+
+def _init_worker(directory: str):
+    """작업자 초기화: 보관본만 읽으므로 속도 제한과 추가 보관을 끔"""
+    global _archive
+    os.environ['CRAWLER_RATE_LIMIT'] = 'off'
+    os.environ['CRAWLER_RAW_ARCHIVE'] = '0'
+    from rate_limiter import get_rate_limiter
+    get_rate_limiter().enabled = False
+    logging.getLogger().setLevel(logging.WARNING)
+    _archive = RawArchive(directory)
+
+
+def _crawler_for(source: str):
+    """보관 당시와 같은 크롤러 생성 (작업자 프로세스마다 source당 한 번)"""
+    crawler = _crawlers.get(source)
+    if crawler is not None:
+        return crawler
+
+    kind, _, name = source.partition(':')
+    if kind == 'spec':
+        from scraping_engine import SpecCrawler, SiteSpec, SITE_SPECS
+        crawler = SpecCrawler(SiteSpec(name, SITE_SPECS[name]), raw_archive=False)
+    elif kind == 'factory':
+        from newspaper_factory import NewspaperFactory
+        crawler = NewspaperFactory.create(name)
+    elif kind == 'crawler':
+        module_name, _, class_name = name.rpartition('.')
+        crawler = getattr(importlib.import_module(module_name), class_name)()
+    if crawler is None:
+        raise ValueError(f"재추출할 수 없는 수집기: {source}")
+
+    crawler.session = ArchiveSession(_archive)
+    crawler.cache = None
+    crawler.raw_archive = None
+    _crawlers[source] = crawler
+    return crawler
+
+
+def extract_entry(entry: Dict) -> Optional[Tuple[str, Dict]]:
+    """보관 항목 하나 재추출 → (대상 DB, DB 기사 딕셔너리), 결과가 없으면 None"""
+    from database_manager import scraped_row_to_article
+
+    crawler = _crawler_for(entry['source'])
+    meta = entry.get('meta')
+
+    if meta and hasattr(crawler, 'build_row'):
+        record = read_record(_archive.path(entry['file']), entry['offset'], entry['length'])
+        row = crawler.build_row(meta, to_response(record), limit_date='')
+        if not isinstance(row, dict):
+            return None
+        return SCRAPED_DB, scraped_row_to_article(row)
+
+    article = crawler.parse_article(entry['url'])
+    if not article:
+        return None
+    article['url'] = article.get('url') or entry['url']
+    article.setdefault('region', crawler.region)
+    article.setdefault('newspaper', crawler.newspaper_name)
+    return NEWS_DB, article
+
+
+def extract_chunk(entries: List[Dict]) -> Tuple[List[Tuple[str, Dict]], Counter]:
+    """작업자 단위 작업: 항목 묶음 재추출"""
+    results = []
+    counts = Counter()
+    for entry in entries:
+        try:
+            result = extract_entry(entry)
+        except Exception as e:
+            counts['error'] += 1
+            logger.warning(f"재추출 실패 ({entry['url']}): {e}")
+            continue
+        if result is None:
+            counts['empty'] += 1
+        else:
+            counts['extracted'] += 1
+            results.append(result)
+    return results, counts
+
+
+def reextract(archive: RawArchive, sources: Optional[List[str]] = None, since: Optional[str] = None,
+              limit: Optional[int] = None, workers: Optional[int] = None, dry_run: bool = False,
+              db_paths: Optional[Dict[str, str]] = None, chunk_size: int = 64, batch_size: int = 500) -> Dict:
+    """
+    보관본 전체(또는 일부)를 병렬로 재추출하여 DB에 반영
+
+    Args:
+        archive: 보관소
+        sources: 대상 수집기 (예: ['spec:seoul_seoul'], None이면 전체)
+        since: 이 날짜(YYYY-MM-DD) 이후 보관한 기사만
+        limit: 최대 항목 수
+        workers: 작업자 프로세스 수 (None이면 CPU 수)
+        dry_run: 추출만 하고 DB에 반영하지 않음
+        db_paths: 대상 DB 경로 변경 ({SCRAPED_DB: 경로, NEWS_DB: 경로})
+        chunk_size: 작업자에게 한 번에 넘길 항목 수
+        batch_size: DB에 한 번에 반영할 기사 수
+
+    Returns:
+        {'entries', 'extracted', 'empty', 'error', 'inserted', 'updated', 'unchanged', 'seconds'}
+    """
+    from database_manager import DatabaseManager
+
+    since_ts = datetime.strptime(since, '%Y-%m-%d').timestamp() if since else None
+    entries = archive.entries(sources=sources, since=since_ts, limit=limit)
+    totals = Counter(entries=len(entries))
+    if not entries:
+        logger.warning("재추출할 보관 항목이 없습니다.")
+        return dict(totals)
+
+    db_paths = {SCRAPED_DB: SCRAPED_DB, NEWS_DB: NEWS_DB, **(db_paths or {})}
+    managers: Dict[str, DatabaseManager] = {}
+    pending: Dict[str, List[Dict]] = {}
+
+    def flush(target: str):
+        batch = pending.pop(target, [])
+        if not batch or dry_run:
+            return
+        if target not in managers:
+            managers[target] = DatabaseManager(db_paths[target])
+        totals.update(managers[target].upsert_articles(batch))
+
+    started = time.perf_counter()
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    logger.info(f"🔁 재추출 시작: {len(entries)}개 (작업자 {workers or os.cpu_count()}개)")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(archive.directory,)) as executor:
+        for done, (results, counts) in enumerate(executor.map(extract_chunk, chunks), 1):
+            totals.update(counts)
+            for target, article in results:
+                pending.setdefault(target, []).append(article)
+                if len(pending[target]) >= batch_size:
+                    flush(target)
+            if done % 10 == 0 or done == len(chunks):
+                logger.info(f"  진행: {min(done * chunk_size, len(entries))}/{len(entries)}")
+
+    for target in list(pending):
+        flush(target)
+
+    totals['seconds'] = round(time.perf_counter() - started, 2)
+    logger.info(f"✓ 재추출 완료: 추출 {totals['extracted']}개, 결과 없음 {totals['empty']}개, "
+                f"오류 {totals['error']}개 ({totals['seconds']}초)")
+    return dict(totals)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='보관된 기사 원본 재추출')
+    parser.add_argument('--archive-dir', default=DEFAULT_ARCHIVE_DIR, help='보관 디렉터리')
+    parser.add_argument('--sources', nargs='+', help='대상 수집기 (--stats로 확인, 기본값: 전체)')
+    parser.add_argument('--since', help='이 날짜(YYYY-MM-DD) 이후 보관한 기사만')
+    parser.add_argument('--limit', type=int, help='최대 항목 수')
+    parser.add_argument('--workers', type=int, help='작업자 프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--dry-run', action='store_true', help='추출만 하고 DB에 반영하지 않음')
+    parser.add_argument('--scraped-db', default=SCRAPED_DB, help='스크래퍼 기사 DB')
+    parser.add_argument('--news-db', default=NEWS_DB, help='지역 크롤러 기사 DB')
+    parser.add_argument('--stats', action='store_true', help='수집기별 보관 현황 출력')
+    parser.add_argument('--rebuild-index', action='store_true', help='보관 파일을 다시 읽어 인덱스 재작성')
+    args = parser.parse_args()
+
+    archive = RawArchive(args.archive_dir)
+
+    if args.rebuild_index:
+        archive.rebuild_index()
+        return
+
+    if args.stats:
+        for source, info in archive.stats().items():
+            last = datetime.fromtimestamp(info['last_fetched']).strftime('%Y-%m-%d %H:%M') if info['last_fetched'] else '-'
+            print(f"{source:<48}{info['records']:>8}개 {info['bytes'] / 1e6:>8.1f}MB  최근 {last}")
+        return
+
+    totals = reextract(archive, sources=args.sources, since=args.since, limit=args.limit,
+                       workers=args.workers, dry_run=args.dry_run,
+                       db_paths={SCRAPED_DB: args.scraped_db, NEWS_DB: args.news_db})
+
+    print("\n" + "=" * 50)
+    for name in ('entries', 'extracted', 'empty', 'error', 'inserted', 'updated', 'unchanged'):
+        print(f"{name:<16}{totals.get(name, 0):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,8 @@ class GangwonDominIlboCrawler(BaseCrawler):
     def __init__(self):
         config = {
             'use_selenium': False,  # BeautifulSoup로 충분
+            'max_concurrency': 4,  # 비동기 모드 호스트당 동시 요청 수
+            'min_request_interval': 0.5,  # 요청 간 최소 간격(초)
         }
         
         super().__init__(
@@ -36,7 +38,7 @@ class GangwonDominIlboCrawler(BaseCrawler):
         seen = set()
         for page in range(1, 21):
             url = f'{self.base_url}/news/articleList.html?sc_section_code=S1N2&page={page}'
-            soup = self.fetch_page(url)
+            soup = self.fetch_page(url, page_class='list')
 
             if not soup:
                 self.logger.info(f"  페이지 {page}: 페이지 로드 실패 - 수집 완료")
@@ -21,6 +21,8 @@ class GyeonggiIlboCrawler(BaseCrawler):
             'link_selector': 'a',
             'content_selector': 'div.article-body',  # 실제 기사 본문 컨테이너
             'date_selector': 'span.date',
+            'max_concurrency': 4,  # 비동기 모드 호스트당 동시 요청 수
+            'min_request_interval': 0.5,  # 요청 간 최소 간격(초)
         }
         
         super().__init__(
@@ -38,7 +40,7 @@ class GyeonggiIlboCrawler(BaseCrawler):
         seen = set()
         for page in range(1, 21):
             url = f'{self.base_url}/list/25?page={page}'
-            soup = self.fetch_page(url)
+            soup = self.fetch_page(url, page_class='list')
 
             if not soup:
                 self.logger.info(f"  페이지 {page}: 페이지 로드 실패 - 수집 완료")
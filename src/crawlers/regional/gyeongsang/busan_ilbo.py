@@ -20,6 +20,8 @@ class GyeongsangCrawler(BaseCrawler):
     def __init__(self):
         config = {
             'use_selenium': False,
+            'max_concurrency': 2,  # 비동기 모드 호스트당 동시 요청 수
+            'min_request_interval': 1.0,  # 요청 간 최소 간격(초)
         }
 
         super().__init__(
@@ -40,7 +42,7 @@ class GyeongsangCrawler(BaseCrawler):
             board_data_raw = f'startPage={start_page}'
             board_data = base64.b64encode(board_data_raw.encode('utf-8')).decode('ascii') + '||'
             url = f'{self.base_url}/list.php?board_data={board_data}&search_items={search_items}'
-            soup = self.fetch_page(url)
+            soup = self.fetch_page(url, page_class='list')
             if not soup:
                 self.logger.info(f"  페이지 {page}: 페이지 로드 실패 - 수집 완료")
                 break
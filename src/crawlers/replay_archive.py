@@ -0,0 +1,410 @@
+"""
+응답 녹화/재생 모듈
+실제 신문사 사이트 대신 녹화해 둔 응답으로 스크래퍼를 실행하기 위한 도구 (벤치마크, 회귀 확인용)
+
+- 녹화: 환경 변수 CRAWLER_RECORD=1 로 스크래퍼를 실행하면 transport.create_session()으로 만든
+  세션의 모든 응답(목록, 상세, POST 목록, 리다이렉트 포함)이 data/replay_archive.db에 저장됨
+- 재생: `python replay_archive.py serve` 로 로컬 재생 서버를 띄우고 CRAWLER_REPLAY=http://127.0.0.1:8800
+  으로 스크래퍼를 실행하면 세션이 모든 요청을 재생 서버로 보냄
+  (원래 URL은 X-Replay-Url 헤더로 전달하고 응답의 url은 원래 URL로 되돌리므로
+   링크 결합, 도메인별 속도 제한, 인코딩 캐시는 실제 사이트와 동일하게 동작)
+- 재생 서버는 응답 지연(latency/jitter)과 오류(HTTP 오류 응답, 연결 끊김)를 일정 비율로 주입 가능
+
+Selenium으로 읽는 페이지는 세션을 거치지 않으므로 녹화/재생 대상이 아님
+
+사용 예시:
+  CRAWLER_RECORD=1 python scraper/seoul_seoul_scraper.py
+  python replay_archive.py serve --port 8800 --latency 0.15 --jitter 0.05 --error-rate 0.02
+  python replay_archive.py stats
+"""
+
+import os
+import sys
+import json
+import zlib
+import time
+import random
+import signal
+import socket
+import hashlib
+import sqlite3
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger('ReplayArchive')
+
+DEFAULT_ARCHIVE_PATH = 'data/replay_archive.db'
+
+# 재생 서버로 원래 요청 URL을 전달하는 헤더
+REPLAY_URL_HEADER = 'X-Replay-Url'
+
+# 본문을 풀어서 저장하므로 재생 시 의미가 없는 헤더 (+ 서버가 직접 쓰는 헤더)
+_SKIP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive',
+                 'date', 'server')
+
+
+def request_key(method: str, url: str, body=None) -> str:
+    """요청 식별 키 (POST 목록 페이지는 폼 데이터까지 구분)"""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    digest = hashlib.sha1(f"{method.upper()} {url}\n".encode('utf-8'))
+    if body:
+        digest.update(body)
+    return digest.hexdigest()
+
+
+class ReplayArchive:
+    """
+    녹화된 응답 저장소 (SQLite)
+    여러 스레드가 하나의 인스턴스를 공유할 수 있도록 내부 잠금 사용
+    """
+
+    def __init__(self, db_path: str = DEFAULT_ARCHIVE_PATH):
+        """
+        Args:
+            db_path: 저장소 DB 파일 경로 (상대 경로면 프로젝트 루트 기준)
+        """
+        if os.path.isabs(db_path):
+            self.db_path = db_path
+        else:
+            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            self.db_path = os.path.join(project_root, db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        # 녹화 중인 스크래퍼 여러 개가 같은 파일에 쓸 수 있도록 잠금 대기 시간을 넉넉히
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    method TEXT,
+                    url TEXT,
+                    domain TEXT,
+                    status INTEGER,
+                    headers TEXT,
+                    body BLOB,
+                    elapsed REAL,
+                    recorded_at REAL
+                )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_domain ON responses (domain)')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
+            self._conn.commit()
+
+    def record(self, response) -> None:
+        """응답 저장 (같은 요청은 최신 응답으로 교체)"""
+        request = response.request
+        method = request.method if request is not None else 'GET'
+        body = request.body if request is not None else None
+        url = response.url
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS}
+
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO responses
+                (key, method, url, domain, status, headers, body, elapsed, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                request_key(method, url, body),
+                method,
+                url,
+                urlparse(url).netloc.lower(),
+                response.status_code,
+                json.dumps(headers),
+                zlib.compress(response.content or b''),
+                response.elapsed.total_seconds() if response.elapsed else None,
+                time.time(),
+            ))
+            self._conn.commit()
+
+    def lookup(self, method: str, url: str, body: Optional[bytes] = None) -> Optional[Dict]:
+        """녹화된 응답 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT status, headers, body FROM responses WHERE key = ?',
+                (request_key(method, url, body),)
+            ).fetchone()
+        if not row:
+            return None
+        status, headers, body = row
+        return {
+            'status': status,
+            'headers': json.loads(headers) if headers else {},
+            'body': zlib.decompress(body) if body else b'',
+        }
+
+    def set_meta(self, name: str, value) -> None:
+        """녹화 정보 저장 (녹화 날짜, 수집 기간 등)"""
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)',
+                               (name, json.dumps(value)))
+            self._conn.commit()
+
+    def get_meta(self, name: str, default=None):
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def stats(self) -> Dict[str, Dict]:
+        """도메인별 녹화 응답 수와 본문 크기"""
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT domain, COUNT(*), SUM(LENGTH(body)), MIN(recorded_at), MAX(recorded_at)
+                FROM responses GROUP BY domain ORDER BY domain
+            ''').fetchall()
+        return {
+            domain: {'responses': count, 'compressed_bytes': size or 0,
+                     'first_recorded': first, 'last_recorded': last}
+            for domain, count, size, first, last in rows
+        }
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+_shared_archive: Optional[ReplayArchive] = None
+_shared_archive_lock = threading.Lock()
+
+
+def get_replay_archive() -> ReplayArchive:
+    """프로세스 전체에서 공유하는 녹화 저장소 (경로는 CRAWLER_RECORD_PATH 또는 기본값)"""
+    global _shared_archive
+    with _shared_archive_lock:
+        if _shared_archive is None:
+            _shared_archive = ReplayArchive(os.environ.get('CRAWLER_RECORD_PATH') or DEFAULT_ARCHIVE_PATH)
+        return _shared_archive
+
+
+def recording_enabled() -> bool:
+    """CRAWLER_RECORD 환경 변수로 녹화가 켜져 있는지 여부"""
+    return os.environ.get('CRAWLER_RECORD', '').strip().lower() in ('1', 'true', 'on')
+
+
+def replay_server_url() -> Optional[str]:
+    """CRAWLER_REPLAY 환경 변수의 재생 서버 주소 (없으면 None)"""
+    url = os.environ.get('CRAWLER_REPLAY', '').strip()
+    return url.rstrip('/') or None
+
+
+def record_hook(response, *args, **kwargs):
+    """requests 응답 훅: 받은 응답을 녹화 저장소에 기록"""
+    try:
+        get_replay_archive().record(response)
+    except sqlite3.Error as e:
+        logger.warning(f"응답 녹화 실패 ({response.url}): {e}")
+    return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    모든 요청을 재생 서버로 보내는 requests 어댑터 (URL 재작성 훅)
+    원래 URL은 X-Replay-Url 헤더로 보내고, 응답과 요청의 url은 원래 URL로 되돌림
+    """
+
+    def __init__(self, server_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.server_url = server_url.rstrip('/')
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        request.headers[REPLAY_URL_HEADER] = original_url
+        request.url = self.server_url + '/'
+        # 원래 URL 기준으로 잡힌 프록시 설정은 재생 서버에 적용하지 않음
+        kwargs['proxies'] = {}
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            request.url = original_url
+            del request.headers[REPLAY_URL_HEADER]
+        response.url = original_url
+        return response
+
+
+def configure_session(session, pool_size: int = 10):
+    """
+    환경 변수에 따라 requests 세션에 녹화 훅 / 재생 어댑터 설치 (transport.create_session에서 호출)
+    (create_session은 녹화/재생 중에는 httpx 대신 requests 백엔드를 사용)
+    """
+    if not isinstance(session, requests.Session):
+        return session
+    server_url = replay_server_url()
+    if server_url:
+        adapter = ReplayAdapter(server_url, pool_connections=1, pool_maxsize=max(pool_size, 10))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    elif recording_enabled():
+        session.hooks.setdefault('response', []).append(record_hook)
+    return session
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """녹화된 응답을 돌려주는 요청 처리기 (설정은 server 속성에서 읽음)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._serve()
+
+    def do_POST(self):
+        self._serve()
+
+    def do_HEAD(self):
+        self._serve()
+
+    def _serve(self):
+        server = self.server
+        url = self.headers.get(REPLAY_URL_HEADER)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+
+        delay = server.latency + (server.rng_uniform(0, server.jitter) if server.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        roll = server.rng_uniform(0, 1)
+        if roll < server.reset_rate:
+            # 응답 없이 연결 종료 (클라이언트에서는 ConnectionError)
+            server.count('reset')
+            self.close_connection = True
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            return
+        if roll < server.reset_rate + server.error_rate:
+            server.count('error')
+            self._send(server.error_status, {'Content-Type': 'text/plain', 'Retry-After': '1'},
+                       b'injected error')
+            return
+
+        entry = server.archive.lookup(self.command, url, body) if url else None
+        if entry is None:
+            server.count('missing')
+            logger.debug(f"녹화 없음: {self.command} {url}")
+            self._send(404, {'Content-Type': 'text/plain'}, b'not recorded')
+            return
+
+        server.count('served')
+        self._send(entry['status'], entry['headers'], entry['body'])
+
+    def _send(self, status: int, headers: Dict[str, str], body: bytes):
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() not in _SKIP_HEADERS:
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    로컬 재생 서버
+
+    Args:
+        address: (호스트, 포트)
+        archive: 녹화 저장소
+        latency: 응답마다 추가할 지연(초)
+        jitter: 추가 지연의 무작위 범위(초, 0 ~ jitter)
+        error_rate: 오류 응답(error_status) 비율
+        error_status: 주입할 오류 응답 코드
+        reset_rate: 응답 없이 연결을 끊는 비율
+        seed: 난수 시드 (같은 시드면 같은 순서로 지연/오류 발생)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, archive: ReplayArchive, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, reset_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        super().__init__(address, ReplayRequestHandler)
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.reset_rate = reset_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.counts = {'served': 0, 'missing': 0, 'error': 0, 'reset': 0}
+
+    def rng_uniform(self, low: float, high: float) -> float:
+        with self._rng_lock:
+            return self._rng.uniform(low, high)
+
+    def count(self, name: str):
+        with self._rng_lock:
+            self.counts[name] += 1
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='응답 녹화 저장소 / 로컬 재생 서버')
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE_PATH, help='녹화 저장소 경로')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='로컬 재생 서버 실행')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8800)
+    serve.add_argument('--latency', type=float, default=0.0, help='응답 지연(초)')
+    serve.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 범위(초)')
+    serve.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    serve.add_argument('--error-status', type=int, default=503, help='오류 응답 코드')
+    serve.add_argument('--reset-rate', type=float, default=0.0, help='연결 끊김 비율 (0~1)')
+    serve.add_argument('--seed', type=int, help='난수 시드')
+
+    sub.add_parser('stats', help='도메인별 녹화 현황')
+    args = parser.parse_args()
+
+    archive = ReplayArchive(args.archive)
+
+    if args.command == 'stats':
+        for domain, info in archive.stats().items():
+            print(f"{domain:<32}{info['responses']:>8}개 {info['compressed_bytes'] / 1e6:>8.2f}MB")
+        recorded = archive.get_meta('recorded_date')
+        if recorded:
+            print(f"녹화 날짜: {recorded}")
+        return
+
+    server = ReplayServer((args.host, args.port), archive, latency=args.latency, jitter=args.jitter,
+                          error_rate=args.error_rate, error_status=args.error_status,
+                          reset_rate=args.reset_rate, seed=args.seed)
+    logger.info(f"✓ 재생 서버 시작: http://{args.host}:{server.server_address[1]} ({archive.db_path})")
+    # 벤치마크 실행기가 terminate()로 종료해도 요청 통계를 남기도록
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"✓ 재생 서버 종료: {server.counts}")
+
+
+if __name__ == '__main__':
+    main()
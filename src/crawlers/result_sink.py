@@ -0,0 +1,197 @@
+"""
+수집 결과 스트리밍 저장 모듈
+페이지 단위로 결과를 파일(CSV 또는 JSONL)에 바로 추가하고, 마지막으로 완료한 페이지를
+체크포인트 파일에 기록하여 중단된 수집을 이어서 진행할 수 있게 함
+(결과를 메모리에 모으지 않으므로 수집 기간이 길어도 메모리 사용량이 일정)
+
+체크포인트 파일: <출력 파일>.checkpoint.json
+{
+  "window": "2026-01-01~2026-01-31",   수집 기간 (다르면 체크포인트 무시)
+  "offset": 123456,                      마지막 페이지까지 기록된 파일 크기 (바이트)
+  "count": 870,                          저장된 기사 수
+  "lists": {"<목록 키>": {"page": 12, "done": false}},
+  "meta": {...}                          엔진이 저장하는 부가 정보 (백필 페이지 범위 등)
+}
+"""
+
+import os
+import csv
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('ResultSink')
+
+# save_to_csv와 동일한 통합 스키마
+COLUMNS = ['date', 'press', 'region', 'title', 'sub_title', 'description', 'content', 'article_url', 'image_url']
+
+FORMATS = ('csv', 'jsonl')
+
+
+class ResultSink:
+    """
+    추가 전용 결과 파일 + 체크포인트
+
+    - write_page(list_key, page, rows): 페이지 결과를 파일에 추가하고 fsync 후 체크포인트 갱신
+    - resume_page(list_key): 이어서 수집할 때 건너뛸 마지막 완료 페이지 (없으면 0)
+    - 같은 기간(window)으로 다시 실행하면 체크포인트 위치까지 파일을 잘라내고 이어서 기록
+      (체크포인트 이후에 쓰다 만 내용은 버림), 기간이 다르거나 완료된 수집이면 새로 시작
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, window: str = ''):
+        """
+        Args:
+            path: 출력 파일 경로
+            fmt: 'csv' 또는 'jsonl' (None이면 확장자로 판단)
+            window: 수집 기간 식별 문자열 (체크포인트 재사용 여부 판단)
+        """
+        self.path = path
+        self.fmt = fmt or ('jsonl' if path.endswith('.jsonl') else 'csv')
+        if self.fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {self.fmt}")
+        self.window = window
+        self.checkpoint_path = path + '.checkpoint.json'
+
+        self._lock = threading.Lock()
+        self._seen = set()
+        self._state = {'window': window, 'offset': 0, 'count': 0, 'lists': {}, 'meta': {}, 'completed': False}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._open()
+
+    # ---- 초기화 / 재개 ----
+
+    def _load_checkpoint(self) -> Optional[Dict]:
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get('window') != self.window or state.get('completed'):
+            return None
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < state.get('offset', 0):
+            return None
+        return state
+
+    def _open(self):
+        state = self._load_checkpoint()
+        if state:
+            # 체크포인트 이후에 기록된(완료되지 않은) 내용 제거
+            with open(self.path, 'r+b') as f:
+                f.truncate(state['offset'])
+            self._state.update(state)
+            self._seen = self._read_urls()
+            pages = ', '.join(f"{key}={entry['page']}" for key, entry in state['lists'].items())
+            logger.info(f"✓ 체크포인트에서 재개: {self.path} ({state['count']}건, {pages or '-'})")
+            self._file = open(self.path, 'a', encoding='utf-8', newline='')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8', newline='')
+            if self.fmt == 'csv':
+                # Excel 호환을 위해 save_to_csv와 같은 utf-8-sig(BOM) 사용
+                self._file.write('\ufeff')
+                csv.writer(self._file).writerow(COLUMNS)
+            self._sync()
+            self._state['offset'] = self._file.tell()
+            self._write_checkpoint()
+
+        if self.fmt == 'csv':
+            self._writer = csv.DictWriter(self._file, fieldnames=COLUMNS, extrasaction='ignore')
+
+    def _read_urls(self) -> set:
+        """이미 기록된 기사 URL (중복 제거용, 본문은 읽지 않고 URL만 보관)"""
+        urls = set()
+        with open(self.path, encoding='utf-8-sig', newline='') as f:
+            if self.fmt == 'csv':
+                for row in csv.DictReader(f):
+                    urls.add(row.get('article_url', ''))
+            else:
+                for line in f:
+                    if line.strip():
+                        urls.add(json.loads(line).get('article_url', ''))
+        urls.discard('')
+        return urls
+
+    # ---- 기록 ----
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _write_checkpoint(self):
+        """체크포인트를 임시 파일에 쓴 뒤 교체 (중간에 종료되어도 이전 체크포인트 유지)"""
+        self._state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def write_page(self, list_key: str, page: int, rows: List[Dict]) -> int:
+        """
+        페이지 결과 기록 (article_url 기준 중복 제외)
+
+        Returns:
+            새로 기록한 기사 수
+        """
+        with self._lock:
+            added = 0
+            for row in rows:
+                url = row.get('article_url', '')
+                if url in self._seen:
+                    continue
+                self._seen.add(url)
+                if self.fmt == 'csv':
+                    self._writer.writerow({col: row.get(col, '') for col in COLUMNS})
+                else:
+                    self._file.write(json.dumps({col: row.get(col, '') for col in COLUMNS}, ensure_ascii=False) + '\n')
+                added += 1
+
+            self._sync()
+            self._state['offset'] = self._file.tell()
+            self._state['count'] += added
+            entry = self._state['lists'].setdefault(list_key, {'page': 0, 'done': False})
+            entry['page'] = max(entry['page'], page)
+            self._write_checkpoint()
+            return added
+
+    def finish_list(self, list_key: str):
+        """목록 하나의 수집 완료 기록 (재개 시 건너뜀)"""
+        with self._lock:
+            self._state['lists'].setdefault(list_key, {'page': 0, 'done': False})['done'] = True
+            self._write_checkpoint()
+
+    def resume_page(self, list_key: str) -> int:
+        """마지막으로 완료한 페이지 (없으면 0)"""
+        with self._lock:
+            return self._state['lists'].get(list_key, {}).get('page', 0)
+
+    def is_done(self, list_key: str) -> bool:
+        with self._lock:
+            return self._state['lists'].get(list_key, {}).get('done', False)
+
+    def get_meta(self, key: str, default=None):
+        with self._lock:
+            return self._state['meta'].get(key, default)
+
+    def set_meta(self, key: str, value):
+        with self._lock:
+            self._state['meta'][key] = value
+            self._write_checkpoint()
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            return self._state['count']
+
+    def close(self, completed: bool = False):
+        """파일 닫기 (completed=True면 다음 실행은 새로 시작)"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._state['completed'] = completed
+            self._write_checkpoint()
+            self._file.close()
@@ -30,6 +30,12 @@ def main():
 
   # 경기도만 크롤링
   python run_crawlers.py --mode region --region 경기도 --articles 30
+
+  # 비동기 모드로 전체 크롤링 (호스트별 동시 요청)
+  python run_crawlers.py --mode all --articles 50 --async-fetch
+
+  # 신문사 6곳을 동시에 크롤링
+  python run_crawlers.py --mode all --articles 50 --workers 6
         '''
     )
 
@@ -52,6 +58,24 @@ def main():
         default=50,
         help='신문사당 최대 기사 수 (기본값: 50)'
     )
+    parser.add_argument(
+        '--async-fetch',
+        action='store_true',
+        default=False,
+        help='비동기 모드로 기사 수집 (호스트별 동시 요청 수/요청 간격은 크롤러 config 사용)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='동시에 실행할 신문사 크롤러 수 (기본값: 1, 순차 실행)'
+    )
+    parser.add_argument(
+        '--use-cache',
+        action='store_true',
+        default=False,
+        help='HTTP 응답 캐시 사용 (변경 없는 기사는 조건부 GET 304로 재사용)'
+    )
     parser.add_argument(
         '--output',
         type=str,
@@ -80,6 +104,9 @@ def main():
     if args.mode == 'region':
         print(f"대상 지역: {args.region}")
     print(f"신문사당 기사 수: {args.articles}개")
+    print(f"비동기 모드: {'예' if args.async_fetch else '아니오'}")
+    print(f"동시 실행 크롤러 수: {args.workers}개")
+    print(f"HTTP 캐시 사용: {'예' if args.use_cache else '아니오'}")
     print(f"CSV 출력: {args.output}")
     print(f"데이터베이스 저장: {'예' if args.save_db else '아니오'}")
     print(f"텍스트 파일 저장: {'예' if args.save_text else '아니오'}")
@@ -91,12 +118,15 @@ def main():
         save_text_files=args.save_text
     )
     manager.register_all_crawlers()
+    if args.use_cache:
+        manager.enable_response_cache()
 
     # 크롤링 실행
     if args.mode == 'all':
-        manager.run_all_crawlers(max_articles=args.articles)
+        manager.run_all_crawlers(max_articles=args.articles, use_async=args.async_fetch, workers=args.workers)
     else:
-        manager.run_by_region(args.region, max_articles=args.articles)
+        manager.run_by_region(args.region, max_articles=args.articles, use_async=args.async_fetch,
+                              workers=args.workers)
 
     # 결과 저장 (모든 포맷)
     manager.save_all(csv_filename=args.output)
@@ -1,98 +1,20 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
-from utils import get_logger, get_common_headers, common_parse_date, save_to_csv, fetch_article_details, fetch_url
+"""
+충청투데이 스크래퍼
+선택자 등 사이트 설정은 site_specs.SITE_SPECS['chungcheong_cctoday'], 수집은 scraping_engine이 담당
+"""
+import os
+import sys
 
-# 로거 설정
-logger = get_logger("chungcheong_cctoday")
+# src/crawlers를 맨 앞에 두어 utils 패키지와 scraper/utils.py 이름 충돌 방지
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_engine import run_site, stream_site
 
-def process_article(item, base_url, session, headers, limit_date):
-    """개별 기사 처리 (세션 사용)"""
-    try:
-        date_tag = item.select_one('span.byline') or item.select_one('.date')
-        if not date_tag: return None
-        
-        formatted_date = common_parse_date(date_tag.get_text(strip=True))
-        if formatted_date < limit_date: return "OLDER"
+SITE = "chungcheong_cctoday"
 
-        title_tag = item.select_one('h4.titles a') or item.select_one('.titles a')
-        if not title_tag: return None
-        
-        article_url = title_tag['href']
-        if not article_url.startswith('http'): article_url = base_url + article_url
-        
-        # 상세 정보 수집 (세션 공유 및 재시도 로직 적용)
-        details = fetch_article_details(article_url, {
-            'sub_title': ['h4.subheading', 'div.sub-title', '.sub-title'],
-            'content': ['div#article-view-content-div', 'div.article-view-content-div', '.article-body', '#articleBody']
-        }, headers, logger, session=session)
-
-        description = item.select_one('p.lead').get_text(strip=True) if item.select_one('p.lead') else ""
-        if not description and details['content']:
-            description = details['content'][:150] + "..."
-
-        return {
-            'date': formatted_date,
-            'press': '충청투데이',
-            'region': 'chungcheong',
-            'title': title_tag.get_text(strip=True),
-            'sub_title': details['sub_title'],
-            'description': description,
-            'content': details['content'],
-            'article_url': article_url,
-            'image_url': item.select_one('img')['src'] if item.select_one('img') else ""
-        }
-    except:
-        return None
-
-def scrape_cctoday_economy(days=30):
-    base_url = "https://www.cctoday.co.kr"
-    target_url_base = f"{base_url}/news/articleList.html?sc_section_code=S1N4&view_type=sm"
-    news_data = []
-    headers = get_common_headers()
-    limit_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    logger.info(f"Starting Chungcheong parallel collection until {limit_date}...")
-
-    with requests.Session() as session:
-        session.headers.update(headers)
-        page = 1
-        while page <= 500:
-            target_url = f"{target_url_base}&page={page}"
-            try:
-                # 목록 페이지 요청 시 fetch_url 사용
-                response = fetch_url(target_url, headers, logger, session=session)
-                if not response or response.status_code != 200: break
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                items = soup.select('ul.types > li') or soup.select('.list-block li')
-                if not items: break
-                
-                logger.info(f"Page {page}: Processing {len(items)} items...")
-                page_data = []
-                reached_limit = False
-                
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    results = list(executor.map(lambda it: process_article(it, base_url, session, headers, limit_date), items))
-                    for res in results:
-                        if res == "OLDER": reached_limit = True
-                        elif res and isinstance(res, dict):
-                            if not any(d['article_url'] == res['article_url'] for d in news_data):
-                                page_data.append(res)
-                
-                news_data.extend(page_data)
-                logger.info(f"Page {page} added {len(page_data)} items. Total: {len(news_data)}")
-                
-                if reached_limit: break
-                page += 1
-                time.sleep(0.1)
-            except Exception as e:
-                logger.error(f"Error on Page {page}: {e}")
-                break
-                
-    return news_data
+def scrape_cctoday_economy(days=30, use_cache=None, skip_known=None):
+    """최근 지정된 일수(기본 30일)만큼 데이터 수집 (use_cache: HTTP 캐시 사용 여부, skip_known: 저장된 기사 건너뛰기)"""
+    return run_site(SITE, days=days, use_cache=use_cache, skip_known=skip_known)
 
 if __name__ == "__main__":
-    results = scrape_cctoday_economy(days=30)
-    save_to_csv(results, "data/scraped/raw_chungcheong_cctoday.csv", logger)
+    # 페이지마다 바로 저장 (중단 후 다시 실행하면 체크포인트부터 이어서 수집)
+    stream_site(SITE, days=30)
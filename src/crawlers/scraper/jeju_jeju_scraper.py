@@ -1,112 +1,20 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
-from utils import get_logger, get_common_headers, common_parse_date, save_to_csv, fetch_article_details, fetch_url
+"""
+제주일보 스크래퍼
+선택자 등 사이트 설정은 site_specs.SITE_SPECS['jeju_jeju'], 수집은 scraping_engine이 담당
+"""
+import os
+import sys
 
-# 로거 설정
-logger = get_logger("jeju_jeju")
+# src/crawlers를 맨 앞에 두어 utils 패키지와 scraper/utils.py 이름 충돌 방지
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_engine import run_site, stream_site
 
-def process_article(item, base_url, session, headers, limit_date):
-    """개별 기사 처리"""
-    try:
-        # 날짜 추출
-        date_tag = item.select_one('div.list-dated')
-        if not date_tag: return None
-        
-        formatted_date = common_parse_date(date_tag.get_text(strip=True))
-        if formatted_date < limit_date: return "OLDER"
+SITE = "jeju_jeju"
 
-        # 제목 및 링크 추출
-        title_tag = item.select_one('div.list-titles a')
-        if not title_tag: return None
-        
-        article_url = title_tag['href']
-        if not article_url.startswith('http'):
-            article_url = base_url + article_url
-        
-        # 상세 정보 수집 (Sub Title, Content)
-        details = fetch_article_details(article_url, {
-            'sub_title': ['div.user-snb h2', 'div.article-head-title'],
-            'content': ['article#article-view-content-div', '#articleBody', 'div#article-view-content-div']
-        }, headers, logger, session=session)
-
-        # [수정] 요약(Description) 추출 로직 개선
-        # 1. 목록 페이지의 요약 태그 시도
-        summary_tag = item.select_one('div.list-summary')
-        if summary_tag:
-            description = summary_tag.get_text(strip=True)
-        else:
-            # 2. 목록에 없으면 수집된 본문의 앞부분 사용
-            content = details.get('content', '')
-            if content:
-                description = (content[:150] + "...") if len(content) > 150 else content
-            else:
-                description = ""
-
-        return {
-            'date': formatted_date,
-            'press': '제주일보',
-            'region': 'jeju',
-            'title': title_tag.get_text(strip=True),
-            'sub_title': details.get('sub_title', ''),
-            'description': description,
-            'content': details.get('content', ''),
-            'article_url': article_url,
-            'image_url': ""
-        }
-    except Exception as e:
-        logger.debug(f"Error processing item: {e}")
-        return None
-
-def scrape_jeju_economy(days=30):
-    base_url = "http://www.jejunews.com"
-    news_data = []
-    headers = get_common_headers()
-    limit_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    logger.info(f"Starting Jeju parallel collection until {limit_date}...")
-
-    with requests.Session() as session:
-        session.headers.update(headers)
-        page = 1
-        while page <= 500:
-            target_url = f"{base_url}/news/articleList.html?sc_section_code=S1N5&view_type=sm&page={page}"
-            try:
-                response = fetch_url(target_url, headers, logger, session=session)
-                if not response or response.status_code != 200: break
-                
-                # 인코딩 깨짐 방지를 위해 response.content 사용
-                soup = BeautifulSoup(response.content, 'html.parser')
-                items = soup.select('div.list-block')
-                if not items: break
-                
-                logger.info(f"Page {page}: Processing {len(items)} items...")
-                page_data = []
-                reached_limit = False
-                
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    results = list(executor.map(lambda it: process_article(it, base_url, session, headers, limit_date), items))
-                    
-                    for res in results:
-                        if res == "OLDER":
-                            reached_limit = True
-                        elif res and isinstance(res, dict):
-                            if not any(d['article_url'] == res['article_url'] for d in news_data):
-                                page_data.append(res)
-                
-                news_data.extend(page_data)
-                logger.info(f"Page {page}: Added {len(page_data)} articles. Total: {len(news_data)}")
-                
-                if reached_limit: break
-                page += 1
-                time.sleep(0.1)
-            except Exception as e:
-                logger.error(f"Error on Page {page}: {e}")
-                break
-                
-    return news_data
+def scrape_jeju_economy(days=30, use_cache=None, skip_known=None):
+    """최근 지정된 일수(기본 30일)만큼 데이터 수집 (use_cache: HTTP 캐시 사용 여부, skip_known: 저장된 기사 건너뛰기)"""
+    return run_site(SITE, days=days, use_cache=use_cache, skip_known=skip_known)
 
 if __name__ == "__main__":
-    results = scrape_jeju_economy(days=30)
-    save_to_csv(results, "data/scraped/raw_jeju_jeju.csv", logger)
+    # 페이지마다 바로 저장 (중단 후 다시 실행하면 체크포인트부터 이어서 수집)
+    stream_site(SITE, days=30)
@@ -1,14 +1,29 @@
 import os
+import sys
 import logging
+from logging.handlers import RotatingFileHandler
 import pandas as pd
 from datetime import datetime, timedelta
 import re
 import requests
-from bs4 import BeautifulSoup
 import time
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import urllib3
 
+# 상위 폴더(src/crawlers)의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_cache import get_response_cache
+from url_index import KnownUrlIndex
+from rate_limiter import get_rate_limiter
+from html_parser import parse_html, target_filter
+from charset_resolver import get_charset_resolver
+from transport import accept_encoding, get_shared_session
+from crawl_metrics import get_crawl_metrics, domain_of
+from extraction_plan import get_plan, get_noise_filter
+from text_engine import clean_body
+
 # SSL 경고 및 종속성 경고 억제
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 os.environ['PYTHONWARNINGS'] = 'ignore:semaphore_tracker:UserWarning'
@@ -19,15 +34,20 @@ def ensure_dirs():
         os.makedirs(d, exist_ok=True)
 
 def get_logger(name, level=logging.DEBUG): # 디버깅을 위해 기본 레벨을 DEBUG로 변경
-    """실행 시간별 로그 파일 설정"""
-    ensure_dirs()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = f"logs/{name}_{timestamp}.log"
+    """
+    스크래퍼별 로그 파일 설정 (logs/<name>.log 하나에 이어서 기록, 10MB마다 교체하고 5개 보관)
+    실행마다 새 파일을 만들지 않으며, 같은 이름으로 다시 호출해도 핸들러를 중복 추가하지 않음
+    (요청/파싱 통계는 crawl_metrics가 data/metrics에 따로 저장)
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+    if logger.handlers:
+        return logger
+
+    ensure_dirs()
+    log_file = f"logs/{name}.log"
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding='utf-8')
     file_handler.setFormatter(formatter)
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
@@ -41,7 +61,7 @@ def get_common_headers():
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
         "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Accept-Encoding": "gzip, deflate",
+        "Accept-Encoding": accept_encoding(),
         "Referer": "https://www.google.com/",
         "Connection": "keep-alive",
         "Sec-Ch-Ua": '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
@@ -80,87 +100,270 @@ def common_parse_date(date_str):
     return target_date.strftime('%Y-%m-%d')
 
 def clean_text(text):
-    """본문 텍스트 정제 (노이즈 제거)"""
-    if not text: return ""
-    text = re.split(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)[0]
-    noise_keywords = ["저작권자", "다른기사 보기", "좋아요 0", "훈훈해요 0", "슬퍼요 0", "화나요 0", "관련기사", "재배포 금지", "무단 전재", "기자 ="]
-    for kw in noise_keywords:
-        if kw in text: text = text.split(kw)[0]
-    text = re.sub(r'#\S+', '', text)
-    text = re.sub(r'/[가-힣]{2,4}\s*기자.*$', '', text, flags=re.MULTILINE)
-    return text.strip()
-
-def fetch_url(url, headers, logger, session=None, retries=3, backoff_factor=1.5):
-    """재시도 로직이 포함된 URL 요청 함수"""
-    fetcher = session if session else requests
+    """본문 텍스트 정제 (노이즈 제거, 미리 컴파일한 패턴으로 처리 - text_engine.clean_body)"""
+    return clean_body(text)
+
+def get_scraper_cache(use_cache=None):
+    """
+    스크래퍼용 HTTP 캐시 반환 (사용하지 않으면 None)
+    use_cache가 None이면 환경 변수 SCRAPER_HTTP_CACHE=1 여부로 결정
+    """
+    if use_cache is None:
+        use_cache = os.environ.get('SCRAPER_HTTP_CACHE') == '1'
+    return get_response_cache() if use_cache else None
+
+def get_known_url_index(skip_known=None):
+    """
+    이미 저장된 기사 URL 인덱스 반환 (사용하지 않으면 None)
+    skip_known이 None이면 환경 변수 SCRAPER_SKIP_KNOWN=1 여부로 결정
+    """
+    if skip_known is None:
+        skip_known = os.environ.get('SCRAPER_SKIP_KNOWN') == '1'
+    return KnownUrlIndex.load_or_build() if skip_known else None
+
+class FetchError(Exception):
+    """요청 실패 (재시도 초과, 연결 오류, 404/410 외의 오류 상태)"""
+
+
+# 페이지가 없다는 뜻의 상태 (목록 끝 등, 요청 실패로 보지 않음)
+MISSING_STATUSES = (404, 410)
+
+def fetch_url(url, headers, logger, session=None, retries=3, backoff_factor=1.5, cache=None, page_class='article',
+              raise_errors=False):
+    """
+    재시도 로직이 포함된 URL 요청 함수
+    요청 간격은 도메인별 공용 속도 제한기가 조절 (429/403/503 시 감속, Retry-After 반영)
+    cache가 주어지면 유효한 캐시는 바로 반환하고, 만료된 캐시는 조건부 GET으로 재검증
+    (page_class: 'list', 'article' 또는 'feed', 종류별 캐시 유효 시간이 다름)
+    raise_errors면 페이지가 없는 경우(404/410)만 None을 반환하고 요청 실패는 FetchError로 알림
+    """
+    # 세션이 없으면 공용 세션 사용 (CRAWLER_TRANSPORT=httpx면 HTTP/2 다중화)
+    fetcher = session if session else get_shared_session()
+    limiter = get_rate_limiter()
+    metrics = get_crawl_metrics()
+
+    cached = None
+    if cache:
+        cached = cache.get(url)
+        if cached and cache.is_fresh(cached, page_class):
+            metrics.observe_fetch(url, 0.0, 'cache', stage=page_class)
+            return get_charset_resolver().apply(cache.to_response(cached))
+        if cached:
+            headers = {**headers, **cache.conditional_headers(cached)}
     
     for i in range(retries):
+        if i > 0:
+            metrics.record_retry(url, page_class)
+        started = None
         try:
-            # 타임아웃 20초, SSL 검증 무시
+            limiter.acquire(url)
+            # 타임아웃 20초, SSL 검증 무시 (지연 시간은 속도 제한 대기 이후부터 측정)
+            started = time.perf_counter()
             response = fetcher.get(url, headers=headers, timeout=20, verify=False)
+            metrics.observe_fetch(url, time.perf_counter() - started, response.status_code,
+                                  len(response.content or b''), page_class)
+            limiter.on_response(url, response.status_code, response.headers.get('Retry-After'))
+            if response.status_code == 304 and cached:
+                # 변경 없음: 캐시된 본문 재사용
+                cache.touch(url)
+                return get_charset_resolver().apply(cache.to_response(cached))
             if response.status_code == 200:
-                # UTF-8 강제 지정 후 즉시 반환
-                response.encoding = 'utf-8'
-                return response
-            elif response.status_code in [403, 401, 429]:
-                print(f"[DEBUG] HTTP {response.status_code} Error: {url}")
+                if cache:
+                    cache.store(url, response)
+                # 도메인별로 한 번 알아낸 인코딩 지정 (response.text가 chardet 감지를 하지 않도록)
+                return get_charset_resolver().apply(response)
+            elif response.status_code in [403, 401, 429, 503]:
                 logger.warning(f"Status {response.status_code} for {url}. ({i+1}/{retries})")
-                time.sleep(backoff_factor ** i)
+                if response.status_code == 401:
+                    time.sleep(backoff_factor ** i)
+                # 403/429/503은 속도 제한기가 도메인 전체를 감속·일시 정지하므로 별도 대기 없음
             else:
-                print(f"[DEBUG] HTTP Error {response.status_code}: {url}")
                 logger.error(f"Failed to fetch {url}: Status {response.status_code}")
+                if raise_errors and response.status_code not in MISSING_STATUSES:
+                    raise FetchError(f"Status {response.status_code}: {url}")
                 return None
+        except FetchError:
+            raise
         except Exception as e:
-            # 에러의 실체를 콘솔에 즉시 출력
-            print(f"\n[DEBUG] Error Fetching URL: {url}")
-            print(f"[DEBUG] Exception Type: {type(e).__name__}")
-            print(f"[DEBUG] Exception Message: {str(e)}")
+            if started is not None:
+                metrics.observe_fetch(url, time.perf_counter() - started, 'error', stage=page_class)
             wait_time = backoff_factor ** i
-            logger.error(f"Error fetching {url}: {str(e)} (Type: {type(e).__name__})")
+            logger.error(f"Error fetching {url}: {str(e)} (Type: {type(e).__name__}, {i+1}/{retries})")
             time.sleep(wait_time)
     
     logger.error(f"Max retries exceeded for {url}")
+    if raise_errors:
+        raise FetchError(f"Max retries exceeded: {url}")
     return None
 
-def fetch_article_details(url, selectors, headers, logger, session=None):
+# 상세 페이지 본문에서 제거할 노이즈 선택자
+DETAIL_NOISE = ('script, style, iframe, ins, .quizContainer, .articleCopyright, figcaption, .byline, '
+                '.article-copy, .banner_box, .account, .relation, .ad-template')
+
+def _selector_list(value):
+    """선택자 설정(문자열 또는 리스트)을 리스트로 정규화"""
+    if not value:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+def fetch_article_details(url, selectors, headers, logger, session=None, cache=None):
     """기사 상세 페이지에서 정보 추출 (재시도 로직 적용)"""
     details = {'sub_title': '', 'content': ''}
     if not url: return details
     try:
-        response = fetch_url(url, headers, logger, session=session)
+        response = fetch_url(url, headers, logger, session=session, cache=cache)
         if response and response.status_code == 200:
-            # 인코딩 오류 방지: ISO-8859-1로 잘못 감지되는 경우 utf-8 강제 시도
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = 'utf-8'
+            metrics = get_crawl_metrics()
+            started = time.perf_counter()
+            # 도메인 인코딩으로 디코딩 (파서는 CRAWLER_HTML_PARSER로 선택)
+            # 부제/본문 선택자가 가리키는 하위 트리만 파싱 (본문이 없으면 전체 파싱)
+            content_selectors = _selector_list(selectors.get('content'))
+            targets = target_filter(_selector_list(selectors.get('sub_title')) + content_selectors,
+                                    required=content_selectors)
+            soup = parse_html(get_charset_resolver().decode(response), targets=targets)
             
-            # BeautifulSoup에서 명시적으로 utf-8을 감지하도록 content 사용
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
+            # 도메인별 추출 계획 (미리 컴파일한 선택자를 자주 채택되는 순으로 시도)
+            domain = domain_of(url)
             
             # Sub Title
-            st_sel = selectors.get('sub_title')
-            if st_sel:
-                st_selectors = st_sel if isinstance(st_sel, list) else [st_sel]
-                for s in st_selectors:
-                    tag = soup.select_one(s)
-                    if tag:
-                        details['sub_title'] = tag.get_text(" ", strip=True)
-                        break
+            if selectors.get('sub_title'):
+                plan = get_plan(domain, 'sub_title', selectors['sub_title'])
+                tag = plan.select_one(soup, metrics.selector_recorder(url, 'sub_title'))
+                if tag:
+                    details['sub_title'] = tag.get_text(" ", strip=True)
             
-            # Content
-            c_sel = selectors.get('content')
-            if c_sel:
-                c_selectors = c_sel if isinstance(c_sel, list) else [c_sel]
-                for s in c_selectors:
-                    tag = soup.select_one(s)
-                    if tag:
-                        for noise in tag.select('script, style, iframe, ins, .quizContainer, .articleCopyright, figcaption, .byline, .article-copy, .banner_box, .account, .relation, .ad-template'):
-                            noise.decompose()
-                        details['content'] = clean_text(tag.get_text(" ", strip=True))
-                        break
+            # Content (노이즈 제거와 텍스트 추출을 한 번에)
+            if selectors.get('content'):
+                plan = get_plan(domain, 'content', selectors['content'])
+                tag = plan.select_one(soup, metrics.selector_recorder(url, 'content'))
+                if tag:
+                    details['content'] = clean_text(get_noise_filter(DETAIL_NOISE).text(tag))
+            metrics.observe_parse(url, time.perf_counter() - started)
     except Exception as e:
         logger.debug(f"Error parsing details for {url}: {e}")
     return details
 
+def iter_page_results(fetch_items, process_item, logger, max_pages=500, workers=10, prefetch=2,
+                      stop_on_older=True, executor=None, max_in_flight=None, start_page=1):
+    """
+    목록 페이지 → 상세 페이지 수집 파이프라인
+    생산자 스레드가 목록 페이지를 미리 받아 상세 작업을 하나의 executor에 계속 넣고,
+    호출자는 페이지 순서대로 (page, results)를 받음 (results는 items 순서와 동일)
+
+    - fetch_items(page): 해당 페이지의 작업 목록 반환 (None이면 종료, 빈 리스트면 건너뜀)
+    - process_item(item): 작업 하나 처리 (Future를 반환하면 그 결과를 기다림, 예: 파싱 작업자 풀)
+    - prefetch: 결과를 기다리지 않고 앞서 받아 둘 목록 페이지 수
+    - stop_on_older: 결과 중 "OLDER"가 나오면 다음 목록 페이지 요청 중단
+    - executor: 여러 번 호출할 때 공유할 executor (없으면 새로 만들고 끝나면 종료)
+    - max_in_flight: 공유 executor에 동시에 올려 둘 최대 작업 수 (한 사이트가 작업자를 독점하지 않도록)
+    - start_page: 시작 페이지 (체크포인트에서 이어서 수집할 때)
+    호출자가 루프를 빠져나오면 아직 시작하지 않은 작업은 취소됨
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    pages = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    closed = threading.Event()
+    slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+
+    def on_done(future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if isinstance(result, Future):
+            result.add_done_callback(on_done)
+        elif result == "OLDER":
+            stop.set()
+
+    def put(entry):
+        # 호출자가 루프를 빠져나간 뒤에는 대기하지 않음
+        while not closed.is_set():
+            try:
+                pages.put(entry, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reserve():
+        # 작업 자리가 날 때까지 대기 (호출자가 루프를 빠져나가면 중단)
+        while not closed.is_set():
+            if slots.acquire(timeout=0.5):
+                return True
+        return False
+
+    def release(future):
+        slots.release()
+
+    def produce():
+        try:
+            for page in range(start_page, max_pages + 1):
+                if stop.is_set():
+                    break
+                try:
+                    items = fetch_items(page)
+                except Exception as e:
+                    logger.error(f"Error on Page {page}: {e}")
+                    break
+                if items is None:
+                    break
+
+                futures = []
+                for item in items:
+                    if slots is not None and not reserve():
+                        break
+                    future = executor.submit(process_item, item)
+                    if slots is not None:
+                        future.add_done_callback(release)
+                    if stop_on_older:
+                        future.add_done_callback(on_done)
+                    futures.append(future)
+
+                if not put((page, futures)):
+                    for future in futures:
+                        future.cancel()
+                    break
+        finally:
+            put(None)
+
+    producer = threading.Thread(target=produce, name='page-producer', daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            entry = pages.get()
+            if entry is None:
+                break
+            page, futures = entry
+            results = []
+            for future in futures:
+                try:
+                    result = future.result()
+                    if isinstance(result, Future):
+                        result = result.result()
+                    results.append(result)
+                except Exception as e:
+                    logger.error(f"Error processing item on Page {page}: {e}")
+                    results.append(None)
+            yield page, results
+    finally:
+        closed.set()
+        stop.set()
+        producer.join()
+        # 미리 받아 두었지만 처리하지 않은 페이지의 작업 취소
+        while True:
+            try:
+                entry = pages.get_nowait()
+            except queue.Empty:
+                break
+            if entry:
+                for future in entry[1]:
+                    future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
 def save_to_csv(data, file_name, logger):
     """데이터 저장"""
     if not data:
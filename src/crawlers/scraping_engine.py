@@ -0,0 +1,1032 @@
+"""
+설정 기반 통합 수집 엔진
+site_specs.SITE_SPECS의 사이트 설정만으로 목록 → 상세 페이지를 수집
+여러 사이트를 한 프로세스에서 실행하며 커넥션 풀, 작업자 스레드, 결과 저장소를 공유
+
+사용 예시:
+  python scraping_engine.py --sites seoul_seoul gyeonggi_kyeongin --days 30
+  python scraping_engine.py --workers 24 --skip-known
+  python scraping_engine.py --sites seoul_seoul --start-date 2026-01-05 --end-date 2026-01-11
+  python scraping_engine.py --stream --format jsonl --days 180
+  python scraping_engine.py --sites chungcheong_cctoday --no-feeds
+  python scraping_engine.py --workers 32 --parse-workers 8
+"""
+
+import os
+import re
+import time
+import random
+import argparse
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from newspaper_factory import NewspaperConfig, GenericNewspaperCrawler
+from rate_limiter import get_rate_limiter
+from html_parser import parse_html, target_filter
+from charset_resolver import get_charset_resolver
+from transport import create_session
+from crawl_metrics import get_crawl_metrics
+from raw_archive import get_raw_archive, raw_archive_enabled
+from feed_discovery import FeedDiscovery
+from parse_pool import ParsePool, parse_workers_from_env
+from extraction_plan import get_plan, get_noise_filter
+from site_specs import SITE_SPECS, DEFAULT_NOISE
+from result_sink import ResultSink
+from scraper.utils import (
+    get_logger, get_common_headers, common_parse_date, clean_text, fetch_url, save_to_csv,
+    get_scraper_cache, get_known_url_index, iter_page_results, FetchError, MISSING_STATUSES
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 목록 단계에서 기준일 이전으로 판정된 항목 (상세 요청 없이 "OLDER" 반환)
+OLDER = "OLDER"
+
+# 피드 탐색 결과의 체크포인트 키
+FEED_LIST_KEY = 'feed'
+
+_site_loggers = {}
+_site_loggers_lock = threading.Lock()
+
+
+def get_site_logger(key: str):
+    """사이트별 로거 (기존 스크래퍼와 같은 이름, 프로세스당 한 번만 생성)"""
+    with _site_loggers_lock:
+        if key not in _site_loggers:
+            logger = get_logger(key)
+            # base_crawler의 루트 핸들러로 중복 출력되지 않도록
+            logger.propagate = False
+            _site_loggers[key] = logger
+        return _site_loggers[key]
+
+
+def _as_list(value) -> List[str]:
+    """선택자 설정을 리스트로 정규화"""
+    if not value:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _tag_value(tag, attrs) -> str:
+    """meta 태그면 content, 아니면 attrs 중 처음 값이 있는 속성 (없으면 빈 문자열)"""
+    if tag is None:
+        return ''
+    if tag.name == 'meta':
+        return tag.get('content') or ''
+    for attr in _as_list(attrs):
+        if tag.get(attr):
+            return tag.get(attr)
+    return ''
+
+
+class SiteSpec(NewspaperConfig):
+    """SITE_SPECS 항목 하나를 NewspaperConfig로 변환한 설정"""
+
+    def __init__(self, key: str, spec: Dict):
+        detail = spec.get('detail', {})
+        list_urls = _as_list(spec['list_url'])
+        link_selectors = _as_list(spec.get('link')) or _as_list(spec.get('title'))
+
+        super().__init__(
+            newspaper_name=spec['press'],
+            region=spec['region'],
+            base_url=spec['base_url'],
+            list_url=spec.get('first_page_url') or list_urls[0].format(page=1),
+            article_link_selector=', '.join(link_selectors),
+            content_selectors=_as_list(detail.get('content')),
+            parsing_method='selector'
+        )
+        self.key = key
+        self.source = spec
+        self.list_urls = list_urls
+        self.feeds = _as_list(spec.get('feeds'))
+        self.first_page_url = spec.get('first_page_url')
+        self.list_method = spec.get('list_method', 'GET').upper()
+        self.list_payload = spec.get('list_payload')
+        self.list_delay = spec.get('list_delay')
+        self.headers = spec.get('headers', {})
+        self.encoding = spec.get('encoding', 'utf-8')
+        self.detail_encoding = spec.get('detail_encoding', 'utf-8')
+
+        self.item_selectors = _as_list(spec['item'])
+        self.date_selectors = _as_list(spec.get('date'))
+        self.date_pattern = re.compile(spec['date_pattern']) if spec.get('date_pattern') else None
+        self.title_selectors = _as_list(spec.get('title'))
+        self.link_selectors = link_selectors
+        self.description_selectors = _as_list(spec.get('description'))
+        self.image_selectors = _as_list(spec.get('image'))
+        self.image_attrs = _as_list(spec.get('image_attr', 'src'))
+
+        self.detail_sub_title = _as_list(detail.get('sub_title'))
+        self.detail_date = _as_list(detail.get('date'))
+        self.detail_title = _as_list(detail.get('title'))
+        self.detail_image = _as_list(detail.get('image'))
+        self.noise = spec.get('noise', DEFAULT_NOISE)
+        self.content_split = re.compile(spec['content_split']) if spec.get('content_split') else None
+        self.collapse_whitespace = spec.get('collapse_whitespace', False)
+        self.title_split = spec.get('title_split', [])
+        self.description_from_content = spec.get('description_from_content', False)
+        self.min_content_length = spec.get('min_content_length', 0)
+
+        # 선택자는 사이트별로 한 번만 컴파일하고, 자주 채택되는 것부터 시도
+        self.plans = {
+            field: get_plan(key, field, selectors) for field, selectors in (
+                ('list_date', self.date_selectors), ('list_title', self.title_selectors),
+                ('list_link', self.link_selectors), ('list_description', self.description_selectors),
+                ('list_image', self.image_selectors),
+                ('sub_title', self.detail_sub_title), ('content', self.content_selectors),
+                ('date', self.detail_date), ('title', self.detail_title), ('image', self.detail_image),
+            )
+        }
+        self.noise_filter = get_noise_filter(self.noise)
+
+        # 상세 페이지는 detail 선택자가 가리키는 하위 트리만 파싱 (본문이 없으면 전체 파싱)
+        self.detail_targets = None
+        if spec.get('partial_parse', True):
+            self.detail_targets = target_filter(
+                self.detail_sub_title + self.content_selectors + self.detail_date
+                + self.detail_title + self.detail_image,
+                required=self.content_selectors,
+            )
+
+        self.stop_rule = spec.get('stop_rule', 'first_older')
+        self.older_ratio = spec.get('older_ratio', 0.7)
+        self.workers = spec.get('workers', 10)
+        self.max_pages = spec.get('max_pages', 500)
+        self.output = spec['output']
+
+    def page_url(self, list_url: str, page: int) -> str:
+        """목록 페이지 URL"""
+        if page == 1 and self.first_page_url:
+            return self.first_page_url
+        return list_url.format(page=page)
+
+
+class SpecCrawler(GenericNewspaperCrawler):
+    """
+    SiteSpec으로 동작하는 크롤러
+    엔진에서는 fetch_list_items / process_item을, 기존 CrawlerManager 방식에서는
+    GenericNewspaperCrawler의 get_article_urls / parse_article을 그대로 사용
+    """
+
+    def __init__(self, spec: SiteSpec, session: Optional[requests.Session] = None,
+                 cache=None, known_urls=None, logger=None, raw_archive=None, parse_pool=None):
+        super().__init__(spec)
+        self.spec = spec
+        self.parse_pool = parse_pool
+        self.archive_source = f"spec:{spec.key}"
+        if session is not None:
+            self.session = session
+        if raw_archive is not None:
+            self.raw_archive = raw_archive or None
+        self.cache = cache
+        self.known_urls = known_urls
+        self.request_headers = {**get_common_headers(), **spec.headers}
+        if logger is not None:
+            self.logger = logger
+
+    def _absolute(self, url: str) -> str:
+        return urljoin(self.spec.base_url + '/', url) if url else ''
+
+    def _decode(self, response, encoding: str, targets=None):
+        """응답을 설정된 인코딩으로 파싱 ('auto'면 도메인 인코딩 캐시 사용, targets를 주면 부분 파싱)"""
+        if encoding == 'auto':
+            return parse_html(get_charset_resolver().decode(response), targets=targets)
+        return parse_html(response.content, encoding=encoding, targets=targets)
+
+    def _fetch_list_response(self, url: str, page: int):
+        """목록 페이지 요청 (POST 목록은 캐시하지 않음, 페이지가 없으면 None, 요청 실패는 FetchError)"""
+        if self.spec.list_delay:
+            time.sleep(random.uniform(*self.spec.list_delay))
+
+        if self.spec.list_method != 'POST':
+            return fetch_url(url, self.request_headers, self.logger, session=self.session,
+                             cache=self.cache, page_class='list', raise_errors=True)
+
+        payload = {k: str(v).format(page=page) for k, v in (self.spec.list_payload or {}).items()}
+        limiter = get_rate_limiter()
+        limiter.acquire(url)
+        started = time.perf_counter()
+        response = self.session.post(url, data=payload, headers=self.request_headers, timeout=20)
+        get_crawl_metrics().observe_fetch(url, time.perf_counter() - started, response.status_code,
+                                          len(response.content or b''), 'list')
+        limiter.on_response(url, response.status_code, response.headers.get('Retry-After'))
+        if response.status_code != 200:
+            self.logger.error(f"Page {page} 요청 실패: {response.status_code}")
+            if response.status_code not in MISSING_STATUSES:
+                raise FetchError(f"Status {response.status_code}: {url}")
+            return None
+        return response
+
+    def _list_elements(self, list_url: str, page: int):
+        """목록 페이지의 아이템 요소 목록 (페이지가 없거나 비었으면 None, 요청 실패는 FetchError)"""
+        spec = self.spec
+        url = spec.page_url(list_url, page)
+        response = self._fetch_list_response(url, page)
+        if not response or response.status_code != 200:
+            return None
+
+        started = time.perf_counter()
+        try:
+            soup = self._decode(response, spec.encoding)
+            for selector in spec.item_selectors:
+                elements = soup.select(selector)
+                if elements:
+                    return elements
+            return None
+        finally:
+            get_crawl_metrics().observe_parse(url, time.perf_counter() - started, 'list')
+
+    def fetch_list_items(self, list_url: str, page: int, limit_date: str, seen_urls: set,
+                         end_date: Optional[str] = None, in_range: bool = False, keep_older: bool = False):
+        """
+        목록 페이지 하나를 읽어 상세 작업 목록 반환
+        (None이면 종료, 빈 리스트면 건너뜀 — iter_page_results의 fetch_items 규칙, 요청 실패는 FetchError)
+        end_date가 주어지면 그보다 최신 기사는 건너뜀 (과거 구간 백필)
+        in_range면 locate_pages로 찾은 범위 안의 페이지이므로, 걸러져서 빈 페이지는 종료하지 않고 건너뜀
+        (None은 목록을 읽지 못한 경우에만 반환)
+        keep_older면 비율 규칙 사이트도 기준일 이전 기사를 OLDER로 남김 (목록만 읽는 쪽에서 종료 비율 계산용)
+        """
+        spec = self.spec
+        elements = self._list_elements(list_url, page)
+        if not elements:
+            self.logger.info(f"Page {page}: No more items found. Ending.")
+            return None
+
+        entries = []
+        for element in elements:
+            entry = self._parse_list_item(element, limit_date)
+            if entry is None:
+                continue
+            if entry == OLDER:
+                # 비율 규칙 사이트는 목록에서 걸러진 과거 기사를 세지 않음
+                if spec.stop_rule != 'older_ratio' or keep_older:
+                    entries.append(OLDER)
+                continue
+            if end_date and entry['date'] and entry['date'] > end_date:
+                continue
+            if self.known_urls is not None and entry['article_url'] in self.known_urls:
+                continue
+            if entry['article_url'] in seen_urls:
+                continue
+            seen_urls.add(entry['article_url'])
+            entries.append(entry)
+
+        if not entries and spec.stop_rule == 'older_ratio':
+            # 빈 페이지는 건너뛰되, 앞쪽 몇 페이지 이후로는 종료
+            return None if page > 5 and not in_range else []
+
+        self.logger.info(f"Page {page}: Processing {len(entries)} items... ({spec.page_url(list_url, page)})")
+        return entries
+
+    def discover_items(self, limit_date: str, seen_urls: set,
+                       end_date: Optional[str] = None) -> Optional[Tuple[List[Dict], bool]]:
+        """
+        피드/사이트맵에서 limit_date 이후 기사 항목 탐색
+        (항목, 기준일까지 모두 찾았는지) 반환, 피드가 없거나 모두 실패하면 None
+        """
+        spec = self.spec
+        if not spec.feeds:
+            return None
+        result = FeedDiscovery(self.session, self.request_headers, self.logger).discover(
+            spec.feeds, limit_date, end_date)
+        if result is None:
+            return None
+
+        entries = []
+        for entry in result['entries']:
+            if not entry['date'] and not spec.detail_date:
+                continue
+            if self.known_urls is not None and entry['article_url'] in self.known_urls:
+                continue
+            if entry['article_url'] in seen_urls:
+                continue
+            seen_urls.add(entry['article_url'])
+            entries.append(entry)
+        return entries, result['complete']
+
+    def poll_list_items(self, list_url: str, limit_date: str, max_pages: int = 5) -> List[Dict]:
+        """
+        1페이지부터 새 기사 항목 수집 (상시 수집용)
+        known_urls에 있는 URL이 나온 페이지까지만 읽음 (상단 고정 기사가 있어도 그 페이지의 새 기사는 포함)
+        """
+        entries = []
+        seen_urls = set()
+        for page in range(1, max_pages + 1):
+            try:
+                elements = self._list_elements(list_url, page)
+            except FetchError as e:
+                # 다음 확인 때 1페이지부터 다시 읽음
+                self.logger.warning(f"목록 {page}페이지를 읽지 못했습니다: {e}")
+                break
+            if not elements:
+                break
+            reached_known = False
+            for element in elements:
+                entry = self._parse_list_item(element, limit_date)
+                if entry is None:
+                    continue
+                if entry == OLDER:
+                    reached_known = True
+                    continue
+                url = entry['article_url']
+                if self.known_urls is not None and url in self.known_urls:
+                    reached_known = True
+                    continue
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    entries.append(entry)
+            if reached_known:
+                break
+        return entries
+
+    def page_dates(self, list_url: str, page: int) -> Optional[List[str]]:
+        """목록 페이지 아이템의 날짜만 읽음 (페이지가 없으면 None)"""
+        elements = self._list_elements(list_url, page)
+        if not elements:
+            return None
+        dates = [self._item_date(element) for element in elements]
+        return [date for date in dates if date]
+
+    def locate_pages(self, list_url: str, start_date: str, end_date: str,
+                     max_pages: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        [start_date, end_date] 기사가 있는 목록 페이지 범위를 갤로핑 탐색으로 찾음
+        1, 2, 4, 8... 페이지로 범위를 좁힌 뒤 이진 탐색 (목록 페이지는 최신순이라고 가정)
+
+        Returns:
+            (첫 페이지, 마지막 페이지) 또는 해당 기간 기사가 없으면 None
+        """
+        max_pages = max_pages or self.spec.max_pages
+        probed: Dict[int, Optional[List[str]]] = {}
+
+        def dates(page):
+            if page not in probed:
+                probed[page] = self.page_dates(list_url, page)
+                if probed[page] == []:
+                    raise ValueError("목록 페이지에 날짜가 없어 페이지 탐색을 할 수 없습니다.")
+            return probed[page]
+
+        def first_page_where(predicate) -> int:
+            """predicate가 처음 참이 되는 페이지 (없으면 max_pages + 1)"""
+            low, high = 0, 1
+            while high <= max_pages and not predicate(high):
+                low, high = high, high * 2
+            high = min(high, max_pages + 1)
+            while high - low > 1:
+                mid = (low + high) // 2
+                if predicate(mid):
+                    high = mid
+                else:
+                    low = mid
+            return high
+
+        # 페이지가 없으면(마지막 페이지 이후) 모든 기사보다 과거로 간주
+        first = first_page_where(lambda p: dates(p) is None or min(dates(p)) <= end_date)
+        after = first_page_where(lambda p: dates(p) is None or max(dates(p)) < start_date)
+        if first >= after:
+            self.logger.info(f"페이지 탐색: 목록 {len(probed)}회 요청 → 해당 페이지 없음 ({start_date} ~ {end_date})")
+            return None
+        self.logger.info(f"페이지 탐색: 목록 {len(probed)}회 요청 → {first}~{after - 1}페이지 ({start_date} ~ {end_date})")
+        return first, after - 1
+
+    def _parse_list_item(self, element, limit_date: str):
+        """목록 아이템 → 기본 정보 (링크 없음: None, 기준일 이전: OLDER)"""
+        spec = self.spec
+        date = self._item_date(element)
+        if date is None:
+            return None
+        if date and date < limit_date:
+            return OLDER
+        if not date and not spec.detail_date:
+            # 상세 페이지에서도 날짜를 얻을 수 없음
+            return None
+
+        link_tag = spec.plans['list_link'].select_one(element)
+        if not link_tag or not link_tag.get('href'):
+            return None
+
+        title_tag = spec.plans['list_title'].select_one(element)
+        description_tag = spec.plans['list_description'].select_one(element)
+        image_tag = spec.plans['list_image'].select_one(element)
+
+        return {
+            'date': date,
+            'title': title_tag.get_text(strip=True) if title_tag else '',
+            'description': description_tag.get_text(strip=True) if description_tag else '',
+            'article_url': self._absolute(link_tag['href']),
+            'image_url': self._absolute(_tag_value(image_tag, spec.image_attrs)),
+        }
+
+    def _item_date(self, element) -> Optional[str]:
+        """목록 아이템 날짜 (날짜 태그 없음: '', date_pattern 불일치: None)"""
+        spec = self.spec
+        date_tag = spec.plans['list_date'].select_one(element)
+        if not date_tag:
+            return ''
+        date_text = date_tag.get_text(strip=True)
+        if spec.date_pattern:
+            match = spec.date_pattern.search(date_text)
+            if not match:
+                return None
+            date_text = match.group()
+        return common_parse_date(date_text)
+
+    def extract_details(self, soup) -> Dict[str, str]:
+        """상세 페이지에서 설정된 항목 추출"""
+        spec = self.spec
+        details = {'sub_title': '', 'content': '', 'date': '', 'title': '', 'image_url': ''}
+        metrics = get_crawl_metrics()
+
+        def record(field):
+            return metrics.selector_recorder(spec.base_url, field)
+
+        plans = spec.plans
+        tag = plans['sub_title'].select_one(soup, record('sub_title'))
+        if tag:
+            details['sub_title'] = tag.get_text(" ", strip=True)
+
+        tag = plans['content'].select_one(soup, record('content'))
+        if tag:
+            # 노이즈 하위 트리를 건너뛰며 한 번에 텍스트 추출
+            text = spec.noise_filter.text(tag)
+            if spec.collapse_whitespace:
+                text = _WHITESPACE_RE.sub(' ', text)
+            if spec.content_split:
+                details['content'] = spec.content_split.split(text)[0].strip()
+            else:
+                details['content'] = clean_text(text)
+
+        if spec.detail_date:
+            tag = plans['date'].select_one(soup, record('date'))
+            if tag:
+                raw_date = tag.get('content') if tag.name == 'meta' else tag.get_text(strip=True)
+                details['date'] = common_parse_date(raw_date or '')
+
+        if spec.detail_title:
+            tag = plans['title'].select_one(soup, record('title'))
+            title = tag.get_text(strip=True) if tag else ''
+            for separator in spec.title_split:
+                title = title.split(separator)[0]
+            details['title'] = title.strip()
+
+        if spec.detail_image:
+            details['image_url'] = self._absolute(_tag_value(plans['image'].select_one(soup, record('image')), 'src'))
+
+        return details
+
+    def process_item(self, entry, limit_date: str, end_date: Optional[str] = None):
+        """
+        목록 항목 하나의 상세 페이지 수집 (dict, "OLDER" 또는 None, end_date보다 최신이면 None)
+        파싱 작업자 풀을 쓰면 그 결과를 담은 Future 반환 (iter_page_results가 기다림)
+        """
+        if entry == OLDER:
+            return OLDER
+
+        try:
+            response = fetch_url(entry['article_url'], self.request_headers, self.logger,
+                                 session=self.session, cache=self.cache)
+            if response is not None and response.status_code == 200 and self.raw_archive:
+                # 목록 항목 정보와 함께 원본 보관 (선택자 수정 후 reextract.py로 재추출)
+                self.raw_archive.store(entry['article_url'], response, self.archive_source, meta=entry)
+            if self.parse_pool is not None and response is not None and response.status_code == 200:
+                # 파싱은 작업자 프로세스에서 (이 스레드는 결과를 기다리지 않고 다음 요청으로)
+                return self.parse_pool.submit(self.spec, entry, response, limit_date, end_date)
+            return self.build_row(entry, response, limit_date, end_date)
+        except Exception as e:
+            self.logger.debug(f"Error processing item: {e}")
+            return None
+
+    def build_row(self, entry, response, limit_date: str, end_date: Optional[str] = None):
+        """
+        목록 항목과 상세 페이지 응답으로 결과 행 생성 (process_item과 보관본 재추출에서 공용)
+        dict, "OLDER" 또는 None 반환
+        """
+        spec = self.spec
+        try:
+            details = None
+            if response is not None and response.status_code == 200:
+                started = time.perf_counter()
+                details = self.extract_details(self._decode(response, spec.detail_encoding, spec.detail_targets))
+                get_crawl_metrics().observe_parse(entry['article_url'], time.perf_counter() - started)
+            elif spec.detail_date or spec.min_content_length:
+                return None
+
+            details = details or {}
+            date = details.get('date') or entry['date']
+            if not date:
+                return None
+            if date < limit_date:
+                return OLDER
+            if end_date and date > end_date:
+                return None
+
+            content = details.get('content', '')
+            if spec.min_content_length and len(content) < spec.min_content_length:
+                return None
+
+            description = entry['description']
+            if not description and spec.description_from_content and content:
+                description = (content[:150].replace("\n", " ") + "...") if len(content) > 150 else content
+
+            get_crawl_metrics().record_articles(entry['article_url'])
+            return {
+                'date': date,
+                'press': spec.newspaper_name,
+                'region': spec.region,
+                'title': entry['title'] or details.get('title') or "제목 없음",
+                'sub_title': details.get('sub_title', ''),
+                'description': description,
+                'content': content,
+                'article_url': entry['article_url'],
+                'image_url': details.get('image_url') or entry['image_url'],
+            }
+        except Exception as e:
+            self.logger.debug(f"Error building row ({entry.get('article_url')}): {e}")
+            return None
+
+
+class ResultCollector:
+    """
+    사이트별 수집 결과를 모으는 공용 저장소 (스레드 안전, article_url 기준 중복 제거)
+    sinks가 주어진 사이트는 메모리에 모으지 않고 ResultSink에 페이지 단위로 바로 기록
+    """
+
+    def __init__(self, sinks: Optional[Dict[str, ResultSink]] = None):
+        self.sinks = sinks or {}
+        self._rows: Dict[str, List[Dict]] = defaultdict(list)
+        self._seen: Dict[str, set] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def add(self, site: str, rows: List[Dict], list_key: str = '', page: int = 0) -> int:
+        """결과 추가 후 새로 추가된 건수 반환 (스트리밍이면 page까지 체크포인트 기록)"""
+        sink = self.sinks.get(site)
+        if sink is not None:
+            return sink.write_page(list_key, page, rows)
+
+        added = 0
+        with self._lock:
+            for row in rows:
+                if row['article_url'] in self._seen[site]:
+                    continue
+                self._seen[site].add(row['article_url'])
+                self._rows[site].append(row)
+                added += 1
+        return added
+
+    def count(self, site: str) -> int:
+        sink = self.sinks.get(site)
+        if sink is not None:
+            return sink.count
+        with self._lock:
+            return len(self._rows[site])
+
+    def rows(self, site: str) -> List[Dict]:
+        """메모리에 모은 결과 (스트리밍 사이트는 파일에 있으므로 빈 리스트)"""
+        with self._lock:
+            return list(self._rows[site])
+
+    def resume_page(self, site: str, list_key: str) -> int:
+        sink = self.sinks.get(site)
+        return sink.resume_page(list_key) if sink is not None else 0
+
+    def is_done(self, site: str, list_key: str) -> bool:
+        sink = self.sinks.get(site)
+        return sink.is_done(list_key) if sink is not None else False
+
+    def finish_list(self, site: str, list_key: str):
+        sink = self.sinks.get(site)
+        if sink is not None:
+            sink.finish_list(list_key)
+
+    def get_meta(self, site: str, key: str, default=None):
+        sink = self.sinks.get(site)
+        return sink.get_meta(key, default) if sink is not None else default
+
+    def set_meta(self, site: str, key: str, value):
+        sink = self.sinks.get(site)
+        if sink is not None:
+            sink.set_meta(key, value)
+
+    def close(self, completed: bool = False):
+        for sink in self.sinks.values():
+            sink.close(completed=completed)
+
+
+class ScrapingEngine:
+    """
+    여러 사이트를 한 프로세스에서 수집하는 엔진
+
+    - 커넥션 풀: 모든 사이트가 하나의 세션 공유 (transport='httpx'면 호스트당 HTTP/2 연결 하나에 다중화)
+    - 작업자 예산: 상세 페이지 수집은 max_workers개 스레드의 executor 하나에서 처리
+      (사이트별 동시 작업 수는 spec의 workers로 제한)
+    - 파싱 단계: parse_workers를 주면 상세 페이지 파싱을 작업자 프로세스 풀(parse_pool)에서 처리하여
+      스레드는 요청만 담당 (GIL에 묶이지 않고 코어 수만큼 파싱)
+    - 결과 저장소: ResultCollector에 모은 뒤 사이트별 CSV로 저장
+      (stream=True면 페이지마다 파일에 바로 추가하고 체크포인트를 남겨, 중단 후 다시 실행하면 이어서 수집)
+    - 백필: start_date를 주면 해당 기간의 목록 페이지 범위를 갤로핑 탐색으로 찾아 구간별로 병렬 수집
+    - 피드 탐색: spec에 feeds가 있으면 RSS/사이트맵에서 먼저 새 기사를 찾고,
+      피드가 기준일까지 닿지 못했거나 읽을 수 없을 때만 목록 페이지로 보충
+    """
+
+    def __init__(self, site_keys: Optional[List[str]] = None, days: int = 30, max_workers: int = 16,
+                 prefetch: int = 2, use_cache=None, skip_known=None,
+                 start_date: Optional[str] = None, end_date: Optional[str] = None, backfill_segments: int = 4,
+                 stream: bool = False, output_format: str = 'csv', transport: Optional[str] = None,
+                 raw_archive=None, use_feeds: bool = True, parse_workers: Optional[int] = None):
+        """
+        Args:
+            site_keys: 수집할 사이트 키 (None이면 SITE_SPECS 전체)
+            days: 수집 기간 (일)
+            max_workers: 전체 사이트가 공유하는 상세 페이지 작업자 수
+            prefetch: 사이트별로 미리 받아 둘 목록 페이지 수
+            use_cache: HTTP 캐시 사용 여부 (None이면 SCRAPER_HTTP_CACHE 환경 변수)
+            skip_known: 저장된 기사 건너뛰기 여부 (None이면 SCRAPER_SKIP_KNOWN 환경 변수)
+            start_date: 백필 시작일 (YYYY-MM-DD, 지정하면 days 대신 사용)
+            end_date: 백필 종료일 (YYYY-MM-DD, 기본값 오늘)
+            backfill_segments: 백필 페이지 범위를 나눠 동시에 수집할 구간 수
+            stream: 결과를 메모리에 모으지 않고 spec의 output 경로에 페이지 단위로 기록
+            output_format: 스트리밍 저장 형식 ('csv' 또는 'jsonl')
+            transport: HTTP 전송 백엔드 ('requests' 또는 'httpx', None이면 CRAWLER_TRANSPORT 환경 변수)
+            raw_archive: 상세 페이지 원본 보관 여부 (None이면 CRAWLER_RAW_ARCHIVE 환경 변수)
+            use_feeds: spec의 feeds(RSS/사이트맵)로 먼저 탐색 (백필에서는 사용하지 않음)
+            parse_workers: 상세 페이지 파싱 작업자 프로세스 수 (0이면 수집 스레드에서 파싱,
+                           None이면 CRAWLER_PARSE_WORKERS 환경 변수)
+        """
+        keys = site_keys or list(SITE_SPECS.keys())
+        unknown = [key for key in keys if key not in SITE_SPECS]
+        if unknown:
+            raise ValueError(f"알 수 없는 사이트: {', '.join(unknown)}")
+
+        self.specs = [SiteSpec(key, SITE_SPECS[key]) for key in keys]
+        self.days = days
+        self.max_workers = max_workers
+        self.prefetch = prefetch
+        self.limit_date = start_date or (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        self.end_date = end_date if start_date else None
+        if start_date and not self.end_date:
+            self.end_date = datetime.now().strftime('%Y-%m-%d')
+        self.backfill_segments = max(1, backfill_segments)
+
+        self.cache = get_scraper_cache(use_cache)
+        self.known_urls = get_known_url_index(skip_known)
+        if raw_archive is None:
+            raw_archive = raw_archive_enabled()
+        self.raw_archive = get_raw_archive() if raw_archive else None
+        self.use_feeds = use_feeds
+        self.stream = stream
+        sinks = {}
+        if stream:
+            window = f"{self.limit_date}~{self.end_date or ''}"
+            sinks = {spec.key: ResultSink(output_path(spec.key, output_format), output_format, window)
+                     for spec in self.specs}
+        self.results = ResultCollector(sinks)
+        self._failed = False
+
+        self.session = create_session(pool_size=max(10, max_workers), hosts=len(self.specs) * 2,
+                                      headers=get_common_headers(), verify=False, backend=transport)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+        if parse_workers is None:
+            parse_workers = parse_workers_from_env()
+        self.parse_pool = ParsePool(parse_workers) if parse_workers > 0 else None
+
+    def _crawl_feeds(self, crawler: SpecCrawler, seen_urls: set, logger) -> bool:
+        """피드/사이트맵으로 찾은 기사 수집, 기준일까지 모두 찾았으면 True (False면 목록 페이지로 보충)"""
+        spec = crawler.spec
+        if self.results.is_done(spec.key, FEED_LIST_KEY):
+            return False
+
+        discovered = crawler.discover_items(self.limit_date, seen_urls, self.end_date)
+        if discovered is None:
+            logger.warning("피드를 읽지 못했습니다. 목록 페이지로 수집합니다.")
+            return False
+        entries, complete = discovered
+
+        def fetch_items(page):
+            return entries if page == 1 else None
+
+        def process(entry):
+            return crawler.process_item(entry, self.limit_date, self.end_date)
+
+        pages = iter_page_results(fetch_items, process, logger, max_pages=1, stop_on_older=False,
+                                  executor=self.executor, max_in_flight=spec.workers)
+        for page, results in pages:
+            added = self.results.add(spec.key, [res for res in results if isinstance(res, dict)], FEED_LIST_KEY, page)
+            logger.info(f"피드: Added {added} articles. Total: {self.results.count(spec.key)}")
+        self.results.finish_list(spec.key, FEED_LIST_KEY)
+
+        if complete:
+            # 목록 페이지를 넘길 필요 없음 (이어서 수집할 때도 건너뛰도록 목록도 완료로 표시)
+            logger.info(f"피드로 기준일({self.limit_date})까지 모두 찾았습니다. 목록 페이지는 건너뜁니다.")
+            for list_url in spec.list_urls:
+                self.results.finish_list(spec.key, list_url)
+        else:
+            logger.info("피드가 기준일까지 닿지 않아 목록 페이지로 보충합니다.")
+        return complete
+
+    def _crawl_list(self, crawler: SpecCrawler, list_url: str, logger, seen_urls: Optional[set] = None) -> None:
+        """목록 URL 하나를 기준일까지 수집 (체크포인트가 있으면 다음 페이지부터, 피드에서 찾은 기사는 seen_urls로 건너뜀)"""
+        spec = crawler.spec
+        seen_urls = set() if seen_urls is None else seen_urls
+        if self.results.is_done(spec.key, list_url):
+            logger.info(f"이미 완료된 목록입니다: {list_url}")
+            return
+        start_page = self.results.resume_page(spec.key, list_url) + 1
+        failed_pages = []
+
+        def fetch_items(page):
+            try:
+                return crawler.fetch_list_items(list_url, page, self.limit_date, seen_urls, self.end_date)
+            except Exception:
+                failed_pages.append(page)
+                raise
+
+        def process(entry):
+            return crawler.process_item(entry, self.limit_date, self.end_date)
+
+        pages = iter_page_results(fetch_items, process, logger, max_pages=spec.max_pages,
+                                  prefetch=self.prefetch, stop_on_older=spec.stop_rule == 'first_older',
+                                  executor=self.executor, max_in_flight=spec.workers, start_page=start_page)
+        for page, results in pages:
+            page_data = [res for res in results if isinstance(res, dict)]
+            older_count = sum(1 for res in results if res == OLDER)
+            added = self.results.add(spec.key, page_data, list_url, page)
+            if not results:
+                continue
+            logger.info(f"Page {page}: Added {added} articles. Total: {self.results.count(spec.key)}")
+
+            if spec.stop_rule == 'older_ratio':
+                if older_count >= len(results) * spec.older_ratio:
+                    logger.info("기준일 이전 기사에 도달했습니다. 수집을 종료합니다.")
+                    break
+            elif older_count:
+                logger.info(f"Reached limit date ({self.limit_date}). Collection complete.")
+                break
+        else:
+            if failed_pages:
+                # 목록 끝이 아니라 요청 실패로 멈춤 → 완료로 표시하지 않고 체크포인트부터 다시 수집
+                # (기준일에 도달해 멈춘 경우에는 미리 받던 다음 페이지의 실패는 무시)
+                self._failed = True
+                logger.error(f"{failed_pages[0]}페이지를 읽지 못해 목록 수집을 완료하지 못했습니다: {list_url}")
+                return
+
+        self.results.finish_list(spec.key, list_url)
+
+    def _crawl_range(self, crawler: SpecCrawler, list_url: str, first: int, last: int, logger) -> None:
+        """목록 페이지 범위를 구간으로 나눠 동시에 수집 (백필)"""
+        spec = crawler.spec
+        pages = list(range(first, last + 1))
+        segments = min(self.backfill_segments, len(pages))
+        size = -(-len(pages) // segments)
+        chunks = [pages[i:i + size] for i in range(0, len(pages), size)]
+        seen_urls = set()
+
+        def crawl_chunk(chunk):
+            try:
+                crawl_segment(chunk)
+            except Exception as e:
+                self._failed = True
+                logger.error(f"구간 수집 실패 ({chunk[0]}~{chunk[-1]}페이지): {e}")
+
+        def crawl_segment(chunk):
+            # iter_page_results의 페이지 번호(1부터)를 구간 안의 실제 페이지로 변환
+            chunk_key = f"{list_url}#{chunk[0]}-{chunk[-1]}"
+            if self.results.is_done(spec.key, chunk_key):
+                return
+            failed_pages = []
+
+            def fetch_items(index):
+                page = chunk[index - 1]
+                try:
+                    items = crawler.fetch_list_items(list_url, page, self.limit_date, seen_urls, self.end_date,
+                                                     in_range=True)
+                except Exception:
+                    failed_pages.append(page)
+                    raise
+                # 범위 안의 페이지가 비어 있으면 목록을 읽지 못한 것 (범위 끝에 더 받는 한 페이지만 예외)
+                if items is None and page != pages[-1]:
+                    failed_pages.append(page)
+                return items
+
+            def process(entry):
+                return crawler.process_item(entry, self.limit_date, self.end_date)
+
+            results_iter = iter_page_results(fetch_items, process, logger, max_pages=len(chunk),
+                                             prefetch=self.prefetch, stop_on_older=False, executor=self.executor,
+                                             max_in_flight=max(1, spec.workers // len(chunks)),
+                                             start_page=self.results.resume_page(spec.key, chunk_key) + 1)
+            for index, results in results_iter:
+                page_data = [res for res in results if isinstance(res, dict)]
+                added = self.results.add(spec.key, page_data, chunk_key, index)
+                logger.info(f"Page {chunk[index - 1]}: Added {added} articles. Total: {self.results.count(spec.key)}")
+            if failed_pages:
+                # 완료로 표시하지 않음 → 이어서 수집할 때 실패한 페이지부터 다시 수집
+                self._failed = True
+                logger.error(f"{failed_pages[0]}페이지를 읽지 못해 {chunk[0]}~{chunk[-1]}페이지 구간을 완료하지 못했습니다.")
+                return
+            self.results.finish_list(spec.key, chunk_key)
+
+        threads = [threading.Thread(target=crawl_chunk, args=(chunk,), name=f"{spec.key}-backfill-{n}", daemon=True)
+                   for n, chunk in enumerate(chunks)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _backfill_list(self, crawler: SpecCrawler, list_url: str, logger) -> None:
+        """start_date ~ end_date 구간만 수집 (페이지 탐색이 불가능하면 1페이지부터 순차 수집)"""
+        spec = crawler.spec
+        # 이어서 수집할 때는 처음 찾은 페이지 범위를 그대로 사용 (구간별 체크포인트 유지)
+        page_range = self.results.get_meta(spec.key, f"range:{list_url}")
+        if page_range is None:
+            try:
+                page_range = crawler.locate_pages(list_url, self.limit_date, self.end_date)
+            except ValueError as e:
+                logger.warning(f"{e} 1페이지부터 순차 수집합니다.")
+                self._crawl_list(crawler, list_url, logger)
+                return
+            self.results.set_meta(spec.key, f"range:{list_url}", page_range or [])
+
+        if not page_range:
+            logger.info(f"{self.limit_date} ~ {self.end_date} 기간의 기사가 없습니다.")
+            return
+
+        first, last = page_range
+        # 탐색 중 새 기사가 올라와 페이지가 밀릴 수 있으므로 한 페이지 더 수집
+        self._crawl_range(crawler, list_url, first, min(last + 1, crawler.spec.max_pages), logger)
+
+    def run_site(self, spec: SiteSpec, list_urls: Optional[List[str]] = None) -> List[Dict]:
+        """사이트 하나 수집 (목록 URL이 여러 개면 순서대로, list_urls를 주면 피드 없이 해당 목록만)"""
+        logger = get_site_logger(spec.key)
+        crawler = SpecCrawler(spec, session=self.session, cache=self.cache,
+                              known_urls=self.known_urls, logger=logger, raw_archive=self.raw_archive or False,
+                              parse_pool=self.parse_pool)
+        if self.end_date:
+            logger.info(f"Starting {spec.newspaper_name} backfill {self.limit_date} ~ {self.end_date}...")
+        else:
+            logger.info(f"Starting {spec.newspaper_name} collection until {self.limit_date} (Last {self.days} days)...")
+
+        seen_urls = set()
+        if self.use_feeds and spec.feeds and not self.end_date and list_urls is None:
+            try:
+                if self._crawl_feeds(crawler, seen_urls, logger):
+                    return self.results.rows(spec.key)
+            except Exception as e:
+                logger.error(f"피드 수집 실패: {e}")
+
+        for list_url in list_urls or spec.list_urls:
+            try:
+                if self.end_date:
+                    self._backfill_list(crawler, list_url, logger)
+                else:
+                    self._crawl_list(crawler, list_url, logger, seen_urls)
+            except Exception as e:
+                self._failed = True
+                logger.error(f"수집 실패 ({list_url}): {e}")
+
+        return self.results.rows(spec.key)
+
+    def run(self) -> Dict[str, int]:
+        """모든 사이트를 동시에 수집하여 사이트별 수집 건수 반환 (끝나면 계측 결과를 data/metrics에 저장)"""
+        metrics = get_crawl_metrics()
+        metrics.reset()
+        threads = [
+            threading.Thread(target=self.run_site, args=(spec,), name=f"site-{spec.key}", daemon=True)
+            for spec in self.specs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 모두 성공했으면 체크포인트를 완료로 표시 (다음 실행은 새로 시작)
+        self.results.close(completed=not self._failed)
+
+        metrics.log_summary()
+        metrics.export(self.specs[0].key if len(self.specs) == 1 else 'scraping_engine')
+        return {spec.key: self.results.count(spec.key) for spec in self.specs}
+
+    def save(self) -> None:
+        """사이트별 결과를 spec의 output 경로에 저장 (스트리밍이면 이미 기록되어 있음)"""
+        if self.stream:
+            return
+        for spec in self.specs:
+            save_site_results(spec.key, self.results.rows(spec.key))
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.parse_pool is not None:
+            self.parse_pool.close()
+        self.session.close()
+        # 중단된 경우에도 마지막 체크포인트까지는 파일에 남음
+        self.results.close(completed=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def run_site(key: str, days: int = 30, use_cache=None, skip_known=None, max_workers: Optional[int] = None,
+             start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
+    """사이트 하나만 수집 (기존 스크래퍼 스크립트용, start_date를 주면 해당 기간 백필)"""
+    spec = SITE_SPECS[key]
+    with ScrapingEngine([key], days=days, max_workers=max_workers or spec.get('workers', 10),
+                        use_cache=use_cache, skip_known=skip_known,
+                        start_date=start_date, end_date=end_date) as engine:
+        engine.run()
+        return engine.results.rows(key)
+
+
+def run_list(key: str, list_url: str, days: int = 30, use_cache=None, skip_known=None,
+             max_workers: Optional[int] = None) -> List[Dict]:
+    """사이트의 목록 URL 하나만 수집 (카테고리별 수집 함수를 두던 기존 스크래퍼 스크립트용)"""
+    spec = SITE_SPECS[key]
+    with ScrapingEngine([key], days=days, max_workers=max_workers or spec.get('workers', 10),
+                        use_cache=use_cache, skip_known=skip_known) as engine:
+        engine.run_site(engine.specs[0], list_urls=[list_url])
+        return engine.results.rows(key)
+
+
+def stream_site(key: str, days: int = 30, use_cache=None, skip_known=None, output_format: str = 'csv',
+                start_date: Optional[str] = None, end_date: Optional[str] = None) -> int:
+    """사이트 하나를 수집하며 output 경로에 바로 기록 (중단 후 다시 실행하면 이어서 수집)"""
+    spec = SITE_SPECS[key]
+    with ScrapingEngine([key], days=days, max_workers=spec.get('workers', 10),
+                        use_cache=use_cache, skip_known=skip_known,
+                        start_date=start_date, end_date=end_date,
+                        stream=True, output_format=output_format) as engine:
+        return engine.run()[key]
+
+
+def output_path(key: str, output_format: str = 'csv') -> str:
+    """사이트 출력 경로 (jsonl이면 확장자 변경)"""
+    output = SITE_SPECS[key]['output']
+    if output_format == 'jsonl':
+        output = os.path.splitext(output)[0] + '.jsonl'
+    return output
+
+
+def save_site_results(key: str, rows: List[Dict]) -> bool:
+    """사이트 결과를 spec의 output 경로에 CSV로 저장"""
+    output = SITE_SPECS[key]['output']
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    return save_to_csv(rows, output, get_site_logger(key))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='설정 기반 통합 뉴스 수집 엔진')
+    parser.add_argument('--sites', nargs='+', choices=list(SITE_SPECS.keys()),
+                        help='수집할 사이트 (기본값: 전체)')
+    parser.add_argument('--days', type=int, default=30, help='수집 기간 (일)')
+    parser.add_argument('--start-date', help='백필 시작일 YYYY-MM-DD (지정하면 --days 무시)')
+    parser.add_argument('--end-date', help='백필 종료일 YYYY-MM-DD (기본값: 오늘)')
+    parser.add_argument('--segments', type=int, default=4, help='백필 페이지 범위를 나눠 동시에 수집할 구간 수')
+    parser.add_argument('--workers', type=int, default=16, help='전체 사이트가 공유하는 작업자 수')
+    parser.add_argument('--use-cache', action='store_true', default=None, help='HTTP 응답 캐시 사용')
+    parser.add_argument('--skip-known', action='store_true', default=None, help='저장된 기사 건너뛰기')
+    parser.add_argument('--stream', action='store_true',
+                        help='페이지마다 결과를 파일에 바로 기록 (중단 후 다시 실행하면 체크포인트부터 이어서 수집)')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help='--stream 저장 형식')
+    parser.add_argument('--transport', choices=['requests', 'httpx'],
+                        help='HTTP 전송 백엔드 (httpx: HTTP/2 + brotli, 기본값: CRAWLER_TRANSPORT 환경 변수)')
+    parser.add_argument('--raw-archive', action='store_true', default=None,
+                        help='상세 페이지 원본을 data/raw_archive에 보관 (reextract.py로 재추출)')
+    parser.add_argument('--no-feeds', action='store_true',
+                        help='RSS/사이트맵 탐색 없이 목록 페이지만 사용')
+    parser.add_argument('--parse-workers', type=int,
+                        help='상세 페이지 파싱 작업자 프로세스 수 (기본값: CRAWLER_PARSE_WORKERS 환경 변수, 0이면 스레드에서 파싱)')
+    parser.add_argument('--list', action='store_true', help='사이트 목록 출력')
+    args = parser.parse_args()
+
+    if args.list:
+        for key, spec in SITE_SPECS.items():
+            print(f"{key:<24}{spec['press']}")
+        return
+
+    with ScrapingEngine(args.sites, days=args.days, max_workers=args.workers,
+                        use_cache=args.use_cache, skip_known=args.skip_known,
+                        start_date=args.start_date, end_date=args.end_date,
+                        backfill_segments=args.segments,
+                        stream=args.stream, output_format=args.format, transport=args.transport,
+                        raw_archive=args.raw_archive, use_feeds=not args.no_feeds,
+                        parse_workers=args.parse_workers) as engine:
+        counts = engine.run()
+        engine.save()
+
+    print("\n" + "=" * 50)
+    for key, count in counts.items():
+        print(f"{key:<24}{count:>6}건")
+    print(f"{'합계':<24}{sum(counts.values()):>6}건")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""
+사이트별 수집 설정 (scraping_engine 용)
+각 신문사의 목록 URL, 페이지 방식, 목록/상세 페이지 CSS 선택자를 선언적으로 정의
+
+필수 키:
+    press, region, base_url, list_url, item, date, title, detail['content'], output
+선택 키:
+    link                  기사 링크 선택자 (없으면 title 선택자의 태그 사용)
+    description, image    목록 아이템의 요약/이미지 선택자
+    image_attr            목록 이미지 주소 속성 (문자열 또는 리스트, 앞에서부터 값이 있는 것, 기본값 src)
+    detail                상세 페이지 선택자 (sub_title, content, image, date, title)
+    noise                 본문에서 제거할 선택자
+    list_url              문자열 또는 문자열 리스트 ({page} 자리에 페이지 번호)
+    first_page_url        1페이지만 URL이 다른 경우
+    feeds                 RSS/Atom 피드 또는 (뉴스) 사이트맵 URL 리스트
+                          지정하면 피드로 먼저 새 기사를 찾고, 기준일까지 닿지 못하면 목록 페이지로 보충
+    list_method           'GET'(기본값) 또는 'POST' (list_payload의 {page} 치환)
+    list_delay            목록 요청 전 무작위 지연 범위(초) [최소, 최대]
+    headers               사이트 전용 추가 헤더
+    encoding              목록 페이지 인코딩 ('auto'면 도메인별 인코딩 캐시 사용, 기본값 utf-8)
+    detail_encoding       상세 페이지 인코딩 (기본값 utf-8)
+    date_pattern          날짜 텍스트에서 먼저 잘라낼 정규식
+    description_from_content  요약이 없으면 본문 앞부분 사용
+    content_split         본문에서 이 정규식 이후를 잘라냄 (지정하면 clean_text 대신 사용)
+    collapse_whitespace   content_split 전에 본문의 연속 공백/줄바꿈을 한 칸으로 (여러 줄에 걸친 패턴도 잘라냄)
+    title_split           상세 페이지 제목에서 잘라낼 구분자 리스트 (예: ' - 신문사명')
+    min_content_length    본문이 이보다 짧으면 버림
+    partial_parse         상세 페이지에서 detail 선택자가 가리키는 하위 트리만 파싱 (기본값 True)
+                          기본 백엔드가 selectolax여도 BeautifulSoup 트리 빌더로 파싱, 본문을 찾지 못하면 전체 파싱으로 다시 시도
+    stop_rule             'first_older'(기본값) 또는 'older_ratio' (과거 기사 비율로 종료)
+    workers               사이트별 최대 동시 상세 요청 수
+    max_pages             최대 목록 페이지 수 (기본값 500)
+    older_ratio           stop_rule이 'older_ratio'일 때 종료 비율 (기본값 0.7)
+
+선택자 값은 문자열 또는 우선순위 순 리스트 (앞에서부터 처음 찾은 것 사용)
+"""
+
+# fetch_article_details와 동일한 기본 본문 노이즈 선택자
+DEFAULT_NOISE = ('script, style, iframe, ins, .quizContainer, .articleCopyright, figcaption, .byline, '
+                 '.article-copy, .banner_box, .account, .relation, .ad-template')
+
+SITE_SPECS = {
+    'seoul_seoul': {
+        'press': '서울신문',
+        'region': 'seoul',
+        'base_url': 'https://www.seoul.co.kr',
+        'list_url': 'https://www.seoul.co.kr/newsList/economy?page={page}',
+        'item': 'li.newsBox_row1',
+        'date': 'div.ArticleInfo span.body14',
+        'title': 'div.articleTitle h2.h28',
+        'link': 'div.articleTitle a',
+        'description': 'div.body16.color600',
+        'image': 'div.articleImage img',
+        'detail': {
+            'sub_title': ['strong.subTitle_s2', 'div.subtitle', '.view_subtitle', 'h3.read_sub_tit'],
+            'content': ['div#articleContent', 'div.viewContent', '.article_view', '#articleBody'],
+        },
+        'workers': 10,
+        'output': 'data/scraped/raw_seoul_seoul.csv',
+    },
+    'chungcheong_cctoday': {
+        'press': '충청투데이',
+        'region': 'chungcheong',
+        'base_url': 'https://www.cctoday.co.kr',
+        'list_url': 'https://www.cctoday.co.kr/news/articleList.html?sc_section_code=S1N4&view_type=sm&page={page}',
+        # ndsoft 섹션 RSS (목록과 같은 섹션 코드)
+        'feeds': ['https://www.cctoday.co.kr/rss/S1N4.xml'],
+        'item': ['ul.types > li', '.list-block li'],
+        'date': ['span.byline', '.date'],
+        'title': ['h4.titles a', '.titles a'],
+        'description': 'p.lead',
+        'image': 'img',
+        'detail': {
+            'sub_title': ['h4.subheading', 'div.sub-title', '.sub-title'],
+            'content': ['div#article-view-content-div', 'div.article-view-content-div', '.article-body', '#articleBody'],
+        },
+        'description_from_content': True,
+        'workers': 10,
+        'output': 'data/scraped/raw_chungcheong_cctoday.csv',
+    },
+    'incheon_incheon': {
+        'press': '인천일보',
+        'region': 'incheon',
+        'base_url': 'https://www.incheonilbo.com',
+        'list_url': 'https://www.incheonilbo.com/news/articleList.html?sc_section_code=S1N4&view_type=sm&page={page}',
+        'feeds': ['https://www.incheonilbo.com/rss/S1N4.xml'],
+        'item': ['section#section-list ul.type2 > li', '.list-block li'],
+        'date': ['span.byline em:last-child', '.date'],
+        'title': ['h2.titles a', '.titles a'],
+        'description': 'p.lead',
+        'image': 'img',
+        'detail': {
+            'sub_title': ['h2.subheading', 'div.sub-title', '.sub-title'],
+            'content': ['div#article-view-content-div', 'div.article-view-content-div', '.article-body', '#articleBody'],
+        },
+        'description_from_content': True,
+        'workers': 10,
+        'output': 'data/scraped/raw_incheon_incheon.csv',
+    },
+    'gyeongbuk_imaeil': {
+        'press': '매일신문',
+        'region': 'gyeongbuk',
+        'base_url': 'https://www.imaeil.com',
+        'list_url': 'https://www.imaeil.com/economy?page={page}',
+        # 헤드라인과 일반 목록 모두 포함
+        'item': 'div.hdl_002 li, div.arl_018 li',
+        'date': 'p.date',
+        'title': 'p.title a',
+        'description': 'p.body',
+        'image': 'div.thumb img',
+        'detail': {
+            'sub_title': ['div.sub_title', 'p.sub_title'],
+            'content': ['div.article_content', 'div.news_cnt'],
+        },
+        'workers': 10,
+        'output': 'data/scraped/raw_gyeongbuk_imaeil.csv',
+    },
+    'jeju_jeju': {
+        'press': '제주일보',
+        'region': 'jeju',
+        'base_url': 'http://www.jejunews.com',
+        'list_url': 'http://www.jejunews.com/news/articleList.html?sc_section_code=S1N5&view_type=sm&page={page}',
+        'feeds': ['http://www.jejunews.com/rss/S1N5.xml'],
+        'item': 'div.list-block',
+        'date': 'div.list-dated',
+        'title': 'div.list-titles a',
+        'description': 'div.list-summary',
+        'detail': {
+            'sub_title': ['div.user-snb h2', 'div.article-head-title'],
+            'content': ['article#article-view-content-div', '#articleBody', 'div#article-view-content-div'],
+        },
+        'description_from_content': True,
+        'workers': 10,
+        'output': 'data/scraped/raw_jeju_jeju.csv',
+    },
+    'gangwon_kwnews': {
+        'press': '강원일보',
+        'region': 'gangwon',
+        'base_url': 'https://www.kwnews.co.kr',
+        'list_url': 'https://www.kwnews.co.kr/economy/all?page={page}',
+        'item': 'div.arl_023 > ul > li',
+        'date': 'p.date',
+        'title': 'p.title a',
+        'description': 'p.body a',
+        'detail': {
+            'sub_title': ['h3.read_sub_tit', '.subtitle', 'strong.read_sub_tit'],
+            'content': ['div#articlebody', 'div.article_view', '.article-body', '.article_content'],
+            # 이미지는 상세 페이지의 og:image 사용
+            'image': ['meta[property="og:image"]', 'meta[name="og:image"]'],
+        },
+        'noise': 'script, style, iframe, ins, .quizContainer, figcaption, .articleCopyright',
+        'workers': 10,
+        'output': 'data/scraped/raw_gangwon_kwnews.csv',
+    },
+    'gyeongnam_gnen': {
+        'press': '경남경제',
+        'region': 'gyeongnam',
+        'base_url': 'https://www.gnen.net',
+        'list_url': 'https://www.gnen.net/news/articleList.html?page={page}&sc_section_code=S1N2&view_type=sm',
+        'feeds': ['https://www.gnen.net/rss/S1N2.xml'],
+        'item': 'section#section-list ul.type > li',
+        'date': 'span.byline em.date',
+        'title': 'h4.titles a',
+        'description': 'p.lead a',
+        'image': 'a.thumb img',
+        'detail': {
+            'sub_title': ['h4.subheading'],
+            'content': ['article#article-view-content-div'],
+        },
+        # 부제, 기자정보, 이미지/캡션 등 제거
+        'noise': 'h4.subheading, div.press, figure, script, style, .article-footer',
+        'workers': 5,
+        'output': 'data/scraped/raw_gyeongnam_gnen.csv',
+    },
+    'gyeongnam_busan': {
+        'press': '부산일보',
+        'region': 'gyeongnam',
+        'base_url': 'https://www.busan.com',
+        # 목록은 POST 요청으로 HTML 조각을 받음 (경제해양 섹션 전용 페이로드)
+        'list_url': 'https://www.busan.com/commonFunc/frontPaging.php',
+        'list_method': 'POST',
+        'list_payload': {
+            'control_type': 'A',
+            'paging_yn': 'Y',
+            'dataset_filename': '2018/12/31/259_513_1_article_list.json',
+            'view_page_type': '1',
+            'directory_type': 'news',
+            'html_idx': '259',
+            'page': '{page}',
+        },
+        # 봇 차단 회피를 위한 랜덤 지연
+        'list_delay': [0.5, 1.0],
+        'item': 'li',
+        'date': 'p.date',
+        # "2026-02-23 [17:01]" -> "2026-02-23"
+        'date_pattern': r'\d{4}-\d{2}-\d{2}',
+        'title': ['p.title a', 'a'],
+        'description': 'p.body',
+        'image': 'div.thumb img',
+        'detail': {
+            'sub_title': ['p.subtitle', 'div.sub_title', 'h3.read_sub_tit'],
+            'content': ['#article-view-content-div', '.article_content', 'div.view_con', '.article-body'],
+        },
+        'min_content_length': 1,
+        'workers': 8,
+        'output': 'data/scraped/raw_gyeongnam_busan.csv',
+    },
+    'national_hankyung': {
+        'press': '한국경제',
+        'region': 'national',
+        'base_url': 'https://www.hankyung.com',
+        # 정책/거시/외환/세금/고용복지 카테고리
+        'list_url': [
+            'https://www.hankyung.com/economy/economic-policy?page={page}',
+            'https://www.hankyung.com/economy/macro?page={page}',
+            'https://www.hankyung.com/economy/forex?page={page}',
+            'https://www.hankyung.com/economy/tax?page={page}',
+            'https://www.hankyung.com/economy/job-welfare?page={page}',
+        ],
+        'item': 'ul.news-list > li',
+        'date': '.txt-date',
+        'title': '.news-tit a',
+        'description': 'p.lead',
+        'image': 'figure.thumb img',
+        'detail': {
+            'sub_title': ['strong.subTitle_s2', 'h2.sub_title', 'div.article-sub-title'],
+            'content': ['div#articletxt', 'div.article-body', 'div#article-view-content-div'],
+        },
+        'workers': 8,
+        'output': 'data/scraped/raw_national_hankyung.csv',
+    },
+    'gyeonggi_kyeongin': {
+        'press': '경인일보',
+        'region': 'gyeonggi',
+        'base_url': 'https://www.kyeongin.com',
+        'first_page_url': 'https://www.kyeongin.com/money',
+        'list_url': 'https://www.kyeongin.com/money?page={page}',
+        # 차단 방지를 위한 추가 헤더
+        'headers': {
+            'Referer': 'https://www.kyeongin.com/money',
+        },
+        'item': ['div.list-item', 'li'],
+        'date': 'span.date',
+        'link': 'a[href*="/article/"]',
+        # 목록에 제목이 없어 날짜/제목/이미지는 상세 페이지에서 추출
+        'title': [],
+        'detail': {
+            'date': ['meta[property="article:published_time"]', 'div.byline span.date', '.article-date', '.date'],
+            'title': ['h2.headline', 'h1.title', '.art-title', 'title'],
+            'image': ['meta[property="og:image"]', 'meta[name="og:image"]'],
+            'content': ['#article-body', '.article-body', '.art-content', '#articleBody', '.view-content', '.content-area'],
+        },
+        'noise': 'script, style, iframe, ins, .article-copy, .byline, button, .ad-template',
+        # 기자명/저작권 문구 이후 잘라냄 (clean_text 대신 사용)
+        'content_split': r'/[가-힣]{2,4}\s*기자|기자\s*=|©|저작권자|무단전재',
+        # "제목 - 경인일보" -> "제목"
+        'title_split': [' - ', ' | '],
+        'detail_encoding': 'auto',
+        'description_from_content': True,
+        'min_content_length': 40,
+        # 날짜순이 아닌 기사가 섞여 있어 과거 기사 비율로 종료
+        'stop_rule': 'older_ratio',
+        'workers': 5,
+        'output': 'data/scraped/raw_gyeonggi_kyeongin.csv',
+    },
+    'jeonnam_kwangju': {
+        'press': 'kwangju',
+        'region': 'jeonnam',
+        'base_url': 'http://www.kwangju.co.kr',
+        'list_url': 'http://www.kwangju.co.kr/section.php?sid=5&page={page}',
+        'headers': {
+            'Referer': 'http://www.kwangju.co.kr',
+        },
+        'encoding': 'auto',
+        'item': 'ul.section_list li',
+        'date': 'span.newsdate',
+        'link': 'a',
+        'title': 'div',
+        'description': 'p',
+        'image': 'span.thumb img',
+        # 지연 로딩 이미지는 data-src에 실제 주소
+        'image_attr': ['data-src', 'src'],
+        'detail': {
+            'sub_title': 'div.rtitle2',
+            'content': 'div#joinskmbox',
+        },
+        'noise': 'script, style, iframe, ins, table, a',
+        # 공백을 정리한 뒤 "/홍길동 기자" 또는 저작권 문구 이후 잘라냄 (clean_text 대신 사용)
+        'collapse_whitespace': True,
+        'content_split': r'/.*?기자|Copyright',
+        'detail_encoding': 'auto',
+        'workers': 3,
+        'output': 'data/scraped/raw_jeonnam_kwangju.csv',
+    },
+}
@@ -0,0 +1,220 @@
+"""
+SQLite 접근 계층
+뉴스 DB(news.db, news_scraped.db)를 읽고 쓰는 모든 코드가 파일별로 하나의 연결 풀을 공유
+
+- 연결을 매번 열고 닫지 않고 풀에서 빌려 쓰고 반납 (페이지 캐시와 컴파일된 SQL 문을 연결 수명 동안 재사용)
+- WAL 저널: 쓰는 동안에도 대시보드/분석기 읽기가 막히지 않음
+  (처음 쓰기 트랜잭션을 열 때 설정 — 읽기만 하는 프로세스는 DB 파일의 저널 모드를 바꾸지 않음)
+- PRAGMA: synchronous=NORMAL(WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음), cache_size, mmap_size,
+  temp_store=MEMORY
+- 쓰기는 transaction()으로 묶고, 행이 많으면 executemany를 chunk_size 단위 트랜잭션으로 나눠 실행
+  (쓰기 잠금을 오래 잡지 않고, 실패해도 앞선 묶음은 저장됨)
+
+사용 예시:
+  store = get_store('data/news.db')
+  with store.transaction() as cursor:
+      cursor.execute('UPDATE news SET is_processed = 1 WHERE id = ?', (news_id,))
+  rows = store.query('SELECT region, COUNT(*) FROM news GROUP BY region')
+"""
+
+import os
+import atexit
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger('SQLiteStore')
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# 연결마다 보관하는 컴파일된 SQL 문 수 (같은 SQL 문자열이면 다시 컴파일하지 않음)
+STATEMENT_CACHE_SIZE = 256
+
+
+def resolve_db_path(db_path: str) -> str:
+    """DB 파일 경로 (상대 경로면 프로젝트 루트 기준)"""
+    if os.path.isabs(db_path):
+        return db_path
+    return os.path.join(PROJECT_ROOT, db_path)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """size개씩 나눈 목록"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class SQLiteStore:
+    """
+    DB 파일 하나의 연결 풀
+    여러 스레드가 하나의 인스턴스를 공유 (연결은 한 번에 한 스레드만 사용)
+    """
+
+    def __init__(self,
+                 db_path: str = 'data/news.db',
+                 pool_size: int = 4,
+                 cache_size_mb: int = 64,
+                 mmap_size_mb: int = 256,
+                 chunk_size: int = 500):
+        """
+        Args:
+            db_path: DB 파일 경로 (상대 경로면 프로젝트 루트 기준)
+            pool_size: 반납 후 열어 둘 최대 연결 수 (동시에 더 필요하면 새로 열고 반납 시 닫음)
+            cache_size_mb: 연결별 페이지 캐시 크기(MB)
+            mmap_size_mb: 메모리 매핑으로 읽을 최대 크기(MB), 0이면 사용 안 함
+            chunk_size: executemany 한 트랜잭션의 최대 행 수
+        """
+        self.db_path = resolve_db_path(db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self.pool_size = pool_size
+        self.cache_size_mb = cache_size_mb
+        self.mmap_size_mb = mmap_size_mb
+        self.chunk_size = chunk_size
+
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._journal_checked = False
+        self.closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # 트랜잭션은 직접 관리 (isolation_level=None), 다른 프로세스가 쓰는 중이면 최대 30초 대기
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA cache_size={-self.cache_size_mb * 1024}')
+        conn.execute(f'PRAGMA mmap_size={self.mmap_size_mb * 1024 * 1024}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+
+    def _enable_wal(self, conn: sqlite3.Connection) -> None:
+        # journal_mode=WAL은 파일에 기록되므로 처음 쓸 때 한 번만 (읽기 전용 위치면 기존 모드로 계속)
+        try:
+            mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+            if mode != 'wal':
+                logger.warning(f"WAL 모드로 바꾸지 못했습니다 ({mode}): {self.db_path}")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"WAL 모드 설정 실패 ({self.db_path}): {e}")
+        self._journal_checked = True
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """풀에서 연결 빌리기 (자동 커밋 모드, 쓰기는 transaction() 사용)"""
+        with self._lock:
+            if self.closed:
+                raise sqlite3.ProgrammingError(f"닫힌 DB 연결 풀입니다: {self.db_path}")
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                if not self.closed and len(self._idle) < self.pool_size:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        쓰기 트랜잭션 (BEGIN IMMEDIATE로 쓰기 잠금을 바로 잡음)
+        블록이 끝나면 커밋, 예외가 나면 롤백
+        """
+        with self.connection() as conn:
+            if not self._journal_checked:
+                self._enable_wal(conn)
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield cursor
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        """조회 결과 전체"""
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence = ()) -> Optional[tuple]:
+        """조회 결과 첫 행 (없으면 None)"""
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def query_dicts(self, sql: str, params: Sequence = ()) -> List[Dict]:
+        """조회 결과를 {컬럼: 값} 딕셔너리 목록으로"""
+        with self.connection() as conn:
+            cursor = conn.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def read_frame(self, sql: str, params: Optional[Sequence] = None):
+        """조회 결과를 pandas DataFrame으로"""
+        import pandas as pd
+
+        with self.connection() as conn:
+            return pd.read_sql(sql, conn, params=params)
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        """쓰기 문 하나를 트랜잭션으로 실행하고 바뀐 행 수 반환"""
+        with self.transaction() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+    def executemany(self, sql: str, rows: Iterable[Sequence], chunk_size: Optional[int] = None) -> int:
+        """
+        같은 문을 여러 행에 실행 (chunk_size 행마다 한 트랜잭션)
+
+        Returns:
+            바뀐 행 수 합계
+        """
+        changed = 0
+        for chunk in chunked(rows, chunk_size or self.chunk_size):
+            with self.transaction() as cursor:
+                cursor.executemany(sql, chunk)
+                changed += max(cursor.rowcount, 0)
+        return changed
+
+    def close(self) -> None:
+        """열어 둔 연결 모두 닫기 (빌려 간 연결은 반납할 때 닫힘)"""
+        with self._lock:
+            self.closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_stores: Dict[str, SQLiteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: str = 'data/news.db') -> SQLiteStore:
+    """DB 파일별 공용 연결 풀 (프로세스당 하나)"""
+    path = resolve_db_path(db_path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None or store.closed:
+            store = _stores[path] = SQLiteStore(path)
+        return store
+
+
+@atexit.register
+def close_stores() -> None:
+    """모든 공용 연결 풀 닫기 (마지막 연결이 닫힐 때 WAL 내용이 DB 파일로 옮겨짐)"""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
@@ -0,0 +1,212 @@
+"""
+본문 정제 / 메타데이터 추출 엔진
+clean_text, TextCleaner, ContentParser의 노이즈 판별, DateParser의 날짜·기자명 추출이 함께 쓰는
+미리 컴파일한 패턴 모음 (결과는 기존 함수와 동일)
+
+- 잘라내기 문구(저작권자, 관련기사 등): 하나의 교대(alternation) 정규식으로 가장 앞선 문구를 찾고,
+  문구끼리 겹칠 때만 기존처럼 문구 순서대로 다시 확인
+- 노이즈 문단 판별: 키워드 수십 개를 `in`으로 하나씩 훑는 대신 교대 정규식 한 번
+- 날짜: 패턴을 하나씩 전체 텍스트에 적용하는 대신 한 번의 순회로 우선순위가 가장 높은 날짜 선택
+- 기자명/이메일/URL/해시태그: 정규식에 꼭 필요한 글자('기자', '@', 'http' 등)가 없으면 정규식을 건너뜀
+
+re 모듈의 교대 정규식은 리터럴 키워드에 대해 첫 글자 집합으로 위치를 거르므로,
+이 정도 키워드 수(수백 개 이하)에서는 Aho-Corasick(pyahocorasick)보다 빠름
+(benchmarks/text_clean_benchmark.py로 확인)
+"""
+
+import re
+from typing import Iterable, Optional, Tuple
+
+# clean_text: 이 문구부터 뒤는 잘라냄 (앞에서부터 순서대로 적용하던 기존 규칙 유지)
+CUT_MARKERS = ["저작권자", "다른기사 보기", "좋아요 0", "훈훈해요 0", "슬퍼요 0", "화나요 0", "관련기사",
+               "재배포 금지", "무단 전재", "기자 ="]
+
+# ContentParser: 이 키워드가 들어 있는 문단/줄은 노이즈
+NOISE_KEYWORDS = [
+    '저작권', 'Copyright', '무단', '전재', '배포금지',
+    'googletag', 'display:', 'width:', 'margin:', 'padding:',
+    'MobileAd', 'function()', 'cmd.push', 'gpt-ad',
+    'src=', 'href=', 'class=', 'div>', '<img', '<div',
+    'window.', 'document.', '.jpg', '.png', '.webp', '.gif',
+    '기사를 듣', 'AI 음성', '뉴스레터', '구독', '팔로우'
+]
+
+# DateParser: 우선순위 순 날짜 패턴
+DATE_PATTERNS = [
+    r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})',  # 2026-02-23 15:30
+    r'(\d{4})-(\d{2})-(\d{2})',                      # 2026-02-23
+    r'(\d{4})\.(\d{2})\.(\d{2})',                    # 2026.02.23
+    r'(\d{4})/(\d{2})/(\d{2})',                      # 2026/02/23
+    r'승인\s*(\d{4}-\d{2}-\d{2})',                   # 승인 2026-02-23
+    r'입력\s*(\d{4}-\d{2}-\d{2})',                   # 입력 2026-02-23
+]
+
+# DateParser: 우선순위 순 작성자 패턴과 그 패턴에 반드시 들어 있는 글자
+WRITER_PATTERNS = [
+    (r'([가-힣]{2,4})\s*기자', '기자'),              # 홍길동 기자
+    (r'기자\s+([가-힣]{2,4})', '기자'),              # 기자 홍길동
+    (r'([가-힣]{2,4})\s*특파원', '특파원'),          # 홍길동 특파원
+    (r'([가-힣]{2,4})\s*리포터', '리포터'),          # 홍길동 리포터
+]
+
+# 날짜 패턴 1~4를 한 번에 (구분자가 같은 YYYY?MM?DD, '-'이면 뒤의 시각까지)
+# 5~6(승인/입력)은 안에 든 YYYY-MM-DD가 항상 2번 패턴에 먼저 걸리므로 따로 볼 필요가 없음
+# 위치를 소비하지 않는 전방 탐색이라 겹쳐 있는 날짜도 빠짐없이 확인
+_DATE_SCAN = re.compile(r'(?=(\d{4})([-./])(\d{2})\2(\d{2})(\s+\d{2}:\d{2})?)')
+_DATE_RANKS = {'-': 1, '.': 2, '/': 3}
+
+EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_EMAIL = re.compile(EMAIL_PATTERN)
+_EMAIL_LOCAL_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-')
+_HASHTAG = re.compile(r'#\S+')
+_BYLINE = re.compile(r'/[가-힣]{2,4}\s*기자.*$', re.MULTILINE)
+_HTTP_URL = re.compile(r'https?://[^\s]+')
+_WWW_URL = re.compile(r'www\.[^\s]+')
+
+
+class MarkerSet:
+    """
+    리터럴 키워드 집합 (교대 정규식 하나로 미리 컴파일)
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = [keyword for keyword in keywords if keyword]
+        # 긴 키워드를 먼저 두어 같은 위치에서 시작하는 키워드 중 가장 긴 것이 잡히도록
+        ordered = sorted(dict.fromkeys(self.keywords), key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, ordered))) if ordered else None
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def contains(self, text: str) -> bool:
+        """키워드가 하나라도 들어 있는지"""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def first(self, text: str, start: int = 0, end: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """text[start:end] 안에서 가장 앞선 키워드 위치 (시작, 끝), 없으면 None"""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text, start, len(text) if end is None else end)
+        return match.span() if match else None
+
+    def cut(self, text: str, end: Optional[int] = None) -> int:
+        """
+        키워드 목록 순서대로 `text = text.split(keyword)[0]`을 반복했을 때 남는 길이
+
+        가장 앞선 키워드와 겹쳐서 시작하는 다른 키워드가 없으면 그 시작 위치가 답이고,
+        겹칠 때만 기존 규칙대로 순서대로 다시 확인
+        """
+        end = len(text) if end is None else end
+        found = self.first(text, 0, end)
+        if found is None:
+            return end
+        start, stop = found
+        overlap = self.first(text, start + 1, end)
+        if overlap is None or overlap[0] >= stop:
+            return start
+
+        for keyword in self.keywords:
+            position = text.find(keyword, 0, end)
+            if position != -1:
+                end = position
+        return end
+
+
+CUT_MARKER_SET = MarkerSet(CUT_MARKERS)
+NOISE_MARKER_SET = MarkerSet(NOISE_KEYWORDS)
+
+
+def email_start(text: str) -> int:
+    """처음 나오는 이메일 주소의 시작 위치 (없으면 -1), '@'가 없으면 정규식을 돌리지 않음"""
+    at = text.find('@')
+    if at == -1:
+        return -1
+    # 이메일은 '@'를 포함하므로 첫 '@' 앞의 아이디 부분보다 앞에서 시작할 수 없음
+    start = at
+    while start and text[start - 1] in _EMAIL_LOCAL_CHARS:
+        start -= 1
+    match = _EMAIL.search(text, start)
+    return match.start() if match else -1
+
+
+def clean_body(text: str) -> str:
+    """
+    본문 텍스트 정제 (scraper.utils.clean_text)
+    첫 이메일 / 잘라내기 문구 이후 제거, 해시태그와 '/홍길동 기자' 이후 줄 내용 제거
+    """
+    if not text:
+        return ""
+    cut = email_start(text)
+    text = text[:CUT_MARKER_SET.cut(text, cut if cut != -1 else None)]
+    if '#' in text:
+        text = _HASHTAG.sub('', text)
+    if '기자' in text:
+        text = _BYLINE.sub('', text)
+    return text.strip()
+
+
+def is_noise(text: str) -> bool:
+    """노이즈 키워드가 들어 있는 문단/줄인지 (ContentParser._is_noise)"""
+    return NOISE_MARKER_SET.contains(text)
+
+
+def remove_urls(text: str) -> str:
+    """http(s) URL과 www. 주소 제거 (TextCleaner.remove_urls)"""
+    if 'http' in text:
+        text = _HTTP_URL.sub('', text)
+    if 'www.' in text:
+        text = _WWW_URL.sub('', text)
+    return text
+
+
+def remove_emails(text: str) -> str:
+    """이메일 주소 제거 (TextCleaner.remove_emails)"""
+    if '@' not in text:
+        return text
+    return _EMAIL.sub('', text)
+
+
+def normalize_whitespace(text: str) -> str:
+    """연속 공백을 하나로, 앞뒤 공백 제거 (re의 \\s와 str.split()의 공백 기준은 같음)"""
+    return ' '.join(text.split())
+
+
+def clean_article(text: str, urls: bool = True, emails: bool = True) -> str:
+    """뉴스 기사 텍스트 종합 정제 (TextCleaner.clean_article_text)"""
+    if urls:
+        text = remove_urls(text)
+    if emails:
+        text = remove_emails(text)
+    return normalize_whitespace(text)
+
+
+def extract_date(text: str) -> str:
+    """
+    우선순위가 가장 높은 날짜 (DateParser.extract_date)
+    시각이 붙은 YYYY-MM-DD > YYYY-MM-DD > YYYY.MM.DD > YYYY/MM/DD, 같은 종류면 먼저 나온 것
+    """
+    best_rank, best = 4, None
+    for match in _DATE_SCAN.finditer(text):
+        separator = match.group(2)
+        if separator == '-' and match.group(5):
+            best = match
+            break
+        rank = _DATE_RANKS[separator]
+        if rank < best_rank:
+            best_rank, best = rank, match
+    if best is None:
+        return ''
+    return f"{best.group(1)}-{best.group(3)}-{best.group(4)}"
+
+
+_WRITERS = [(re.compile(pattern), anchor) for pattern, anchor in WRITER_PATTERNS]
+
+
+def extract_writer(text: str) -> str:
+    """우선순위가 가장 높은 패턴의 첫 작성자명 (DateParser.extract_writer)"""
+    for pattern, anchor in _WRITERS:
+        if anchor in text:
+            match = pattern.search(text)
+            if match:
+                return match.group(1)
+    return ''
@@ -0,0 +1,207 @@
+"""
+HTTP 전송 계층 선택 모듈
+기본값은 requests(HTTP/1.1), 선택적으로 httpx(HTTP/2 + brotli) 사용
+
+- HTTP/2에서는 같은 호스트로 가는 동시 요청이 연결 하나에 다중화됨
+  (작업자 스레드마다 연결을 따로 여는 HTTP/1.1보다 핸드셰이크/연결 수가 줄어듦)
+- brotli 디코더(brotli 또는 brotlicffi)가 있으면 Accept-Encoding에 br 추가
+- HttpxSession은 프로젝트에서 쓰는 requests.Session API(get / post / headers / close)만 제공하고
+  requests.Response를 돌려주므로 fetch_url, 캐시, 인코딩 처리 코드를 그대로 사용
+
+백엔드는 create_session(backend=...) 또는 환경 변수 CRAWLER_TRANSPORT ('requests', 'httpx')로 지정
+(httpx/h2가 설치되지 않았으면 requests로 대체)
+
+CRAWLER_RECORD / CRAWLER_REPLAY가 설정되어 있으면 만든 세션에 녹화 훅 / 재생 어댑터를 설치 (replay_archive 참고)
+
+설치: pip install httpx[http2,brotli]
+"""
+
+import os
+import logging
+import threading
+from datetime import timedelta
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from replay_archive import configure_session, recording_enabled, replay_server_url
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+logger = logging.getLogger('Transport')
+
+BACKENDS = ('requests', 'httpx')
+
+# 응답 본문을 이미 풀어 둔 뒤에는 의미가 없는 헤더 (캐시에 저장된 응답을 다시 풀지 않도록 제거)
+_DECODED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+def accept_encoding() -> str:
+    """설치된 디코더 기준 Accept-Encoding 값 (urllib3와 httpx 모두 brotli가 있으면 br 해제 가능)"""
+    return 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate'
+
+
+def default_backend() -> str:
+    """환경 변수 또는 설치 상태에 따른 기본 백엔드"""
+    backend = os.environ.get('CRAWLER_TRANSPORT', '').strip().lower() or 'requests'
+    if backend not in BACKENDS:
+        logger.warning(f"전송 백엔드 '{backend}'를 알 수 없습니다. requests를 사용합니다.")
+        return 'requests'
+    if backend == 'httpx' and (httpx is None or not HAS_HTTP2):
+        logger.warning("httpx[http2]가 설치되지 않았습니다. requests를 사용합니다.")
+        return 'requests'
+    return backend
+
+
+class HttpxSession:
+    """
+    httpx.Client(HTTP/2)를 requests.Session처럼 쓰기 위한 래퍼
+    여러 스레드가 하나의 인스턴스를 공유 (httpx 연결 풀이 호스트당 연결 하나에 요청을 다중화)
+    """
+
+    def __init__(self, pool_size: int = 10, hosts: int = 1, headers: Optional[Dict] = None,
+                 verify: bool = True, http2: bool = True):
+        """
+        Args:
+            pool_size: 호스트당 동시 요청 수 (작업자 수)
+            hosts: 동시에 접속할 호스트 수 (HTTP/1.1로 협상된 호스트에도 충분한 연결 확보)
+            headers: 기본 헤더
+            verify: SSL 인증서 검증 여부 (클라이언트 단위로만 지정 가능)
+            http2: HTTP/2 사용 여부
+        """
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.verify = verify
+        max_connections = max(pool_size, 1) * max(hosts, 1)
+        self._client = httpx.Client(
+            http2=http2 and HAS_HTTP2,
+            verify=verify,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    def _merge_headers(self, headers: Optional[Dict]) -> Dict:
+        merged = CaseInsensitiveDict(self.headers)
+        if headers:
+            merged.update(headers)
+        # requests와 동일하게 None 값 헤더는 보내지 않음
+        return {k: v for k, v in merged.items() if v is not None}
+
+    def request(self, method: str, url: str, params=None, data=None, headers: Optional[Dict] = None,
+                timeout=None, verify=None, allow_redirects: bool = True, **kwargs) -> requests.Response:
+        """requests.Session.request와 같은 인자 (verify는 클라이언트 설정을 따름)"""
+        try:
+            response = self._client.request(
+                method, url, params=params, data=data, headers=self._merge_headers(headers),
+                timeout=httpx.Timeout(timeout) if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                follow_redirects=allow_redirects,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+        return self._to_requests_response(response)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.request('POST', url, data=data, **kwargs)
+
+    @staticmethod
+    def _to_requests_response(response) -> requests.Response:
+        """httpx 응답을 requests.Response로 변환 (본문은 이미 gzip/br 해제됨)"""
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.url = str(response.url)
+        result._content = response.content
+        result.headers = CaseInsensitiveDict(
+            {k: v for k, v in response.headers.items() if k.lower() not in _DECODED_HEADERS}
+        )
+        result.headers['X-Http-Version'] = response.http_version
+        result.elapsed = timedelta(seconds=response.elapsed.total_seconds())
+        result.encoding = None
+        return result
+
+    def mount(self, prefix: str, adapter) -> None:
+        """requests 어댑터는 사용하지 않음 (연결 풀은 생성 시 지정)"""
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def create_session(pool_size: int = 10, hosts: int = 1, headers: Optional[Dict] = None,
+                   verify: bool = True, backend: Optional[str] = None):
+    """
+    공용 HTTP 세션 생성
+
+    Args:
+        pool_size: 호스트당 동시 요청 수 (작업자 수에 맞춤)
+        hosts: 동시에 접속할 호스트 수
+        headers: 기본 헤더 (Accept-Encoding은 설치된 디코더에 맞게 설정)
+        verify: SSL 인증서 검증 여부
+        backend: 'requests' 또는 'httpx' (None이면 default_backend())
+
+    Returns:
+        requests.Session 또는 HttpxSession
+    """
+    backend = backend or default_backend()
+    if backend == 'httpx' and (httpx is None or not HAS_HTTP2):
+        logger.warning("httpx[http2]가 설치되지 않았습니다. requests를 사용합니다.")
+        backend = 'requests'
+    if backend == 'httpx' and (replay_server_url() or recording_enabled()):
+        # 녹화 훅(리다이렉트 단계별 기록)과 재생 서버 URL 재작성은 requests 세션에서만 지원
+        backend = 'requests'
+
+    headers = dict(headers or {})
+    headers['Accept-Encoding'] = accept_encoding()
+
+    if backend == 'httpx':
+        return HttpxSession(pool_size=pool_size, hosts=hosts, headers=headers, verify=verify)
+
+    session = requests.Session()
+    session.headers.update(headers)
+    session.verify = verify
+    adapter = requests.adapters.HTTPAdapter(pool_connections=max(hosts, 10), pool_maxsize=max(pool_size, 10))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return configure_session(session, pool_size=pool_size)
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session():
+    """세션을 넘기지 않은 요청이 공유하는 프로세스 공용 세션 (연결 재사용)"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session(pool_size=16, hosts=16, verify=False)
+        return _shared_session
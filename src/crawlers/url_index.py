@@ -0,0 +1,249 @@
+"""
+수집 완료 URL 인덱스
+news.db / news_scraped.db 와 이전 raw CSV에 이미 저장된 기사 URL을
+64비트 해시 집합으로 보관하여, 스크래퍼가 상세 페이지 요청 전에 중복을 거를 수 있게 함
+"""
+
+import os
+import csv
+import sys
+import glob
+import json
+import sqlite3
+import heapq
+import hashlib
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, Optional
+
+from sqlite_store import get_store
+
+logger = logging.getLogger('KnownUrlIndex')
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# 인덱스 구성에 사용하는 기본 소스
+DEFAULT_DB_PATHS = ['data/news.db', 'data/news_scraped.db']
+DEFAULT_CSV_GLOB = 'data/scraped/raw_*.csv'
+
+
+def _abs_path(path: str) -> str:
+    """상대 경로면 프로젝트 루트 기준 절대 경로로 변환"""
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def url_hash(url: str) -> int:
+    """URL의 64비트 해시 (앞뒤 공백 제거 후 계산)"""
+    digest = hashlib.blake2b(url.strip().encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class KnownUrlIndex:
+    """
+    이미 저장된 기사 URL 인덱스
+
+    - 정렬된 64비트 해시 배열(URL당 8바이트)에 이진 탐색으로 조회
+    - 실행 중 추가된 URL은 별도 집합에 보관 후 save() 시 병합
+    - 소스별 진행 상황(DB는 마지막 id·기사 수·파일 inode, CSV는 수정 시각)을 기록하여 변경분만 다시 읽음
+      (DB가 교체되었거나 마지막 id/기사 수가 줄었으면 지워진 URL이 남지 않도록 인덱스 전체를 다시 만듦)
+    """
+
+    def __init__(self, index_path: str = 'data/known_urls.idx'):
+        """
+        Args:
+            index_path: 인덱스 파일 경로 (상대 경로면 프로젝트 루트 기준)
+        """
+        self.index_path = _abs_path(index_path)
+        self.meta_path = self.index_path + '.json'
+        self._base = array('Q')
+        self._delta = set()
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._delta)
+
+    def __contains__(self, url: str) -> bool:
+        if not url:
+            return False
+        h = url_hash(url)
+        return h in self._delta or self._in_base(h)
+
+    def _in_base(self, h: int) -> bool:
+        """정렬된 기본 배열에서 해시 이진 탐색"""
+        i = bisect_left(self._base, h)
+        return i < len(self._base) and self._base[i] == h
+
+    def add(self, url: str) -> None:
+        """URL 추가"""
+        if url:
+            with self._lock:
+                self._delta.add(url_hash(url))
+
+    def add_many(self, urls: Iterable[str]) -> int:
+        """URL 여러 개 추가, 추가 시도한 개수 반환"""
+        hashes = [url_hash(u) for u in urls if u]
+        with self._lock:
+            self._delta.update(hashes)
+        return len(hashes)
+
+    def load(self) -> bool:
+        """저장된 인덱스 로드 (파일이 없으면 False)"""
+        if not os.path.exists(self.index_path):
+            return False
+
+        base = array('Q')
+        with open(self.index_path, 'rb') as f:
+            base.frombytes(f.read())
+        self._base = base
+
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                self._sources = json.load(f).get('sources', {})
+
+        logger.info(f"✓ URL 인덱스 로드: {len(self._base)}개")
+        return True
+
+    def save(self) -> None:
+        """인덱스를 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            if self._delta:
+                # 정렬된 배열 두 개를 병합하여 메모리 사용 최소화
+                fresh = sorted(h for h in self._delta if not self._in_base(h))
+                self._base = array('Q', heapq.merge(self._base, fresh))
+                self._delta = set()
+            base = self._base
+
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            base.tofile(f)
+        os.replace(tmp_path, self.index_path)
+
+        tmp_meta = self.meta_path + '.tmp'
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump({'sources': self._sources}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_meta, self.meta_path)
+
+        logger.info(f"✓ URL 인덱스 저장: {len(base)}개 ({self.index_path})")
+
+    def refresh(self,
+                db_paths: Optional[List[str]] = None,
+                csv_glob: str = DEFAULT_CSV_GLOB) -> int:
+        """
+        DB와 raw CSV에서 새로 생긴 URL만 읽어 인덱스에 반영
+
+        Args:
+            db_paths: news 테이블이 있는 SQLite 파일 목록
+            csv_glob: raw CSV 파일 패턴
+
+        Returns:
+            새로 읽은 URL 수
+        """
+        states = {}
+        for db_path in (db_paths or DEFAULT_DB_PATHS):
+            db_path = _abs_path(db_path)
+            states[db_path] = self._db_state(db_path)
+
+        stale = [db_path for db_path, state in states.items() if state and self._db_regressed(db_path, state)]
+        if stale:
+            logger.warning(f"DB가 교체되었거나 기사가 줄어 URL 인덱스를 다시 만듭니다: {', '.join(stale)}")
+            with self._lock:
+                self._base = array('Q')
+                self._delta = set()
+                self._sources = {}
+
+        added = 0
+        for db_path, state in states.items():
+            if state:
+                added += self._refresh_db(db_path, state)
+        for csv_path in glob.glob(_abs_path(csv_glob)):
+            added += self._refresh_csv(csv_path)
+
+        if added:
+            logger.info(f"✓ URL 인덱스 갱신: {added}개 추가 (전체 {len(self)}개)")
+        return added
+
+    def _db_state(self, db_path: str) -> Optional[dict]:
+        """DB의 현재 상태 (마지막 id, 기사 수, 파일 inode), 없거나 읽을 수 없으면 None"""
+        if not os.path.exists(db_path):
+            return None
+        inode = os.stat(db_path).st_ino
+        if self._db_source(db_path).get('inode', inode) != inode:
+            # 교체 전 파일을 열어 둔 풀 연결로 읽지 않도록
+            get_store(db_path).close()
+        try:
+            with get_store(db_path).connection() as conn:
+                max_id, count = conn.execute('SELECT MAX(id), COUNT(*) FROM news').fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"DB 읽기 실패 ({db_path}): {e}")
+            return None
+        return {'last_id': max_id or 0, 'count': count, 'inode': inode}
+
+    def _db_source(self, db_path: str) -> dict:
+        """기록된 DB 진행 상황 (예전 형식은 마지막 id 정수만 있음)"""
+        source = self._sources.get(f"db:{db_path}", {})
+        return source if isinstance(source, dict) else {'last_id': source}
+
+    def _db_regressed(self, db_path: str, state: dict) -> bool:
+        """마지막으로 읽은 뒤 DB가 교체되었거나 마지막 id/기사 수가 줄었는지"""
+        source = self._db_source(db_path)
+        if not source:
+            return False
+        return (state['last_id'] < source.get('last_id', 0)
+                or state['count'] < source.get('count', 0)
+                or source.get('inode', state['inode']) != state['inode'])
+
+    def _refresh_db(self, db_path: str, state: dict) -> int:
+        """DB에서 마지막으로 읽은 id 이후의 URL만 읽기 (state의 마지막 id까지)"""
+        last_id = self._db_source(db_path).get('last_id', 0)
+        try:
+            with get_store(db_path).connection() as conn:
+                cursor = conn.execute('SELECT url FROM news WHERE id > ? AND id <= ? ORDER BY id',
+                                      (last_id, state['last_id']))
+                count = 0
+                while True:
+                    rows = cursor.fetchmany(10000)
+                    if not rows:
+                        break
+                    count += self.add_many(url for url, in rows)
+        except sqlite3.Error as e:
+            logger.warning(f"DB 읽기 실패 ({db_path}): {e}")
+            return 0
+
+        self._sources[f"db:{db_path}"] = state
+        return count
+
+    def _refresh_csv(self, csv_path: str) -> int:
+        """수정된 raw CSV의 URL 컬럼 읽기"""
+        key = f"csv:{csv_path}"
+        mtime = os.path.getmtime(csv_path)
+        if self._sources.get(key) == mtime:
+            return 0
+
+        # 본문 컬럼이 길어 기본 필드 크기 제한을 넘는 경우 대비
+        csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+
+        count = 0
+        try:
+            with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                reader = csv.DictReader(f)
+                url_col = 'article_url' if reader.fieldnames and 'article_url' in reader.fieldnames else 'url'
+                count = self.add_many(row.get(url_col, '') for row in reader)
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            logger.warning(f"CSV 읽기 실패 ({csv_path}): {e}")
+            return 0
+
+        self._sources[key] = mtime
+        return count
+
+    @classmethod
+    def load_or_build(cls, index_path: str = 'data/known_urls.idx') -> 'KnownUrlIndex':
+        """저장된 인덱스를 불러와 변경분을 반영하고 저장"""
+        index = cls(index_path)
+        index.load()
+        index.refresh()
+        index.save()
+        return index
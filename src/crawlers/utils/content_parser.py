@@ -7,6 +7,9 @@ from bs4 import BeautifulSoup, Tag
 from typing import List, Optional
 import re
 
+from extraction_plan import get_plan, get_noise_filter
+import text_engine
+
 
 class ContentParser:
     """
@@ -23,20 +26,18 @@ class ContentParser:
         'related', 'recommend', 'popular', 'share', 'social'
     ]
     
-    # 필터링할 키워드
-    NOISE_KEYWORDS = [
-        '저작권', 'Copyright', '무단', '전재', '배포금지',
-        'googletag', 'display:', 'width:', 'margin:', 'padding:',
-        'MobileAd', 'function()', 'cmd.push', 'gpt-ad',
-        'src=', 'href=', 'class=', 'div>', '<img', '<div',
-        'window.', 'document.', '.jpg', '.png', '.webp', '.gif',
-        '기사를 듣', 'AI 음성', '뉴스레터', '구독', '팔로우'
-    ]
+    # 태그/패턴을 합친 노이즈 선택자 (한 번에 컴파일, 한 번의 순회로 제거)
+    UNWANTED_SELECTOR = ', '.join(UNWANTED_TAGS + [f'[class*="{pattern}"], [id*="{pattern}"]'
+                                                   for pattern in UNWANTED_PATTERNS])
+    
+    # 필터링할 키워드 (text_engine에서 하나의 정규식으로 미리 컴파일)
+    NOISE_KEYWORDS = text_engine.NOISE_KEYWORDS
     
     @staticmethod
     def extract_from_selector(soup: BeautifulSoup, 
                               selectors: List[str],
-                              min_length: int = 100) -> str:
+                              min_length: int = 100,
+                              plan_key: str = '') -> str:
         """
         CSS 선택자로 본문 추출
         
@@ -44,18 +45,17 @@ class ContentParser:
             soup: BeautifulSoup 객체
             selectors: 시도할 CSS 선택자 리스트
             min_length: 최소 텍스트 길이
+            plan_key: 추출 계획을 공유할 키 (보통 신문사 base_url, 자주 채택되는 선택자부터 시도)
             
         Returns:
             추출된 본문
         """
-        for selector in selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                text = ContentParser._clean_element(content_div)
-                if len(text) >= min_length:
-                    return text
+        def extract(content_div):
+            text = ContentParser._clean_element(content_div)
+            return text if len(text) >= min_length else None
         
-        return ''
+        plan = get_plan(plan_key or 'ContentParser', 'content', selectors)
+        return plan.first(soup, extract) or ''
     
     @staticmethod
     def extract_from_paragraphs(soup: BeautifulSoup,
@@ -110,11 +110,8 @@ class ContentParser:
         if not content_div:
             return ''
         
-        # 불필요한 요소 제거
-        ContentParser._remove_unwanted_elements(content_div)
-        
-        # 텍스트 추출
-        text = content_div.get_text(separator='\n', strip=True)
+        # 불필요한 요소를 건너뛰며 텍스트 추출
+        text = get_noise_filter(ContentParser.UNWANTED_SELECTOR).text(content_div, separator='\n')
         lines = text.split('\n')
         
         # 필터링
@@ -131,33 +128,18 @@ class ContentParser:
     @staticmethod
     def _clean_element(element: Tag) -> str:
         """요소에서 깨끗한 텍스트 추출"""
-        # 불필요한 요소 제거
-        ContentParser._remove_unwanted_elements(element)
-        
-        # 텍스트 추출
-        text = element.get_text(separator=' ', strip=True)
+        # 불필요한 요소를 건너뛰며 텍스트 추출 (한 번의 순회)
+        text = get_noise_filter(ContentParser.UNWANTED_SELECTOR).text(element)
         
         # 중복 공백 제거
         text = re.sub(r'\s+', ' ', text)
         
         return text.strip()
     
-    @staticmethod
-    def _remove_unwanted_elements(element: Tag) -> None:
-        """불필요한 HTML 요소 제거"""
-        # 태그 제거
-        for tag in element.select(','.join(ContentParser.UNWANTED_TAGS)):
-            tag.decompose()
-        
-        # 클래스/ID 패턴 제거
-        for pattern in ContentParser.UNWANTED_PATTERNS:
-            for elem in element.select(f'[class*="{pattern}"], [id*="{pattern}"]'):
-                elem.decompose()
-    
     @staticmethod
     def _is_noise(text: str) -> bool:
-        """노이즈 텍스트 판별"""
-        return any(keyword in text for keyword in ContentParser.NOISE_KEYWORDS)
+        """노이즈 텍스트 판별 (키워드 전체를 한 번에 검색)"""
+        return text_engine.is_noise(text)
     
     @staticmethod
     def _is_url_or_path(text: str) -> bool:
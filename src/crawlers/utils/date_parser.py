@@ -6,29 +6,19 @@ import re
 from typing import Optional, Dict
 from datetime import datetime
 
+import text_engine
+
 
 class DateParser:
     """
     날짜, 작성자 등 메타데이터 추출 유틸리티
     """
     
-    # 날짜 패턴들
-    DATE_PATTERNS = [
-        r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})',  # 2026-02-23 15:30
-        r'(\d{4})-(\d{2})-(\d{2})',                      # 2026-02-23
-        r'(\d{4})\.(\d{2})\.(\d{2})',                    # 2026.02.23
-        r'(\d{4})/(\d{2})/(\d{2})',                      # 2026/02/23
-        r'승인\s*(\d{4}-\d{2}-\d{2})',                   # 승인 2026-02-23
-        r'입력\s*(\d{4}-\d{2}-\d{2})',                   # 입력 2026-02-23
-    ]
+    # 날짜 패턴들 (우선순위 순, text_engine에서 한 번의 순회로 처리)
+    DATE_PATTERNS = text_engine.DATE_PATTERNS
     
-    # 작성자 패턴들
-    WRITER_PATTERNS = [
-        r'([가-힣]{2,4})\s*기자',                        # 홍길동 기자
-        r'기자\s+([가-힣]{2,4})',                        # 기자 홍길동
-        r'([가-힣]{2,4})\s*특파원',                      # 홍길동 특파원
-        r'([가-힣]{2,4})\s*리포터',                      # 홍길동 리포터
-    ]
+    # 작성자 패턴들 (우선순위 순)
+    WRITER_PATTERNS = [pattern for pattern, _ in text_engine.WRITER_PATTERNS]
     
     @staticmethod
     def extract_date(text: str, format: str = 'YYYY-MM-DD') -> str:
@@ -42,17 +32,7 @@ class DateParser:
         Returns:
             날짜 문자열 또는 빈 문자열
         """
-        for pattern in DateParser.DATE_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                # 그룹이 여러 개면 조합
-                groups = match.groups()
-                if len(groups) >= 3:
-                    return f"{groups[0]}-{groups[1]}-{groups[2]}"
-                else:
-                    return match.group(1)
-        
-        return ''
+        return text_engine.extract_date(text)
     
     @staticmethod
     def extract_writer(text: str) -> str:
@@ -65,12 +45,7 @@ class DateParser:
         Returns:
             작성자명 또는 빈 문자열
         """
-        for pattern in DateParser.WRITER_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return ''
+        return text_engine.extract_writer(text)
     
     @staticmethod
     def extract_metadata(soup, selectors: Dict[str, str]) -> Dict[str, str]:
@@ -5,6 +5,8 @@
 import re
 from typing import List
 
+import text_engine
+
 
 class TextCleaner:
     """
@@ -43,13 +45,8 @@ class TextCleaner:
         Returns:
             정규화된 텍스트
         """
-        # 연속된 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 앞뒤 공백 제거
-        text = text.strip()
-        
-        return text
+        # 연속된 공백을 하나로, 앞뒤 공백 제거
+        return text_engine.normalize_whitespace(text)
     
     @staticmethod
     def remove_urls(text: str) -> str:
@@ -62,13 +59,8 @@ class TextCleaner:
         Returns:
             URL이 제거된 텍스트
         """
-        # http/https URL 제거
-        text = re.sub(r'https?://[^\s]+', '', text)
-        
-        # www.로 시작하는 URL 제거
-        text = re.sub(r'www\.[^\s]+', '', text)
-        
-        return text
+        # http/https URL, www.로 시작하는 URL 제거
+        return text_engine.remove_urls(text)
     
     @staticmethod
     def remove_emails(text: str) -> str:
@@ -81,8 +73,7 @@ class TextCleaner:
         Returns:
             이메일이 제거된 텍스트
         """
-        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)
-        return text
+        return text_engine.remove_emails(text)
     
     @staticmethod
     def clean_article_text(text: str, 
@@ -99,16 +90,8 @@ class TextCleaner:
         Returns:
             정제된 텍스트
         """
-        if remove_urls:
-            text = TextCleaner.remove_urls(text)
-        
-        if remove_emails:
-            text = TextCleaner.remove_emails(text)
-        
-        # 공백 정규화
-        text = TextCleaner.normalize_whitespace(text)
-        
-        return text
+        # 미리 컴파일한 패턴으로 처리 (필요한 글자가 없으면 정규식을 건너뜀)
+        return text_engine.clean_article(text, urls=remove_urls, emails=remove_emails)
     
     @staticmethod
     def truncate(text: str, max_length: int, suffix: str = '...') -> str:
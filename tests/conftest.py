@@ -0,0 +1,8 @@
+"""크롤러 모듈(src/crawlers)을 바로 임포트할 수 있도록 경로 추가"""
+
+import os
+import sys
+
+CRAWLERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'crawlers')
+if CRAWLERS_DIR not in sys.path:
+    sys.path.insert(0, CRAWLERS_DIR)
@@ -0,0 +1,87 @@
+"""SelectorPlan이 자주 맞는 선택자부터 시도하면서도 선언 순서대로 처음 맞는 선택자를 고르던 기존 결과와 같은지 확인"""
+
+import random
+
+from bs4 import BeautifulSoup
+
+from extraction_plan import SelectorPlan
+
+SELECTORS = ['div.a', 'div.b', 'div.c', 'article p', '#body']
+
+
+def legacy_first(soup, selectors):
+    for selector in selectors:
+        tag = soup.select_one(selector)
+        if tag:
+            return tag
+    return None
+
+
+def page(classes, text='본문'):
+    body = ''.join(f'<div class="{name}">{text} {name}</div>' for name in classes)
+    return BeautifulSoup(f'<html><body>{body}<article><p>문단</p></article></body></html>', 'html.parser')
+
+
+class CountingPlan(SelectorPlan):
+    """선택자 시도 횟수를 세는 계획"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.probes = 0
+
+    def _select(self, index, element):
+        self.probes += 1
+        return super()._select(index, element)
+
+
+def test_winner_first_order_skips_probes():
+    plan = CountingPlan(SELECTORS, warmup=20, recheck_every=200)
+    # 마지막 후보(#body)만 맞는 페이지
+    soup = BeautifulSoup('<html><body><div class="x">본문</div><div id="body">본문</div></body></html>', 'html.parser')
+    for _ in range(1000):
+        assert plan.select_one(soup) is soup.select_one('#body')
+    # 선언 순서 확인(처음 20번 + 200번마다 5번)만 후보 5개를 모두 시도하고 나머지는 한 번에 맞음
+    declared = 20 + 1000 // 200
+    assert plan.probes == declared * len(SELECTORS) + (1000 - declared)
+
+
+def test_earlier_selector_seen_together_with_winner_is_rechecked():
+    plan = SelectorPlan(['div.a', 'div.b'], warmup=3)
+    # 선언 순서 확인에서 div.a와 div.b가 함께 맞는 페이지를 본 뒤로는 div.b가 앞서도 div.a를 다시 확인
+    assert plan.select_one(page(['a', 'b'])).get_text() == '본문 a'
+    for _ in range(plan.warmup + 10):
+        assert plan.select_one(page(['b'])).get_text() == '본문 b'
+    assert plan.select_one(page(['a', 'b'])).get_text() == '본문 a'
+
+
+def test_catch_all_fallback_does_not_shadow_specific_selector():
+    plan = SelectorPlan(['h2.headline', 'title'], warmup=5)
+    with_headline = BeautifulSoup('<html><head><title>T</title></head><body><h2 class="headline">H</h2></body></html>',
+                                  'html.parser')
+    without_headline = BeautifulSoup('<html><head><title>T</title></head><body></body></html>', 'html.parser')
+    plan.select_one(with_headline)
+    for _ in range(50):
+        assert plan.select_one(without_headline).get_text() == 'T'
+    assert plan.select_one(with_headline).get_text() == 'H'
+
+
+def test_matches_legacy_first_match_on_overlapping_selectors():
+    rng = random.Random(7)
+    plan = SelectorPlan(SELECTORS, warmup=5, recheck_every=50)
+    # 겹치는 후보 조합은 선언 순서 확인에서 한 번 보고 나면 이후 결과가 기존과 같음
+    for classes in (['a', 'b', 'c'], ['b', 'c'], ['a', 'c']):
+        plan.select_one(page(classes))
+    for _ in range(1000):
+        # 대부분은 뒤쪽 후보만 있는 페이지 (순서 재배치 유도), 가끔 앞쪽 후보가 함께 있는 페이지
+        classes = ['c'] if rng.random() < 0.7 else rng.sample(['a', 'b', 'c'], rng.randint(1, 3))
+        soup = page(classes)
+        expected = legacy_first(soup, SELECTORS)
+        assert plan.select_one(soup) is expected
+
+
+def test_extract_uses_first_declared_candidate_with_a_result():
+    plan = SelectorPlan(['div.a', 'div.b'], warmup=0)
+    extract = lambda tag: tag.get_text() if 'b' in tag.get_text() else None
+    for _ in range(5):
+        plan.first(page(['b']), extract)
+    assert plan.first(page(['a', 'b']), extract) == '본문 b'
@@ -0,0 +1,74 @@
+"""기본 설정(selectolax가 설치되어 기본 백엔드여도)에서 상세 페이지가 부분 파싱되는지 확인"""
+
+from types import SimpleNamespace
+
+import pytest
+from bs4 import BeautifulSoup
+
+import html_parser
+from html_parser import TargetFilter, parse_html
+from scraping_engine import SiteSpec, SpecCrawler
+from site_specs import SITE_SPECS
+
+NAV = ''.join(f'<li><a href="/n/{i}">메뉴 {i}</a></li>' for i in range(50))
+ARTICLE = (
+    f'<html><head><script>var a = 1;</script></head><body><nav><ul>{NAV}</ul></nav>'
+    '<div class="ad"><p>광고</p></div>'
+    '<h4 class="subheading">부제목</h4>'
+    '<div id="article-view-content-div"><p>첫 문단</p><p>둘째 문단</p></div>'
+    f'<footer><ul>{NAV}</ul></footer></body></html>'
+)
+
+
+@pytest.fixture(autouse=True)
+def default_backend(monkeypatch):
+    monkeypatch.delenv('CRAWLER_HTML_PARSER', raising=False)
+
+
+def test_targets_are_parsed_partially_with_default_backend():
+    targets = TargetFilter(['h4.subheading', 'div#article-view-content-div'],
+                           required=['div#article-view-content-div'])
+
+    doc = parse_html(ARTICLE.encode('utf-8'), encoding='utf-8', targets=targets)
+
+    assert isinstance(doc, BeautifulSoup)
+    assert (targets.hits, targets.misses) == (1, 0)
+    assert doc.select_one('div#article-view-content-div').get_text(' ', strip=True) == '첫 문단 둘째 문단'
+    assert doc.select_one('h4.subheading').get_text() == '부제목'
+    assert doc.select_one('nav') is None
+    assert doc.select_one('footer') is None
+
+
+def test_missing_content_falls_back_to_full_parse():
+    targets = TargetFilter(['div.article_body'], required=['div.article_body'])
+
+    doc = parse_html(ARTICLE, targets=targets)
+
+    assert (targets.hits, targets.misses) == (0, 1)
+    assert doc.select_one('footer') is not None
+
+
+def test_explicit_selectolax_backend_parses_full_tree():
+    if 'selectolax' not in html_parser.available_backends():
+        pytest.skip('selectolax 미설치')
+    targets = TargetFilter(['div#article-view-content-div'], required=['div#article-view-content-div'])
+
+    doc = parse_html(ARTICLE, backend='selectolax', targets=targets)
+
+    assert isinstance(doc, html_parser.LexborDocument)
+    assert targets.hits == 0
+    assert doc.select_one('footer') is not None
+
+
+def test_spec_detail_pages_use_partial_parse_by_default():
+    spec = SiteSpec('chungcheong_cctoday', SITE_SPECS['chungcheong_cctoday'])
+    crawler = SpecCrawler(spec)
+    hits = spec.detail_targets.hits
+    response = SimpleNamespace(status_code=200, content=ARTICLE.encode('utf-8'), headers={})
+
+    doc = crawler._decode(response, spec.detail_encoding, spec.detail_targets)
+
+    assert spec.detail_targets
+    assert spec.detail_targets.hits == hits + 1
+    assert doc.select_one('nav') is None
+    assert crawler.extract_details(doc)['content'].startswith('첫 문단')
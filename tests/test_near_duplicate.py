@@ -0,0 +1,128 @@
+"""한 문장만 고친 재게재 기사를 원본에 연결하는지, 밴드 조회가 거리 7 이내를 빠짐없이 적은 후보로 찾는지 확인"""
+
+import random
+import sqlite3
+
+import pytest
+
+import near_duplicate
+from near_duplicate import NearDuplicateDetector, SimHashIndex, hamming
+
+SYLLABLES = '가나다라마바사아자차카타파하경제정치사회문화지역개발투자시장도청군수의회예산주민교육환경산업관광농업항만철도'
+
+
+def make_corpus(count=60, seed=13):
+    """기사 모음 (기사마다 20~30문장, 문장마다 8~14단어)"""
+    rng = random.Random(seed)
+    words = [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(400)]
+    return [
+        [' '.join(rng.choice(words) for _ in range(rng.randint(8, 14))) + '했다.'
+         for _ in range(rng.randint(20, 30))]
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def news_db(tmp_path):
+    """기사 모음을 넣은 임시 뉴스 DB"""
+    detector = NearDuplicateDetector()
+    conn = sqlite3.connect(tmp_path / 'news.db')
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE news (id INTEGER PRIMARY KEY, content TEXT, keyword TEXT,
+                           sentiment_score REAL, is_processed INTEGER DEFAULT 0)
+    ''')
+    detector.ensure_schema(cursor)
+    articles = list(enumerate(make_corpus(), start=1))
+    cursor.executemany('INSERT INTO news (id, content) VALUES (?, ?)',
+                       [(news_id, ' '.join(sentences)) for news_id, sentences in articles])
+    assert detector.index_existing(cursor) == 0
+    yield cursor, articles
+    conn.close()
+
+
+def one_sentence_edits(sentences, other):
+    """가운데 문장 삭제 / 다른 기사 문장으로 교체 / 다른 기사 문장 삽입"""
+    middle = len(sentences) // 2
+    yield sentences[:middle] + sentences[middle + 1:]
+    yield sentences[:middle] + [other] + sentences[middle + 1:]
+    yield sentences[:middle] + [other] + sentences[middle:]
+
+
+def test_one_sentence_edit_is_detected(news_db):
+    cursor, articles = news_db
+    detector = NearDuplicateDetector()
+
+    detected = total = 0
+    for n, (news_id, sentences) in enumerate(articles):
+        other_sentences = articles[(n + 1) % len(articles)][1]
+        other = other_sentences[len(other_sentences) // 2]
+        for edited in one_sentence_edits(sentences, other):
+            total += 1
+            detected += detector.find_canonical(cursor, detector.fingerprint(' '.join(edited))) == news_id
+    # 20문장 이상 기사는 한 문장을 고쳐도 대부분 거리 7 이내 (기존 기준 3으로는 절반 정도만 연결됨)
+    assert detected / total >= 0.85
+
+
+def test_distinct_articles_are_not_linked(news_db):
+    cursor, articles = news_db
+    detector = NearDuplicateDetector()
+    fingerprints = [detector.fingerprint(' '.join(sentences)) for _, sentences in articles]
+
+    assert min(hamming(a, b) for i, a in enumerate(fingerprints) for b in fingerprints[i + 1:]) > 7
+    cursor.execute("INSERT INTO news (id, content) VALUES (1000, ?)", (' '.join(articles[0][1][:-1]),))
+    assert detector.index_existing(cursor) == 1
+    assert cursor.execute("SELECT canonical_id FROM news WHERE id = 1000").fetchone() == (1,)
+
+
+def test_every_fingerprint_within_distance_7_is_found_among_few_candidates():
+    rng = random.Random(7)
+    detector = NearDuplicateDetector()
+    conn = sqlite3.connect(':memory:')
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE news (id INTEGER PRIMARY KEY, content TEXT)')
+    detector.ensure_schema(cursor)
+    stored = [rng.getrandbits(64) for _ in range(20000)]
+    detector.add_many(cursor, enumerate(stored))
+    memory = SimHashIndex()
+    for news_id, fingerprint in enumerate(stored[:2000]):
+        memory.add(news_id, fingerprint)
+
+    candidates = 0
+    for news_id in range(0, 2000, 10):
+        query = stored[news_id]
+        for bit in rng.sample(range(64), 7):
+            query ^= 1 << bit
+        assert detector.find_canonical(cursor, query) == news_id
+        assert memory.find(query) == news_id
+        candidates += len(cursor.execute(near_duplicate._FIND_SQL, near_duplicate.probes(query)).fetchall())
+    # 조회마다 후보가 전체의 1/1000 정도 (8비트 밴드 8개면 1/32, 20000개 중 600개 이상)
+    assert candidates / 200 < 20000 / 500
+
+
+def test_max_distance_beyond_probe_radius_is_rejected():
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(max_distance=near_duplicate.MAX_DISTANCE + 1)
+
+
+def test_old_eight_band_table_is_rebuilt_and_reindexed():
+    detector = NearDuplicateDetector()
+    conn = sqlite3.connect(':memory:')
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE news (id INTEGER PRIMARY KEY, content TEXT, canonical_id INTEGER)')
+    cursor.execute(f'''
+        CREATE TABLE fingerprints (news_id INTEGER PRIMARY KEY, simhash INTEGER,
+                                   {', '.join(f'band{i} INTEGER' for i in range(8))})
+    ''')
+    cursor.execute('INSERT INTO fingerprints (news_id, simhash, band0) VALUES (1, 5, 5)')
+    cursor.executemany('INSERT INTO news (id, content, canonical_id) VALUES (?, ?, ?)',
+                       [(1, '가' * 300, None), (2, '가' * 300, 1), (3, '가' * 300, None)])
+
+    detector.ensure_schema(cursor)
+    columns = [row[1] for row in cursor.execute('PRAGMA table_info(fingerprints)')]
+    assert columns == ['news_id', 'simhash'] + [f'band{i}' for i in range(4)]
+
+    # 원본(1)은 다시 등록되고, 새로 검사한 같은 본문(3)은 원본에 연결
+    assert detector.index_existing(cursor) == 1
+    assert cursor.execute('SELECT news_id FROM fingerprints').fetchall() == [(1,)]
+    assert cursor.execute('SELECT id, canonical_id FROM news').fetchall() == [(1, None), (2, 1), (3, 1)]
@@ -0,0 +1,84 @@
+"""파싱 작업자 풀에 넘긴 뒤 수집 스레드가 결과를 기다리지 않고 다음 요청으로 넘어가는지 확인"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+from parse_pool import ParsePool
+from scraper.utils import iter_page_results
+from scraping_engine import SiteSpec
+from site_specs import SITE_SPECS
+
+logger = logging.getLogger('test')
+
+ARTICLE = (
+    '<html><body><nav>메뉴</nav><h4 class="subheading">부제목</h4>'
+    '<div id="article-view-content-div"><p>첫 문단</p><p>둘째 문단</p></div></body></html>'
+)
+
+
+def test_fetch_threads_do_not_wait_for_parse_results():
+    pages = {1: list(range(6)), 2: list(range(6, 12))}
+    parsed = {}
+    fetched = threading.Semaphore(0)
+
+    def fetch_items(page):
+        return pages.get(page)
+
+    def process_item(item):
+        # 수집 스레드: 파싱 결과 Future만 넘기고 바로 반환
+        parsed[item] = Future()
+        fetched.release()
+        return parsed[item]
+
+    results = []
+    consumer = threading.Thread(target=lambda: results.extend(
+        iter_page_results(fetch_items, process_item, logger, workers=2, prefetch=2)))
+    consumer.start()
+
+    # 파싱이 하나도 끝나지 않았는데 스레드 2개로 12개 요청이 모두 끝남
+    for _ in range(12):
+        assert fetched.acquire(timeout=5)
+    assert not results
+    for item, future in parsed.items():
+        future.set_result({'item': item})
+    consumer.join(timeout=5)
+
+    assert [(page, [row['item'] for row in rows]) for page, rows in results] == [
+        (1, list(range(6))), (2, list(range(6, 12)))]
+
+
+def test_older_parse_result_stops_list_pages():
+    requested = []
+
+    def fetch_items(page):
+        requested.append(page)
+        return [page]
+
+    def process_item(item):
+        future = Future()
+        future.set_result('OLDER' if item == 2 else {'item': item})
+        return future
+
+    pages = [page for page, _ in iter_page_results(fetch_items, process_item, logger, prefetch=1)]
+
+    assert pages[:2] == [1, 2]
+    assert max(requested) <= 4
+
+
+def test_submit_returns_future_with_build_row_result():
+    spec = SiteSpec('chungcheong_cctoday', SITE_SPECS['chungcheong_cctoday'])
+    entry = {'article_url': 'https://www.cctoday.co.kr/news/1', 'date': '2026-10-01', 'title': '제목',
+             'description': '', 'image_url': ''}
+    response = SimpleNamespace(status_code=200, reason='OK', url=entry['article_url'],
+                               headers={'Content-Type': 'text/html; charset=utf-8'},
+                               content=ARTICLE.encode('utf-8'))
+
+    with ParsePool(workers=1, max_pending=1) as pool:
+        future = pool.submit(spec, entry, response, limit_date='2026-09-01')
+        assert isinstance(future, Future)
+        row = future.result(timeout=60)
+
+    assert row['sub_title'] == '부제목'
+    assert row['content'].startswith('첫 문단')
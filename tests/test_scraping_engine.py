@@ -0,0 +1,110 @@
+"""목록 요청이 실패하면 목록/구간을 완료로 표시하지 않고 체크포인트부터 다시 수집하는지 확인"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import scraping_engine as se
+
+logger = logging.getLogger('test_scraping_engine')
+
+
+class MemorySink:
+    """ResultSink 대신 쓰는 메모리 체크포인트"""
+
+    def __init__(self):
+        self.pages = {}
+        self.done = set()
+        self.count = 0
+
+    def write_page(self, list_key, page, rows):
+        self.pages[list_key] = page
+        self.count += len(rows)
+        return len(rows)
+
+    def resume_page(self, list_key):
+        return self.pages.get(list_key, 0)
+
+    def is_done(self, list_key):
+        return list_key in self.done
+
+    def finish_list(self, list_key):
+        self.done.add(list_key)
+
+
+class FakeSpec:
+    key = 'fake'
+    workers = 4
+    max_pages = 20
+    stop_rule = 'first_older'
+
+
+class FakeCrawler:
+    """failures: {페이지: 'error'(요청 실패) 또는 'empty'(아이템 없음)}, last_page 이후는 목록 끝"""
+
+    spec = FakeSpec()
+
+    def __init__(self, failures=None, last_page=12):
+        self.failures = failures or {}
+        self.last_page = last_page
+
+    def fetch_list_items(self, list_url, page, *args, **kwargs):
+        failure = self.failures.get(page)
+        if failure == 'error':
+            raise se.FetchError(f"Status 503: {page}")
+        if failure == 'empty' or page > self.last_page:
+            return None
+        return [page]
+
+    def process_item(self, entry, *args):
+        return {'article_url': f'/a/{entry}'}
+
+
+@pytest.fixture
+def engine():
+    engine = se.ScrapingEngine.__new__(se.ScrapingEngine)
+    engine._failed = False
+    engine.backfill_segments = 3
+    engine.prefetch = 1
+    engine.executor = ThreadPoolExecutor(4)
+    engine.limit_date = '2000-01-01'
+    engine.end_date = None
+    engine.sink = MemorySink()
+    engine.results = se.ResultCollector({'fake': engine.sink})
+    yield engine
+    engine.executor.shutdown()
+
+
+def test_list_request_failure_keeps_checkpoint(engine):
+    engine._crawl_list(FakeCrawler({5: 'error'}), 'list', logger)
+    assert engine._failed
+    assert 'list' not in engine.sink.done
+    assert engine.sink.resume_page('list') == 4
+
+    # 다시 실행하면 5페이지부터 이어서 끝까지 수집
+    engine._failed = False
+    engine._crawl_list(FakeCrawler(), 'list', logger)
+    assert not engine._failed
+    assert 'list' in engine.sink.done
+    assert engine.sink.count == 12
+
+
+def test_end_of_list_completes(engine):
+    engine._crawl_list(FakeCrawler(last_page=7), 'list', logger)
+    assert not engine._failed
+    assert 'list' in engine.sink.done
+
+
+@pytest.mark.parametrize('failure', ['error', 'empty'])
+def test_backfill_segment_failure_is_not_finished(engine, failure):
+    engine._crawl_range(FakeCrawler({7: failure}), 'list', 1, 12, logger)
+    assert engine._failed
+    assert engine.sink.done == {'list#1-4', 'list#9-12'}
+    assert engine.sink.resume_page('list#5-8') == 2
+
+
+def test_backfill_lookahead_page_may_be_empty(engine):
+    engine._crawl_range(FakeCrawler(last_page=11), 'list', 1, 12, logger)
+    assert not engine._failed
+    assert engine.sink.done == {'list#1-4', 'list#5-8', 'list#9-12'}
@@ -0,0 +1,84 @@
+"""DB가 교체되거나 기사가 줄면 URL 인덱스를 다시 만드는지 확인 (마지막 id만 기억하면 새 DB의 기사를 놓침)"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from url_index import KnownUrlIndex
+
+
+def write_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE IF NOT EXISTS news (id INTEGER PRIMARY KEY, url TEXT)')
+    conn.executemany('INSERT INTO news (id, url) VALUES (?, ?)', rows)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / 'news.db'), str(tmp_path / 'known_urls.idx')
+
+
+def build(db_path, index_path):
+    index = KnownUrlIndex(index_path)
+    index.load()
+    index.refresh(db_paths=[db_path], csv_glob=os.path.join(os.path.dirname(db_path), 'none_*.csv'))
+    index.save()
+    return index
+
+
+def test_new_rows_are_read_incrementally(paths):
+    db_path, index_path = paths
+    write_db(db_path, [(i, f'https://a/{i}') for i in range(1, 6)])
+    assert len(build(db_path, index_path)) == 5
+
+    write_db(db_path, [(6, 'https://a/6')])
+    index = build(db_path, index_path)
+
+    assert len(index) == 6 and 'https://a/6' in index
+
+
+def test_replaced_db_with_lower_ids_is_rebuilt(paths):
+    db_path, index_path = paths
+    write_db(db_path, [(i, f'https://old/{i}') for i in range(1, 11)])
+    build(db_path, index_path)
+
+    replacement = db_path + '.new'
+    write_db(replacement, [(1, 'https://new/1'), (2, 'https://new/2')])
+    os.replace(replacement, db_path)
+    index = build(db_path, index_path)
+
+    assert 'https://new/1' in index and 'https://new/2' in index
+    assert 'https://old/3' not in index
+    assert len(index) == 2
+
+
+def test_deleted_rows_trigger_rebuild(paths):
+    db_path, index_path = paths
+    write_db(db_path, [(i, f'https://a/{i}') for i in range(1, 11)])
+    build(db_path, index_path)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute('DELETE FROM news WHERE id BETWEEN 3 AND 5')
+    conn.commit()
+    conn.close()
+    index = build(db_path, index_path)
+
+    assert 'https://a/4' not in index
+    assert len(index) == 7
+
+
+def test_legacy_last_id_only_source_is_upgraded(paths):
+    db_path, index_path = paths
+    write_db(db_path, [(i, f'https://a/{i}') for i in range(1, 4)])
+    with open(index_path + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'sources': {f'db:{db_path}': 50}}, f)
+
+    index = build(db_path, index_path)
+
+    assert len(index) == 3
+    with open(index_path + '.json', encoding='utf-8') as f:
+        assert json.load(f)['sources'][f'db:{db_path}']['last_id'] == 3